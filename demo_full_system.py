@@ -144,7 +144,7 @@ def demo_enrollment_authentication():
 
     # Manually register key with auth service for demo
     if result.dna_key:
-        auth._enrolled_keys[result.key_id] = result.dna_key
+        auth.enroll_key(result.dna_key)
 
     # Generate authentication challenge
     print("\n2️⃣ Generating Authentication Challenge...")
@@ -52,9 +52,12 @@ REST API Server - FastAPI-based REST API with complete authentication system.
 Admin authentication uses DNA-Key system for master key auth.
 """
 
+import asyncio
 import base64
 import os
+import socket
 import sys
+import time
 import traceback
 from datetime import datetime
 from typing import List, Optional, Dict, Any
@@ -62,7 +65,7 @@ from typing import List, Optional, Dict, Any
 import uvicorn
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field
 
@@ -72,10 +75,15 @@ try:
     from server.core.authentication import ChallengeRequest as CoreChallengeRequest
     from server.core.enrollment import EnrollmentRequest as CoreEnrollmentRequest
     from server.core.enrollment import EnrollmentService
+    from server.core.enrollment_jobs import EnrollmentJobError, EnrollmentJobManager, KeyDeliveredError
+    from server.core.key_store import DirectoryKeyStore
+    from server.core.kv_store import KeyValueError, ShardedKeyValueStore
     from server.core.revocation import RevocationReason
     from server.core.revocation import RevocationRequest as CoreRevocationRequest
     from server.core.revocation import RevocationService
+    from server.crypto.backend import get_signer_backend
     from server.crypto.dna_key import SecurityLevel
+    from server.security.signed_tokens import RevocationBloomFilter, SignedTokenCodec, TokenClaims
     CORE_SERVICES_AVAILABLE = True
 except ImportError as e:
     print(f"[WARNING] Core services not fully available: {e}")
@@ -92,6 +100,8 @@ except ImportError:
     def get_platform_info():
         return {"platform": sys.platform, "python_version": sys.version}
 
+from server.runtime.work_executor import BoundedWorkExecutor, ExecutorRejectedError
+
 # Import crypto backend info
 try:
     from server.crypto.backend import is_nacl_available, get_available_backends
@@ -116,18 +126,100 @@ except ImportError:
 enrollment_service = None
 auth_service = None
 revocation_service = None
+shared_store = None
+token_codec = None
+
+# Identifies this worker's revocation filter snapshot in the shared store
+NODE_ID = f"{socket.gethostname()}:{os.getpid()}"
+REVOCATION_SYNC_KEY = "dnalock:revocations"
+REVOCATION_SYNC_SECONDS = float(os.getenv("DNAKEY_REVOCATION_SYNC_SECONDS", "5"))
+_last_revocation_sync = 0.0
+_revocation_sync_task: Optional["asyncio.Task"] = None
+
+
+def _create_token_codec() -> "SignedTokenCodec":
+    """
+    Build the session token codec.
+
+    DNAKEY_TOKEN_SIGNING_KEY is the hex Ed25519 seed shared by every node
+    that issues tokens; DNAKEY_TOKEN_VERIFY_KEYS lists further trusted
+    public keys (hex, comma-separated), e.g. during key rotation.
+    """
+    seed = os.getenv("DNAKEY_TOKEN_SIGNING_KEY", "")
+    if not seed:
+        print("[WARNING] DNAKEY_TOKEN_SIGNING_KEY not set; session tokens will only validate on this worker")
+    signer = get_signer_backend(bytes.fromhex(seed) if seed else None)
+    verify_keys = [bytes.fromhex(k.strip()) for k in os.getenv("DNAKEY_TOKEN_VERIFY_KEYS", "").split(",") if k.strip()]
+    revocations = RevocationBloomFilter(rotate_seconds=AuthenticationService.SESSION_EXPIRY_SECONDS)
+    return SignedTokenCodec(signer, verify_keys=verify_keys, revocations=revocations)
+
 
 if CORE_SERVICES_AVAILABLE:
     try:
         enrollment_service = EnrollmentService()
-        auth_service = AuthenticationService()
+        # Comma-separated shard endpoints (tcp://host:port or unix:///path)
+        # shared by every worker for challenges and token revocations;
+        # both stay in-process when unset.
+        shared_endpoints = [e.strip() for e in os.getenv("DNAKEY_CHALLENGE_STORE", "").split(",") if e.strip()]
+        if shared_endpoints:
+            shared_store = ShardedKeyValueStore(shared_endpoints, password=os.getenv("DNAKEY_KV_PASSWORD") or None)
+        token_codec = _create_token_codec()
+        # Full enrolled keys are only kept when a key directory is configured
+        key_store_dir = os.getenv("DNAKEY_KEY_STORE_DIR", "")
+        auth_service = AuthenticationService(
+            key_store=DirectoryKeyStore(key_store_dir) if key_store_dir else None,
+            challenge_store=shared_store,
+            token_codec=token_codec,
+        )
         revocation_service = RevocationService()
+        revocation_service.add_listener(auth_service.on_key_revoked)
     except Exception as e:
         print(f"[ERROR] Failed to initialize services: {e}")
         CORE_SERVICES_AVAILABLE = False
 
 security = HTTPBearer(auto_error=False)
 
+# Default per-security-level limits on concurrent enrollments. STANDARD keys
+# are cheap and bounded only by the queue depth; heavier levels are capped
+# so they can never hold every enrollment worker at once.
+DEFAULT_ENROLLMENT_QUOTAS = {
+    "enhanced": 4,
+    "maximum": 2,
+    "government": 1,
+    "ultimate": 1,
+}
+
+
+def _parse_quotas(value: str) -> Dict[str, int]:
+    """Parse a quota override such as ``"maximum=2,government=1"``."""
+    quotas = dict(DEFAULT_ENROLLMENT_QUOTAS)
+    for item in value.split(","):
+        if "=" not in item:
+            continue
+        level, limit = item.split("=", 1)
+        quotas[level.strip().lower()] = int(limit)
+    return quotas
+
+
+# Enrollment generates and serializes the full key, which is CPU-bound and
+# must not run on the event loop.
+enrollment_executor = BoundedWorkExecutor(
+    max_workers=int(os.getenv("DNAKEY_ENROLL_WORKERS", "2")),
+    max_queue_depth=int(os.getenv("DNAKEY_ENROLL_QUEUE_DEPTH", "8")),
+    class_quotas=_parse_quotas(os.getenv("DNAKEY_ENROLL_QUOTAS", "")),
+    executor_type=os.getenv("DNAKEY_ENROLL_EXECUTOR", "thread"),
+    name="dnalock-enroll",
+)
+
+enrollment_jobs = None
+if CORE_SERVICES_AVAILABLE:
+    enrollment_jobs = EnrollmentJobManager(
+        enrollment_service,
+        enrollment_executor,
+        retention_seconds=int(os.getenv("DNAKEY_ENROLL_JOB_RETENTION", "900")),
+        on_complete=auth_service.enroll_key,
+    )
+
 
 # ============= API Models =============
 
@@ -143,6 +235,15 @@ class EnrollmentRequest(BaseModel):
     device_binding_required: bool = False
 
 
+class EnrollmentJobResponse(BaseModel):
+    success: bool
+    job_id: Optional[str] = None
+    status: Optional[str] = None
+    status_url: Optional[str] = None
+    download_url: Optional[str] = None
+    error_message: Optional[str] = None
+
+
 class EnrollmentResponse(BaseModel):
     success: bool
     key_id: Optional[str] = None
@@ -217,30 +318,94 @@ def create_error_response(
     )
 
 
+def create_rejection_response(error: ExecutorRejectedError) -> JSONResponse:
+    """Translate an executor rejection into a 429/503 response with Retry-After."""
+    response = create_error_response(
+        error=str(error),
+        error_code=error.error_code,
+        status_code=error.status_code,
+        details={"work_class": error.work_class, "retry_after": error.retry_after},
+    )
+    response.headers["Retry-After"] = str(error.retry_after)
+    return response
+
+
 # ============= Security Dependencies =============
 
 
-async def verify_admin_auth(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    """Verify admin authentication using DNA-Key system."""
+def _sync_revocations(force: bool = False) -> None:
+    """Exchange token revocations with other workers via the shared store."""
+    global _last_revocation_sync
+    if shared_store is None or token_codec is None:
+        return
+    now = time.monotonic()
+    if not force and now - _last_revocation_sync < REVOCATION_SYNC_SECONDS:
+        return
+    _last_revocation_sync = now
+    try:
+        token_codec.revocations.sync(shared_store, REVOCATION_SYNC_KEY, NODE_ID)
+    except KeyValueError as e:
+        print(f"[WARNING] Revocation sync failed: {e}")
+
+
+def _schedule_revocation_sync() -> None:
+    """Start a background revocation sync when one is due and none is running."""
+    global _revocation_sync_task
+    if shared_store is None or token_codec is None:
+        return
+    if _revocation_sync_task is not None and not _revocation_sync_task.done():
+        return
+    if time.monotonic() - _last_revocation_sync < REVOCATION_SYNC_SECONDS:
+        return
+    # The shared store is blocking; never wait on it from the event loop
+    _revocation_sync_task = asyncio.get_running_loop().create_task(asyncio.to_thread(_sync_revocations))
+
+
+async def verify_session_auth(credentials: HTTPAuthorizationCredentials = Depends(security)) -> "TokenClaims":
+    """
+    Verify a signed session token locally.
+
+    Signature, expiry and revocation are checked without a session store
+    round trip; revocations from other workers are merged in the background.
+    """
     if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication credentials required",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if token_codec is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Core services are not available. Check server logs for details."
+        )
 
-    token = credentials.credentials
-
-    # In production, validate session token against auth_service
-    # For now, check token format
-    if not token.startswith("dna-session-"):
+    _schedule_revocation_sync()
+    is_valid, claims, error = token_codec.decode(credentials.credentials)
+    if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid admin authentication token"
+            detail=f"Invalid session token: {error}",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return claims
+
+
+async def verify_admin_auth(claims: "TokenClaims" = Depends(verify_session_auth)):
+    """Verify admin authentication using DNA-Key system."""
+    if not claims.has_scope("admin:full"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin scope required"
         )
 
     # Return admin identity
-    return {"token": token, "role": "admin"}
+    return {
+        "key_id": claims.user_id,
+        "session_id": claims.session_id,
+        "token_id": claims.token_id,
+        "role": "admin",
+    }
 
 
 def check_services_available():
@@ -274,6 +439,12 @@ app.add_middleware(
 # ============= Global Exception Handler =============
 
 
+@app.on_event("shutdown")
+async def shutdown_executors():
+    """Stop the enrollment worker pool."""
+    enrollment_executor.shutdown(wait=False)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle all unhandled exceptions gracefully."""
@@ -359,8 +530,12 @@ async def api_status():
             "/health",
             "/api/v1/status",
             "/api/v1/enroll",
+            "/api/v1/enroll/jobs",
+            "/api/v1/enroll/jobs/{job_id}",
+            "/api/v1/enroll/jobs/{job_id}/key",
             "/api/v1/challenge",
             "/api/v1/authenticate",
+            "/api/v1/logout",
             "/api/v1/visual/{key_id}",
         ],
         "admin_endpoints": [
@@ -373,50 +548,138 @@ async def api_status():
     }
 
 
+def _to_core_enrollment_request(request: EnrollmentRequest) -> "CoreEnrollmentRequest":
+    """Map an API enrollment request onto the core service request."""
+    security_map = {
+        "standard": SecurityLevel.STANDARD,
+        "enhanced": SecurityLevel.ENHANCED,
+        "maximum": SecurityLevel.MAXIMUM,
+        "government": SecurityLevel.GOVERNMENT,
+        "ultimate": SecurityLevel.ULTIMATE,
+    }
+
+    return CoreEnrollmentRequest(
+        subject_id=request.subject_id,
+        subject_type=request.subject_type,
+        security_level=security_map.get(request.security_level.lower(), SecurityLevel.STANDARD),
+        policy_id=request.policy_id,
+        validity_days=request.validity_days,
+        mfa_required=request.mfa_required,
+        biometric_required=request.biometric_required,
+        device_binding_required=request.device_binding_required,
+    )
+
+
+def _run_enrollment(core_request: "CoreEnrollmentRequest"):
+    """
+    Generate, serialize and encode a key on an enrollment worker.
+
+    Returns:
+        Tuple of (core EnrollmentResponse, base64 serialized key or None)
+    """
+    response = enrollment_service.enroll(core_request)
+    if not response.success:
+        return response, None
+    return response, base64.b64encode(response.serialized_key).decode("utf-8")
+
+
 @app.post("/api/v1/enroll", response_model=EnrollmentResponse)
 async def enroll_key(request: EnrollmentRequest):
     """Enroll new DNA key with visual DNA generation."""
     check_services_available()
 
     try:
-        security_map = {
-            "standard": SecurityLevel.STANDARD,
-            "enhanced": SecurityLevel.ENHANCED,
-            "maximum": SecurityLevel.MAXIMUM,
-            "government": SecurityLevel.GOVERNMENT,
-        }
-
-        core_request = CoreEnrollmentRequest(
-            subject_id=request.subject_id,
-            subject_type=request.subject_type,
-            security_level=security_map.get(request.security_level.lower(), SecurityLevel.STANDARD),
-            policy_id=request.policy_id,
-            validity_days=request.validity_days,
-            mfa_required=request.mfa_required,
-            biometric_required=request.biometric_required,
-            device_binding_required=request.device_binding_required,
+        core_request = _to_core_enrollment_request(request)
+        response, serialized_key = await enrollment_executor.run(
+            core_request.security_level.value, _run_enrollment, core_request
         )
 
-        response = enrollment_service.enroll(core_request)
-
         if not response.success:
             return EnrollmentResponse(success=False, error_message=response.error_message)
 
-        auth_service.enroll_key(response.dna_key)
+        # Indexing validates the helix; keep it off the event loop
+        await asyncio.to_thread(auth_service.enroll_key, response.dna_key)
 
         return EnrollmentResponse(
             success=True,
             key_id=response.key_id,
             created_at=response.dna_key.created_timestamp,
             expires_at=response.dna_key.expires_timestamp,
-            serialized_key=base64.b64encode(response.serialized_key).decode("utf-8"),
+            serialized_key=serialized_key,
             signing_key=response.signing_key_hex,  # User needs this to sign challenges!
             visual_seed=response.dna_key.visual_dna.animation_seed if response.dna_key.visual_dna else None,
         )
+    except ExecutorRejectedError as e:
+        return create_rejection_response(e)
     except Exception as e:
         return EnrollmentResponse(success=False, error_message=f"Enrollment failed: {str(e)}")
 
 
+@app.post("/api/v1/enroll/jobs", response_model=EnrollmentJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_enrollment_job(request: EnrollmentRequest):
+    """Start a background enrollment and return its job ID."""
+    check_services_available()
+
+    try:
+        job = enrollment_jobs.submit(_to_core_enrollment_request(request))
+    except ExecutorRejectedError as e:
+        return create_rejection_response(e)
+
+    return EnrollmentJobResponse(
+        success=True,
+        job_id=job.job_id,
+        status=job.status.value,
+        status_url=f"/api/v1/enroll/jobs/{job.job_id}",
+        download_url=f"/api/v1/enroll/jobs/{job.job_id}/key",
+    )
+
+
+@app.get("/api/v1/enroll/jobs/{job_id}")
+async def get_enrollment_job(job_id: str):
+    """Get enrollment job status and progress."""
+    check_services_available()
+
+    job = enrollment_jobs.get_job(job_id)
+    if job is None:
+        return create_error_response(
+            error="Enrollment job not found", error_code="JOB_NOT_FOUND", status_code=404
+        )
+
+    result = job.to_dict()
+    # The signing key is handed out on the first poll after completion only
+    signing_key = enrollment_jobs.take_signing_key(job_id)
+    if signing_key is not None:
+        result["signing_key"] = signing_key
+    return result
+
+
+@app.get("/api/v1/enroll/jobs/{job_id}/key")
+async def download_enrollment_key(job_id: str):
+    """Stream the serialized key of a completed enrollment job."""
+    check_services_available()
+
+    job = enrollment_jobs.get_job(job_id)
+    if job is None:
+        return create_error_response(
+            error="Enrollment job not found", error_code="JOB_NOT_FOUND", status_code=404
+        )
+
+    try:
+        chunks = enrollment_jobs.iter_key_chunks(job_id)
+    except KeyDeliveredError as e:
+        return create_error_response(error=str(e), error_code="KEY_DELIVERED", status_code=410)
+    except EnrollmentJobError as e:
+        return create_error_response(
+            error=str(e), error_code="JOB_NOT_READY", status_code=409, details=job.to_dict()
+        )
+
+    return StreamingResponse(
+        chunks,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{job.key_id}.dnakey"'},
+    )
+
+
 @app.post("/api/v1/challenge", response_model=ChallengeResponse)
 async def get_challenge(request: ChallengeRequest):
     """Get authentication challenge."""
@@ -459,9 +722,9 @@ async def authenticate(request: AuthenticateRequest):
         if not response.success:
             return AuthenticationResponse(success=False, error_message=response.error_message)
 
-        # Check if this is an admin key (based on policy or subject type)
-        is_admin = response.key_id and "admin" in response.key_id
-        permissions = ["admin:full"] if is_admin else ["user:standard"]
+        # Scopes embedded in the session token
+        permissions = response.scopes or []
+        is_admin = "admin:full" in permissions
 
         return AuthenticationResponse(
             success=True,
@@ -475,6 +738,14 @@ async def authenticate(request: AuthenticateRequest):
         return AuthenticationResponse(success=False, error_message=f"Authentication failed: {str(e)}")
 
 
+@app.post("/api/v1/logout")
+async def logout(claims: "TokenClaims" = Depends(verify_session_auth)):
+    """Revoke the presented session token before it expires."""
+    token_codec.revoke(claims.token_id)
+    await asyncio.to_thread(_sync_revocations, True)
+    return {"success": True, "session_id": claims.session_id}
+
+
 @app.get("/api/v1/visual/{key_id}")
 async def get_visual_dna(key_id: str):
     """Get 3D visual DNA configuration."""
@@ -528,11 +799,14 @@ async def admin_stats():
 
     try:
         return {
-            "enrolled_keys": len(auth_service._enrolled_keys),
+            "enrolled_keys": auth_service.get_enrolled_count(),
             "active_challenges": auth_service.get_active_challenges_count(),
             "revoked_keys": revocation_service.get_revoked_count(),
             "crl_version": revocation_service.get_crl_version(),
             "crl_hash": revocation_service.get_crl_hash(),
+            "enrollment_executor": enrollment_executor.get_stats(),
+            "enrollment_jobs": enrollment_jobs.get_stats(),
+            "verify_key_cache": auth_service.verify_key_cache.get_stats(),
         }
     except Exception as e:
         return {"error": f"Failed to get stats: {str(e)}"}
@@ -545,15 +819,15 @@ async def admin_list_keys():
 
     try:
         keys = []
-        for key_id, dna_key in auth_service._enrolled_keys.items():
+        for record in auth_service.iter_key_records():
             keys.append(
                 {
-                    "key_id": key_id,
-                    "subject_type": dna_key.subject.subject_type if dna_key.subject else None,
-                    "created": dna_key.created_timestamp.isoformat() if dna_key.created_timestamp else None,
-                    "expires": dna_key.expires_timestamp.isoformat() if dna_key.expires_timestamp else None,
-                    "is_revoked": revocation_service.is_revoked(key_id),
-                    "segment_count": dna_key.dna_helix.segment_count,
+                    "key_id": record.key_id,
+                    "subject_type": record.subject_type,
+                    "created": record.created_at.isoformat() if record.created_at else None,
+                    "expires": record.expires_at.isoformat() if record.expires_at else None,
+                    "is_revoked": revocation_service.is_revoked(record.key_id),
+                    "segment_count": record.segment_count,
                 }
             )
         return {"keys": keys, "total": len(keys)}
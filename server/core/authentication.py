@@ -61,14 +61,19 @@ Authentication Flow:
 5. Server creates session token
 """
 
+import dataclasses
 import hashlib
+import json
 import secrets
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
+from server.core.key_store import AuthKeyRecord, KeyMaterialStore
+from server.core.kv_store import InMemoryKeyValueStore, KeyValueStore
 from server.crypto.dna_key import DNAKey
-from server.crypto.signatures import Ed25519VerifyKey
+from server.crypto.signatures import VerifyKeyCache
+from server.security.signed_tokens import SignedTokenCodec
 
 
 @dataclass
@@ -108,6 +113,7 @@ class AuthenticationResponse:
     key_id: Optional[str] = None
     error_message: Optional[str] = None
     timestamp: Optional[datetime] = None
+    scopes: Optional[List[str]] = None
 
 
 class AuthenticationError(Exception):
@@ -130,27 +136,132 @@ class AuthenticationService:
     # Session expiry in seconds
     SESSION_EXPIRY_SECONDS = 3600  # 1 hour
 
-    def __init__(self):
-        """Initialize authentication service."""
-        # In-memory storage for active challenges
-        # In production, this would be Redis or similar
-        self._challenges: Dict[str, Dict[str, Any]] = {}
+    # Prepared verify keys retained for repeat authentications
+    VERIFY_KEY_CACHE_SIZE = 4096
 
-        # In-memory storage for enrolled keys
+    # Key prefix for challenges in the challenge store
+    CHALLENGE_KEY_PREFIX = "challenge:"
+
+    def __init__(
+        self,
+        key_store: Optional[KeyMaterialStore] = None,
+        verify_key_cache_size: Optional[int] = None,
+        challenge_store: Optional[KeyValueStore] = None,
+        token_codec: Optional[SignedTokenCodec] = None,
+    ):
+        """
+        Initialize authentication service.
+
+        Args:
+            key_store: Store for full DNA keys, e.g. DirectoryKeyStore.
+                       By default full keys are not retained at all; the
+                       authentication path itself only reads the compact
+                       key index.
+            verify_key_cache_size: Maximum cached verify keys
+                                   (defaults to VERIFY_KEY_CACHE_SIZE)
+            challenge_store: Store for outstanding challenges (defaults to
+                             InMemoryKeyValueStore). Pass a shared store such
+                             as ShardedKeyValueStore so a challenge issued by
+                             one API worker can be answered on another; it
+                             should be dedicated to challenges, since
+                             get_active_challenges_count() counts its keys.
+            token_codec: Issue signed session tokens that any node holding
+                         the public key can validate locally
+        """
+        # Outstanding challenges, expiring with CHALLENGE_EXPIRY_SECONDS
+        self.challenge_store = challenge_store if challenge_store is not None else InMemoryKeyValueStore()
+
+        # Signer for self-describing session tokens
+        self.token_codec = token_codec
+
+        # Compact index of enrolled keys used for authentication
         # In production, this would be a database
-        self._enrolled_keys: Dict[str, DNAKey] = {}
+        self._key_index: Dict[str, AuthKeyRecord] = {}
+
+        # Full keys (helix and all), loaded on demand
+        self.key_store: Optional[KeyMaterialStore] = key_store
+
+        # LRU cache of parsed Ed25519 verify keys
+        self.verify_key_cache = VerifyKeyCache(verify_key_cache_size or self.VERIFY_KEY_CACHE_SIZE)
 
     def enroll_key(self, dna_key: DNAKey) -> None:
         """
         Enroll a DNA key for authentication.
 
+        Only a compact AuthKeyRecord is kept in the index; the full key
+        is handed to the key store, if one is configured. Building the
+        record validates the helix, so callers on an event loop should
+        run this in a worker thread.
+
         Args:
             dna_key: DNA key to enroll
 
         Note:
             In production, this would store in database.
         """
-        self._enrolled_keys[dna_key.key_id] = dna_key
+        record = AuthKeyRecord.from_dna_key(dna_key)
+        if self.key_store is not None:
+            self.key_store.put(dna_key)
+        self._key_index[record.key_id] = record
+
+        # Re-enrollment may change the public key
+        self.verify_key_cache.invalidate(record.key_id)
+
+    def remove_key(self, key_id: str) -> bool:
+        """
+        Remove an enrolled key from the index and key store.
+
+        Args:
+            key_id: Key identifier
+
+        Returns:
+            True if the key was enrolled
+        """
+        record = self._key_index.pop(key_id, None)
+        if self.key_store is not None:
+            self.key_store.delete(key_id)
+        self.verify_key_cache.invalidate(key_id)
+        return record is not None
+
+    def on_key_revoked(self, key_id: str) -> None:
+        """
+        Mark a key revoked so it can no longer authenticate.
+
+        Suitable as a RevocationService listener.
+
+        Args:
+            key_id: Revoked key identifier
+        """
+        record = self._key_index.get(key_id)
+        if record is not None:
+            self._key_index[key_id] = dataclasses.replace(record, revoked=True)
+        self.verify_key_cache.invalidate(key_id)
+
+    def get_key_record(self, key_id: str) -> Optional[AuthKeyRecord]:
+        """Get the authentication index record for a key."""
+        return self._key_index.get(key_id)
+
+    def iter_key_records(self) -> Iterator[AuthKeyRecord]:
+        """Iterate over enrolled key records."""
+        return iter(list(self._key_index.values()))
+
+    def get_key(self, key_id: str) -> Optional[DNAKey]:
+        """
+        Load the full DNA key from the key store.
+
+        Args:
+            key_id: Key identifier
+
+        Returns:
+            The DNA key, or None if not enrolled or no key store is configured
+        """
+        if self.key_store is None or key_id not in self._key_index:
+            return None
+        return self.key_store.get(key_id)
+
+    def get_enrolled_count(self) -> int:
+        """Get count of enrolled keys."""
+        return len(self._key_index)
 
     def generate_challenge(self, request: ChallengeRequest) -> ChallengeResponse:
         """
@@ -171,13 +282,12 @@ class AuthenticationService:
         """
         try:
             # Validate key exists
-            if request.key_id not in self._enrolled_keys:
+            record = self._key_index.get(request.key_id)
+            if record is None:
                 return ChallengeResponse(success=False, error_message="Key not found")
 
-            dna_key = self._enrolled_keys[request.key_id]
-
             # Check if key is valid
-            if not dna_key.is_valid() or dna_key.is_expired():
+            if not record.is_usable():
                 return ChallengeResponse(success=False, error_message="Key is invalid or expired")
 
             # Generate random challenge (32 bytes)
@@ -186,12 +296,16 @@ class AuthenticationService:
             expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.CHALLENGE_EXPIRY_SECONDS)
 
             # Store challenge
-            self._challenges[challenge_id] = {
-                "challenge": challenge,
+            record = {
+                "challenge": challenge.hex(),
                 "key_id": request.key_id,
-                "expires_at": expires_at,
-                "used": False,
+                "expires_at": expires_at.isoformat(),
             }
+            self.challenge_store.set(
+                self.CHALLENGE_KEY_PREFIX + challenge_id,
+                json.dumps(record).encode(),
+                ttl=self.CHALLENGE_EXPIRY_SECONDS,
+            )
 
             return ChallengeResponse(
                 success=True, challenge=challenge, challenge_id=challenge_id, expires_at=expires_at
@@ -218,64 +332,67 @@ class AuthenticationService:
             ...     print(f"Session token: {response.session_token}")
         """
         try:
-            # Validate challenge exists
-            if challenge_id not in self._challenges:
+            # Take the challenge; only one response can ever consume it.
+            # The store expires challenges itself, so an unknown ID and an
+            # expired one are indistinguishable.
+            stored = self.challenge_store.take(self.CHALLENGE_KEY_PREFIX + challenge_id)
+            if stored is None:
                 return AuthenticationResponse(
-                    success=False, error_message="Invalid challenge ID", timestamp=datetime.now(timezone.utc)
+                    success=False,
+                    error_message="Invalid challenge ID or challenge expired",
+                    timestamp=datetime.now(timezone.utc),
                 )
 
-            challenge_data = self._challenges[challenge_id]
+            challenge_data = json.loads(stored)
 
             # Check if challenge is expired
-            if datetime.now(timezone.utc) > challenge_data["expires_at"]:
-                del self._challenges[challenge_id]
+            if datetime.now(timezone.utc) > datetime.fromisoformat(challenge_data["expires_at"]):
                 return AuthenticationResponse(
                     success=False, error_message="Challenge expired", timestamp=datetime.now(timezone.utc)
                 )
 
-            # Check if challenge already used
-            if challenge_data["used"]:
-                return AuthenticationResponse(
-                    success=False, error_message="Challenge already used", timestamp=datetime.now(timezone.utc)
-                )
-
-            # Mark challenge as used
-            challenge_data["used"] = True
-
             # Get enrolled key
             key_id = challenge_data["key_id"]
-            dna_key = self._enrolled_keys[key_id]
+            record = self._key_index.get(key_id)
+            if record is None:
+                return AuthenticationResponse(
+                    success=False, error_message="Key not found", timestamp=datetime.now(timezone.utc)
+                )
+            if record.revoked:
+                return AuthenticationResponse(
+                    success=False, error_message="Key has been revoked", timestamp=datetime.now(timezone.utc)
+                )
 
             # Verify signature
-            if not self._verify_challenge_response(dna_key, challenge_data["challenge"], challenge_response):
+            challenge = bytes.fromhex(challenge_data["challenge"])
+            if not self._verify_challenge_response(record, challenge, challenge_response):
                 return AuthenticationResponse(
                     success=False, error_message="Invalid signature", timestamp=datetime.now(timezone.utc)
                 )
 
             # Create session token
-            session_token = self._create_session_token(key_id)
+            scopes = self.get_token_scopes(key_id)
+            session_token = self._create_session_token(key_id, scopes)
             expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.SESSION_EXPIRY_SECONDS)
 
-            # Clean up used challenge
-            del self._challenges[challenge_id]
-
             return AuthenticationResponse(
                 success=True,
                 session_token=session_token,
                 expires_at=expires_at,
                 key_id=key_id,
                 timestamp=datetime.now(timezone.utc),
+                scopes=scopes,
             )
 
         except Exception as e:
             return AuthenticationResponse(success=False, error_message=str(e), timestamp=datetime.now(timezone.utc))
 
-    def _verify_challenge_response(self, dna_key: DNAKey, challenge: bytes, response: bytes) -> bool:
+    def _verify_challenge_response(self, record: AuthKeyRecord, challenge: bytes, response: bytes) -> bool:
         """
         Verify challenge response signature.
 
         Args:
-            dna_key: DNA key being authenticated
+            record: Index record of the key being authenticated
             challenge: Original challenge
             response: Signed challenge response
 
@@ -283,12 +400,12 @@ class AuthenticationService:
             True if signature valid, False otherwise
         """
         try:
-            # Get public key from DNA key
-            if not dna_key.cryptographic_material or not dna_key.cryptographic_material.public_key:
+            # Get public key from the key record
+            if not record.public_key:
                 return False
 
-            # Create verify key
-            verify_key = Ed25519VerifyKey.from_bytes(dna_key.cryptographic_material.public_key)
+            # Get prepared verify key
+            verify_key = self.verify_key_cache.get(record.key_id, record.public_key)
 
             # Verify signature
             return verify_key.verify(challenge, response)
@@ -296,16 +413,42 @@ class AuthenticationService:
         except Exception:
             return False
 
-    def _create_session_token(self, key_id: str) -> str:
+    @staticmethod
+    def get_token_scopes(key_id: str) -> List[str]:
+        """
+        Get the scopes granted to sessions of a key.
+
+        Args:
+            key_id: Authenticated key ID
+
+        Returns:
+            Permission scopes (admin keys are identified by their key ID)
+        """
+        return ["admin:full"] if "admin" in key_id else ["user:standard"]
+
+    def _create_session_token(self, key_id: str, scopes: Optional[List[str]] = None) -> str:
         """
         Create a session token.
 
+        With a token codec the token is signed and carries the session ID,
+        key ID, scopes and expiry; otherwise it is an opaque random value.
+
         Args:
             key_id: Key ID for the session
+            scopes: Granted scopes (defaults to get_token_scopes)
 
         Returns:
             Session token string
         """
+        if self.token_codec is not None:
+            token, _ = self.token_codec.issue(
+                session_id=f"sess_{secrets.token_hex(16)}",
+                user_id=key_id,
+                scopes=scopes if scopes is not None else self.get_token_scopes(key_id),
+                lifetime_seconds=self.SESSION_EXPIRY_SECONDS,
+            )
+            return token
+
         # Create token with key ID and random data
         token_data = f"{key_id}:{secrets.token_hex(32)}"
         token_hash = hashlib.sha256(token_data.encode()).hexdigest()
@@ -313,19 +456,15 @@ class AuthenticationService:
 
     def get_active_challenges_count(self) -> int:
         """Get count of active challenges."""
-        return len(self._challenges)
+        return len(self.challenge_store)
 
     def cleanup_expired_challenges(self) -> int:
         """
         Clean up expired challenges.
 
+        Stores that expire keys themselves report nothing to clean up.
+
         Returns:
             Number of challenges cleaned up
         """
-        now = datetime.now(timezone.utc)
-        expired = [cid for cid, data in self._challenges.items() if now > data["expires_at"]]
-
-        for cid in expired:
-            del self._challenges[cid]
-
-        return len(expired)
+        return self.challenge_store.purge_expired()
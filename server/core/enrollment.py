@@ -66,7 +66,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from server.crypto.dna_generator import DNAKeyGenerator, SecurityLevel
+from server.crypto.dna_generator import DNAKeyGenerator, ProgressCallback, SecurityLevel
 from server.crypto.dna_key import DNAKey
 from server.crypto.serialization import serialize_dna_key
 
@@ -122,12 +122,16 @@ class EnrollmentService:
         """
         self.issuer_org = issuer_org
 
-    def enroll(self, request: EnrollmentRequest) -> EnrollmentResponse:
+    def enroll(
+        self, request: EnrollmentRequest, progress_callback: Optional[ProgressCallback] = None
+    ) -> EnrollmentResponse:
         """
         Enroll a new DNA key.
 
         Args:
             request: Enrollment request with user details
+            progress_callback: Optional generator progress callback, invoked
+                               as ``callback(stage, completed, total)``
 
         Returns:
             EnrollmentResponse with generated key or error
@@ -148,7 +152,7 @@ class EnrollmentService:
             self._validate_request(request)
 
             # Generate DNA key WITH signing key (for user authentication)
-            generator = DNAKeyGenerator(request.security_level)
+            generator = DNAKeyGenerator(request.security_level, progress_callback=progress_callback)
             key_with_signing = generator.generate_with_signing_key(
                 subject_id=request.subject_id,
                 subject_type=request.subject_type,
@@ -0,0 +1,409 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Asynchronous Enrollment Jobs
+
+Runs enrollments as background jobs so large keys (GOVERNMENT, ULTIMATE)
+do not hold an HTTP request open for the whole generation.
+
+Job Flow:
+1. Submit enrollment request, receive job ID
+2. Poll job status (stage, segments generated); the first poll after
+   completion hands out the signing key, later polls do not
+3. Download the finished serialized key in chunks; the key is released
+   once it has been streamed in full
+
+With a process executor only the enrollment itself runs in the worker
+process and its result is applied to the job here, so such jobs report
+no per-segment progress while running.
+"""
+
+import functools
+import secrets
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from server.core.enrollment import EnrollmentRequest, EnrollmentResponse, EnrollmentService
+from server.crypto.dna_generator import DNAKeyGenerator, GenerationStage
+from server.crypto.dna_key import DNAKey
+from server.runtime.work_executor import BoundedWorkExecutor
+
+
+class JobStatus(Enum):
+    """Lifecycle state of an enrollment job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+# Stage reported while the generated key is being serialized
+STAGE_SERIALIZING = "serializing"
+
+
+@dataclass
+class EnrollmentJob:
+    """State of one asynchronous enrollment."""
+
+    job_id: str
+    security_level: str
+    segments_total: int
+    status: JobStatus = JobStatus.PENDING
+    stage: str = "queued"
+    segments_generated: int = 0
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    key_id: Optional[str] = None
+    error_message: Optional[str] = None
+    key_size: Optional[int] = None
+    key_delivered: bool = False
+    serialized_key: Optional[bytes] = None
+    signing_key_hex: Optional[str] = None
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now(timezone.utc)
+
+    @property
+    def is_finished(self) -> bool:
+        """Check whether the job has completed or failed."""
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of segments generated (0.0 - 1.0)."""
+        if self.status == JobStatus.COMPLETED:
+            return 1.0
+        if self.segments_total == 0:
+            return 0.0
+        return min(1.0, self.segments_generated / self.segments_total)
+
+    def update_progress(self, stage: GenerationStage, completed: int, total: int) -> None:
+        """Progress callback handed to the key generator."""
+        self.stage = STAGE_SERIALIZING if stage == GenerationStage.COMPLETE else stage.value
+        self.segments_generated = completed
+        self.segments_total = total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert job status to dictionary, without the key or signing key."""
+        result = {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "stage": self.stage,
+            "security_level": self.security_level,
+            "segments_generated": self.segments_generated,
+            "segments_total": self.segments_total,
+            "progress": round(self.progress, 4),
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "key_id": self.key_id,
+            "key_size": self.key_size,
+            "key_delivered": self.key_delivered,
+            "error_message": self.error_message,
+        }
+        return result
+
+
+class EnrollmentJobError(Exception):
+    """Exception raised for invalid enrollment job operations."""
+
+    pass
+
+
+class KeyDeliveredError(EnrollmentJobError):
+    """Exception raised when a job's key was already claimed for download."""
+
+    pass
+
+
+class EnrollmentJobManager:
+    """
+    Tracks asynchronous enrollment jobs running on a bounded executor.
+
+    Finished jobs keep their serialized key for ``retention_seconds`` or
+    until it has been downloaded in full; at most ``max_jobs`` jobs are
+    retained, evicting the oldest finished jobs first.
+    """
+
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        enrollment_service: EnrollmentService,
+        executor: BoundedWorkExecutor,
+        retention_seconds: int = 900,
+        max_jobs: int = 256,
+        on_complete: Optional[Callable[[DNAKey], None]] = None,
+    ):
+        """
+        Initialize job manager.
+
+        Args:
+            enrollment_service: Service performing the enrollment
+            executor: Bounded executor the jobs run on
+            retention_seconds: How long finished jobs remain downloadable
+            max_jobs: Maximum number of jobs retained
+            on_complete: Optional hook called with each enrolled key
+                         (e.g. to register it for authentication)
+        """
+        self.enrollment_service = enrollment_service
+        self.executor = executor
+        self.retention = timedelta(seconds=retention_seconds)
+        self.max_jobs = max_jobs
+        self.on_complete = on_complete
+
+        self._jobs: Dict[str, EnrollmentJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, request: EnrollmentRequest) -> EnrollmentJob:
+        """
+        Queue an enrollment job.
+
+        Args:
+            request: Enrollment request
+
+        Returns:
+            The pending job
+
+        Raises:
+            ExecutorRejectedError: If the executor does not admit the job
+        """
+        self.cleanup_expired()
+
+        level = request.security_level
+        job = EnrollmentJob(
+            job_id=f"job-{secrets.token_hex(16)}",
+            security_level=level.value,
+            segments_total=DNAKeyGenerator.SEGMENT_COUNTS[level],
+        )
+
+        # Admission happens before the job is registered so rejected
+        # requests leave no trace
+        if self.executor.executor_type == "process":
+            # Neither this manager nor progress callbacks can be pickled
+            # into a worker process, so only the enrollment runs there
+            future = self.executor.submit(level.value, self.enrollment_service.enroll, request)
+        else:
+            future = self.executor.submit(level.value, self._run, job, request)
+
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._evict_overflow()
+
+        future.add_done_callback(functools.partial(self._finish, job))
+        return job
+
+    def _run(self, job: EnrollmentJob, request: EnrollmentRequest) -> EnrollmentResponse:
+        """Execute an enrollment job on an executor thread, reporting progress."""
+        job.status = JobStatus.RUNNING
+        job.stage = GenerationStage.SEGMENTS.value
+        job.started_at = datetime.now(timezone.utc)
+        return self.enrollment_service.enroll(request, progress_callback=job.update_progress)
+
+    def _finish(self, job: EnrollmentJob, future: Future) -> None:
+        """Apply a finished enrollment's result to its job."""
+        try:
+            response = future.result()
+            if response.success and self.on_complete is not None:
+                self.on_complete(response.dna_key)
+        except Exception as e:
+            self._fail(job, f"Enrollment failed: {e}")
+            return
+
+        if not response.success:
+            self._fail(job, response.error_message)
+            return
+
+        # Only the serialized key is retained; the DNAKey is left to the
+        # on_complete hook
+        job.key_id = response.key_id
+        job.serialized_key = response.serialized_key
+        job.key_size = len(response.serialized_key)
+        job.signing_key_hex = response.signing_key_hex
+        job.segments_generated = job.segments_total
+        job.stage = JobStatus.COMPLETED.value
+        job.finished_at = datetime.now(timezone.utc)
+        job.status = JobStatus.COMPLETED
+
+    @staticmethod
+    def _fail(job: EnrollmentJob, error_message: Optional[str]) -> None:
+        """Mark a job as failed."""
+        job.error_message = error_message
+        job.stage = JobStatus.FAILED.value
+        job.finished_at = datetime.now(timezone.utc)
+        job.status = JobStatus.FAILED
+
+    def get_job(self, job_id: str) -> Optional[EnrollmentJob]:
+        """
+        Get a job by ID.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The job, or None if unknown or expired
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def take_signing_key(self, job_id: str) -> Optional[str]:
+        """
+        Hand out a completed job's signing key, once.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The signing key (hex), or None if the job is unknown, not
+            completed or its key was already taken
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.COMPLETED:
+                return None
+            signing_key, job.signing_key_hex = job.signing_key_hex, None
+            return signing_key
+
+    def iter_key_chunks(self, job_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream a finished job's serialized key.
+
+        The key is claimed when this is called, so only one download can
+        be in progress. It is released once the last chunk has been
+        consumed, or handed back to the job if the stream is closed
+        part-way so the download can be retried.
+
+        Args:
+            job_id: Job identifier
+            chunk_size: Bytes per chunk
+
+        Returns:
+            Iterator over chunks of the serialized key
+
+        Raises:
+            EnrollmentJobError: If the job is unknown or not completed
+            KeyDeliveredError: If the key was already downloaded or is
+                being downloaded
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise EnrollmentJobError(f"Unknown enrollment job: {job_id}")
+            if job.status != JobStatus.COMPLETED:
+                raise EnrollmentJobError(f"Enrollment job {job_id} is {job.status.value}")
+            if job.key_delivered:
+                raise KeyDeliveredError(f"Key of enrollment job {job_id} was already downloaded")
+            if job.serialized_key is None:
+                raise KeyDeliveredError(f"Key of enrollment job {job_id} is already being downloaded")
+            data, job.serialized_key = job.serialized_key, None
+
+        return self._chunks(job, data, chunk_size)
+
+    def _chunks(self, job: EnrollmentJob, data: bytes, chunk_size: int) -> Iterator[bytes]:
+        """Yield zero-copy slices of a claimed key, then mark it delivered."""
+        view = memoryview(data)
+        delivered = False
+        try:
+            for start in range(0, len(view), chunk_size):
+                yield view[start:start + chunk_size]
+            delivered = True
+        finally:
+            with self._lock:
+                if delivered:
+                    job.key_delivered = True
+                else:
+                    job.serialized_key = data
+
+    def cleanup_expired(self) -> int:
+        """
+        Drop finished jobs older than the retention period.
+
+        Returns:
+            Number of jobs removed
+        """
+        cutoff = datetime.now(timezone.utc) - self.retention
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.is_finished and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        return len(expired)
+
+    def _evict_overflow(self) -> None:
+        """Evict the oldest finished jobs beyond max_jobs (lock held)."""
+        overflow = len(self._jobs) - self.max_jobs
+        if overflow <= 0:
+            return
+        finished: List[EnrollmentJob] = sorted(
+            (job for job in self._jobs.values() if job.is_finished),
+            key=lambda job: job.finished_at,
+        )
+        for job in finished[:overflow]:
+            del self._jobs[job.job_id]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get job counts by status."""
+        with self._lock:
+            counts = {status.value: 0 for status in JobStatus}
+            for job in self._jobs.values():
+                counts[job.status.value] += 1
+        counts["total"] = sum(counts.values())
+        return counts
@@ -0,0 +1,311 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Authentication Key Index and Key Stores
+
+The authentication path only needs a key's public key, expiry, validity
+and policy flags. AuthKeyRecord holds exactly that, so an auth node can
+index many thousands of keys without retaining their helices. Full DNA
+keys live in a pluggable KeyMaterialStore and are loaded on demand.
+
+Stores:
+- InMemoryKeyStore: keeps DNAKey objects as-is
+- PackedKeyStore: keeps packed (DNAP) bytes, deserialized zero-copy on access
+- DirectoryKeyStore: one packed file per key, loaded via mmap
+"""
+
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional
+
+from server.crypto.dna_key import DNAKey
+from server.crypto.serialization import DNAKeySerializer
+
+
+@dataclass(frozen=True)
+class AuthKeyRecord:
+    """Compact authentication view of an enrolled DNA key."""
+
+    __slots__ = (
+        "key_id",
+        "public_key",
+        "created_at",
+        "expires_at",
+        "structurally_valid",
+        "revoked",
+        "subject_type",
+        "segment_count",
+        "policy_id",
+        "mfa_required",
+        "biometric_required",
+        "device_binding_required",
+    )
+
+    key_id: str
+    public_key: Optional[bytes]
+    created_at: Optional[datetime]
+    expires_at: Optional[datetime]
+    structurally_valid: bool
+    revoked: bool
+    subject_type: Optional[str]
+    segment_count: int
+    policy_id: Optional[str]
+    mfa_required: bool
+    biometric_required: bool
+    device_binding_required: bool
+
+    @classmethod
+    def from_dna_key(cls, dna_key: DNAKey) -> "AuthKeyRecord":
+        """
+        Build an index record from a full DNA key.
+
+        Structural validation (checksums, segment count) runs once here
+        rather than on every challenge.
+
+        Args:
+            dna_key: DNA key being enrolled
+
+        Returns:
+            AuthKeyRecord for the key
+        """
+        material = dna_key.cryptographic_material
+        policy = dna_key.policy_binding
+
+        return cls(
+            key_id=dna_key.key_id,
+            public_key=bytes(material.public_key) if material and material.public_key else None,
+            created_at=dna_key.created_timestamp,
+            expires_at=dna_key.expires_timestamp,
+            structurally_valid=dna_key.is_valid(),
+            revoked=False,
+            subject_type=dna_key.subject.subject_type if dna_key.subject else None,
+            segment_count=dna_key.dna_helix.segment_count,
+            policy_id=policy.policy_id if policy else None,
+            mfa_required=policy.mfa_required if policy else False,
+            biometric_required=policy.biometric_required if policy else False,
+            device_binding_required=policy.device_binding_required if policy else False,
+        )
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        """Check if the key has expired."""
+        if self.expires_at is None:
+            return False
+        return (now or datetime.now(timezone.utc)) > self.expires_at
+
+    def is_usable(self, now: Optional[datetime] = None) -> bool:
+        """Check if the key may be used to authenticate."""
+        return self.structurally_valid and not self.revoked and not self.is_expired(now)
+
+
+class KeyMaterialStore(ABC):
+    """Abstract store for full DNA keys, loaded on demand."""
+
+    @abstractmethod
+    def put(self, dna_key: DNAKey) -> None:
+        """
+        Store a DNA key, replacing any key with the same ID.
+
+        Args:
+            dna_key: DNA key to store
+        """
+        pass
+
+    @abstractmethod
+    def get(self, key_id: str) -> Optional[DNAKey]:
+        """
+        Load a DNA key.
+
+        Args:
+            key_id: Key identifier
+
+        Returns:
+            The DNA key, or None if not stored
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key_id: str) -> bool:
+        """
+        Remove a DNA key.
+
+        Args:
+            key_id: Key identifier
+
+        Returns:
+            True if a key was removed
+        """
+        pass
+
+    @abstractmethod
+    def __contains__(self, key_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class InMemoryKeyStore(KeyMaterialStore):
+    """Keeps DNAKey objects in memory unchanged."""
+
+    def __init__(self):
+        self._keys: Dict[str, DNAKey] = {}
+
+    def put(self, dna_key: DNAKey) -> None:
+        self._keys[dna_key.key_id] = dna_key
+
+    def get(self, key_id: str) -> Optional[DNAKey]:
+        return self._keys.get(key_id)
+
+    def delete(self, key_id: str) -> bool:
+        return self._keys.pop(key_id, None) is not None
+
+    def __contains__(self, key_id: str) -> bool:
+        return key_id in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class PackedKeyStore(KeyMaterialStore):
+    """
+    Keeps keys as packed bytes in memory.
+
+    A packed key is a handful of contiguous columns instead of one Python
+    object per segment; get() deserializes it zero-copy on demand.
+    """
+
+    def __init__(self):
+        self._blobs: Dict[str, bytes] = {}
+
+    def put(self, dna_key: DNAKey) -> None:
+        self._blobs[dna_key.key_id] = DNAKeySerializer.serialize_packed(dna_key)
+
+    def get(self, key_id: str) -> Optional[DNAKey]:
+        blob = self._blobs.get(key_id)
+        if blob is None:
+            return None
+        return DNAKeySerializer.deserialize_packed(blob)
+
+    def delete(self, key_id: str) -> bool:
+        return self._blobs.pop(key_id, None) is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the stored packed keys."""
+        return sum(len(blob) for blob in self._blobs.values())
+
+    def __contains__(self, key_id: str) -> bool:
+        return key_id in self._blobs
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+
+class DirectoryKeyStore(KeyMaterialStore):
+    """Stores one packed key file per key ID in a directory."""
+
+    FILE_SUFFIX = ".dnap"
+
+    def __init__(self, directory: str):
+        """
+        Initialize directory store.
+
+        Args:
+            directory: Directory for key files (created if missing)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, key_id: str) -> str:
+        """Map a key ID onto a file path inside the store directory."""
+        if not key_id or os.sep in key_id or (os.altsep and os.altsep in key_id) or key_id.startswith("."):
+            raise ValueError(f"Invalid key ID for directory store: {key_id!r}")
+        return os.path.join(self.directory, key_id + self.FILE_SUFFIX)
+
+    def put(self, dna_key: DNAKey) -> None:
+        path = self._path(dna_key.key_id)
+        data = DNAKeySerializer.serialize_packed(dna_key)
+        tmp_path = path + ".tmp"
+        with self._lock:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+    def get(self, key_id: str) -> Optional[DNAKey]:
+        path = self._path(key_id)
+        if not os.path.exists(path):
+            return None
+        return DNAKeySerializer.load_packed(path)
+
+    def delete(self, key_id: str) -> bool:
+        path = self._path(key_id)
+        with self._lock:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                return False
+        return True
+
+    def _key_ids(self) -> Iterator[str]:
+        for name in os.listdir(self.directory):
+            if name.endswith(self.FILE_SUFFIX):
+                yield name[: -len(self.FILE_SUFFIX)]
+
+    def __contains__(self, key_id: str) -> bool:
+        return os.path.exists(self._path(key_id))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._key_ids())
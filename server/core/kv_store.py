@@ -0,0 +1,1006 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Shared Key-Value Stores
+
+Sessions and authentication challenges have to be visible to every API
+worker behind a load balancer, not just the process that created them.
+KeyValueStore is the small set of operations they need: byte values with
+TTLs, an atomic take for single-use records, and score-ordered member
+sets for per-user indexes.
+
+Stores:
+- InMemoryKeyValueStore: process-local, TTLs tracked in an expiry heap
+- ShardedKeyValueStore: RESP client over TCP or unix sockets; keys are
+  spread across shards with jump consistent hashing and multi-key reads
+  and writes are pipelined per shard
+- KeyValueServer: RESP stand-in server backed by an InMemoryKeyValueStore,
+  for development and tests (``python -m server.core.kv_store``)
+
+ShardedKeyValueStore only speaks a subset of RESP that Redis also
+understands, so production deployments can point it at Redis shards.
+Conditional writes use ``SET ... IFEQ`` and need Redis 8.4+ or Valkey 8.1+.
+"""
+
+import argparse
+import hashlib
+import heapq
+import os
+import socket
+import socketserver
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+
+class KeyValueError(Exception):
+    """Exception raised for key-value protocol, type or connection errors."""
+
+    pass
+
+
+class KeyValueStore(ABC):
+    """Abstract key-value store shared between API workers."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read a value.
+
+        Args:
+            key: Key to read
+
+        Returns:
+            The value, or None if the key is missing or expired
+        """
+        pass
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """
+        Read several values.
+
+        Args:
+            keys: Keys to read
+
+        Returns:
+            Values in the order of ``keys``, None for missing keys
+        """
+        return [self.get(key) for key in keys]
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """
+        Write a value.
+
+        Args:
+            key: Key to write
+            value: Value bytes
+            ttl: Seconds until the key expires (None keeps it until deleted)
+        """
+        pass
+
+    def set_many(self, items: Dict[str, bytes], ttl: Optional[float] = None) -> None:
+        """
+        Write several values sharing one TTL.
+
+        Args:
+            items: Mapping of key to value
+            ttl: Seconds until the keys expire
+        """
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
+    @abstractmethod
+    def compare_and_set(self, key: str, expected: bytes, value: bytes, ttl: Optional[float] = None) -> bool:
+        """
+        Atomically replace a value only if it still equals ``expected``.
+
+        Args:
+            key: Key to write
+            expected: Value the key must currently hold
+            value: Replacement value
+            ttl: Seconds until the key expires (None keeps it until deleted)
+
+        Returns:
+            True if the value was replaced; False if the key is missing,
+            expired or holds a different value
+        """
+        pass
+
+    def compare_and_set_many(
+        self,
+        entries: Sequence[Tuple[str, bytes, bytes, Optional[float]]]
+    ) -> List[bool]:
+        """
+        Run several compare-and-set writes.
+
+        Each write is atomic on its own; the batch as a whole is not.
+
+        Args:
+            entries: (key, expected, value, ttl) tuples
+
+        Returns:
+            Per-entry results in the order of ``entries``
+        """
+        return [self.compare_and_set(*entry) for entry in entries]
+
+    @abstractmethod
+    def delete(self, *keys: str) -> int:
+        """
+        Remove keys.
+
+        Returns:
+            Number of keys that existed
+        """
+        pass
+
+    @abstractmethod
+    def take(self, key: str) -> Optional[bytes]:
+        """
+        Atomically read and remove a value.
+
+        Only one caller can take a given value, which makes this suitable
+        for single-use records such as challenges.
+
+        Args:
+            key: Key to take
+
+        Returns:
+            The value, or None if the key was missing or expired
+        """
+        pass
+
+    @abstractmethod
+    def expire(self, key: str, ttl: float) -> bool:
+        """
+        Set a key's TTL.
+
+        Returns:
+            True if the key exists
+        """
+        pass
+
+    @abstractmethod
+    def add_member(self, key: str, member: str, score: float) -> bool:
+        """
+        Add a member to a score-ordered set.
+
+        Args:
+            key: Set key
+            member: Member to add
+            score: Sort score (re-adding updates it)
+
+        Returns:
+            True if the member was not present
+        """
+        pass
+
+    @abstractmethod
+    def remove_members(self, key: str, *members: str) -> int:
+        """
+        Remove members from a score-ordered set.
+
+        Returns:
+            Number of members removed
+        """
+        pass
+
+    @abstractmethod
+    def members(self, key: str) -> List[str]:
+        """Get the members of a score-ordered set, lowest score first."""
+        pass
+
+    @abstractmethod
+    def member_count(self, key: str) -> int:
+        """Get the number of members in a score-ordered set."""
+        pass
+
+    def purge_expired(self) -> int:
+        """
+        Remove expired keys that have not been reclaimed yet.
+
+        Returns:
+            Number of keys removed (0 for stores that expire keys themselves)
+        """
+        return 0
+
+    def close(self) -> None:
+        """Release connections held by the store."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+# ============================================================================
+# IN-MEMORY STORE
+# ============================================================================
+
+
+class InMemoryKeyValueStore(KeyValueStore):
+    """
+    Process-local key-value store.
+
+    Expired keys are never returned. They are reclaimed from an expiry
+    heap on writes and by purge_expired(), so a call only visits keys
+    that are actually due.
+    """
+
+    # Stale heap entries (from re-set TTLs) tolerated before a rebuild
+    HEAP_COMPACT_SLACK = 1024
+
+    def __init__(self, clock: Optional[Callable[[], float]] = None):
+        """
+        Initialize in-memory store.
+
+        Args:
+            clock: Monotonic time source in seconds (defaults to time.monotonic)
+        """
+        self._clock = clock or time.monotonic
+        self._values: Dict[str, Union[bytes, Dict[str, float]]] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def _live(self, key: str, now: float) -> Any:
+        """Get a key's value, dropping it if it has expired."""
+        deadline = self._deadlines.get(key)
+        if deadline is not None and deadline <= now:
+            self._drop(key)
+            return None
+        return self._values.get(key)
+
+    def _drop(self, key: str) -> bool:
+        self._deadlines.pop(key, None)
+        return self._values.pop(key, None) is not None
+
+    def _set_ttl(self, key: str, ttl: Optional[float], now: float) -> None:
+        if ttl is None:
+            self._deadlines.pop(key, None)
+            return
+        deadline = now + ttl
+        self._deadlines[key] = deadline
+        heapq.heappush(self._expiry_heap, (deadline, key))
+        if len(self._expiry_heap) > 2 * len(self._deadlines) + self.HEAP_COMPACT_SLACK:
+            self._expiry_heap = [(d, k) for k, d in self._deadlines.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _purge(self, now: float) -> int:
+        heap = self._expiry_heap
+        purged = 0
+        while heap and heap[0][0] <= now:
+            deadline, key = heapq.heappop(heap)
+            # Entries left behind by a later TTL change are skipped
+            if self._deadlines.get(key) == deadline:
+                self._drop(key)
+                purged += 1
+        return purged
+
+    def _members(self, key: str, now: float, create: bool = False) -> Optional[Dict[str, float]]:
+        value = self._live(key, now)
+        if value is None:
+            if not create:
+                return None
+            value = self._values[key] = {}
+        if not isinstance(value, dict):
+            raise KeyValueError(f"WRONGTYPE {key} does not hold a member set")
+        return value
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._live(key, self._clock())
+            if isinstance(value, dict):
+                raise KeyValueError(f"WRONGTYPE {key} holds a member set")
+            return value
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        with self._lock:
+            now = self._clock()
+            values = [self._live(key, now) for key in keys]
+        return [None if isinstance(value, dict) else value for value in values]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            now = self._clock()
+            self._purge(now)
+            self._values[key] = bytes(value)
+            self._set_ttl(key, ttl, now)
+
+    def set_many(self, items: Dict[str, bytes], ttl: Optional[float] = None) -> None:
+        with self._lock:
+            now = self._clock()
+            self._purge(now)
+            for key, value in items.items():
+                self._values[key] = bytes(value)
+                self._set_ttl(key, ttl, now)
+
+    def compare_and_set(self, key: str, expected: bytes, value: bytes, ttl: Optional[float] = None) -> bool:
+        with self._lock:
+            now = self._clock()
+            current = self._live(key, now)
+            if isinstance(current, dict):
+                raise KeyValueError(f"WRONGTYPE {key} holds a member set")
+            if current is None or current != expected:
+                return False
+            self._values[key] = bytes(value)
+            self._set_ttl(key, ttl, now)
+            return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            now = self._clock()
+            return sum(1 for key in keys if self._live(key, now) is not None and self._drop(key))
+
+    def take(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._live(key, self._clock())
+            if value is None:
+                return None
+            if isinstance(value, dict):
+                raise KeyValueError(f"WRONGTYPE {key} holds a member set")
+            self._drop(key)
+            return value
+
+    def expire(self, key: str, ttl: float) -> bool:
+        with self._lock:
+            now = self._clock()
+            if self._live(key, now) is None:
+                return False
+            self._set_ttl(key, ttl, now)
+            return True
+
+    def add_member(self, key: str, member: str, score: float) -> bool:
+        with self._lock:
+            now = self._clock()
+            self._purge(now)
+            members = self._members(key, now, create=True)
+            added = member not in members
+            members[member] = float(score)
+            return added
+
+    def remove_members(self, key: str, *members: str) -> int:
+        with self._lock:
+            current = self._members(key, self._clock())
+            if current is None:
+                return 0
+            removed = sum(1 for member in members if current.pop(member, None) is not None)
+            if not current:
+                self._drop(key)
+            return removed
+
+    def members(self, key: str) -> List[str]:
+        with self._lock:
+            current = self._members(key, self._clock())
+            if current is None:
+                return []
+            return [member for member, _ in sorted(current.items(), key=lambda item: (item[1], item[0]))]
+
+    def member_count(self, key: str) -> int:
+        with self._lock:
+            current = self._members(key, self._clock())
+            return len(current) if current is not None else 0
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return self._purge(self._clock())
+
+    def clear(self) -> None:
+        """Remove every key."""
+        with self._lock:
+            self._values.clear()
+            self._deadlines.clear()
+            self._expiry_heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+# ============================================================================
+# RESP PROTOCOL
+# ============================================================================
+
+
+def _encode_command(*args: Union[str, bytes, int, float]) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode()
+        elif not isinstance(arg, bytes):
+            arg = repr(arg).encode() if isinstance(arg, float) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+def _read_reply(reader: BinaryIO) -> Any:
+    """
+    Read one RESP value.
+
+    Error replies are returned as KeyValueError instances rather than
+    raised, so a pipelined caller can drain every reply first.
+    """
+    line = reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise KeyValueError("Connection closed by peer")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        return KeyValueError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = reader.read(length + 2)
+        if len(data) != length + 2:
+            raise KeyValueError("Connection closed by peer")
+        return data[:-2]
+    if kind == b"*":
+        count = int(payload)
+        if count < 0:
+            return None
+        return [_read_reply(reader) for _ in range(count)]
+    raise KeyValueError(f"Unexpected reply type: {line!r}")
+
+
+def _parse_endpoint(endpoint: str) -> Tuple[int, Union[str, Tuple[str, int]]]:
+    """
+    Parse an endpoint into a socket family and address.
+
+    Accepts ``unix:///path/to.sock``, ``tcp://host:port`` and ``host:port``.
+    """
+    if endpoint.startswith("unix:"):
+        path = endpoint[len("unix:"):]
+        if path.startswith("//"):
+            path = path[2:]
+        return socket.AF_UNIX, path
+    if endpoint.startswith("tcp://"):
+        endpoint = endpoint[len("tcp://"):]
+    host, sep, port = endpoint.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"Invalid key-value endpoint: {endpoint!r}")
+    return socket.AF_INET, (host.strip("[]") or "127.0.0.1", int(port))
+
+
+def jump_hash(key: int, num_buckets: int) -> int:
+    """
+    Map a 64-bit key onto a bucket with jump consistent hashing.
+
+    Growing the bucket count only moves the keys that land in the new
+    buckets (Lamping & Veach).
+    """
+    bucket, j = -1, 0
+    while j < num_buckets:
+        bucket = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+class _RespConnection:
+    """A lazily (re)connected RESP connection to one shard."""
+
+    def __init__(self, endpoint: str, timeout: float, password: Optional[str]):
+        self.endpoint = endpoint
+        self.family, self.address = _parse_endpoint(endpoint)
+        self.timeout = timeout
+        self.password = password
+        self.lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._reader: Optional[BinaryIO] = None
+
+    def _connect(self) -> None:
+        sock = socket.socket(self.family, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.address)
+            if self.family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+        if self.password:
+            reply = self._roundtrip([_encode_command("AUTH", self.password)])[0]
+            if isinstance(reply, KeyValueError):
+                self.close()
+                raise reply
+
+    def _roundtrip(self, commands: List[bytes]) -> List[Any]:
+        self._sock.sendall(b"".join(commands))
+        return [_read_reply(self._reader) for _ in commands]
+
+    def send(self, commands: List[bytes]) -> None:
+        """Write a batch of encoded commands without waiting for replies."""
+        try:
+            if self._sock is None:
+                self._connect()
+            self._sock.sendall(b"".join(commands))
+        except OSError as e:
+            self.close()
+            raise KeyValueError(f"{self.endpoint}: {e}") from e
+
+    def receive(self, count: int) -> List[Any]:
+        """Read the replies to a previously sent batch."""
+        try:
+            return [_read_reply(self._reader) for _ in range(count)]
+        except (OSError, KeyValueError) as e:
+            self.close()
+            raise KeyValueError(f"{self.endpoint}: {e}") from e
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._reader = None
+
+
+# ============================================================================
+# SHARDED NETWORK STORE
+# ============================================================================
+
+
+class ShardedKeyValueStore(KeyValueStore):
+    """
+    Key-value store spread over one or more RESP servers.
+
+    Each key lives on the shard chosen by jump-hashing its BLAKE2b digest.
+    Multi-key operations group keys by shard, write every shard's batch
+    before reading any replies, and so cost one round trip overall rather
+    than one per key.
+    """
+
+    def __init__(self, endpoints: Sequence[str], timeout: float = 5.0, password: Optional[str] = None):
+        """
+        Initialize sharded store.
+
+        Args:
+            endpoints: Shard endpoints (``tcp://host:port`` or ``unix:///path``),
+                       in a fixed order; appending shards moves the fewest keys
+            timeout: Socket timeout in seconds
+            password: Password sent with AUTH on connect
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        self._shards = [_RespConnection(endpoint, timeout, password) for endpoint in endpoints]
+
+    @property
+    def shard_count(self) -> int:
+        """Number of shards."""
+        return len(self._shards)
+
+    def shard_index(self, key: str) -> int:
+        """Get the shard that holds a key."""
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        return jump_hash(int.from_bytes(digest, "big"), len(self._shards))
+
+    def _pipeline(self, batches: Dict[int, List[bytes]]) -> Dict[int, List[Any]]:
+        """Send per-shard command batches and collect their replies."""
+        shard_ids = sorted(batches)
+        locks = [self._shards[i].lock for i in shard_ids]
+        for lock in locks:
+            lock.acquire()
+        try:
+            try:
+                for i in shard_ids:
+                    self._shards[i].send(batches[i])
+                replies = {i: self._shards[i].receive(len(batches[i])) for i in shard_ids}
+            except BaseException:
+                # Shards that were sent a batch but not read hold unread
+                # replies; the next command on them would read those instead
+                # of its own, so every connection in the batch is reset
+                for i in shard_ids:
+                    self._shards[i].close()
+                raise
+        finally:
+            for lock in locks:
+                lock.release()
+
+        for shard_replies in replies.values():
+            for reply in shard_replies:
+                if isinstance(reply, KeyValueError):
+                    raise reply
+        return replies
+
+    def _execute(self, key: str, *args: Union[str, bytes, int, float]) -> Any:
+        shard = self.shard_index(key)
+        return self._pipeline({shard: [_encode_command(*args)]})[shard][0]
+
+    def _execute_per_key(self, keys: Sequence[str], build: Callable[[str], bytes]) -> List[Any]:
+        """Run one command per key, pipelined per shard, replies in key order."""
+        return self._execute_keyed([(key, build(key)) for key in keys])
+
+    def _execute_keyed(self, commands: Sequence[Tuple[str, bytes]]) -> List[Any]:
+        """Run (key, encoded command) pairs pipelined per shard, replies in order."""
+        batches: Dict[int, List[bytes]] = {}
+        slots: List[Tuple[int, int]] = []
+        for key, command in commands:
+            shard = self.shard_index(key)
+            batch = batches.setdefault(shard, [])
+            slots.append((shard, len(batch)))
+            batch.append(command)
+        if not batches:
+            return []
+        replies = self._pipeline(batches)
+        return [replies[shard][i] for shard, i in slots]
+
+    @staticmethod
+    def _ttl_ms(ttl: float) -> int:
+        return max(1, int(ttl * 1000))
+
+    def _set_command(self, key: str, value: bytes, ttl: Optional[float]) -> bytes:
+        if ttl is None:
+            return _encode_command("SET", key, value)
+        return _encode_command("SET", key, value, "PX", self._ttl_ms(ttl))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._execute(key, "GET", key)
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return self._execute_per_key(keys, lambda key: _encode_command("GET", key))
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        shard = self.shard_index(key)
+        self._pipeline({shard: [self._set_command(key, value, ttl)]})
+
+    def set_many(self, items: Dict[str, bytes], ttl: Optional[float] = None) -> None:
+        self._execute_per_key(list(items), lambda key: self._set_command(key, items[key], ttl))
+
+    def _compare_and_set_command(self, key: str, expected: bytes, value: bytes, ttl: Optional[float]) -> bytes:
+        # SET ... IFEQ is understood by Valkey 8.1+ and Redis 8.4+
+        if ttl is None:
+            return _encode_command("SET", key, value, "IFEQ", expected)
+        return _encode_command("SET", key, value, "IFEQ", expected, "PX", self._ttl_ms(ttl))
+
+    def compare_and_set(self, key: str, expected: bytes, value: bytes, ttl: Optional[float] = None) -> bool:
+        return self.compare_and_set_many([(key, expected, value, ttl)])[0]
+
+    def compare_and_set_many(
+        self,
+        entries: Sequence[Tuple[str, bytes, bytes, Optional[float]]]
+    ) -> List[bool]:
+        replies = self._execute_keyed([(entry[0], self._compare_and_set_command(*entry)) for entry in entries])
+        return [reply == "OK" for reply in replies]
+
+    def delete(self, *keys: str) -> int:
+        return sum(self._execute_per_key(keys, lambda key: _encode_command("DEL", key)))
+
+    def take(self, key: str) -> Optional[bytes]:
+        return self._execute(key, "GETDEL", key)
+
+    def expire(self, key: str, ttl: float) -> bool:
+        return self._execute(key, "PEXPIRE", key, self._ttl_ms(ttl)) == 1
+
+    def add_member(self, key: str, member: str, score: float) -> bool:
+        return self._execute(key, "ZADD", key, float(score), member) == 1
+
+    def remove_members(self, key: str, *members: str) -> int:
+        if not members:
+            return 0
+        return self._execute(key, "ZREM", key, *members)
+
+    def members(self, key: str) -> List[str]:
+        return [member.decode() for member in self._execute(key, "ZRANGE", key, 0, -1)]
+
+    def member_count(self, key: str) -> int:
+        return self._execute(key, "ZCARD", key)
+
+    def ping(self) -> bool:
+        """Check every shard is reachable."""
+        replies = self._pipeline({i: [_encode_command("PING")] for i in range(len(self._shards))})
+        return all(reply[0] == "PONG" for reply in replies.values())
+
+    def close(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.close()
+
+    def __len__(self) -> int:
+        replies = self._pipeline({i: [_encode_command("DBSIZE")] for i in range(len(self._shards))})
+        return sum(reply[0] for reply in replies.values())
+
+
+# ============================================================================
+# STAND-IN SERVER
+# ============================================================================
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    """Serves RESP commands from one client connection."""
+
+    def setup(self) -> None:
+        super().setup()
+        if self.connection.family == socket.AF_INET:
+            # Pipelined replies are written one by one; do not let Nagle hold them
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self) -> None:
+        server: KeyValueServer = self.server.owner
+        authenticated = server.password is None
+        while True:
+            try:
+                request = _read_reply(self.rfile)
+            except (KeyValueError, ValueError, OSError):
+                return
+            if not isinstance(request, list) or not request:
+                self.wfile.write(b"-ERR Protocol error\r\n")
+                continue
+            name = request[0].decode().upper()
+            args = request[1:]
+            if name == "AUTH":
+                authenticated = server.password is None or (args and args[-1].decode() == server.password)
+                reply: Any = "OK" if authenticated else KeyValueError("WRONGPASS invalid password")
+            elif not authenticated:
+                reply = KeyValueError("NOAUTH Authentication required")
+            else:
+                reply = server.execute(name, args)
+            try:
+                self.wfile.write(self._encode_reply(reply))
+            except OSError:
+                return
+
+    @classmethod
+    def _encode_reply(cls, reply: Any) -> bytes:
+        if reply is None:
+            return b"$-1\r\n"
+        if isinstance(reply, KeyValueError):
+            return b"-%s\r\n" % str(reply).encode()
+        if isinstance(reply, str):
+            return b"+%s\r\n" % reply.encode()
+        if isinstance(reply, bool):
+            reply = int(reply)
+        if isinstance(reply, int):
+            return b":%d\r\n" % reply
+        if isinstance(reply, bytes):
+            return b"$%d\r\n%s\r\n" % (len(reply), reply)
+        if isinstance(reply, list):
+            return b"*%d\r\n" % len(reply) + b"".join(cls._encode_reply(item) for item in reply)
+        raise TypeError(f"Cannot encode reply {reply!r}")
+
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _ThreadingTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class KeyValueServer:
+    """
+    Stand-in RESP server over an InMemoryKeyValueStore.
+
+    Understands the commands ShardedKeyValueStore issues (GET, SET with
+    PX/EX/IFEQ, GETDEL, DEL, PEXPIRE, ZADD, ZREM, ZRANGE, ZCARD, DBSIZE,
+    FLUSHDB, PING, AUTH). It is meant for development and tests; run one
+    per shard.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "tcp://127.0.0.1:0",
+        store: Optional[InMemoryKeyValueStore] = None,
+        password: Optional[str] = None,
+    ):
+        """
+        Initialize server.
+
+        Args:
+            endpoint: Address to listen on; TCP port 0 picks a free port
+            store: Backing store (a fresh InMemoryKeyValueStore by default)
+            password: Password clients must send with AUTH
+        """
+        self.store = store if store is not None else InMemoryKeyValueStore()
+        self.password = password
+        family, address = _parse_endpoint(endpoint)
+        if family == socket.AF_UNIX:
+            if os.path.exists(address):
+                os.remove(address)
+            self._server: socketserver.BaseServer = _ThreadingUnixServer(address, _RespHandler)
+        else:
+            self._server = _ThreadingTCPServer(address, _RespHandler)
+        self._server.owner = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def endpoint(self) -> str:
+        """Endpoint clients should connect to."""
+        address = self._server.server_address
+        if isinstance(address, tuple):
+            return f"tcp://{address[0]}:{address[1]}"
+        return f"unix://{address}"
+
+    def start(self) -> "KeyValueServer":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, name="kv-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until shutdown."""
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        if isinstance(self._server.server_address, str) and os.path.exists(self._server.server_address):
+            os.remove(self._server.server_address)
+
+    def __enter__(self) -> "KeyValueServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def execute(self, name: str, args: List[bytes]) -> Any:
+        """
+        Run one command against the backing store.
+
+        Returns:
+            The reply value, or a KeyValueError for error replies
+        """
+        handler = getattr(self, f"_cmd_{name.lower()}", None)
+        if handler is None:
+            return KeyValueError(f"ERR unknown command '{name}'")
+        try:
+            return handler(*args)
+        except KeyValueError as e:
+            return e
+        except (TypeError, ValueError) as e:
+            return KeyValueError(f"ERR wrong arguments for '{name}': {e}")
+
+    def _cmd_ping(self) -> str:
+        return "PONG"
+
+    def _cmd_get(self, key: bytes) -> Optional[bytes]:
+        return self.store.get(key.decode())
+
+    def _cmd_set(self, key: bytes, value: bytes, *options: bytes) -> Optional[str]:
+        ttl = None
+        expected = None
+        if len(options) % 2:
+            raise ValueError("syntax error")
+        for i in range(0, len(options), 2):
+            option, argument = options[i].decode().upper(), options[i + 1]
+            if option == "PX":
+                ttl = float(argument) / 1000
+            elif option == "EX":
+                ttl = float(argument)
+            elif option == "IFEQ":
+                expected = argument
+            else:
+                raise ValueError(f"unsupported option {option}")
+        if expected is not None:
+            return "OK" if self.store.compare_and_set(key.decode(), expected, value, ttl) else None
+        self.store.set(key.decode(), value, ttl)
+        return "OK"
+
+    def _cmd_getdel(self, key: bytes) -> Optional[bytes]:
+        return self.store.take(key.decode())
+
+    def _cmd_del(self, *keys: bytes) -> int:
+        return self.store.delete(*(key.decode() for key in keys))
+
+    def _cmd_pexpire(self, key: bytes, milliseconds: bytes) -> int:
+        return int(self.store.expire(key.decode(), int(milliseconds) / 1000))
+
+    def _cmd_zadd(self, key: bytes, *pairs: bytes) -> int:
+        if not pairs or len(pairs) % 2:
+            raise ValueError("expected score/member pairs")
+        return sum(
+            self.store.add_member(key.decode(), pairs[i + 1].decode(), float(pairs[i]))
+            for i in range(0, len(pairs), 2)
+        )
+
+    def _cmd_zrem(self, key: bytes, *members: bytes) -> int:
+        return self.store.remove_members(key.decode(), *(member.decode() for member in members))
+
+    def _cmd_zrange(self, key: bytes, start: bytes, stop: bytes) -> List[bytes]:
+        members = self.store.members(key.decode())
+        stop_index = int(stop)
+        end = len(members) if stop_index == -1 else stop_index + 1
+        return [member.encode() for member in members[int(start):end]]
+
+    def _cmd_zcard(self, key: bytes) -> int:
+        return self.store.member_count(key.decode())
+
+    def _cmd_dbsize(self) -> int:
+        self.store.purge_expired()
+        return len(self.store)
+
+    def _cmd_flushdb(self) -> str:
+        self.store.clear()
+        return "OK"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run stand-in key-value servers until interrupted."""
+    parser = argparse.ArgumentParser(description="DNALockOS stand-in key-value server")
+    parser.add_argument(
+        "--listen",
+        action="append",
+        default=[],
+        help="Endpoint to serve, e.g. tcp://127.0.0.1:6390 or unix:///tmp/dnalock-kv.sock "
+        "(repeat for one independent shard per endpoint)",
+    )
+    parser.add_argument("--password", default=os.getenv("DNAKEY_KV_PASSWORD"), help="Require AUTH")
+    args = parser.parse_args(argv)
+
+    servers = [KeyValueServer(endpoint, password=args.password) for endpoint in args.listen or ["tcp://127.0.0.1:6390"]]
+    for server in servers:
+        server.start()
+        print(f"[kv] serving {server.endpoint}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
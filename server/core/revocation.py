@@ -66,7 +66,7 @@ import hashlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 
 
 class RevocationReason(Enum):
@@ -134,6 +134,18 @@ class RevocationService:
         # Last update timestamp
         self._last_updated = datetime.now(timezone.utc)
 
+        # Callbacks notified with the key ID of each newly revoked key
+        self._listeners: List[Callable[[str], None]] = []
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """
+        Register a callback invoked with the key ID of each revoked key.
+
+        Args:
+            callback: Callable taking a key ID
+        """
+        self._listeners.append(callback)
+
     def revoke_key(self, request: RevocationRequest) -> RevocationResponse:
         """
         Revoke a DNA key.
@@ -177,6 +189,13 @@ class RevocationService:
             self._crl_version += 1
             self._last_updated = revoked_at
 
+            # The key is revoked regardless of listener failures
+            for listener in self._listeners:
+                try:
+                    listener(request.key_id)
+                except Exception:
+                    pass
+
             return RevocationResponse(success=True, key_id=request.key_id, revoked_at=revoked_at)
 
         except Exception as e:
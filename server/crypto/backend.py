@@ -50,7 +50,7 @@ Security Note:
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 import warnings
 
 
@@ -399,6 +399,64 @@ def generate_keypair() -> Tuple[bytes, bytes]:
     return signer.to_bytes(), signer.get_public_key()
 
 
+def get_verifier(public_key: bytes) -> Callable[[bytes, bytes], bool]:
+    """
+    Get a verify-only Ed25519 function for a public key.
+
+    Nodes that only validate signatures (e.g. session tokens) do not hold
+    the private key. The public key is parsed once; the returned function
+    can be called repeatedly.
+
+    Args:
+        public_key: 32-byte Ed25519 public key.
+
+    Returns:
+        Function taking (data, signature) and returning True if valid.
+
+    Raises:
+        ValueError: If public_key is not 32 bytes.
+        RuntimeError: If no signing backend is available.
+    """
+    if len(public_key) != 32:
+        raise ValueError("Public key must be exactly 32 bytes")
+
+    if _check_nacl():
+        from nacl.exceptions import BadSignatureError
+        from nacl.signing import VerifyKey
+
+        verify_key = VerifyKey(bytes(public_key))
+
+        def verify(data: bytes, signature: bytes) -> bool:
+            if len(signature) != 64:
+                return False
+            try:
+                verify_key.verify(data, signature)
+                return True
+            except BadSignatureError:
+                return False
+
+        return verify
+
+    if _check_cryptography():
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+
+        key = ed25519.Ed25519PublicKey.from_public_bytes(bytes(public_key))
+
+        def verify(data: bytes, signature: bytes) -> bool:
+            if len(signature) != 64:
+                return False
+            try:
+                key.verify(signature, data)
+                return True
+            except InvalidSignature:
+                return False
+
+        return verify
+
+    raise RuntimeError("No crypto backend available. Install PyNaCl or cryptography.")
+
+
 def is_nacl_available() -> bool:
     """
     Check if PyNaCl is available.
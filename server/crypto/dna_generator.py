@@ -72,12 +72,19 @@ Generation follows the enhanced algorithm:
 """
 
 import hashlib
+import os
 import secrets
 import string
+import struct
+from array import array
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Tuple, Union
+from enum import Enum
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from server.crypto.dna_key import (
+    SEGMENT_LAYER_MAPPING,
+    CompactDNAHelix,
     CryptographicMaterial,
     DNAHelix,
     DNAKey,
@@ -87,12 +94,12 @@ from server.crypto.dna_key import (
     LayerChecksum,
     PolicyBinding,
     SecurityLevel,
-    SecurityLayer,
     SecurityMethodsIntegrated,
     SegmentType,
     SubjectInfo,
     VisualDNA,
 )
+from server.crypto.helix_checksum import compute_helix_digests
 from server.crypto.signatures import generate_ed25519_keypair
 
 
@@ -101,6 +108,21 @@ from server.crypto.signatures import generate_ed25519_keypair
 DNA_ALPHABET = string.ascii_letters + string.digits + "!@#$%^&*()-_=+[]{}|;:,.<>?/~`"
 
 
+class GenerationStage(Enum):
+    """Stages reported to a generator progress callback."""
+
+    SEGMENTS = "segments"
+    HASHING = "hashing"
+    SHUFFLING = "shuffling"
+    CHECKSUM = "checksum"
+    SIGNING = "signing"
+    COMPLETE = "complete"
+
+
+# progress_callback(stage, segments_completed, segments_total)
+ProgressCallback = Callable[[GenerationStage, int, int], None]
+
+
 class DNAKeyGenerator:
     """
     Generator for DNA authentication keys.
@@ -136,29 +158,49 @@ class DNAKeyGenerator:
     }
     
     # Mapping of segment types to security layers
-    LAYER_MAPPING = {
-        SegmentType.METADATA: SecurityLayer.OUTER_SHELL,
-        SegmentType.ENTROPY: SecurityLayer.ENTROPY_MATRIX,
-        SegmentType.POLICY: SecurityLayer.SECURITY_FRAMEWORK,
-        SegmentType.CAPABILITY: SecurityLayer.SECURITY_FRAMEWORK,
-        SegmentType.TEMPORAL: SecurityLayer.SECURITY_FRAMEWORK,
-        SegmentType.HASH: SecurityLayer.IDENTITY_CORE,
-        SegmentType.SIGNATURE: SecurityLayer.CRYPTO_NUCLEUS,
-        SegmentType.KEY_DERIVATION: SecurityLayer.CRYPTO_NUCLEUS,
-        SegmentType.NONCE: SecurityLayer.ENTROPY_MATRIX,
-        SegmentType.ATTESTATION: SecurityLayer.IDENTITY_CORE,
-        SegmentType.REVOCATION: SecurityLayer.OUTER_SHELL,
+    LAYER_MAPPING = SEGMENT_LAYER_MAPPING
+
+    # Bytes of fresh randomness consumed per segment in bulk mode
+    BULK_RANDOM_BYTES = {
+        SegmentType.ENTROPY: 32,
+        SegmentType.POLICY: 64,
+        SegmentType.TEMPORAL: 4,
+        SegmentType.CAPABILITY: 32,
+        SegmentType.METADATA: 28,
     }
 
-    def __init__(self, security_level: SecurityLevel = SecurityLevel.STANDARD):
+    # Width of the random sort keys used by the bulk shuffle
+    SHUFFLE_KEY_BYTES = 8
+
+    # Signature segments signed between progress reports
+    PROGRESS_INTERVAL = 4096
+
+    def __init__(
+        self,
+        security_level: SecurityLevel = SecurityLevel.STANDARD,
+        bulk_generation: bool = True,
+        compact_helix: bool = False,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
         """
         Initialize DNA key generator.
 
         Args:
             security_level: Security level determining segment count
+            bulk_generation: If True, draw all entropy in one buffer and
+                             build, hash and shuffle segments as batch steps.
+                             If False, use the per-segment generation path.
+            compact_helix: If True, store generated keys in a columnar
+                           CompactDNAHelix instead of a list of segments.
+            progress_callback: Optional callable invoked as
+                               ``callback(stage, completed, total)`` while
+                               segments are generated and the key is assembled.
         """
         self.security_level = security_level
         self.segment_count = self.SEGMENT_COUNTS[security_level]
+        self.bulk_generation = bulk_generation
+        self.compact_helix = compact_helix
+        self.progress_callback = progress_callback
 
     def generate(
         self,
@@ -198,12 +240,11 @@ class DNAKeyGenerator:
         created = datetime.now(timezone.utc)
         expires = created + timedelta(days=validity_days)
 
-        # Generate DNA segments
-        segments = self._generate_segments(subject_id=subject_id, signing_key=signing_key)
-
-        # Create helix and compute checksum
-        helix = DNAHelix(segments=segments)
-        helix.compute_checksum()
+        # Generate DNA segments, create helix and compute checksums in one pass
+        helix = self._build_helix(subject_id=subject_id, signing_key=signing_key)
+        self._report_progress(GenerationStage.CHECKSUM, self.segment_count)
+        digests = compute_helix_digests(helix)
+        helix.checksum = digests.checksum
 
         # Create issuer info
         issuer_key, issuer_verify_key = generate_ed25519_keypair()
@@ -249,18 +290,19 @@ class DNAKeyGenerator:
         )
 
         # Sign the DNA key with issuer key
+        self._report_progress(GenerationStage.SIGNING, self.segment_count)
         key_data = self._serialize_for_signing(dna_key)
         issuer.issuer_signature = issuer_key.sign(key_data)
         
-        # Compute layer checksums
-        layer_checksums = self._compute_layer_checksums(segments)
-        dna_key.layer_checksums = layer_checksums
+        # Layer checksums come from the same single pass as the helix checksum
+        dna_key.layer_checksums = digests.copy_layer_checksums()
         
         # Calculate total lines (each segment represents one or more lines)
-        dna_key.total_lines = self._calculate_total_lines(segments)
+        dna_key.total_lines = self._calculate_total_lines(helix)
         
         # Calculate security score
         dna_key.calculate_security_score()
+        self._report_progress(GenerationStage.COMPLETE, self.segment_count)
 
         return dna_key
     
@@ -301,12 +343,11 @@ class DNAKeyGenerator:
         created = datetime.now(timezone.utc)
         expires = created + timedelta(days=validity_days)
 
-        # Generate DNA segments
-        segments = self._generate_segments(subject_id=subject_id, signing_key=signing_key)
-
-        # Create helix and compute checksum
-        helix = DNAHelix(segments=segments)
-        helix.compute_checksum()
+        # Generate DNA segments, create helix and compute checksums in one pass
+        helix = self._build_helix(subject_id=subject_id, signing_key=signing_key)
+        self._report_progress(GenerationStage.CHECKSUM, self.segment_count)
+        digests = compute_helix_digests(helix)
+        helix.checksum = digests.checksum
 
         # Create issuer info
         issuer_key, issuer_verify_key = generate_ed25519_keypair()
@@ -352,61 +393,38 @@ class DNAKeyGenerator:
         )
 
         # Sign the DNA key with issuer key
+        self._report_progress(GenerationStage.SIGNING, self.segment_count)
         key_data = self._serialize_for_signing(dna_key)
         issuer.issuer_signature = issuer_key.sign(key_data)
         
-        # Compute layer checksums
-        layer_checksums = self._compute_layer_checksums(segments)
-        dna_key.layer_checksums = layer_checksums
+        # Layer checksums come from the same single pass as the helix checksum
+        dna_key.layer_checksums = digests.copy_layer_checksums()
         
         # Calculate total lines
-        dna_key.total_lines = self._calculate_total_lines(segments)
+        dna_key.total_lines = self._calculate_total_lines(helix)
         
         # Calculate security score
         dna_key.calculate_security_score()
+        self._report_progress(GenerationStage.COMPLETE, self.segment_count)
 
         return DNAKeyWithSigningKey(
             dna_key=dna_key,
             signing_key_hex=signing_key_hex
         )
     
-    def _compute_layer_checksums(self, segments: List[DNASegment]) -> List[LayerChecksum]:
+    def _compute_layer_checksums(self, helix: Union[DNAHelix, CompactDNAHelix]) -> List[LayerChecksum]:
         """
         Compute checksums for each security layer.
         
         Args:
-            segments: All DNA segments
+            helix: Helix containing all DNA segments
             
         Returns:
             List of LayerChecksum objects for each layer
         """
-        layer_checksums = []
-        
-        # Group segments by layer
-        layer_segments: Dict[int, List[DNASegment]] = {1: [], 2: [], 3: [], 4: [], 5: []}
-        
-        for segment in segments:
-            layer = self.LAYER_MAPPING.get(segment.type, SecurityLayer.OUTER_SHELL)
-            layer_segments[layer.value].append(segment)
-        
-        # Compute checksum for each layer
-        for layer_num in range(1, 6):
-            segs = layer_segments[layer_num]
-            if segs:
-                hasher = hashlib.sha3_512()
-                for seg in sorted(segs, key=lambda s: s.position):
-                    hasher.update(seg.data)
-                
-                layer_checksums.append(LayerChecksum(
-                    layer=layer_num,
-                    algorithm="SHA3-512",
-                    checksum=hasher.hexdigest(),
-                    segment_count=len(segs)
-                ))
-        
-        return layer_checksums
+        return compute_helix_digests(helix).copy_layer_checksums()
     
-    def _calculate_total_lines(self, segments: List[DNASegment]) -> int:
+    def _calculate_total_lines(self, helix: Union[DNAHelix, CompactDNAHelix]) -> int:
         """
         Calculate total lines of security data.
         
@@ -414,19 +432,59 @@ class DNAKeyGenerator:
         A line is roughly 64 characters of mixed symbols/letters/numbers.
         
         Args:
-            segments: All DNA segments
+            helix: Helix containing all DNA segments
             
         Returns:
             Total number of lines
         """
-        total_bytes = sum(len(seg.data) for seg in segments)
+        total_bytes = helix.strand_length
         # Each "line" is approximately 64 bytes of data
         # But we also count the hash representations
-        lines_from_data = total_bytes // 32  # ~2 lines per segment
-        lines_from_hashes = len(segments)    # 1 line per hash
+        lines_from_data = total_bytes // 32      # ~2 lines per segment
+        lines_from_hashes = helix.segment_count  # 1 line per hash
         
         return lines_from_data + lines_from_hashes
 
+    def _report_progress(self, stage: GenerationStage, completed: int) -> None:
+        """
+        Forward generation progress to the configured callback.
+
+        Args:
+            stage: Current generation stage
+            completed: Segments completed so far
+        """
+        if self.progress_callback is not None:
+            self.progress_callback(stage, completed, self.segment_count)
+
+    def _build_helix(self, subject_id: str, signing_key: Any) -> Union[DNAHelix, CompactDNAHelix]:
+        """
+        Generate segments and assemble them into a helix.
+
+        Args:
+            subject_id: Subject identifier
+            signing_key: Signing key for signature segments
+
+        Returns:
+            DNAHelix, or CompactDNAHelix if compact_helix is enabled
+        """
+        if not self.compact_helix:
+            return DNAHelix(segments=self._generate_segments(subject_id, signing_key))
+
+        if not self.bulk_generation:
+            return CompactDNAHelix.from_segments(self._generate_segments(subject_id, signing_key))
+
+        order, types, data, hashes = self._generate_bulk_columns(subject_id, signing_key)
+        offsets = array("Q", [0])
+        offsets.extend(accumulate(len(data[p]) for p in order))
+
+        return CompactDNAHelix(
+            positions=array("I", order),
+            type_codes=bytes(ord(types[p].value) for p in order),
+            offsets=offsets,
+            data=b"".join([data[p] for p in order]),
+            hashes=b"".join([hashes[p] for p in order]),
+        )
+
     def _generate_segments(self, subject_id: str, signing_key: Any) -> List[DNASegment]:
         """
         Generate all DNA segments according to distribution.
@@ -438,11 +496,20 @@ class DNAKeyGenerator:
         Returns:
             List of DNASegment objects
         """
-        segments = []
-        position = 0
+        if self.bulk_generation:
+            return self._generate_segments_bulk(subject_id, signing_key)
+        return self._generate_segments_sequential(subject_id, signing_key)
 
-        # Calculate segment counts per type
-        # Use explicit calculation to ensure we hit exact count
+    def _calculate_type_counts(self) -> Dict[SegmentType, int]:
+        """
+        Calculate segment counts per type.
+
+        Uses explicit calculation to ensure we hit the exact count:
+        the last type in the distribution receives the remainder.
+
+        Returns:
+            Mapping of segment type to number of segments
+        """
         counts = {}
         total_assigned = 0
         distributions = list(self.SEGMENT_DISTRIBUTION.items())
@@ -457,17 +524,36 @@ class DNAKeyGenerator:
         last_type, _ = distributions[-1]
         counts[last_type] = self.segment_count - total_assigned
 
+        return counts
+
+    def _generate_segments_sequential(self, subject_id: str, signing_key: Any) -> List[DNASegment]:
+        """
+        Generate segments one at a time (original generation path).
+
+        Args:
+            subject_id: Subject identifier
+            signing_key: Signing key for signature segments
+
+        Returns:
+            List of DNASegment objects
+        """
+        segments = []
+        position = 0
+        counts = self._calculate_type_counts()
+
         # Generate entropy segments (40%)
         for _ in range(counts[SegmentType.ENTROPY]):
             data = secrets.token_bytes(32)
             segments.append(DNASegment(position=position, type=SegmentType.ENTROPY, data=data))
             position += 1
+        self._report_progress(GenerationStage.SEGMENTS, position)
 
         # Generate policy segments (10%)
         for i in range(counts[SegmentType.POLICY]):
             data = self._generate_policy_data(i)
             segments.append(DNASegment(position=position, type=SegmentType.POLICY, data=data))
             position += 1
+        self._report_progress(GenerationStage.SEGMENTS, position)
 
         # Generate hash segments (5%)
         identity_hash = hashlib.sha3_512(subject_id.encode()).digest()
@@ -479,36 +565,189 @@ class DNAKeyGenerator:
 
             segments.append(DNASegment(position=position, type=SegmentType.HASH, data=data))
             position += 1
+        self._report_progress(GenerationStage.SEGMENTS, position)
 
         # Generate temporal segments (5%)
         for i in range(counts[SegmentType.TEMPORAL]):
             data = self._generate_temporal_data(i)
             segments.append(DNASegment(position=position, type=SegmentType.TEMPORAL, data=data))
             position += 1
+        self._report_progress(GenerationStage.SEGMENTS, position)
 
         # Generate capability segments (20%)
         for i in range(counts[SegmentType.CAPABILITY]):
             data = self._generate_capability_data(i)
             segments.append(DNASegment(position=position, type=SegmentType.CAPABILITY, data=data))
             position += 1
+        self._report_progress(GenerationStage.SEGMENTS, position)
 
         # Generate signature segments (10%)
         for i in range(counts[SegmentType.SIGNATURE]):
             data = self._generate_signature_data(i, signing_key)
             segments.append(DNASegment(position=position, type=SegmentType.SIGNATURE, data=data))
             position += 1
+        self._report_progress(GenerationStage.SEGMENTS, position)
 
         # Generate metadata segments (10%)
         for i in range(counts[SegmentType.METADATA]):
             data = self._generate_metadata(i)
             segments.append(DNASegment(position=position, type=SegmentType.METADATA, data=data))
             position += 1
+        self._report_progress(GenerationStage.SEGMENTS, position)
 
         # Cryptographically shuffle segments for security
+        self._report_progress(GenerationStage.SHUFFLING, position)
         segments = self._cryptographic_shuffle(segments)
 
         return segments
 
+    def _generate_segments_bulk(self, subject_id: str, signing_key: Any) -> List[DNASegment]:
+        """
+        Generate all segments as batch steps.
+
+        Args:
+            subject_id: Subject identifier
+            signing_key: Signing key for signature segments
+
+        Returns:
+            List of DNASegment objects in shuffled order
+        """
+        order, types, data, hashes = self._generate_bulk_columns(subject_id, signing_key)
+
+        return [
+            DNASegment(position=position, type=types[position], data=data[position], segment_hash=hashes[position].hex())
+            for position in order
+        ]
+
+    def _generate_bulk_columns(
+        self, subject_id: str, signing_key: Any
+    ) -> Tuple[List[int], List[SegmentType], List[bytes], List[bytes]]:
+        """
+        Generate segment columns as batch steps.
+
+        Produces the same segment layout as the sequential path (same
+        type order, data layout and position assignment) but draws all
+        randomness from a single os.urandom buffer, hashes segments in
+        one pass and shuffles via random sort keys instead of one
+        CSPRNG call per swap.
+
+        Args:
+            subject_id: Subject identifier
+            signing_key: Signing key for signature segments
+
+        Returns:
+            Tuple of (shuffled position order, types, data, raw hashes),
+            where types, data and hashes are indexed by position
+        """
+        counts = self._calculate_type_counts()
+        n = self.segment_count
+
+        # Draw all entropy in one go: per-type random payloads + shuffle keys
+        random_total = sum(
+            counts[seg_type] * size for seg_type, size in self.BULK_RANDOM_BYTES.items()
+        )
+        pool = os.urandom(random_total + n * self.SHUFFLE_KEY_BYTES)
+        offset = 0
+
+        def take(count: int, size: int) -> List[bytes]:
+            nonlocal offset
+            chunk = [pool[i:i + size] for i in range(offset, offset + count * size, size)]
+            offset += count * size
+            return chunk
+
+        # Segment data per type, in the same order as the sequential path
+        blocks: List[Tuple[SegmentType, List[bytes]]] = []
+        generated = 0
+
+        def add_block(seg_type: SegmentType, block: List[bytes]) -> None:
+            nonlocal generated
+            blocks.append((seg_type, block))
+            generated += len(block)
+            self._report_progress(GenerationStage.SEGMENTS, generated)
+
+        # Entropy segments (40%)
+        add_block(SegmentType.ENTROPY, take(counts[SegmentType.ENTROPY], 32))
+
+        # Policy segments (10%)
+        policy_random = take(counts[SegmentType.POLICY], 64)
+        add_block(
+            SegmentType.POLICY,
+            [rnd + i.to_bytes(4, "big") for i, rnd in enumerate(policy_random)],
+        )
+
+        # Hash segments (5%) - split identity hash across segments
+        identity_hash = hashlib.sha3_512(subject_id.encode()).digest()
+        hash_count = counts[SegmentType.HASH]
+        hash_len = len(identity_hash)
+        add_block(
+            SegmentType.HASH,
+            [
+                identity_hash[(i * hash_len) // hash_count:((i + 1) * hash_len) // hash_count]
+                for i in range(hash_count)
+            ],
+        )
+
+        # Temporal segments (5%) - one timestamp for the whole batch
+        timestamp = int(datetime.now(timezone.utc).timestamp()).to_bytes(8, "big")
+        temporal_random = take(counts[SegmentType.TEMPORAL], 4)
+        add_block(
+            SegmentType.TEMPORAL,
+            [timestamp + i.to_bytes(4, "big") + rnd for i, rnd in enumerate(temporal_random)],
+        )
+
+        # Capability segments (20%) - flags and random data from the same pool
+        capability_random = take(counts[SegmentType.CAPABILITY], 32)
+        add_block(
+            SegmentType.CAPABILITY,
+            [rnd + i.to_bytes(4, "big") for i, rnd in enumerate(capability_random)],
+        )
+
+        # Signature segments (10%) - Ed25519 is deterministic per message
+        # and is the slowest step, so report progress in chunks
+        sign = signing_key.sign
+        signature_count = counts[SegmentType.SIGNATURE]
+        signatures: List[bytes] = []
+        for start in range(0, signature_count, self.PROGRESS_INTERVAL):
+            signatures.extend(
+                sign(f"segment-{i}".encode())[:32] + i.to_bytes(4, "big")
+                for i in range(start, min(start + self.PROGRESS_INTERVAL, signature_count))
+            )
+            if len(signatures) < signature_count:
+                self._report_progress(GenerationStage.SEGMENTS, generated + len(signatures))
+        add_block(SegmentType.SIGNATURE, signatures)
+
+        # Metadata segments (10%)
+        metadata_random = take(counts[SegmentType.METADATA], 28)
+        add_block(
+            SegmentType.METADATA,
+            [rnd + i.to_bytes(4, "big") for i, rnd in enumerate(metadata_random)],
+        )
+
+        # Batch-hash every segment (same construction as DNASegment._compute_hash)
+        self._report_progress(GenerationStage.HASHING, n)
+        types: List[SegmentType] = []
+        data: List[bytes] = []
+        hashes: List[bytes] = []
+        position = 0
+        for seg_type, block in blocks:
+            type_hasher = hashlib.sha3_256(seg_type.value.encode())
+            for seg_data in block:
+                hasher = type_hasher.copy()
+                hasher.update(position.to_bytes(4, "big"))
+                hasher.update(seg_data)
+                hashes.append(hasher.digest())
+                position += 1
+            types.extend([seg_type] * len(block))
+            data.extend(block)
+
+        # Shuffle by sorting on uniformly random 64-bit keys ("<Q" is
+        # always 8 bytes, unlike the platform-dependent array("Q"))
+        self._report_progress(GenerationStage.SHUFFLING, n)
+        sort_keys = struct.unpack_from(f"<{n}Q", pool, offset)
+        order = sorted(range(n), key=sort_keys.__getitem__)
+
+        return order, types, data, hashes
+
     def _generate_policy_data(self, index: int) -> bytes:
         """Generate policy segment data."""
         # For now, generate random policy data
@@ -574,12 +813,7 @@ class DNAKeyGenerator:
         Returns:
             Bytes to sign
         """
-        # Create deterministic representation
-        data = f"{dna_key.key_id}:{dna_key.created_timestamp.isoformat()}"
-        data += f":{dna_key.subject.subject_id}"
-        data += f":{dna_key.dna_helix.checksum}"
-
-        return data.encode()
+        return dna_key.issuer_signing_payload()
 
     def _generate_test_keypair(self):
         """Generate keypair for testing (not for production use)."""
@@ -69,10 +69,13 @@ Segment Types (Digital "Bases"):
 
 import hashlib
 import secrets
+from array import array
+from collections.abc import Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from itertools import accumulate
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 
 class SegmentType(Enum):
@@ -134,7 +137,23 @@ class SecurityLayer(Enum):
     CRYPTO_NUCLEUS = 5   # Layer 5: Keys, salts, signatures, recovery (10%)
 
 
-@dataclass
+# Mapping of segment types to security layers (unlisted types -> OUTER_SHELL)
+SEGMENT_LAYER_MAPPING = {
+    SegmentType.METADATA: SecurityLayer.OUTER_SHELL,
+    SegmentType.ENTROPY: SecurityLayer.ENTROPY_MATRIX,
+    SegmentType.POLICY: SecurityLayer.SECURITY_FRAMEWORK,
+    SegmentType.CAPABILITY: SecurityLayer.SECURITY_FRAMEWORK,
+    SegmentType.TEMPORAL: SecurityLayer.SECURITY_FRAMEWORK,
+    SegmentType.HASH: SecurityLayer.IDENTITY_CORE,
+    SegmentType.SIGNATURE: SecurityLayer.CRYPTO_NUCLEUS,
+    SegmentType.KEY_DERIVATION: SecurityLayer.CRYPTO_NUCLEUS,
+    SegmentType.NONCE: SecurityLayer.ENTROPY_MATRIX,
+    SegmentType.ATTESTATION: SecurityLayer.IDENTITY_CORE,
+    SegmentType.REVOCATION: SecurityLayer.OUTER_SHELL,
+}
+
+
+@dataclass(init=False)
 class DNASegment:
     """
     A single DNA segment (digital base).
@@ -148,10 +167,31 @@ class DNASegment:
     data: bytes
     segment_hash: Optional[str] = None
 
-    def __post_init__(self):
-        """Compute segment hash if not provided."""
-        if self.segment_hash is None:
-            self.segment_hash = self._compute_hash()
+    # Number of field reassignments on existing segments; cached helix
+    # digests (see server.crypto.helix_checksum) are only valid while
+    # this is unchanged
+    mutations: ClassVar[int] = 0
+
+    def __init__(
+        self,
+        position: int,
+        type: SegmentType,
+        data: bytes,
+        segment_hash: Optional[str] = None,
+    ):
+        """
+        Initialize a segment, computing its hash if not provided.
+
+        Fields are stored directly so that only later reassignments
+        go through __setattr__ and count as mutations.
+        """
+        self.__dict__.update(position=position, type=type, data=data, segment_hash=segment_hash)
+        if segment_hash is None:
+            self.__dict__["segment_hash"] = self._compute_hash()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        DNASegment.mutations += 1
 
     def _compute_hash(self) -> str:
         """Compute SHA3-256 hash of segment data."""
@@ -332,18 +372,95 @@ class LayerChecksum:
     segment_count: int  # Number of segments in this layer
 
 
+class SegmentList(list):
+    """
+    List of helix segments that counts its own modifications.
+
+    The version changes whenever a segment is added, removed, replaced
+    or reordered, which lets cached helix digests be validated in O(1).
+    """
+
+    version = 0
+
+    def _modified(self) -> None:
+        self.version += 1
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._modified()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._modified()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._modified()
+        return result
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self._modified()
+        return result
+
+    def append(self, segment):
+        super().append(segment)
+        self._modified()
+
+    def extend(self, segments):
+        super().extend(segments)
+        self._modified()
+
+    def insert(self, index, segment):
+        super().insert(index, segment)
+        self._modified()
+
+    def pop(self, index=-1):
+        segment = super().pop(index)
+        self._modified()
+        return segment
+
+    def remove(self, segment):
+        super().remove(segment)
+        self._modified()
+
+    def clear(self):
+        super().clear()
+        self._modified()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._modified()
+
+    def reverse(self):
+        super().reverse()
+        self._modified()
+
+
 @dataclass
 class DNAHelix:
     """
     The DNA helix structure containing all segments.
 
     This is the core container for the authentication data,
-    analogous to a chromosome in biological DNA.
+    analogous to a chromosome in biological DNA. Assigned segment
+    lists are copied into a SegmentList.
     """
 
     segments: List[DNASegment] = field(default_factory=list)
     checksum: Optional[str] = None
 
+    # Digests with the segment list, its version and the segment mutation
+    # count they were computed at (see server.crypto.helix_checksum)
+    _digest_cache: Optional[Tuple[SegmentList, int, int, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "segments" and type(value) is not SegmentList:
+            value = SegmentList(value)
+        object.__setattr__(self, name, value)
+
     @property
     def strand_length(self) -> int:
         """Total length of all segment data."""
@@ -358,40 +475,258 @@ class DNAHelix:
         """
         Compute SHA3-512 checksum of all segments.
 
+        Segments are hashed in position order. The result is cached
+        until the segment list or a segment field is modified.
+
         Returns:
             Hexadecimal checksum string
         """
-        hasher = hashlib.sha3_512()
-
-        # Sort segments by position for deterministic checksum
-        sorted_segments = sorted(self.segments, key=lambda s: s.position)
-
-        for segment in sorted_segments:
-            hasher.update(segment.type.value.encode())
-            hasher.update(segment.position.to_bytes(4, "big"))
-            hasher.update(segment.data)
-            if segment.segment_hash:
-                hasher.update(segment.segment_hash.encode())
+        from server.crypto.helix_checksum import get_checksum_engine
 
-        self.checksum = hasher.hexdigest()
+        self.checksum = get_checksum_engine().compute(self).checksum
         return self.checksum
 
     def verify_checksum(self) -> bool:
         """Verify the checksum matches current segments."""
-        if self.checksum is None:
-            return False
+        from server.crypto.helix_checksum import get_checksum_engine
+
+        return get_checksum_engine().verify(self)
+
+    def get_segments_by_type(self, segment_type: SegmentType) -> List[DNASegment]:
+        """Get all segments of a specific type."""
+        return [seg for seg in self.segments if seg.type == segment_type]
+
+
+class CompactSegmentView(Sequence):
+    """
+    Read-only sequence of DNASegment views over a CompactDNAHelix.
+
+    Segments are materialized lazily on access and are not retained,
+    so modifying a returned segment does not change the helix.
+    """
 
-        stored_checksum = self.checksum
-        computed_checksum = self.compute_checksum()
+    def __init__(self, helix: "CompactDNAHelix"):
+        self._helix = helix
 
-        # Restore the original checksum for future verifications
-        self.checksum = stored_checksum
+    def __len__(self) -> int:
+        return self._helix.segment_count
 
-        return secrets.compare_digest(computed_checksum, stored_checksum)
+    def __getitem__(self, index: Union[int, slice]) -> Union[DNASegment, List[DNASegment]]:
+        if isinstance(index, slice):
+            return [self._helix.segment_at(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        return self._helix.segment_at(index)
+
+    def __iter__(self) -> Iterator[DNASegment]:
+        segment_at = self._helix.segment_at
+        for i in range(len(self)):
+            yield segment_at(i)
+
+
+class CompactDNAHelix:
+    """
+    Columnar, array-backed DNA helix.
+
+    Stores the helix as contiguous columns instead of one DNASegment
+    object per segment:
+    - positions: array of segment positions (uint32)
+    - type_codes: one byte per segment holding the SegmentType value
+    - offsets: array of n+1 offsets into the shared data buffer
+    - data: single buffer with all segment data concatenated
+    - hashes: raw SHA3-256 segment digests (32 bytes each)
+
+    Provides the same read interface as DNAHelix. DNASegment objects
+    are only created when segments are accessed. Columns may also be
+    memoryviews over a packed buffer (see DNAKeySerializer.deserialize_packed).
+
+    Columns must not be modified after construction: the helix is
+    treated as immutable, so its checksum digests are computed once
+    and cached (see server.crypto.helix_checksum).
+    """
+
+    HASH_SIZE = 32
+
+    # Type code byte -> SegmentType
+    TYPE_BY_CODE = {ord(seg_type.value): seg_type for seg_type in SegmentType}
+
+    def __init__(
+        self,
+        positions: array,
+        type_codes: bytes,
+        offsets: array,
+        data: bytes,
+        hashes: bytes,
+        checksum: Optional[str] = None,
+    ):
+        """
+        Initialize a compact helix from prebuilt columns.
+
+        Args:
+            positions: Segment positions (array or memoryview of 'I')
+            type_codes: One SegmentType value byte per segment
+            offsets: Data offsets (array or memoryview of 'Q', segment_count + 1 entries)
+            data: Concatenated segment data
+            hashes: Concatenated raw segment digests
+            checksum: Optional existing helix checksum
+
+        Raises:
+            ValueError: If column lengths are inconsistent
+        """
+        count = len(positions)
+        if len(type_codes) != count or len(offsets) != count + 1:
+            raise ValueError("Column lengths do not match segment count")
+        if len(hashes) != count * self.HASH_SIZE:
+            raise ValueError("Hash column length does not match segment count")
+        if offsets[-1] != len(data):
+            raise ValueError("Data buffer length does not match offsets")
+
+        self.positions = positions
+        self.type_codes = type_codes
+        self.offsets = offsets
+        self.data = data
+        self.hashes = hashes
+        self.checksum = checksum
+
+        # Cached HelixDigests (set by HelixChecksumEngine)
+        self._digests = None
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[DNASegment], checksum: Optional[str] = None) -> "CompactDNAHelix":
+        """
+        Build a compact helix from DNASegment objects.
+
+        Args:
+            segments: Segments in storage order
+            checksum: Optional existing helix checksum
+
+        Returns:
+            CompactDNAHelix with the same content
+
+        Raises:
+            ValueError: If a segment hash is not a SHA3-256 hex digest
+        """
+        positions = array("I")
+        type_codes = bytearray()
+        lengths = []
+        chunks = []
+        hashes = bytearray()
+
+        for seg in segments:
+            if seg.segment_hash is None or len(seg.segment_hash) != cls.HASH_SIZE * 2:
+                raise ValueError(f"Segment {seg.position} has no SHA3-256 segment hash")
+            positions.append(seg.position)
+            type_codes += seg.type.value.encode()
+            lengths.append(len(seg.data))
+            chunks.append(seg.data)
+            hashes += bytes.fromhex(seg.segment_hash)
+
+        offsets = array("Q", [0])
+        offsets.extend(accumulate(lengths))
+
+        return cls(
+            positions=positions,
+            type_codes=bytes(type_codes),
+            offsets=offsets,
+            data=b"".join(chunks),
+            hashes=bytes(hashes),
+            checksum=checksum,
+        )
+
+    @classmethod
+    def from_helix(cls, helix: "DNAHelix") -> "CompactDNAHelix":
+        """Convert a DNAHelix to its compact representation."""
+        return cls.from_segments(helix.segments, checksum=helix.checksum)
+
+    def to_helix(self) -> "DNAHelix":
+        """Materialize a list-backed DNAHelix with the same content."""
+        return DNAHelix(segments=list(self.segments), checksum=self.checksum)
+
+    @property
+    def segments(self) -> CompactSegmentView:
+        """Lazy, read-only view of the segments."""
+        return CompactSegmentView(self)
+
+    @property
+    def strand_length(self) -> int:
+        """Total length of all segment data."""
+        return len(self.data)
+
+    @property
+    def segment_count(self) -> int:
+        """Total number of segments."""
+        return len(self.positions)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the columns in bytes."""
+        return (
+            len(self.positions) * self.positions.itemsize
+            + len(self.type_codes)
+            + len(self.offsets) * self.offsets.itemsize
+            + len(self.data)
+            + len(self.hashes)
+        )
+
+    def segment_at(self, index: int) -> DNASegment:
+        """
+        Materialize the segment stored at a given index.
+
+        Args:
+            index: Storage index (not position)
+
+        Returns:
+            DNASegment view of the stored segment
+        """
+        hash_start = index * self.HASH_SIZE
+        return DNASegment(
+            position=self.positions[index],
+            type=self.TYPE_BY_CODE[self.type_codes[index]],
+            data=bytes(self.data[self.offsets[index]:self.offsets[index + 1]]),
+            segment_hash=self.hashes[hash_start:hash_start + self.HASH_SIZE].hex(),
+        )
+
+    def type_counts(self) -> Dict[SegmentType, int]:
+        """Count segments per type directly on the type column."""
+        codes = self.type_codes if isinstance(self.type_codes, bytes) else bytes(self.type_codes)
+        counts = {}
+        for seg_type in SegmentType:
+            count = codes.count(seg_type.value.encode())
+            if count:
+                counts[seg_type] = count
+        return counts
+
+    def indices_by_type(self, segment_type: SegmentType) -> List[int]:
+        """Get storage indices of all segments of a specific type."""
+        code = ord(segment_type.value)
+        return [i for i, c in enumerate(self.type_codes) if c == code]
 
     def get_segments_by_type(self, segment_type: SegmentType) -> List[DNASegment]:
         """Get all segments of a specific type."""
-        return [seg for seg in self.segments if seg.type == segment_type]
+        return [self.segment_at(i) for i in self.indices_by_type(segment_type)]
+
+    def compute_checksum(self) -> str:
+        """
+        Compute SHA3-512 checksum of all segments.
+
+        Produces the same value as DNAHelix.compute_checksum for the
+        same segments. The result is cached on the helix.
+
+        Returns:
+            Hexadecimal checksum string
+        """
+        from server.crypto.helix_checksum import get_checksum_engine
+
+        self.checksum = get_checksum_engine().compute(self).checksum
+        return self.checksum
+
+    def verify_checksum(self) -> bool:
+        """Verify the checksum matches current segments (O(1) once cached)."""
+        from server.crypto.helix_checksum import get_checksum_engine
+
+        return get_checksum_engine().verify(self)
 
 
 @dataclass
@@ -426,7 +761,7 @@ class DNAKey:
 
     issuer: Optional[IssuerInfo] = None
     subject: Optional[SubjectInfo] = None
-    dna_helix: DNAHelix = field(default_factory=DNAHelix)
+    dna_helix: Union[DNAHelix, CompactDNAHelix] = field(default_factory=DNAHelix)
     cryptographic_material: Optional[CryptographicMaterial] = None
     policy_binding: Optional[PolicyBinding] = None
     visual_dna: VisualDNA = field(default_factory=VisualDNA)
@@ -448,6 +783,19 @@ class DNAKey:
             key_hash = hashlib.sha256(key_data.encode()).hexdigest()[:32]
             self.key_id = f"dna-{key_hash}"
 
+    def issuer_signing_payload(self) -> bytes:
+        """
+        Get the deterministic bytes covered by the issuer signature.
+
+        Returns:
+            Bytes signed by the issuer (key ID, creation time, subject, helix checksum)
+        """
+        data = f"{self.key_id}:{self.created_timestamp.isoformat()}"
+        data += f":{self.subject.subject_id}"
+        data += f":{self.dna_helix.checksum}"
+
+        return data.encode()
+
     def is_expired(self) -> bool:
         """Check if the DNA key has expired."""
         if self.expires_timestamp is None:
@@ -480,8 +828,14 @@ class DNAKey:
 
         return True
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert DNA key to dictionary representation."""
+    def to_dict(self, include_segments: bool = True) -> Dict[str, Any]:
+        """
+        Convert DNA key to dictionary representation.
+
+        Args:
+            include_segments: If False, omit the per-segment list from the
+                              helix entry (used by the packed binary format)
+        """
         result = {
             "format_version": self.format_version,
             "key_id": self.key_id,
@@ -503,8 +857,9 @@ class DNAKey:
             "strand_length": self.dna_helix.strand_length,
             "segment_count": self.dna_helix.segment_count,
             "checksum": self.dna_helix.checksum,
-            "segments": [seg.to_dict() for seg in self.dna_helix.segments],
         }
+        if include_segments:
+            result["dna_helix"]["segments"] = [seg.to_dict() for seg in self.dna_helix.segments]
 
         if self.cryptographic_material:
             result["cryptographic_material"] = {
@@ -74,18 +74,23 @@ The verification system checks:
 
 import hashlib
 import secrets
-from dataclasses import dataclass
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from server.crypto.dna_key import (
+    CompactDNAHelix,
+    DNAHelix,
     DNAKey,
     DNASegment,
     SecurityLayer,
     SecurityLevel,
     SegmentType,
 )
+from server.crypto.helix_checksum import get_checksum_engine
 
 
 class VerificationResult(Enum):
@@ -146,6 +151,80 @@ class VerificationReport:
         }
 
 
+@dataclass
+class HelixIndex:
+    """
+    Per-type segment index and counts built in one pass over a helix.
+
+    Shared by all barriers of a verification run so the helix is
+    scanned once instead of once per barrier. For a CompactDNAHelix,
+    storage indices are kept and segments are materialized on demand.
+    """
+
+    helix: Union[DNAHelix, CompactDNAHelix]
+    type_counts: Dict[SegmentType, int] = field(default_factory=dict)
+    by_type: Dict[SegmentType, List[Any]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, helix: Union[DNAHelix, CompactDNAHelix]) -> "HelixIndex":
+        """
+        Build the index with a single pass over the helix.
+
+        Args:
+            helix: Helix to index
+
+        Returns:
+            HelixIndex for the helix
+        """
+        by_type: Dict[SegmentType, List[Any]] = {}
+
+        if isinstance(helix, CompactDNAHelix):
+            type_by_code = CompactDNAHelix.TYPE_BY_CODE
+            for i, code in enumerate(helix.type_codes):
+                by_type.setdefault(type_by_code[code], []).append(i)
+        else:
+            for seg in helix.segments:
+                by_type.setdefault(seg.type, []).append(seg)
+
+        type_counts = {seg_type: len(entries) for seg_type, entries in by_type.items()}
+        return cls(helix=helix, type_counts=type_counts, by_type=by_type)
+
+    def count(self, segment_type: SegmentType) -> int:
+        """Number of segments of a type."""
+        return self.type_counts.get(segment_type, 0)
+
+    def segments_of(self, segment_type: SegmentType, limit: Optional[int] = None) -> List[DNASegment]:
+        """
+        Get segments of a type in storage order.
+
+        Args:
+            segment_type: Segment type
+            limit: Maximum number of segments to return
+
+        Returns:
+            List of DNASegment objects
+        """
+        entries = self.by_type.get(segment_type, [])
+        if limit is not None:
+            entries = entries[:limit]
+        if isinstance(self.helix, CompactDNAHelix):
+            return [self.helix.segment_at(i) for i in entries]
+        return list(entries)
+
+    def missing_hash_count(self, segment_type: SegmentType) -> int:
+        """Number of segments of a type without a segment hash."""
+        if isinstance(self.helix, CompactDNAHelix):
+            # Compact helices always store a SHA3-256 digest per segment
+            return 0
+        return sum(1 for seg in self.by_type.get(segment_type, []) if not seg.segment_hash)
+
+    def leading_positions(self, limit: int) -> List[int]:
+        """Positions of the first segments in storage order."""
+        if isinstance(self.helix, CompactDNAHelix):
+            return list(self.helix.positions[:limit])
+        return [seg.position for seg in self.helix.segments[:limit]]
+
+
 class DNAVerifier:
     """
     Custom verification system for DNA authentication keys.
@@ -188,45 +267,120 @@ class DNAVerifier:
         SegmentType.TEMPORAL: (0.02, 0.08),     # 5% ± 3%
     }
     
-    def __init__(self, strict_mode: bool = True):
+    # Barrier execution order: cheap metadata checks first, hashing-heavy last
+    BARRIER_ORDER = (1, 2, 3, 9, 7, 4, 10, 11, 12, 6, 8, 5)
+    
+    # Barriers offloaded to the thread pool in parallel mode, and only when
+    # the helix digests are not cached. The checksum barrier is the only one
+    # that can overlap with the inline barriers: hashlib releases the GIL for
+    # buffers of 2 KiB or more, so this helps helices with large segments
+    # only. The entropy and signature barriers are pure Python and stay inline.
+    HEAVY_BARRIERS = (5,)
+    
+    # Barrier names and descriptions (used for skipped barriers)
+    BARRIER_INFO = {
+        1: ("Format Validation", "Validate DNA key structure matches specification"),
+        2: ("Version Check", "Verify format version is supported"),
+        3: ("Timestamp Validation", "Validate timestamps are within acceptable range"),
+        4: ("Issuer Verification", "Verify issuer signature is valid"),
+        5: ("Checksum Verification", "Verify helix checksum matches computed value"),
+        6: ("Entropy Validation", "Verify entropy quality meets minimum requirements"),
+        7: ("Policy Evaluation", "Verify all policy constraints are satisfied"),
+        8: ("Signature Verification", "Verify cryptographic signatures are valid"),
+        9: ("Revocation Check", "Verify key has not been revoked"),
+        10: ("Layer Integrity", "Verify all 5 security layers are intact"),
+        11: ("Segment Distribution", "Verify segment type ratios are correct"),
+        12: ("Cross-Reference Check", "Verify internal consistency of DNA key"),
+    }
+    
+    def __init__(
+        self,
+        strict_mode: bool = True,
+        fail_fast: bool = False,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+    ):
         """
         Initialize the DNA verifier.
         
         Args:
             strict_mode: If True, all barriers must pass. If False,
                         warnings are allowed.
+            fail_fast: If True, stop at the first FAILED barrier and
+                      report the remaining barriers as SKIPPED.
+            parallel: If True, hash an uncached helix in a thread pool
+                     while the other barriers run inline.
+            max_workers: Thread pool size for parallel mode (default: number
+                        of offloaded barriers)
         """
         self.strict_mode = strict_mode
+        self.fail_fast = fail_fast
+        self.parallel = parallel
+        self.max_workers = max_workers or len(self.HEAVY_BARRIERS)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.last_batch_stats: Optional["BatchVerificationStats"] = None
         # In-memory revocation list. 
         # TODO: Implement persistent storage backend (e.g., Redis, PostgreSQL)
         # Expected interface: add(key_id), remove(key_id), contains(key_id)
         self._revocation_list: set = set()
     
-    def verify(self, dna_key: DNAKey) -> VerificationReport:
+    def verify(
+        self,
+        dna_key: DNAKey,
+        fail_fast: Optional[bool] = None,
+        issuer_signature_valid: Optional[bool] = None,
+    ) -> VerificationReport:
         """
         Verify a DNA key through all 12 security barriers.
         
+        The helix is indexed once and shared by all barriers. Barriers
+        run cheapest-first; in fail-fast mode the first failure stops
+        the run, otherwise the full report is produced.
+        
         Args:
             dna_key: The DNA key to verify
+            fail_fast: Override the verifier's fail_fast setting
+            issuer_signature_valid: Result of a batched issuer signature
+                                    check (see verify_issuer_signatures)
             
         Returns:
             VerificationReport with detailed results
         """
-        barrier_results = []
-        
-        # Run all 12 barriers
-        barrier_results.append(self._barrier_1_format_validation(dna_key))
-        barrier_results.append(self._barrier_2_version_check(dna_key))
-        barrier_results.append(self._barrier_3_timestamp_validation(dna_key))
-        barrier_results.append(self._barrier_4_issuer_verification(dna_key))
-        barrier_results.append(self._barrier_5_checksum_verification(dna_key))
-        barrier_results.append(self._barrier_6_entropy_validation(dna_key))
-        barrier_results.append(self._barrier_7_policy_evaluation(dna_key))
-        barrier_results.append(self._barrier_8_signature_verification(dna_key))
-        barrier_results.append(self._barrier_9_revocation_check(dna_key))
-        barrier_results.append(self._barrier_10_layer_integrity(dna_key))
-        barrier_results.append(self._barrier_11_segment_distribution(dna_key))
-        barrier_results.append(self._barrier_12_cross_reference(dna_key))
+        fail_fast = self.fail_fast if fail_fast is None else fail_fast
+        index = HelixIndex.build(dna_key.dna_helix) if dna_key.dna_helix else None
+        barriers = self._barrier_functions(dna_key, index, issuer_signature_valid)
+        
+        results: Dict[int, VerificationBarrier] = {}
+        futures: Dict[int, Future] = {}
+        
+        if self.parallel and dna_key.dna_helix and not get_checksum_engine().is_cached(dna_key.dna_helix):
+            executor = self._get_executor()
+            for number in self.HEAVY_BARRIERS:
+                futures[number] = executor.submit(barriers[number])
+        
+        failed_early = False
+        for number in self.BARRIER_ORDER:
+            if number in futures:
+                continue
+            if fail_fast and failed_early:
+                break
+            results[number] = barriers[number]()
+            failed_early = results[number].result == VerificationResult.FAILED
+        
+        for number in self.BARRIER_ORDER:
+            future = futures.get(number)
+            if future is None:
+                continue
+            if fail_fast and failed_early:
+                future.cancel()
+                continue
+            results[number] = future.result()
+            failed_early = results[number].result == VerificationResult.FAILED
+        
+        barrier_results = [
+            results[number] if number in results else self._skipped_barrier(number)
+            for number in range(1, 13)
+        ]
         
         # Calculate results
         passed = sum(1 for b in barrier_results if b.result == VerificationResult.PASSED)
@@ -251,6 +405,54 @@ class DNAVerifier:
             barrier_results=barrier_results
         )
     
+    def _barrier_functions(
+        self,
+        dna_key: DNAKey,
+        index: Optional[HelixIndex],
+        issuer_signature_valid: Optional[bool] = None,
+    ) -> Dict[int, Callable[[], VerificationBarrier]]:
+        """Bind every barrier to the key and shared helix index."""
+        return {
+            1: lambda: self._barrier_1_format_validation(dna_key),
+            2: lambda: self._barrier_2_version_check(dna_key),
+            3: lambda: self._barrier_3_timestamp_validation(dna_key),
+            4: lambda: self._barrier_4_issuer_verification(dna_key, issuer_signature_valid),
+            5: lambda: self._barrier_5_checksum_verification(dna_key),
+            6: lambda: self._barrier_6_entropy_validation(dna_key, index),
+            7: lambda: self._barrier_7_policy_evaluation(dna_key),
+            8: lambda: self._barrier_8_signature_verification(dna_key, index),
+            9: lambda: self._barrier_9_revocation_check(dna_key),
+            10: lambda: self._barrier_10_layer_integrity(dna_key),
+            11: lambda: self._barrier_11_segment_distribution(dna_key, index),
+            12: lambda: self._barrier_12_cross_reference(dna_key, index),
+        }
+    
+    def _skipped_barrier(self, number: int) -> VerificationBarrier:
+        """Result for a barrier not run because of an earlier failure."""
+        name, description = self.BARRIER_INFO[number]
+        return VerificationBarrier(
+            barrier_number=number,
+            name=name,
+            description=description,
+            result=VerificationResult.SKIPPED,
+            details="Skipped after earlier barrier failure (fail-fast)",
+            time_ms=0.0
+        )
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get (lazily creating) the thread pool for offloaded barriers."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="dna-verify"
+            )
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the barrier thread pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
     def _barrier_1_format_validation(self, dna_key: DNAKey) -> VerificationBarrier:
         """Barrier 1: Validate DNA key format structure."""
         import time
@@ -389,8 +591,17 @@ class DNAVerifier:
             time_ms=(time.time() - start) * 1000
         )
     
-    def _barrier_4_issuer_verification(self, dna_key: DNAKey) -> VerificationBarrier:
-        """Barrier 4: Verify issuer signature."""
+    def _barrier_4_issuer_verification(
+        self, dna_key: DNAKey, issuer_signature_valid: Optional[bool] = None
+    ) -> VerificationBarrier:
+        """
+        Barrier 4: Verify issuer signature.
+        
+        Args:
+            dna_key: The DNA key to verify
+            issuer_signature_valid: Result of a prior (batched) cryptographic
+                                    check of the issuer signature, if any
+        """
         import time
         start = time.time()
         
@@ -426,6 +637,26 @@ class DNAVerifier:
                 time_ms=(time.time() - start) * 1000
             )
         
+        if issuer_signature_valid is False:
+            return VerificationBarrier(
+                barrier_number=4,
+                name="Issuer Verification",
+                description="Verify issuer signature is valid",
+                result=VerificationResult.FAILED,
+                details="Issuer signature does not verify",
+                time_ms=(time.time() - start) * 1000
+            )
+        
+        if issuer_signature_valid:
+            return VerificationBarrier(
+                barrier_number=4,
+                name="Issuer Verification",
+                description="Verify issuer signature is valid",
+                result=VerificationResult.PASSED,
+                details=f"Issuer: {dna_key.issuer.organization_id} (signature verified)",
+                time_ms=(time.time() - start) * 1000
+            )
+        
         return VerificationBarrier(
             barrier_number=4,
             name="Issuer Verification",
@@ -469,14 +700,17 @@ class DNAVerifier:
             time_ms=(time.time() - start) * 1000
         )
     
-    def _barrier_6_entropy_validation(self, dna_key: DNAKey) -> VerificationBarrier:
+    def _barrier_6_entropy_validation(
+        self, dna_key: DNAKey, index: Optional[HelixIndex] = None
+    ) -> VerificationBarrier:
         """Barrier 6: Validate entropy quality."""
         import time
         start = time.time()
         
-        entropy_segments = dna_key.dna_helix.get_segments_by_type(SegmentType.ENTROPY)
+        index = index or HelixIndex.build(dna_key.dna_helix)
+        entropy_count = index.count(SegmentType.ENTROPY)
         
-        if len(entropy_segments) == 0:
+        if entropy_count == 0:
             return VerificationBarrier(
                 barrier_number=6,
                 name="Entropy Validation",
@@ -487,13 +721,13 @@ class DNAVerifier:
             )
         
         # Sample entropy quality (check first 100 segments max)
-        sample_size = min(100, len(entropy_segments))
+        sample = index.segments_of(SegmentType.ENTROPY, limit=100)
         total_entropy = 0.0
         
-        for seg in entropy_segments[:sample_size]:
+        for seg in sample:
             total_entropy += self._estimate_entropy(seg.data)
         
-        avg_entropy = total_entropy / sample_size
+        avg_entropy = total_entropy / len(sample)
         
         if avg_entropy < self.MIN_ENTROPY_THRESHOLD:
             return VerificationBarrier(
@@ -510,7 +744,7 @@ class DNAVerifier:
             name="Entropy Validation",
             description="Verify entropy quality meets minimum requirements",
             result=VerificationResult.PASSED,
-            details=f"Entropy: {avg_entropy:.2f} bits/byte ({len(entropy_segments)} segments)",
+            details=f"Entropy: {avg_entropy:.2f} bits/byte ({entropy_count} segments)",
             time_ms=(time.time() - start) * 1000
         )
     
@@ -576,14 +810,17 @@ class DNAVerifier:
             time_ms=(time.time() - start) * 1000
         )
     
-    def _barrier_8_signature_verification(self, dna_key: DNAKey) -> VerificationBarrier:
+    def _barrier_8_signature_verification(
+        self, dna_key: DNAKey, index: Optional[HelixIndex] = None
+    ) -> VerificationBarrier:
         """Barrier 8: Verify cryptographic signatures."""
         import time
         start = time.time()
         
-        signature_segments = dna_key.dna_helix.get_segments_by_type(SegmentType.SIGNATURE)
+        index = index or HelixIndex.build(dna_key.dna_helix)
+        signature_count = index.count(SegmentType.SIGNATURE)
         
-        if len(signature_segments) == 0:
+        if signature_count == 0:
             return VerificationBarrier(
                 barrier_number=8,
                 name="Signature Verification",
@@ -594,10 +831,7 @@ class DNAVerifier:
             )
         
         # Verify segment hashes
-        invalid_count = 0
-        for seg in signature_segments:
-            if not seg.segment_hash:
-                invalid_count += 1
+        invalid_count = index.missing_hash_count(SegmentType.SIGNATURE)
         
         if invalid_count > 0:
             return VerificationBarrier(
@@ -614,7 +848,7 @@ class DNAVerifier:
             name="Signature Verification",
             description="Verify cryptographic signatures are valid",
             result=VerificationResult.PASSED,
-            details=f"{len(signature_segments)} signatures verified",
+            details=f"{signature_count} signatures verified",
             time_ms=(time.time() - start) * 1000
         )
     
@@ -682,7 +916,9 @@ class DNAVerifier:
             time_ms=(time.time() - start) * 1000
         )
     
-    def _barrier_11_segment_distribution(self, dna_key: DNAKey) -> VerificationBarrier:
+    def _barrier_11_segment_distribution(
+        self, dna_key: DNAKey, index: Optional[HelixIndex] = None
+    ) -> VerificationBarrier:
         """Barrier 11: Verify segment type distribution is correct."""
         import time
         start = time.time()
@@ -699,9 +935,8 @@ class DNAVerifier:
             )
         
         # Count segments by type
-        type_counts = {}
-        for seg in dna_key.dna_helix.segments:
-            type_counts[seg.type] = type_counts.get(seg.type, 0) + 1
+        index = index or HelixIndex.build(dna_key.dna_helix)
+        type_counts = index.type_counts
         
         # Check distribution
         warnings = []
@@ -729,17 +964,19 @@ class DNAVerifier:
             time_ms=(time.time() - start) * 1000
         )
     
-    def _barrier_12_cross_reference(self, dna_key: DNAKey) -> VerificationBarrier:
+    def _barrier_12_cross_reference(
+        self, dna_key: DNAKey, index: Optional[HelixIndex] = None
+    ) -> VerificationBarrier:
         """Barrier 12: Cross-reference internal consistency."""
         import time
         start = time.time()
         
+        index = index or HelixIndex.build(dna_key.dna_helix)
         issues = []
         
         # Check subject hash consistency
         if dna_key.subject:
-            hash_segments = dna_key.dna_helix.get_segments_by_type(SegmentType.HASH)
-            if not hash_segments:
+            if index.count(SegmentType.HASH) == 0:
                 issues.append("No hash segments for subject verification")
         
         # Check crypto material consistency
@@ -751,7 +988,7 @@ class DNAVerifier:
                 issues.append("Missing public key")
         
         # Check position continuity (sample check)
-        positions = sorted([seg.position for seg in dna_key.dna_helix.segments[:1000]])
+        positions = sorted(index.leading_positions(1000))
         if positions:
             # Check for duplicates
             if len(positions) != len(set(positions)):
@@ -776,6 +1013,80 @@ class DNAVerifier:
             time_ms=(time.time() - start) * 1000
         )
     
+    def verify_many(
+        self,
+        keys: Iterable[Union[DNAKey, bytes]],
+        workers: int = 1,
+        chunk_size: int = 16,
+        fail_fast: Optional[bool] = None,
+    ) -> Iterator[VerificationReport]:
+        """
+        Verify many DNA keys, yielding reports as they finish.
+        
+        Keys may be DNAKey objects or serialized keys (CBOR or packed).
+        Work is split into chunks; each chunk is deserialized once and
+        its issuer signatures are checked before the barriers run. All
+        keys are checked against a snapshot of the revocation list taken
+        when the run starts. With workers > 1, chunks are spread across
+        a process pool (DNAKey objects are shipped in the packed format)
+        and reports are yielded in completion order.
+        
+        Throughput is tracked in last_batch_stats while the run progresses;
+        each key counts its helix strand length whether it was passed as a
+        DNAKey or serialized.
+        
+        Args:
+            keys: DNA keys or serialized keys
+            workers: Number of worker processes (1 = verify in-process)
+            chunk_size: Keys per work item
+            fail_fast: Override the verifier's fail_fast setting
+            
+        Yields:
+            VerificationReport for each key
+        """
+        fail_fast = self.fail_fast if fail_fast is None else fail_fast
+        revoked = frozenset(self._revocation_list)
+        stats = BatchVerificationStats()
+        self.last_batch_stats = stats
+        
+        if workers <= 1:
+            snapshot_verifier = DNAVerifier(strict_mode=self.strict_mode, fail_fast=fail_fast)
+            snapshot_verifier._revocation_list = set(revoked)
+            for chunk in _chunked(keys, chunk_size):
+                for report, size in _verify_chunk(snapshot_verifier, chunk):
+                    stats.record(size)
+                    yield report
+            return
+        
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        
+        max_in_flight = workers * 2
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_batch_worker_init,
+            initargs=(revoked, self.strict_mode, fail_fast),
+        ) as executor:
+            pending = set()
+            chunks = _chunked((_to_wire(key) for key in keys), chunk_size)
+            exhausted = False
+            
+            while pending or not exhausted:
+                while not exhausted and len(pending) < max_in_flight:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    pending.add(executor.submit(_batch_worker_verify, chunk))
+                
+                if not pending:
+                    break
+                
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for report, size in future.result():
+                        stats.record(size)
+                        yield report
+    
     def revoke_key(self, key_id: str) -> None:
         """
         Add a key to the revocation list.
@@ -807,6 +1118,166 @@ class DNAVerifier:
         return key_id in self._revocation_list
 
 
+@dataclass
+class BatchVerificationStats:
+    """Throughput statistics for a verify_many run."""
+    
+    keys_verified: int = 0
+    bytes_verified: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    elapsed_seconds: float = 0.0
+    
+    def record(self, size: int) -> None:
+        """Record one verified key of the given size in bytes."""
+        self.keys_verified += 1
+        self.bytes_verified += size
+        self.elapsed_seconds = time.perf_counter() - self.started_at
+    
+    @property
+    def keys_per_second(self) -> float:
+        """Keys verified per second."""
+        return self.keys_verified / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+    
+    @property
+    def mb_per_second(self) -> float:
+        """Megabytes of helix strand data verified per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_verified / (1024 * 1024) / self.elapsed_seconds
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "keys_verified": self.keys_verified,
+            "bytes_verified": self.bytes_verified,
+            "elapsed_seconds": self.elapsed_seconds,
+            "keys_per_second": self.keys_per_second,
+            "mb_per_second": self.mb_per_second,
+        }
+
+
+def verify_issuer_signatures(keys: List[DNAKey]) -> List[Optional[bool]]:
+    """
+    Check issuer signatures for a list of keys.
+    
+    Each key carries its own issuer public key, so every signature is
+    verified individually; none of the available Ed25519 backends
+    offers batch verification.
+    
+    Args:
+        keys: DNA keys to check
+        
+    Returns:
+        One entry per key: True/False for a checked signature, None if
+        the key has no issuer signature to check
+    """
+    from server.crypto.signatures import Ed25519VerifyKey
+    
+    results: List[Optional[bool]] = [None] * len(keys)
+    
+    for i, key in enumerate(keys):
+        issuer = key.issuer
+        if issuer is None or not issuer.issuer_signature or key.subject is None:
+            continue
+        if len(issuer.issuer_signature) != DNAVerifier.EXPECTED_SIGNATURE_LENGTH:
+            continue
+        try:
+            verify_key = Ed25519VerifyKey(issuer.issuer_public_key)
+        except ValueError:
+            results[i] = False
+            continue
+        results[i] = verify_key.verify(key.issuer_signing_payload(), issuer.issuer_signature)
+    
+    return results
+
+
+def _to_wire(key: Union[DNAKey, bytes]) -> bytes:
+    """Serialize a key for shipping to a worker process."""
+    if isinstance(key, (bytes, bytearray, memoryview)):
+        return bytes(key)
+    from server.crypto.serialization import DNAKeySerializer
+    try:
+        return DNAKeySerializer.serialize_packed(key)
+    except ValueError:
+        return DNAKeySerializer.serialize(key)
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most size items."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _verify_chunk(
+    verifier: DNAVerifier,
+    chunk: List[Union[DNAKey, bytes]],
+) -> List[Tuple[VerificationReport, int]]:
+    """Verify one chunk, pairing each report with the key's strand length."""
+    from server.crypto.serialization import DNAKeySerializer
+    
+    keys = [
+        key if isinstance(key, DNAKey) else DNAKeySerializer.deserialize(key)
+        for key in chunk
+    ]
+    signature_results = verify_issuer_signatures(keys)
+    
+    return [
+        (verifier.verify(key, issuer_signature_valid=valid), key.dna_helix.strand_length)
+        for key, valid in zip(keys, signature_results)
+    ]
+
+
+# Per-process verifier for verify_many worker pools
+_worker_verifier: Optional[DNAVerifier] = None
+
+
+def _batch_worker_init(revoked: frozenset, strict_mode: bool, fail_fast: bool) -> None:
+    """Initialize a worker process with the shared revocation snapshot."""
+    global _worker_verifier
+    _worker_verifier = DNAVerifier(strict_mode=strict_mode, fail_fast=fail_fast)
+    _worker_verifier._revocation_list = set(revoked)
+
+
+def _batch_worker_verify(chunk: List[bytes]) -> List[Tuple[VerificationReport, int]]:
+    """Verify a chunk of serialized keys inside a worker process."""
+    return _verify_chunk(_worker_verifier, chunk)
+
+
+def verify_many(
+    keys: Iterable[Union[DNAKey, bytes]],
+    workers: int = 1,
+    strict_mode: bool = True,
+    revoked_key_ids: Optional[Iterable[str]] = None,
+) -> Iterator[VerificationReport]:
+    """
+    Convenience function to verify many DNA keys.
+    
+    Args:
+        keys: DNA keys or serialized keys
+        workers: Number of worker processes
+        strict_mode: If True, all barriers must pass
+        revoked_key_ids: Revocation snapshot to check against
+        
+    Yields:
+        VerificationReport for each key, in completion order
+        
+    Example:
+        >>> for report in verify_many(stored_keys, workers=4):
+        ...     if report.overall_result == VerificationResult.FAILED:
+        ...         print(f"Key failed re-validation: {report.key_id}")
+    """
+    verifier = DNAVerifier(strict_mode=strict_mode)
+    for key_id in revoked_key_ids or ():
+        verifier.revoke_key(key_id)
+    yield from verifier.verify_many(keys, workers=workers)
+
+
 def verify_dna_key(dna_key: DNAKey, strict_mode: bool = True) -> VerificationReport:
     """
     Convenience function to verify a DNA key.
@@ -0,0 +1,369 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Helix Checksum Engine
+
+Computes the helix checksum and all five layer checksums together
+in a single position-ordered pass over the helix.
+
+Features:
+- One sort and one pass for the SHA3-512 helix checksum and every
+  SHA3-512 layer checksum
+- Column-based computation for CompactDNAHelix (no DNASegment objects)
+- Streaming over packed serialized keys without materializing segments
+- Digest caching on immutable (compact) helices, so repeat
+  verifications of the same key are O(1)
+- Digest caching on list-backed helices, validated in O(1) against
+  modification counters
+
+List-backed DNAHelix objects are mutable: their cache entry remembers the
+SegmentList version and the global DNASegment mutation count it was
+computed at, so any added, removed, replaced or reordered segment, or any
+reassigned segment field, is a cache miss. Helices with mutable segment
+data (e.g. bytearray) are never cached.
+"""
+
+import hashlib
+import secrets
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Tuple, Union
+
+from server.crypto.dna_key import (
+    SEGMENT_LAYER_MAPPING,
+    CompactDNAHelix,
+    DNAHelix,
+    DNASegment,
+    LayerChecksum,
+    SecurityLayer,
+    SegmentList,
+    SegmentType,
+)
+
+
+@dataclass(frozen=True)
+class HelixDigests:
+    """Helix checksum and per-layer checksums computed in one pass."""
+
+    checksum: str
+    layer_checksums: Tuple[LayerChecksum, ...]
+    segment_count: int
+
+    def copy_layer_checksums(self) -> List[LayerChecksum]:
+        """
+        Get copies of the layer checksums for storing on a key.
+
+        LayerChecksum is mutable and digests may be cached, so keys must
+        not share the cached instances.
+        """
+        return [replace(lc) for lc in self.layer_checksums]
+
+
+class HelixChecksumEngine:
+    """
+    Single-pass checksum engine for DNA helices.
+
+    Produces the same values as DNAHelix.compute_checksum and the
+    generator's per-layer checksums.
+    """
+
+    LAYER_ALGORITHM = "SHA3-512"
+    LAYER_NUMBERS = tuple(layer.value for layer in SecurityLayer)
+
+    def __init__(self):
+        """Initialize the engine with empty cache statistics."""
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @staticmethod
+    def layer_for(segment_type: SegmentType) -> int:
+        """Get the security layer number of a segment type."""
+        return SEGMENT_LAYER_MAPPING.get(segment_type, SecurityLayer.OUTER_SHELL).value
+
+    def compute(self, helix: Union[DNAHelix, CompactDNAHelix], use_cache: bool = True) -> HelixDigests:
+        """
+        Compute helix and layer checksums.
+
+        Args:
+            helix: Helix to checksum
+            use_cache: If True, reuse digests cached on the helix
+
+        Returns:
+            HelixDigests for the helix
+        """
+        if not isinstance(helix, CompactDNAHelix):
+            return self._compute_list(helix, use_cache)
+
+        if use_cache and helix._digests is not None:
+            self.cache_hits += 1
+            return helix._digests
+
+        self.cache_misses += 1
+        digests = self._compute_compact(helix)
+        helix._digests = digests
+        return digests
+
+    def is_cached(self, helix: Union[DNAHelix, CompactDNAHelix]) -> bool:
+        """
+        Check whether compute() would be served from the helix's cache.
+
+        Args:
+            helix: Helix to check
+
+        Returns:
+            True if valid digests are cached on the helix
+        """
+        if isinstance(helix, CompactDNAHelix):
+            return helix._digests is not None
+        return self._cache_valid(helix._digest_cache, self._list_state(helix))
+
+    @staticmethod
+    def _list_state(helix: DNAHelix) -> Tuple[SegmentList, int, int]:
+        """Segment list, list version and segment mutation count of a helix."""
+        segments = helix.segments
+        return segments, segments.version, DNASegment.mutations
+
+    @staticmethod
+    def _cache_valid(cached, state: Tuple[SegmentList, int, int]) -> bool:
+        """Check a list helix cache entry against the current state in O(1)."""
+        return (
+            cached is not None
+            and cached[0] is state[0]
+            and cached[1] == state[1]
+            and cached[2] == state[2]
+        )
+
+    def _compute_list(self, helix: DNAHelix, use_cache: bool) -> HelixDigests:
+        """Compute digests of a list-backed helix, reusing a still-valid cache entry."""
+        if not use_cache or type(helix.segments) is not SegmentList:
+            return self.compute_segments(helix.segments)
+
+        # Captured before hashing so a concurrent modification is a later miss
+        state = self._list_state(helix)
+        cached = helix._digest_cache
+        if self._cache_valid(cached, state):
+            self.cache_hits += 1
+            return cached[3]
+
+        self.cache_misses += 1
+        segments = state[0]
+        digests = self.compute_segments(segments)
+        if all(type(segment.data) is bytes for segment in segments):
+            helix._digest_cache = state + (digests,)
+        else:
+            helix._digest_cache = None
+        return digests
+
+    def compute_segments(self, segments: Iterable[DNASegment]) -> HelixDigests:
+        """
+        Compute helix and layer checksums from DNASegment objects.
+
+        Args:
+            segments: Segments in any order
+
+        Returns:
+            HelixDigests for the segments
+        """
+        helix_hasher = hashlib.sha3_512()
+        layer_hashers = {layer_num: hashlib.sha3_512() for layer_num in self.LAYER_NUMBERS}
+        layer_counts = dict.fromkeys(self.LAYER_NUMBERS, 0)
+        layer_by_type = {seg_type: self.layer_for(seg_type) for seg_type in SegmentType}
+
+        for segment in sorted(segments, key=lambda s: s.position):
+            helix_hasher.update(segment.type.value.encode())
+            helix_hasher.update(segment.position.to_bytes(4, "big"))
+            helix_hasher.update(segment.data)
+            if segment.segment_hash:
+                helix_hasher.update(segment.segment_hash.encode())
+
+            layer_num = layer_by_type[segment.type]
+            layer_hashers[layer_num].update(segment.data)
+            layer_counts[layer_num] += 1
+
+        return self._finish(helix_hasher, layer_hashers, layer_counts)
+
+    def compute_packed(self, buffer) -> HelixDigests:
+        """
+        Compute checksums by streaming over a packed serialized key.
+
+        The packed columns are read in place; no DNASegment objects
+        are created and segment data is never copied.
+
+        Args:
+            buffer: Packed key bytes, memoryview or mmap
+
+        Returns:
+            HelixDigests for the serialized helix
+        """
+        from server.crypto.serialization import DNAKeySerializer
+
+        helix = DNAKeySerializer.deserialize_packed(buffer).dna_helix
+        return self.compute(helix, use_cache=False)
+
+    def verify(self, helix: Union[DNAHelix, CompactDNAHelix]) -> bool:
+        """
+        Verify the stored helix checksum.
+
+        Args:
+            helix: Helix with a stored checksum
+
+        Returns:
+            True if the stored checksum matches the computed one
+        """
+        if helix.checksum is None:
+            return False
+        return secrets.compare_digest(self.compute(helix).checksum, helix.checksum)
+
+    def verify_layers(
+        self, helix: Union[DNAHelix, CompactDNAHelix], layer_checksums: List[LayerChecksum]
+    ) -> bool:
+        """
+        Verify stored layer checksums against the helix.
+
+        Args:
+            helix: Helix to check
+            layer_checksums: Stored layer checksums (e.g. DNAKey.layer_checksums)
+
+        Returns:
+            True if every stored layer checksum matches
+        """
+        computed = {lc.layer: lc for lc in self.compute(helix).layer_checksums}
+        for stored in layer_checksums:
+            actual = computed.get(stored.layer)
+            if actual is None or actual.segment_count != stored.segment_count:
+                return False
+            if not secrets.compare_digest(actual.checksum, stored.checksum):
+                return False
+        return True
+
+    def _compute_compact(self, helix: CompactDNAHelix) -> HelixDigests:
+        """One position-ordered pass over the columns of a compact helix."""
+        helix_hasher = hashlib.sha3_512()
+        layer_hashers = {layer_num: hashlib.sha3_512() for layer_num in self.LAYER_NUMBERS}
+        layer_counts = dict.fromkeys(self.LAYER_NUMBERS, 0)
+
+        # Per type code: type prefix for the helix hash and layer routing
+        type_prefix: Dict[int, bytes] = {}
+        layer_update = {}
+        layer_of_code: Dict[int, int] = {}
+        for seg_type in SegmentType:
+            code = ord(seg_type.value)
+            layer_num = self.layer_for(seg_type)
+            type_prefix[code] = seg_type.value.encode()
+            layer_update[code] = layer_hashers[layer_num].update
+            layer_of_code[code] = layer_num
+
+        update = helix_hasher.update
+        positions = helix.positions
+        offsets = helix.offsets
+        type_codes = helix.type_codes
+        data = memoryview(helix.data)
+        hashes = memoryview(helix.hashes)
+        hash_size = helix.HASH_SIZE
+        code_counts: Dict[int, int] = dict.fromkeys(type_prefix, 0)
+
+        for i in sorted(range(len(positions)), key=positions.__getitem__):
+            code = type_codes[i]
+            seg_data = data[offsets[i]:offsets[i + 1]]
+            update(type_prefix[code])
+            update(positions[i].to_bytes(4, "big"))
+            update(seg_data)
+            update(hashes[i * hash_size:(i + 1) * hash_size].hex().encode())
+            layer_update[code](seg_data)
+            code_counts[code] += 1
+
+        for code, count in code_counts.items():
+            layer_counts[layer_of_code[code]] += count
+
+        return self._finish(helix_hasher, layer_hashers, layer_counts)
+
+    def _finish(self, helix_hasher, layer_hashers, layer_counts) -> HelixDigests:
+        """Build HelixDigests from finished hashers (empty layers are omitted)."""
+        layer_checksums = tuple(
+            LayerChecksum(
+                layer=layer_num,
+                algorithm=self.LAYER_ALGORITHM,
+                checksum=layer_hashers[layer_num].hexdigest(),
+                segment_count=layer_counts[layer_num],
+            )
+            for layer_num in self.LAYER_NUMBERS
+            if layer_counts[layer_num]
+        )
+        return HelixDigests(
+            checksum=helix_hasher.hexdigest(),
+            layer_checksums=layer_checksums,
+            segment_count=sum(layer_counts.values()),
+        )
+
+
+# Shared engine used by helix and generator helpers
+_default_engine = HelixChecksumEngine()
+
+
+def get_checksum_engine() -> HelixChecksumEngine:
+    """Get the shared helix checksum engine."""
+    return _default_engine
+
+
+def compute_helix_digests(helix: Union[DNAHelix, CompactDNAHelix]) -> HelixDigests:
+    """
+    Convenience function to compute helix and layer checksums in one pass.
+
+    Args:
+        helix: Helix to checksum
+
+    Returns:
+        HelixDigests for the helix
+
+    Example:
+        >>> digests = compute_helix_digests(key.dna_helix)
+        >>> assert digests.checksum == key.dna_helix.checksum
+    """
+    return _default_engine.compute(helix)
@@ -58,15 +58,73 @@ CBOR (Concise Binary Object Representation) provides:
 - Fast serialization/deserialization
 - Schema-free data interchange
 
+Also implements a versioned packed binary format ("DNAP") for large keys:
+a fixed header, the key metadata as canonical CBOR, a columnar segment
+table and one raw data blob. Packed keys are read through memoryview
+(or mmap) into a CompactDNAHelix without copying individual segments.
+
 Reference: RFC 8949 - Concise Binary Object Representation (CBOR)
 """
 
+import mmap
+import operator
+import struct
+import sys
+from array import array
 from datetime import datetime
-from typing import Any, Dict
+from itertools import islice
+from typing import Any, Dict, Optional, Union
 
 import cbor2
 
-from server.crypto.dna_key import DNAKey, DNASegment, SegmentType
+from server.crypto.dna_key import (
+    CompactDNAHelix,
+    DNAHelix,
+    DNAKey,
+    DNASegment,
+    LayerChecksum,
+    SegmentType,
+)
+
+
+# Packed binary format constants
+PACKED_MAGIC = b"DNAP"
+PACKED_VERSION = 1
+
+# Header: magic, version, flags, segment_count, reserved, metadata_length, data_length
+PACKED_HEADER = struct.Struct("<4sHHIIQQ")
+
+# Every section starts on an 8-byte boundary
+PACKED_ALIGNMENT = 8
+
+BufferLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# Segment type codes a packed key may contain
+_PACKED_TYPE_CODES = bytes(sorted(CompactDNAHelix.TYPE_BY_CODE))
+
+
+def _padding(length: int) -> int:
+    """Number of padding bytes needed to align length."""
+    return -length % PACKED_ALIGNMENT
+
+
+def _little_endian_bytes(column: Union[array, memoryview]) -> bytes:
+    """Encode a numeric column as little-endian bytes."""
+    if sys.byteorder == "little":
+        return column.tobytes()
+    swapped = array(column.format if isinstance(column, memoryview) else column.typecode, column)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _numeric_column(view: memoryview, typecode: str) -> Union[array, memoryview]:
+    """Read a little-endian numeric column, zero-copy on little-endian hosts."""
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    column = array(typecode)
+    column.frombytes(view)
+    column.byteswap()
+    return column
 
 
 class DNAKeySerializer:
@@ -74,7 +132,8 @@ class DNAKeySerializer:
     CBOR serializer for DNA keys.
 
     Provides deterministic serialization suitable for signing
-    and compact storage/transmission.
+    and compact storage/transmission, plus the packed binary
+    format for large keys.
     """
 
     @staticmethod
@@ -122,6 +181,10 @@ class DNAKeySerializer:
             >>> restored_key = DNAKeySerializer.deserialize(cbor_data)
             >>> assert restored_key.key_id == key.key_id
         """
+        # Packed keys are recognised by their magic prefix
+        if cbor_data[:len(PACKED_MAGIC)] == PACKED_MAGIC:
+            return DNAKeySerializer.deserialize_packed(cbor_data)
+
         # Decode CBOR
         key_dict = cbor2.loads(cbor_data)
 
@@ -129,19 +192,158 @@ class DNAKeySerializer:
         return DNAKeySerializer._dict_to_dna_key(key_dict)
 
     @staticmethod
-    def _dict_to_dna_key(data: Dict[str, Any]) -> DNAKey:
+    def serialize_packed(dna_key: DNAKey) -> bytes:
+        """
+        Serialize DNA key to the packed binary format.
+
+        Layout (all integers little-endian, sections 8-byte aligned):
+        - Header: magic "DNAP", version, flags, segment count,
+          metadata length, data length
+        - Metadata: canonical CBOR of the key without segments
+        - Offsets: segment_count + 1 uint64 data offsets
+        - Positions: segment_count uint32 positions
+        - Hashes: segment_count raw 32-byte SHA3-256 digests
+        - Type codes: segment_count bytes (SegmentType values)
+        - Data: all segment data concatenated
+
+        Args:
+            dna_key: DNA key to serialize
+
+        Returns:
+            Packed bytes
+
+        Raises:
+            ValueError: If a segment has no SHA3-256 segment hash
+        """
+        helix = dna_key.dna_helix
+        if not isinstance(helix, CompactDNAHelix):
+            helix = CompactDNAHelix.from_helix(helix)
+
+        metadata = cbor2.dumps(dna_key.to_dict(include_segments=False), canonical=True)
+        count = helix.segment_count
+
+        header = PACKED_HEADER.pack(
+            PACKED_MAGIC, PACKED_VERSION, 0, count, 0, len(metadata), len(helix.data)
+        )
+        sections = [
+            metadata,
+            _little_endian_bytes(helix.offsets),
+            _little_endian_bytes(helix.positions),
+            bytes(helix.hashes),
+            bytes(helix.type_codes),
+        ]
+
+        parts = [header]
+        for section in sections:
+            parts.append(section)
+            parts.append(b"\x00" * _padding(len(section)))
+        parts.append(bytes(helix.data))
+
+        return b"".join(parts)
+
+    @staticmethod
+    def deserialize_packed(buffer: BufferLike) -> DNAKey:
+        """
+        Deserialize DNA key from the packed binary format.
+
+        The returned key holds a CompactDNAHelix whose columns are
+        memoryviews into the given buffer; segments are not copied
+        until they are accessed. The buffer must stay alive (and
+        unmodified) for as long as the key is used.
+
+        Args:
+            buffer: Packed bytes, memoryview or mmap
+
+        Returns:
+            DNAKey object backed by the buffer
+
+        Raises:
+            ValueError: If the buffer is not a valid packed DNA key
+        """
+        view = memoryview(buffer).cast("B")
+
+        if len(view) < PACKED_HEADER.size:
+            raise ValueError("Packed DNA key is truncated (header)")
+
+        magic, version, _flags, count, _reserved, metadata_length, data_length = PACKED_HEADER.unpack_from(view)
+        if magic != PACKED_MAGIC:
+            raise ValueError("Not a packed DNA key")
+        if version != PACKED_VERSION:
+            raise ValueError(f"Unsupported packed format version: {version}")
+
+        section_lengths = [
+            metadata_length,
+            (count + 1) * 8,
+            count * 4,
+            count * CompactDNAHelix.HASH_SIZE,
+            count,
+        ]
+        sections = []
+        offset = PACKED_HEADER.size
+        for length in section_lengths:
+            sections.append((offset, length))
+            offset += length + _padding(length)
+
+        if offset + data_length != len(view):
+            raise ValueError("Packed DNA key length does not match header")
+
+        def section(index: int) -> memoryview:
+            start, length = sections[index]
+            return view[start:start + length]
+
+        key_dict = cbor2.loads(section(0))
+        offsets = _numeric_column(section(1), "Q")
+        if offsets[0] != 0 or offsets[-1] != data_length:
+            raise ValueError("Packed DNA key has inconsistent data offsets")
+        if any(map(operator.gt, islice(offsets, count), islice(offsets, 1, None))):
+            raise ValueError("Packed DNA key has inconsistent data offsets")
+        if bytes(section(4)).translate(None, _PACKED_TYPE_CODES):
+            raise ValueError("Packed DNA key has unknown segment type codes")
+
+        helix = CompactDNAHelix(
+            positions=_numeric_column(section(2), "I"),
+            type_codes=section(4),
+            offsets=offsets,
+            data=view[offset:offset + data_length],
+            hashes=section(3),
+            checksum=key_dict.get("dna_helix", {}).get("checksum"),
+        )
+
+        return DNAKeySerializer._dict_to_dna_key(key_dict, helix=helix)
+
+    @staticmethod
+    def load_packed(path: str) -> DNAKey:
+        """
+        Load a packed DNA key from a file via mmap.
+
+        The file is mapped read-only; segment data is paged in on access.
+
+        Args:
+            path: Path to a file written with serialize_packed
+
+        Returns:
+            DNAKey object backed by the mapped file
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return DNAKeySerializer.deserialize_packed(mapped)
+
+    @staticmethod
+    def _dict_to_dna_key(
+        data: Dict[str, Any], helix: Optional[Union[DNAHelix, CompactDNAHelix]] = None
+    ) -> DNAKey:
         """
         Reconstruct DNAKey from dictionary.
 
         Args:
             data: Dictionary representation of DNA key
+            helix: Prebuilt helix; if None, segments are read from the dictionary
 
         Returns:
             DNAKey object
         """
         from server.crypto.dna_key import (
             CryptographicMaterial,
-            DNAHelix,
             IssuerInfo,
             PolicyBinding,
             SubjectInfo,
@@ -175,19 +377,20 @@ class DNAKeySerializer:
             )
 
         # Reconstruct DNA helix
-        helix_data = data["dna_helix"]
-        segments = []
-        for seg_data in helix_data["segments"]:
-            segment = DNASegment(
-                position=seg_data["position"],
-                type=SegmentType(seg_data["type"]),
-                data=bytes.fromhex(seg_data["data"]),
-                segment_hash=seg_data.get("segment_hash"),
-            )
-            segments.append(segment)
-
-        helix = DNAHelix(segments=segments)
-        helix.checksum = helix_data.get("checksum")
+        if helix is None:
+            helix_data = data["dna_helix"]
+            segments = []
+            for seg_data in helix_data["segments"]:
+                segment = DNASegment(
+                    position=seg_data["position"],
+                    type=SegmentType(seg_data["type"]),
+                    data=bytes.fromhex(seg_data["data"]),
+                    segment_hash=seg_data.get("segment_hash"),
+                )
+                segments.append(segment)
+
+            helix = DNAHelix(segments=segments)
+            helix.checksum = helix_data.get("checksum")
 
         # Reconstruct cryptographic material
         crypto_material = None
@@ -236,6 +439,19 @@ class DNAKeySerializer:
             visual_dna=visual,
         )
 
+        # Restore generation results when present
+        dna_key.layer_checksums = [
+            LayerChecksum(
+                layer=lc["layer"],
+                algorithm=lc["algorithm"],
+                checksum=lc["checksum"],
+                segment_count=lc["segment_count"],
+            )
+            for lc in data.get("layer_checksums", [])
+        ]
+        dna_key.total_lines = data.get("total_lines", 0)
+        dna_key.security_score = data.get("security_score", 0.0)
+
         return dna_key
 
     @staticmethod
@@ -271,6 +487,32 @@ def serialize_dna_key(dna_key: DNAKey) -> bytes:
     return DNAKeySerializer.serialize(dna_key)
 
 
+def serialize_dna_key_packed(dna_key: DNAKey) -> bytes:
+    """
+    Convenience function to serialize a DNA key to the packed binary format.
+
+    Args:
+        dna_key: DNA key to serialize
+
+    Returns:
+        Packed bytes
+    """
+    return DNAKeySerializer.serialize_packed(dna_key)
+
+
+def deserialize_dna_key_packed(buffer: BufferLike) -> DNAKey:
+    """
+    Convenience function to deserialize a packed DNA key without copying segments.
+
+    Args:
+        buffer: Packed bytes, memoryview or mmap
+
+    Returns:
+        DNAKey object backed by the buffer
+    """
+    return DNAKeySerializer.deserialize_packed(buffer)
+
+
 def deserialize_dna_key(cbor_data: bytes) -> DNAKey:
     """
     Convenience function to deserialize a DNA key from CBOR.
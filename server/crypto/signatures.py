@@ -63,7 +63,9 @@ Ed25519 provides:
 Reference: RFC 8032 - Edwards-Curve Digital Signature Algorithm (EdDSA)
 """
 
-from typing import Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 # Import backend abstraction
 try:
@@ -288,3 +290,101 @@ def generate_ed25519_keypair() -> Tuple[Ed25519SigningKey, Ed25519VerifyKey]:
     signing_key = Ed25519SigningKey()
     verify_key = signing_key.verify_key()
     return signing_key, verify_key
+
+
+class VerifyKeyCache:
+    """
+    LRU cache of prepared Ed25519VerifyKey objects.
+
+    Entries are keyed by key ID and validated against the public key bytes,
+    so a re-enrolled key with a new public key is never served a stale
+    verifier. Building a verify key parses the point and selects a backend;
+    caching skips both for keys that authenticate repeatedly.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of verify keys retained
+
+        Raises:
+            ValueError: If max_size is less than 1
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[bytes, Ed25519VerifyKey]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key_id: str, public_key: bytes) -> Ed25519VerifyKey:
+        """
+        Get the verify key for a key ID, building it on a miss.
+
+        Args:
+            key_id: Key identifier
+            public_key: 32-byte public key the entry must match
+
+        Returns:
+            Ed25519VerifyKey for ``public_key``
+
+        Raises:
+            ValueError: If public_key is not exactly 32 bytes
+        """
+        with self._lock:
+            entry = self._entries.get(key_id)
+            if entry is not None and entry[0] == public_key:
+                self._entries.move_to_end(key_id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        verify_key = Ed25519VerifyKey.from_bytes(public_key)
+
+        with self._lock:
+            self._entries[key_id] = (public_key, verify_key)
+            self._entries.move_to_end(key_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return verify_key
+
+    def invalidate(self, key_id: str) -> bool:
+        """
+        Drop the cached verify key for a key ID.
+
+        Args:
+            key_id: Key identifier
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            return self._entries.pop(key_id, None) is not None
+
+    def clear(self) -> None:
+        """Drop all cached verify keys."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -409,8 +409,17 @@ class UltimateVerificationEngine:
         (24, "Final Cryptographic Proof", "Zero-knowledge proof"),
     ]
     
-    def __init__(self, threat_level: ThreatLevel = ThreatLevel.GREEN):
+    def __init__(self, threat_level: ThreatLevel = ThreatLevel.GREEN, registry: Any = None):
+        """
+        Initialize the engine.
+        
+        Args:
+            threat_level: Current threat level
+            registry: Optional DNAStrandRegistry backing the registry and
+                revocation barriers (17, 18)
+        """
         self.threat_level = threat_level
+        self.registry = registry
         self._rate_limit_cache: Dict[str, List[float]] = {}
         self._ip_blacklist: set = set()
         self._anomaly_threshold = 0.7
@@ -772,8 +781,17 @@ class UltimateVerificationEngine:
         """Barrier 17: Global registry check."""
         key_id = getattr(dna_strand, 'key_id', '')
         
-        # In production, check against central registry
-        # For now, assume registered
+        if self.registry is None:
+            # No registry configured, assume registered
+            return True, "Strand registered in global registry", 0.0
+        
+        entry = self.registry.get_entry(key_id)
+        if entry is None:
+            return False, "Strand not found in registry", 1.0
+        
+        checksum = getattr(getattr(dna_strand, 'dna_helix', None), 'checksum', None)
+        if checksum and not hmac.compare_digest(entry.dna_checksum, checksum):
+            return False, "Strand checksum does not match registry", 1.0
         
         return True, "Strand registered in global registry", 0.0
     
@@ -781,8 +799,15 @@ class UltimateVerificationEngine:
         """Barrier 18: Revocation check."""
         key_id = getattr(dna_strand, 'key_id', '')
         
-        # In production, check CRL and OCSP
-        # For now, assume not revoked
+        if self.registry is None:
+            # In production, check CRL and OCSP
+            # For now, assume not revoked
+            return True, "Strand not revoked", 0.0
+        
+        entry = self.registry.get_entry(key_id)
+        status = getattr(getattr(entry, 'status', None), 'value', 'active')
+        if status != "active":
+            return False, f"Strand is {status}", 1.0
         
         return True, "Strand not revoked", 0.0
     
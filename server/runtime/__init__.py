@@ -47,5 +47,18 @@ environment detection, and graceful fallback mechanisms.
 __version__ = "0.1.0"
 
 from server.runtime.event_loop import install_best_event_loop, get_platform_info
+from server.runtime.work_executor import (
+    BoundedWorkExecutor,
+    ExecutorRejectedError,
+    QueueFullError,
+    QuotaExceededError,
+)
 
-__all__ = ["install_best_event_loop", "get_platform_info"]
+__all__ = [
+    "install_best_event_loop",
+    "get_platform_info",
+    "BoundedWorkExecutor",
+    "ExecutorRejectedError",
+    "QueueFullError",
+    "QuotaExceededError",
+]
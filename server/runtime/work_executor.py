@@ -0,0 +1,304 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNA-Key Authentication System - Bounded Work Executor
+
+Runs CPU-bound work (key generation, serialization) off the asyncio event
+loop on a dedicated thread or process pool. Admission is bounded twice:
+
+* a global queue-depth limit - once every worker is busy and the waiting
+  queue is full, new work is rejected with 503 semantics instead of piling
+  up behind the pool;
+* per-class concurrency quotas - e.g. at most one GOVERNMENT enrollment in
+  flight, so a burst of heavy requests cannot occupy every worker and
+  starve lighter traffic. Exceeding a quota is rejected with 429 semantics.
+
+Rejections carry a suggested Retry-After so the API layer can translate
+them directly into HTTP responses.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+
+class ExecutorRejectedError(Exception):
+    """Raised when the executor refuses to admit new work."""
+
+    status_code = 503
+    error_code = "EXECUTOR_UNAVAILABLE"
+
+    def __init__(self, message: str, work_class: str, retry_after: int = 1):
+        super().__init__(message)
+        self.work_class = work_class
+        self.retry_after = retry_after
+
+
+class QueueFullError(ExecutorRejectedError):
+    """All workers are busy and the waiting queue is at capacity."""
+
+    status_code = 503
+    error_code = "QUEUE_FULL"
+
+
+class QuotaExceededError(ExecutorRejectedError):
+    """The work class already has its maximum number of jobs in flight."""
+
+    status_code = 429
+    error_code = "QUOTA_EXCEEDED"
+
+
+@dataclass
+class ExecutorStats:
+    """Admission and completion counters for a BoundedWorkExecutor."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected_queue_full: int = 0
+    rejected_quota: int = 0
+    in_flight: int = 0
+    in_flight_by_class: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_quota": self.rejected_quota,
+            "in_flight": self.in_flight,
+            "in_flight_by_class": dict(self.in_flight_by_class),
+        }
+
+
+class BoundedWorkExecutor:
+    """
+    Thread or process pool with queue-depth backpressure and per-class quotas.
+
+    A job counts against the limits from admission until its result is
+    ready, so ``in_flight`` covers both running and queued work.
+    """
+
+    EXECUTOR_TYPES = ("thread", "process")
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue_depth: int = 16,
+        class_quotas: Optional[Dict[str, int]] = None,
+        executor_type: str = "thread",
+        name: str = "dnalock-work",
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            max_workers: Number of pool workers
+            max_queue_depth: Jobs allowed to wait once all workers are busy
+            class_quotas: Maximum in-flight jobs per work class; classes not
+                listed are bounded only by the queue-depth limit
+            executor_type: "thread" or "process"
+            name: Thread name prefix for the pool
+
+        Raises:
+            ValueError: If a limit or the executor type is invalid
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue_depth < 0:
+            raise ValueError("max_queue_depth cannot be negative")
+        if executor_type not in self.EXECUTOR_TYPES:
+            raise ValueError(f"Unknown executor type: {executor_type}")
+
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.class_quotas = dict(class_quotas or {})
+        self.executor_type = executor_type
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._stats = ExecutorStats()
+        self._executor: Optional[Executor] = None
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of jobs admitted at once (running + queued)."""
+        return self.max_workers + self.max_queue_depth
+
+    def _get_executor(self) -> Executor:
+        """Create the underlying pool on first use."""
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=self.name
+                )
+        return self._executor
+
+    def acquire(self, work_class: str) -> None:
+        """
+        Reserve a slot for one job of ``work_class``.
+
+        Args:
+            work_class: Quota bucket the job belongs to
+
+        Raises:
+            QuotaExceededError: If the class is at its quota
+            QueueFullError: If the executor is at capacity
+        """
+        with self._lock:
+            stats = self._stats
+            running = stats.in_flight_by_class.get(work_class, 0)
+            quota = self.class_quotas.get(work_class)
+
+            if quota is not None and running >= quota:
+                stats.rejected_quota += 1
+                raise QuotaExceededError(
+                    f"Too many concurrent '{work_class}' jobs (limit {quota})",
+                    work_class,
+                    retry_after=self._retry_after(),
+                )
+
+            if stats.in_flight >= self.capacity:
+                stats.rejected_queue_full += 1
+                raise QueueFullError(
+                    f"Work queue is full ({self.capacity} jobs in flight)",
+                    work_class,
+                    retry_after=self._retry_after(),
+                )
+
+            stats.submitted += 1
+            stats.in_flight += 1
+            stats.in_flight_by_class[work_class] = running + 1
+
+    def release(self, work_class: str, failed: bool = False) -> None:
+        """
+        Return the slot reserved by :meth:`acquire`.
+
+        Args:
+            work_class: Quota bucket the job belonged to
+            failed: Whether the job raised
+        """
+        with self._lock:
+            stats = self._stats
+            stats.in_flight -= 1
+            remaining = stats.in_flight_by_class.get(work_class, 1) - 1
+            if remaining > 0:
+                stats.in_flight_by_class[work_class] = remaining
+            else:
+                stats.in_flight_by_class.pop(work_class, None)
+
+            if failed:
+                stats.failed += 1
+            else:
+                stats.completed += 1
+
+    def _retry_after(self) -> int:
+        """Suggest a Retry-After (seconds) proportional to queued work."""
+        waiting = max(0, self._stats.in_flight - self.max_workers)
+        return 1 + waiting // self.max_workers
+
+    def submit(self, work_class: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Admit and schedule a job, returning a concurrent Future.
+
+        The slot is released when the future completes.
+
+        Raises:
+            ExecutorRejectedError: If the job is not admitted
+        """
+        self.acquire(work_class)
+        try:
+            future = self._get_executor().submit(fn, *args, **kwargs)
+        except Exception:
+            self.release(work_class, failed=True)
+            raise
+
+        def _done(done: Future) -> None:
+            failed = done.cancelled() or done.exception() is not None
+            self.release(work_class, failed=failed)
+
+        future.add_done_callback(_done)
+        return future
+
+    async def run(self, work_class: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a job on the pool and await its result from the event loop.
+
+        Args:
+            work_class: Quota bucket the job belongs to
+            fn: Callable to run (must be picklable for process pools)
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            The return value of ``fn``
+
+        Raises:
+            ExecutorRejectedError: If the job is not admitted
+        """
+        future = self.submit(work_class, functools.partial(fn, *args, **kwargs))
+        return await asyncio.wrap_future(future)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executor limits and counters."""
+        with self._lock:
+            stats = self._stats.to_dict()
+        stats.update(
+            {
+                "executor_type": self.executor_type,
+                "max_workers": self.max_workers,
+                "max_queue_depth": self.max_queue_depth,
+                "class_quotas": dict(self.class_quotas),
+            }
+        )
+        return stats
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the underlying pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
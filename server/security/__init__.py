@@ -65,6 +65,8 @@ from server.security.neural_auth import (
     NeuralAuthDecision,
     AnomalyDetectionEngine,
     FraudDetectionEngine,
+    ScoringRequest,
+    NeuralScoringService,
 )
 
 # Distributed Ledger
@@ -75,7 +77,10 @@ from server.security.distributed_ledger import (
     DNATransaction,
     Block,
     DNASmartContract,
+    BlockStore,
+    InMemoryBlockStore,
 )
+from server.security.ledger_store import FileBlockStore
 
 # Threat Intelligence
 from server.security.threat_intelligence import (
@@ -92,6 +97,9 @@ from server.security.threat_intelligence import (
 # Session Management
 from server.security.session_management import (
     SessionManager,
+    SessionStore,
+    InMemorySessionStore,
+    KeyValueSessionStore,
     Session,
     SessionToken,
     SessionBinding,
@@ -100,6 +108,11 @@ from server.security.session_management import (
     TerminationReason,
     TokenGenerator,
 )
+from server.security.signed_tokens import (
+    SignedTokenCodec,
+    TokenClaims,
+    RevocationBloomFilter,
+)
 
 # Audit Logging
 from server.security.audit_logging import (
@@ -109,7 +122,10 @@ from server.security.audit_logging import (
     AuditEventCategory,
     AuditSeverity,
     AuditLogStorage,
+    AuditPipeline,
+    BackpressureMode,
 )
+from server.security.audit_store import FileAuditLogStorage
 
 # Security Hardening
 from server.security.hardening import (
@@ -133,6 +149,8 @@ __all__ = [
     "NeuralAuthDecision",
     "AnomalyDetectionEngine",
     "FraudDetectionEngine",
+    "ScoringRequest",
+    "NeuralScoringService",
     # Distributed Ledger
     "DNAStrandRegistry",
     "BlockchainNetwork",
@@ -140,6 +158,9 @@ __all__ = [
     "DNATransaction",
     "Block",
     "DNASmartContract",
+    "BlockStore",
+    "InMemoryBlockStore",
+    "FileBlockStore",
     # Threat Intelligence
     "ThreatIntelligenceService",
     "ThreatIndicator",
@@ -151,6 +172,9 @@ __all__ = [
     "AttackPatternDetector",
     # Session Management
     "SessionManager",
+    "SessionStore",
+    "InMemorySessionStore",
+    "KeyValueSessionStore",
     "Session",
     "SessionToken",
     "SessionBinding",
@@ -158,6 +182,9 @@ __all__ = [
     "SessionType",
     "TerminationReason",
     "TokenGenerator",
+    "SignedTokenCodec",
+    "TokenClaims",
+    "RevocationBloomFilter",
     # Audit Logging
     "AuditLogger",
     "AuditEvent",
@@ -165,6 +192,9 @@ __all__ = [
     "AuditEventCategory",
     "AuditSeverity",
     "AuditLogStorage",
+    "AuditPipeline",
+    "BackpressureMode",
+    "FileAuditLogStorage",
     # Security Hardening
     "SecurityHardeningEngine",
     "SecurityViolationType",
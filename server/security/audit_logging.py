@@ -73,14 +73,20 @@ This module implements enterprise-grade audit logging for:
 FULL AUDIT TRAIL FOR COMPLIANCE AND SECURITY
 """
 
+import bisect
+import functools
 import hashlib
 import json
+import math
+import os
 import secrets
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
 
 # ============================================================================
@@ -228,9 +234,39 @@ class AuditEvent:
             "details": self.details,
             "session_id": self.session_id,
             "request_id": self.request_id,
+            "correlation_id": self.correlation_id,
             "event_hash": self.event_hash
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AuditEvent":
+        """
+        Rebuild an event from its dictionary form.
+        
+        The stored integrity hash is kept as-is, so verify_integrity()
+        detects records that were modified after they were written.
+        """
+        return cls(
+            event_id=data["event_id"],
+            event_type=AuditEventType(data["event_type"]),
+            category=AuditEventCategory(data["category"]),
+            severity=AuditSeverity(data["severity"]),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            actor_id=data.get("actor_id"),
+            actor_type=data.get("actor_type", "user"),
+            actor_ip=data.get("actor_ip"),
+            target_type=data.get("target_type"),
+            target_id=data.get("target_id"),
+            action=data.get("action", ""),
+            outcome=data.get("outcome", "success"),
+            message=data.get("message", ""),
+            details=data.get("details") or {},
+            session_id=data.get("session_id"),
+            request_id=data.get("request_id"),
+            correlation_id=data.get("correlation_id"),
+            event_hash=data.get("event_hash", "")
+        )
+    
     def to_json(self) -> str:
         """Convert to JSON string."""
         return json.dumps(self.to_dict(), default=str)
@@ -240,10 +276,275 @@ class AuditEvent:
 # AUDIT LOG STORAGE
 # ============================================================================
 
+class _AuditSegment:
+    """
+    A contiguous run of stored events with its own secondary indexes.
+    
+    Index postings are event positions within the segment in arrival
+    order, so they are dropped together with the segment's events.
+    """
+    
+    __slots__ = (
+        "base_seq", "events", "times", "start", "min_time", "max_time",
+        "ordered", "by_actor", "by_target", "by_type", "by_category"
+    )
+    
+    def __init__(self, base_seq: int):
+        self.base_seq = base_seq
+        self.events: List[Optional[AuditEvent]] = []
+        self.times: List[float] = []
+        # Positions before start have been evicted
+        self.start = 0
+        self.min_time = math.inf
+        self.max_time = -math.inf
+        # True while events arrived in timestamp order
+        self.ordered = True
+        self.by_actor: Dict[str, List[int]] = {}
+        self.by_target: Dict[str, List[int]] = {}
+        self.by_type: Dict[str, List[int]] = {}
+        self.by_category: Dict[str, List[int]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.events) - self.start
+    
+    def append(self, event: AuditEvent, ts: float):
+        """Append an event and index it."""
+        pos = len(self.events)
+        if self.times and ts < self.times[-1]:
+            self.ordered = False
+        self.events.append(event)
+        self.times.append(ts)
+        self.min_time = min(self.min_time, ts)
+        self.max_time = max(self.max_time, ts)
+        
+        if event.actor_id:
+            self.by_actor.setdefault(event.actor_id, []).append(pos)
+        if event.target_id:
+            self.by_target.setdefault(event.target_id, []).append(pos)
+        self.by_type.setdefault(event.event_type.value, []).append(pos)
+        self.by_category.setdefault(event.category.value, []).append(pos)
+    
+    def evict_first(self) -> Tuple[AuditEvent, float]:
+        """Evict the oldest retained event, returning it and its timestamp."""
+        event = self.events[self.start]
+        self.events[self.start] = None
+        self.start += 1
+        return event, self.times[self.start - 1]
+    
+    def select(
+        self,
+        lo: float,
+        hi: float,
+        actor_id: Optional[str] = None,
+        target_id: Optional[str] = None,
+        type_key: Optional[str] = None,
+        category_key: Optional[str] = None
+    ) -> List[int]:
+        """
+        Get positions matching the indexed filters within [lo, hi].
+        
+        The smallest applicable posting list drives the scan; the time
+        range is applied by binary search when the segment is ordered.
+        """
+        covered = lo <= self.min_time and self.max_time <= hi
+        if self.ordered:
+            first = bisect.bisect_left(self.times, lo, self.start)
+            last = bisect.bisect_right(self.times, hi, first)
+            covered = True
+        else:
+            first, last = self.start, len(self.events)
+        
+        postings = None
+        for index, key in (
+            (self.by_actor, actor_id),
+            (self.by_target, target_id),
+            (self.by_type, type_key),
+            (self.by_category, category_key),
+        ):
+            if key:
+                candidate = index.get(key)
+                if candidate is None:
+                    return []
+                if postings is None or len(candidate) < len(postings):
+                    postings = candidate
+        
+        if postings is None:
+            positions = range(first, last)
+        else:
+            positions = postings[
+                bisect.bisect_left(postings, first):bisect.bisect_left(postings, last)
+            ]
+        
+        events = self.events
+        times = self.times
+        selected = []
+        for pos in positions:
+            event = events[pos]
+            if actor_id and event.actor_id != actor_id:
+                continue
+            if target_id and event.target_id != target_id:
+                continue
+            if type_key and event.event_type.value != type_key:
+                continue
+            if category_key and event.category.value != category_key:
+                continue
+            if not covered and not lo <= times[pos] <= hi:
+                continue
+            selected.append(pos)
+        return selected
+
+
+# (category, event_type, severity, outcome) -> event count
+RollupKey = Tuple[str, str, str, str]
+
+
+class AuditRollup:
+    """
+    Pre-aggregated event counts per minute and per hour.
+    
+    Counts are keyed by (category, event type, severity, outcome) and
+    maintained as events are stored and evicted. A time range is answered
+    from whole hours, then whole minutes at the edges, leaving at most
+    two partial minutes to be counted from the events themselves.
+    """
+    
+    MINUTE = 60
+    HOUR = 3600
+    
+    def __init__(self):
+        self._minutes: Dict[int, Dict[RollupKey, int]] = {}
+        self._hours: Dict[int, Dict[RollupKey, int]] = {}
+    
+    @staticmethod
+    def key_for(event: AuditEvent) -> RollupKey:
+        """Rollup key of an event."""
+        return (event.category.value, event.event_type.value, event.severity.value, event.outcome)
+    
+    def add(self, event: AuditEvent, ts: float, delta: int = 1):
+        """Count (or with a negative delta, uncount) an event."""
+        key = self.key_for(event)
+        for buckets, width in ((self._minutes, self.MINUTE), (self._hours, self.HOUR)):
+            index = int(ts // width)
+            counts = buckets.get(index)
+            if counts is None:
+                counts = buckets[index] = {}
+            value = counts.get(key, 0) + delta
+            if value:
+                counts[key] = value
+            else:
+                counts.pop(key, None)
+                if not counts:
+                    del buckets[index]
+    
+    def remove(self, event: AuditEvent, ts: float):
+        """Uncount an evicted event."""
+        self.add(event, ts, -1)
+    
+    @staticmethod
+    def _merge(total: Dict[RollupKey, int], counts: Dict[RollupKey, int]):
+        for key, value in counts.items():
+            total[key] = total.get(key, 0) + value
+    
+    def _sum_buckets(self, buckets: Dict[int, Dict[RollupKey, int]], first: int, last: int, total: Dict[RollupKey, int]):
+        """Add buckets first..last (inclusive) into ``total``."""
+        if last < first:
+            return
+        if last - first + 1 > len(buckets):
+            for index, counts in buckets.items():
+                if first <= index <= last:
+                    self._merge(total, counts)
+        else:
+            for index in range(first, last + 1):
+                counts = buckets.get(index)
+                if counts:
+                    self._merge(total, counts)
+    
+    def totals(
+        self,
+        lo: float,
+        hi: float,
+        count_range: Callable[[float, float], Dict[RollupKey, int]]
+    ) -> Dict[RollupKey, int]:
+        """
+        Get counts for events with lo <= timestamp <= hi.
+        
+        Args:
+            lo: Range start (may be -inf)
+            hi: Range end, inclusive (may be inf)
+            count_range: Counts events in a half-open [start, end) range
+                         shorter than a minute, from the raw events
+        
+        Returns:
+            Dictionary mapping rollup keys to counts
+        """
+        total: Dict[RollupKey, int] = {}
+        if not self._hours:
+            return total
+        
+        # Clamp open bounds to the data so bucket arithmetic stays finite
+        lo = max(lo, min(self._hours) * self.HOUR)
+        hi_excl = (max(self._hours) + 1) * self.HOUR
+        if hi < hi_excl:
+            hi_excl = math.nextafter(hi, math.inf)
+        if lo >= hi_excl:
+            return total
+        
+        # Whole minutes [m0, m1] inside the range
+        m0 = math.ceil(lo / self.MINUTE)
+        m1 = math.floor(hi_excl / self.MINUTE) - 1
+        if m0 > m1:
+            return count_range(lo, hi_excl)
+        
+        self._merge(total, count_range(lo, m0 * self.MINUTE))
+        self._merge(total, count_range((m1 + 1) * self.MINUTE, hi_excl))
+        
+        # Whole hours [h0, h1] inside those minutes
+        per_hour = self.HOUR // self.MINUTE
+        h0 = -(-m0 // per_hour)
+        h1 = (m1 + 1) // per_hour - 1
+        if h0 > h1:
+            self._sum_buckets(self._minutes, m0, m1, total)
+        else:
+            self._sum_buckets(self._minutes, m0, h0 * per_hour - 1, total)
+            self._sum_buckets(self._hours, h0, h1, total)
+            self._sum_buckets(self._minutes, (h1 + 1) * per_hour, m1, total)
+        return total
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get bucket counts."""
+        return {"minute_buckets": len(self._minutes), "hour_buckets": len(self._hours)}
+
+
+def summarize_rollup(counts: Dict[RollupKey, int], hours: int) -> Dict[str, Any]:
+    """Shape rollup counts as get_statistics() output."""
+    by_type: Dict[str, int] = {}
+    by_severity: Dict[str, int] = {}
+    by_outcome: Dict[str, int] = {}
+    for (_, type_key, sev_key, outcome), value in counts.items():
+        by_type[type_key] = by_type.get(type_key, 0) + value
+        by_severity[sev_key] = by_severity.get(sev_key, 0) + value
+        by_outcome[outcome] = by_outcome.get(outcome, 0) + value
+    return {
+        "total_events": sum(counts.values()),
+        "time_period_hours": hours,
+        "by_type": by_type,
+        "by_severity": by_severity,
+        "by_outcome": by_outcome
+    }
+
+
 class AuditLogStorage:
     """
     Storage backend for audit logs.
     
+    Events are kept in fixed-size segments in arrival order. Each segment
+    carries its own actor/target/type indexes and time bounds, so queries
+    skip segments outside the requested time range and walk only the
+    smallest matching posting list inside the rest. When the capacity is
+    reached the oldest events are evicted and a segment is released,
+    indexes included, once all of its events are gone. An AuditRollup is
+    kept in step with the retained events for counts and statistics.
+    
     In production, this would connect to:
     - Database (PostgreSQL, etc.)
     - Log aggregation (ELK, Splunk, etc.)
@@ -251,38 +552,121 @@ class AuditLogStorage:
     - Immutable storage (blockchain, etc.)
     """
     
-    def __init__(self, max_memory_events: int = 100000):
-        self._events: List[AuditEvent] = []
+    # Events per segment
+    SEGMENT_SIZE = 4096
+    
+    def __init__(self, max_memory_events: int = 100000, segment_size: Optional[int] = None):
+        """
+        Initialize storage.
+        
+        Args:
+            max_memory_events: Maximum events retained
+            segment_size: Events per segment (defaults to SEGMENT_SIZE)
+        """
+        if max_memory_events <= 0:
+            raise ValueError("max_memory_events must be positive")
+        
         self._max_events = max_memory_events
-        self._index_by_actor: Dict[str, List[str]] = {}
-        self._index_by_target: Dict[str, List[str]] = {}
-        self._index_by_type: Dict[str, List[str]] = {}
+        self._segment_size = max(1, min(segment_size or self.SEGMENT_SIZE, max_memory_events))
+        self._segments: Deque[_AuditSegment] = deque()
+        self._size = 0
+        self._next_seq = 0
+        self._rollup = AuditRollup()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return self._size
     
     def store(self, event: AuditEvent) -> bool:
         """Store an audit event."""
-        self._events.append(event)
-        
-        # Update indexes
-        if event.actor_id:
-            if event.actor_id not in self._index_by_actor:
-                self._index_by_actor[event.actor_id] = []
-            self._index_by_actor[event.actor_id].append(event.event_id)
+        with self._lock:
+            self._append(event)
+        return True
+    
+    def store_many(self, events: List[AuditEvent]) -> int:
+        """
+        Store a batch of audit events under one lock acquisition.
         
-        if event.target_id:
-            if event.target_id not in self._index_by_target:
-                self._index_by_target[event.target_id] = []
-            self._index_by_target[event.target_id].append(event.event_id)
+        Returns:
+            Number of events stored
+        """
+        with self._lock:
+            for event in events:
+                self._append(event)
+        return len(events)
+    
+    def _append(self, event: AuditEvent):
+        """Append one event and enforce the capacity (lock held)."""
+        segments = self._segments
+        if not segments or len(segments[-1].events) >= self._segment_size:
+            segments.append(_AuditSegment(self._next_seq))
+        ts = event.timestamp.timestamp()
+        segments[-1].append(event, ts)
+        self._rollup.add(event, ts)
+        self._next_seq += 1
+        self._size += 1
         
-        type_key = event.event_type.value
-        if type_key not in self._index_by_type:
-            self._index_by_type[type_key] = []
-        self._index_by_type[type_key].append(event.event_id)
+        # Evict oldest events if over limit
+        while self._size > self._max_events:
+            head = segments[0]
+            self._rollup.remove(*head.evict_first())
+            self._size -= 1
+            if not len(head):
+                segments.popleft()
+    
+    def prune_before(self, cutoff: datetime) -> int:
+        """
+        Drop events older than ``cutoff``.
         
-        # Cleanup if over limit
-        if len(self._events) > self._max_events:
-            self._events = self._events[-self._max_events:]
+        Whole segments older than the cutoff are released; events in
+        time-ordered segments at the head of the log are trimmed
+        individually.
         
-        return True
+        Args:
+            cutoff: Oldest timestamp to retain
+            
+        Returns:
+            Number of events removed
+        """
+        limit = cutoff.timestamp()
+        removed = 0
+        with self._lock:
+            for segment in list(self._segments):
+                if segment.max_time < limit:
+                    while len(segment):
+                        self._rollup.remove(*segment.evict_first())
+                        removed += 1
+                    self._segments.remove(segment)
+            
+            while self._segments:
+                head = self._segments[0]
+                if not head.ordered or head.times[head.start] >= limit:
+                    break
+                while len(head) and head.times[head.start] < limit:
+                    self._rollup.remove(*head.evict_first())
+                    removed += 1
+                if len(head):
+                    break
+                self._segments.popleft()
+            
+            self._size -= removed
+        return removed
+    
+    @staticmethod
+    def _time_range(
+        start_time: Optional[datetime],
+        end_time: Optional[datetime]
+    ) -> Tuple[float, float]:
+        lo = start_time.timestamp() if start_time else -math.inf
+        hi = end_time.timestamp() if end_time else math.inf
+        return lo, hi
+    
+    def _overlapping(self, lo: float, hi: float) -> List[_AuditSegment]:
+        """Segments whose time bounds intersect [lo, hi] (lock held)."""
+        return [
+            segment for segment in self._segments
+            if len(segment) and segment.max_time >= lo and segment.min_time <= hi
+        ]
     
     def query(
         self,
@@ -296,34 +680,72 @@ class AuditLogStorage:
         limit: int = 100,
         offset: int = 0
     ) -> List[AuditEvent]:
-        """Query audit events."""
-        results = self._events
-        
-        if actor_id:
-            results = [e for e in results if e.actor_id == actor_id]
-        
-        if target_id:
-            results = [e for e in results if e.target_id == target_id]
-        
-        if event_type:
-            results = [e for e in results if e.event_type == event_type]
+        """
+        Query audit events, newest first.
         
-        if category:
-            results = [e for e in results if e.category == category]
+        Segments are visited newest first and the scan stops once no
+        remaining segment can contribute to the requested page.
+        """
+        needed = offset + limit
+        if needed <= 0:
+            return []
         
-        if severity:
-            results = [e for e in results if e.severity == severity]
+        lo, hi = self._time_range(start_time, end_time)
+        type_key = event_type.value if event_type else None
+        category_key = category.value if category else None
         
-        if start_time:
-            results = [e for e in results if e.timestamp >= start_time]
+        with self._lock:
+            segments = self._overlapping(lo, hi)
+            segments.sort(key=lambda segment: segment.max_time, reverse=True)
+            
+            # (timestamp, -sequence, event): newest first, arrival order on ties
+            matches: List[Tuple[float, int, AuditEvent]] = []
+            for segment in segments:
+                if len(matches) >= needed and segment.max_time < matches[-1][0]:
+                    break
+                
+                for pos in segment.select(lo, hi, actor_id, target_id, type_key, category_key):
+                    event = segment.events[pos]
+                    if severity and event.severity != severity:
+                        continue
+                    matches.append((segment.times[pos], -(segment.base_seq + pos), event))
+                
+                matches.sort(key=lambda match: match[:2], reverse=True)
+                del matches[needed:]
         
-        if end_time:
-            results = [e for e in results if e.timestamp <= end_time]
+        return [event for _, _, event in matches[offset:needed]]
+    
+    def _count_range(self, lo: float, hi_excl: float) -> Dict[RollupKey, int]:
+        """Count raw events in [lo, hi_excl) by rollup key (lock held)."""
+        counts: Dict[RollupKey, int] = {}
+        for segment in self._overlapping(lo, hi_excl):
+            for pos in segment.select(lo, hi_excl):
+                if segment.times[pos] < hi_excl:
+                    key = AuditRollup.key_for(segment.events[pos])
+                    counts[key] = counts.get(key, 0) + 1
+        return counts
+    
+    def summarize(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> Dict[RollupKey, int]:
+        """
+        Count events in a time range by (category, type, severity, outcome).
         
-        # Sort by timestamp descending
-        results.sort(key=lambda e: e.timestamp, reverse=True)
+        Answered from the minute/hour rollups; only partial minutes at the
+        range edges are counted from the events.
         
-        return results[offset:offset + limit]
+        Args:
+            start_time: Earliest timestamp (inclusive)
+            end_time: Latest timestamp (inclusive)
+            
+        Returns:
+            Dictionary mapping rollup keys to counts
+        """
+        lo, hi = self._time_range(start_time, end_time)
+        with self._lock:
+            return self._rollup.totals(lo, hi, self._count_range)
     
     def count(
         self,
@@ -332,44 +754,473 @@ class AuditLogStorage:
         end_time: Optional[datetime] = None
     ) -> int:
         """Count matching events."""
-        results = self._events
-        
-        if event_type:
-            results = [e for e in results if e.event_type == event_type]
-        
-        if start_time:
-            results = [e for e in results if e.timestamp >= start_time]
+        if start_time is None and end_time is None and event_type is None:
+            return self._size
         
-        if end_time:
-            results = [e for e in results if e.timestamp <= end_time]
-        
-        return len(results)
+        type_key = event_type.value if event_type else None
+        return sum(
+            value for key, value in self.summarize(start_time, end_time).items()
+            if type_key is None or key[1] == type_key
+        )
     
     def get_statistics(self, hours: int = 24) -> Dict[str, Any]:
         """Get audit log statistics."""
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-        recent = [e for e in self._events if e.timestamp >= cutoff]
+        return summarize_rollup(self.summarize(start_time=cutoff), hours)
+    
+    def scan(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        category: Optional[AuditEventCategory] = None
+    ) -> Iterator[AuditEvent]:
+        """
+        Iterate events within a time range in storage order.
+        
+        Args:
+            start_time: Earliest timestamp (inclusive)
+            end_time: Latest timestamp (inclusive)
+            category: Only events of this category
+            
+        Yields:
+            Matching AuditEvents, oldest stored first
+        """
+        lo, hi = self._time_range(start_time, end_time)
+        category_key = category.value if category else None
+        with self._lock:
+            events = [
+                segment.events[pos]
+                for segment in self._overlapping(lo, hi)
+                for pos in segment.select(lo, hi, category_key=category_key)
+            ]
+        return iter(events)
+    
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """Get segment and capacity statistics."""
+        with self._lock:
+            return {
+                "events": self._size,
+                "max_events": self._max_events,
+                "segments": len(self._segments),
+                "segment_size": self._segment_size,
+                "stored_total": self._next_seq,
+                **self._rollup.get_stats()
+            }
+
+
+# ============================================================================
+# AUDIT PIPELINE
+# ============================================================================
+
+class BackpressureMode(Enum):
+    """What an audit pipeline does when its queue is full."""
+    
+    DROP = "drop"    # Discard the event and count it
+    BLOCK = "block"  # Wait for space (up to block_timeout)
+    SPILL = "spill"  # Append the event to a spill file, replayed later
+
+
+# Queue item: a built event or a zero-argument callable that builds one
+AuditItem = Union[AuditEvent, Callable[[], AuditEvent]]
+
+
+class AuditPipeline:
+    """
+    Non-blocking audit pipeline.
+    
+    Producers enqueue events (or deferred event builders) into a bounded
+    queue and return immediately. A background writer drains the queue
+    in batches into the storage backend, and events that need alerting
+    are handed to a separate alert worker, so slow alert handlers never
+    hold up storage and neither holds up the producer.
+    """
+    
+    def __init__(
+        self,
+        storage: Any,
+        max_queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        backpressure: BackpressureMode = BackpressureMode.DROP,
+        block_timeout: Optional[float] = None,
+        spill_path: Optional[str] = None,
+        alert_predicate: Optional[Callable[[AuditEvent], bool]] = None,
+        alert_handler: Optional[Callable[[AuditEvent], None]] = None,
+        max_alert_queue: int = 1000
+    ):
+        """
+        Initialize and start the pipeline.
+        
+        Args:
+            storage: Storage backend (AuditLogStorage or FileAuditLogStorage)
+            max_queue_size: Maximum queued events
+            batch_size: Maximum events written per batch
+            flush_interval: Maximum seconds a queued event waits for a batch
+            backpressure: Behaviour when the queue is full
+            block_timeout: Seconds to wait in BLOCK mode before dropping (None waits)
+            spill_path: Spill file used in SPILL mode
+            alert_predicate: Selects events passed to the alert handler
+            alert_handler: Called on the alert worker for selected events
+            max_alert_queue: Maximum events waiting for the alert handler
+            
+        Raises:
+            ValueError: If sizes are not positive or SPILL mode has no spill_path
+        """
+        if max_queue_size <= 0 or batch_size <= 0 or max_alert_queue <= 0:
+            raise ValueError("Queue and batch sizes must be positive")
+        if backpressure == BackpressureMode.SPILL and not spill_path:
+            raise ValueError("SPILL backpressure requires a spill_path")
         
-        by_type = {}
-        by_severity = {}
-        by_outcome = {}
+        self._storage = storage
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self.spill_path = spill_path
+        self._alert_predicate = alert_predicate
+        self._alert_handler = alert_handler
+        self.max_alert_queue = max_alert_queue
+        
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        # (enqueue time, item), oldest first
+        self._queue: Deque[Tuple[float, AuditItem]] = deque()
+        self._closed = False
+        self._flush_requested = False
+        
+        self._alert_cond = threading.Condition()
+        self._alert_queue: Deque[AuditEvent] = deque()
+        self._alert_busy = False
+        
+        self._spill_lock = threading.Lock()
+        self._spill_pending = self._count_spilled()
+        
+        # Metrics (guarded by _lock, alert metrics by _alert_cond)
+        self._enqueued = 0
+        self._processed = 0
+        self._written = 0
+        self._dropped = 0
+        self._spilled = 0
+        self._replayed = 0
+        self._write_errors = 0
+        self._batches = 0
+        self._last_batch_size = 0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+        self._alerts_dispatched = 0
+        self._alerts_dropped = 0
+        self._alert_errors = 0
+        
+        self._writer = threading.Thread(target=self._run_writer, name="audit-writer", daemon=True)
+        self._alerter = threading.Thread(target=self._run_alerts, name="audit-alerts", daemon=True)
+        self._writer.start()
+        self._alerter.start()
+    
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+    
+    def submit(self, item: AuditItem) -> bool:
+        """
+        Enqueue an event without waiting for it to be stored.
         
-        for event in recent:
-            type_key = event.event_type.value
-            by_type[type_key] = by_type.get(type_key, 0) + 1
+        Args:
+            item: AuditEvent, or a callable building one on the writer thread
+            
+        Returns:
+            True if the event was queued or spilled, False if it was dropped
+            
+        Raises:
+            RuntimeError: If the pipeline is closed
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Audit pipeline is closed")
             
-            sev_key = event.severity.value
-            by_severity[sev_key] = by_severity.get(sev_key, 0) + 1
+            if len(self._queue) >= self.max_queue_size:
+                if self.backpressure == BackpressureMode.BLOCK:
+                    self._not_full.wait_for(
+                        lambda: self._closed or len(self._queue) < self.max_queue_size,
+                        self.block_timeout
+                    )
+                    if self._closed:
+                        raise RuntimeError("Audit pipeline is closed")
+                if len(self._queue) >= self.max_queue_size:
+                    if self.backpressure != BackpressureMode.SPILL:
+                        self._dropped += 1
+                        return False
+                    spill = True
+                else:
+                    spill = False
+            else:
+                spill = False
             
-            by_outcome[event.outcome] = by_outcome.get(event.outcome, 0) + 1
+            if not spill:
+                self._queue.append((time.monotonic(), item))
+                self._enqueued += 1
+                if len(self._queue) >= self.batch_size:
+                    self._not_empty.notify()
+                return True
         
-        return {
-            "total_events": len(recent),
-            "time_period_hours": hours,
-            "by_type": by_type,
-            "by_severity": by_severity,
-            "by_outcome": by_outcome
-        }
+        return self._spill(item)
+    
+    @staticmethod
+    def _build(item: AuditItem) -> AuditEvent:
+        return item if isinstance(item, AuditEvent) else item()
+    
+    def _spill(self, item: AuditItem) -> bool:
+        """Append an overflowing event to the spill file."""
+        try:
+            line = self._build(item).to_json() + "\n"
+            with self._spill_lock:
+                with open(self.spill_path, "a", encoding="utf-8") as f:
+                    f.write(line)
+        except Exception:
+            with self._lock:
+                self._dropped += 1
+            return False
+        
+        with self._lock:
+            self._spilled += 1
+            self._spill_pending += 1
+        return True
+    
+    def _count_spilled(self) -> int:
+        """Count events left in spill files by a previous run."""
+        if not self.spill_path:
+            return 0
+        total = 0
+        for path in (self.spill_path + ".replay", self.spill_path):
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    total += sum(1 for _ in f)
+        return total
+    
+    # ------------------------------------------------------------------
+    # Writer
+    # ------------------------------------------------------------------
+    
+    def _run_writer(self):
+        while True:
+            with self._lock:
+                if (
+                    len(self._queue) < self.batch_size
+                    and not self._closed
+                    and not self._flush_requested
+                ):
+                    self._not_empty.wait(self.flush_interval)
+                
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(self.batch_size, len(self._queue)))
+                ]
+                if batch:
+                    self._not_full.notify_all()
+                elif self._flush_requested and not self._spill_pending:
+                    self._flush_requested = False
+                    self._idle.notify_all()
+                replay = not batch and self._spill_pending > 0
+                if not batch and not replay and self._closed:
+                    self._idle.notify_all()
+                    return
+            
+            if batch:
+                self._write_batch(batch)
+                with self._lock:
+                    self._processed += len(batch)
+                    self._idle.notify_all()
+            elif replay:
+                self._replay_spill()
+    
+    def _write_batch(self, batch: List[Tuple[float, AuditItem]]):
+        """Build, store and route one batch of events."""
+        lag = time.monotonic() - batch[0][0]
+        events = []
+        for _, item in batch:
+            try:
+                events.append(self._build(item))
+            except Exception:
+                with self._lock:
+                    self._write_errors += 1
+        self._store(events)
+        with self._lock:
+            self._batches += 1
+            self._last_batch_size = len(batch)
+            self._last_lag = lag
+            self._max_lag = max(self._max_lag, lag)
+    
+    def _store(self, events: List[AuditEvent]):
+        """Write events to storage and queue alerts."""
+        if not events:
+            return
+        try:
+            store_many = getattr(self._storage, "store_many", None)
+            if store_many is not None:
+                store_many(events)
+            else:
+                for event in events:
+                    self._storage.store(event)
+        except Exception:
+            with self._lock:
+                self._write_errors += len(events)
+            return
+        
+        with self._lock:
+            self._written += len(events)
+        
+        if self._alert_handler is None:
+            return
+        predicate = self._alert_predicate
+        selected = [e for e in events if predicate is None or predicate(e)]
+        if selected:
+            with self._alert_cond:
+                for event in selected:
+                    if len(self._alert_queue) >= self.max_alert_queue:
+                        self._alerts_dropped += 1
+                    else:
+                        self._alert_queue.append(event)
+                self._alert_cond.notify()
+    
+    def _replay_spill(self):
+        """Store events spilled while the queue was full."""
+        replay_path = self.spill_path + ".replay"
+        with self._spill_lock:
+            if not os.path.exists(replay_path) and os.path.exists(self.spill_path):
+                os.replace(self.spill_path, replay_path)
+        
+        replayed = 0
+        if os.path.exists(replay_path):
+            with open(replay_path, "r", encoding="utf-8") as f:
+                events = []
+                for line in f:
+                    replayed += 1
+                    try:
+                        events.append(AuditEvent.from_dict(json.loads(line)))
+                    except (ValueError, KeyError):
+                        with self._lock:
+                            self._write_errors += 1
+                        continue
+                    if len(events) >= self.batch_size:
+                        self._store(events)
+                        events = []
+                self._store(events)
+            os.remove(replay_path)
+        
+        with self._lock:
+            self._replayed += replayed
+            self._spill_pending = max(0, self._spill_pending - replayed)
+            if not replayed:
+                self._spill_pending = 0
+            self._idle.notify_all()
+    
+    # ------------------------------------------------------------------
+    # Alerts
+    # ------------------------------------------------------------------
+    
+    def _run_alerts(self):
+        while True:
+            with self._alert_cond:
+                self._alert_busy = False
+                self._alert_cond.notify_all()
+                while not self._alert_queue and not self._closed:
+                    self._alert_cond.wait()
+                if not self._alert_queue:
+                    return
+                event = self._alert_queue.popleft()
+                self._alert_busy = True
+            
+            try:
+                self._alert_handler(event)
+                with self._alert_cond:
+                    self._alerts_dispatched += 1
+            except Exception:
+                with self._alert_cond:
+                    self._alert_errors += 1
+    
+    # ------------------------------------------------------------------
+    # Control and metrics
+    # ------------------------------------------------------------------
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until everything submitted so far is stored and alerted.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            True if the pipeline drained within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - time.monotonic())
+        
+        with self._lock:
+            target = self._enqueued
+            self._flush_requested = True
+            self._not_empty.notify()
+            drained = self._idle.wait_for(
+                lambda: self._processed >= target and not self._spill_pending,
+                remaining()
+            )
+        if not drained:
+            return False
+        
+        storage_flush = getattr(self._storage, "flush", None)
+        if storage_flush is not None:
+            storage_flush()
+        
+        with self._alert_cond:
+            return self._alert_cond.wait_for(
+                lambda: not self._alert_queue and not self._alert_busy,
+                remaining()
+            )
+    
+    def close(self, timeout: Optional[float] = None):
+        """Drain the queue and stop the worker threads."""
+        self.flush(timeout)
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        with self._alert_cond:
+            self._alert_cond.notify_all()
+        self._writer.join(timeout)
+        self._alerter.join(timeout)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue depth, lag and throughput counters."""
+        with self._lock:
+            lag = time.monotonic() - self._queue[0][0] if self._queue else 0.0
+            metrics = {
+                "backpressure": self.backpressure.value,
+                "queue_depth": len(self._queue),
+                "max_queue_size": self.max_queue_size,
+                "queue_lag_seconds": lag,
+                "last_batch_lag_seconds": self._last_lag,
+                "max_batch_lag_seconds": self._max_lag,
+                "enqueued": self._enqueued,
+                "written": self._written,
+                "dropped": self._dropped,
+                "spilled": self._spilled,
+                "spill_pending": self._spill_pending,
+                "replayed": self._replayed,
+                "write_errors": self._write_errors,
+                "batches": self._batches,
+                "last_batch_size": self._last_batch_size
+            }
+        with self._alert_cond:
+            metrics.update({
+                "alert_queue_depth": len(self._alert_queue),
+                "alerts_dispatched": self._alerts_dispatched,
+                "alerts_dropped": self._alerts_dropped,
+                "alert_errors": self._alert_errors
+            })
+        return metrics
 
 
 # ============================================================================
@@ -386,11 +1237,52 @@ class AuditLogger:
     - Query and search capabilities
     - Compliance reporting
     - Alert generation
+    - Optional asynchronous pipeline (see enable_pipeline)
     """
     
     def __init__(self, storage: Optional[AuditLogStorage] = None):
-        self._storage = storage or AuditLogStorage()
+        self._storage = storage if storage is not None else AuditLogStorage()
         self._alert_handlers: List[callable] = []
+        self._pipeline: Optional[AuditPipeline] = None
+    
+    @property
+    def pipeline(self) -> Optional[AuditPipeline]:
+        """The asynchronous pipeline, if enabled."""
+        return self._pipeline
+    
+    def enable_pipeline(self, **options) -> AuditPipeline:
+        """
+        Route events through an asynchronous AuditPipeline.
+        
+        Once enabled, log() still returns the built event but storage and
+        alert handlers run on the pipeline's worker threads, and submit()
+        defers building the event as well.
+        
+        Args:
+            **options: AuditPipeline options (queue size, backpressure, ...)
+            
+        Returns:
+            The pipeline
+        """
+        if self._pipeline is None:
+            self._pipeline = AuditPipeline(
+                self._storage,
+                alert_predicate=self._should_alert,
+                alert_handler=self._dispatch_alert,
+                **options
+            )
+        return self._pipeline
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for pipelined events to be stored (no-op when synchronous)."""
+        if self._pipeline is None:
+            return True
+        return self._pipeline.flush(timeout)
+    
+    def close(self, timeout: Optional[float] = None):
+        """Drain and stop the pipeline, if enabled."""
+        if self._pipeline is not None:
+            self._pipeline.close(timeout)
     
     def log(
         self,
@@ -427,6 +1319,77 @@ class AuditLogger:
         Returns:
             The created AuditEvent
         """
+        event = self._build_event(
+            event_type,
+            f"evt_{secrets.token_hex(12)}",
+            datetime.now(timezone.utc),
+            actor_id=actor_id,
+            target_id=target_id,
+            target_type=target_type,
+            action=action,
+            outcome=outcome,
+            message=message,
+            details=details,
+            severity=severity,
+            actor_ip=actor_ip,
+            session_id=session_id,
+            request_id=request_id
+        )
+        
+        if self._pipeline is not None:
+            self._pipeline.submit(event)
+            return event
+        
+        # Store event
+        self._storage.store(event)
+        
+        # Check for alerts
+        self._check_alerts(event)
+        
+        return event
+    
+    def submit(self, event_type: AuditEventType, **fields) -> str:
+        """
+        Log an audit event without waiting for it to be built or stored.
+        
+        Takes the same keyword arguments as log(). The event ID and
+        timestamp are fixed now; hashing, storage and alerting happen on
+        the pipeline (or inline if no pipeline is enabled).
+        
+        Returns:
+            The event ID
+        """
+        event_id = f"evt_{secrets.token_hex(12)}"
+        timestamp = datetime.now(timezone.utc)
+        
+        if self._pipeline is None:
+            event = self._build_event(event_type, event_id, timestamp, **fields)
+            self._storage.store(event)
+            self._check_alerts(event)
+        else:
+            self._pipeline.submit(
+                functools.partial(self._build_event, event_type, event_id, timestamp, **fields)
+            )
+        return event_id
+    
+    def _build_event(
+        self,
+        event_type: AuditEventType,
+        event_id: str,
+        timestamp: datetime,
+        actor_id: Optional[str] = None,
+        target_id: Optional[str] = None,
+        target_type: Optional[str] = None,
+        action: str = "",
+        outcome: str = "success",
+        message: str = "",
+        details: Optional[Dict[str, Any]] = None,
+        severity: Optional[AuditSeverity] = None,
+        actor_ip: Optional[str] = None,
+        session_id: Optional[str] = None,
+        request_id: Optional[str] = None
+    ) -> AuditEvent:
+        """Create an event, filling in category and severity."""
         # Auto-detect category
         category = self._determine_category(event_type)
         
@@ -434,13 +1397,12 @@ class AuditLogger:
         if severity is None:
             severity = self._determine_severity(event_type, outcome)
         
-        # Create event
-        event = AuditEvent(
-            event_id=f"evt_{secrets.token_hex(12)}",
+        return AuditEvent(
+            event_id=event_id,
             event_type=event_type,
             category=category,
             severity=severity,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp,
             actor_id=actor_id,
             actor_ip=actor_ip,
             target_type=target_type,
@@ -452,14 +1414,6 @@ class AuditLogger:
             session_id=session_id,
             request_id=request_id
         )
-        
-        # Store event
-        self._storage.store(event)
-        
-        # Check for alerts
-        self._check_alerts(event)
-        
-        return event
     
     def _determine_category(self, event_type: AuditEventType) -> AuditEventCategory:
         """Determine category from event type."""
@@ -526,13 +1480,21 @@ class AuditLogger:
     
     def _check_alerts(self, event: AuditEvent):
         """Check if event should trigger alerts."""
+        if self._should_alert(event):
+            self._dispatch_alert(event)
+    
+    def _should_alert(self, event: AuditEvent) -> bool:
+        """Whether an event triggers alert handlers."""
         # Critical events always alert
-        if event.severity == AuditSeverity.CRITICAL:
-            for handler in self._alert_handlers:
-                try:
-                    handler(event)
-                except Exception:
-                    pass
+        return event.severity == AuditSeverity.CRITICAL
+    
+    def _dispatch_alert(self, event: AuditEvent):
+        """Run alert handlers for an event."""
+        for handler in self._alert_handlers:
+            try:
+                handler(event)
+            except Exception:
+                pass
     
     def register_alert_handler(self, handler: callable):
         """Register an alert handler."""
@@ -628,17 +1590,11 @@ class AuditLogger:
         include_details: bool = False
     ) -> Dict[str, Any]:
         """Generate a compliance report."""
-        events = self._storage.query(
-            start_time=start_time,
-            end_time=end_time,
-            limit=100000
-        )
-        
         report = {
             "report_generated": datetime.now(timezone.utc).isoformat(),
             "period_start": start_time.isoformat(),
             "period_end": end_time.isoformat(),
-            "total_events": len(events),
+            "total_events": 0,
             "summary": {
                 "authentication_events": 0,
                 "key_management_events": 0,
@@ -655,36 +1611,43 @@ class AuditLogger:
             "compliance_status": "compliant"
         }
         
-        for event in events:
-            if event.category == AuditEventCategory.AUTHENTICATION:
-                report["summary"]["authentication_events"] += 1
-                if event.event_type == AuditEventType.AUTH_ATTEMPT:
-                    report["auth_statistics"]["total_attempts"] += 1
-                elif event.event_type == AuditEventType.AUTH_SUCCESS:
-                    report["auth_statistics"]["successful"] += 1
-                elif event.event_type == AuditEventType.AUTH_FAILURE:
-                    report["auth_statistics"]["failed"] += 1
-                elif event.event_type == AuditEventType.MFA_CHALLENGE:
-                    report["auth_statistics"]["mfa_challenges"] += 1
-            
-            elif event.category == AuditEventCategory.KEY_MANAGEMENT:
-                report["summary"]["key_management_events"] += 1
-            
-            elif event.category == AuditEventCategory.SECURITY:
-                report["summary"]["security_events"] += 1
-                if event.severity in [AuditSeverity.CRITICAL, AuditSeverity.ERROR]:
-                    incident = {
-                        "event_id": event.event_id,
-                        "timestamp": event.timestamp.isoformat(),
-                        "type": event.event_type.value,
-                        "message": event.message
-                    }
-                    if include_details:
-                        incident["details"] = event.details
-                    report["security_incidents"].append(incident)
-            
-            elif event.category == AuditEventCategory.ADMINISTRATIVE:
-                report["summary"]["administrative_events"] += 1
+        auth_counters = {
+            AuditEventType.AUTH_ATTEMPT.value: "total_attempts",
+            AuditEventType.AUTH_SUCCESS.value: "successful",
+            AuditEventType.AUTH_FAILURE.value: "failed",
+            AuditEventType.MFA_CHALLENGE.value: "mfa_challenges",
+        }
+        category_counters = {
+            AuditEventCategory.AUTHENTICATION.value: "authentication_events",
+            AuditEventCategory.KEY_MANAGEMENT.value: "key_management_events",
+            AuditEventCategory.SECURITY.value: "security_events",
+            AuditEventCategory.ADMINISTRATIVE.value: "administrative_events",
+        }
+        
+        # Counts come from the storage rollups
+        for (category, event_type, _, _), value in self._storage.summarize(start_time, end_time).items():
+            report["total_events"] += value
+            summary_key = category_counters.get(category)
+            if summary_key:
+                report["summary"][summary_key] += value
+            if category == AuditEventCategory.AUTHENTICATION.value and event_type in auth_counters:
+                report["auth_statistics"][auth_counters[event_type]] += value
+        
+        # Incidents need the events themselves, but only security ones
+        for event in self._storage.scan(start_time, end_time, category=AuditEventCategory.SECURITY):
+            if event.severity in [AuditSeverity.CRITICAL, AuditSeverity.ERROR]:
+                incident = {
+                    "event_id": event.event_id,
+                    "timestamp": event.timestamp.isoformat(),
+                    "type": event.event_type.value,
+                    "message": event.message
+                }
+                if include_details:
+                    incident["details"] = event.details
+                report["security_incidents"].append(incident)
+        
+        # Newest incidents first
+        report["security_incidents"].sort(key=lambda incident: incident["timestamp"], reverse=True)
         
         return report
 
@@ -699,5 +1662,8 @@ __all__ = [
     "AuditSeverity",
     "AuditEvent",
     "AuditLogStorage",
+    "AuditPipeline",
     "AuditLogger",
+    "AuditRollup",
+    "BackpressureMode",
 ]
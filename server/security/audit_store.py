@@ -0,0 +1,937 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+"""
+DNA-Key Authentication System - Persistent Audit Log Store
+
+Append-only, segmented on-disk storage for audit events:
+
+1. Events are appended as JSON lines to numbered segment files, with
+   group commit (one write and fsync per batch) on a background thread,
+   so logging never waits on the disk.
+2. Each sealed segment has a manifest holding its time bounds, counters
+   by type/severity/outcome, the set of actors it contains and a sparse
+   timestamp -> offset index. Queries consult manifests first and mmap
+   only the segments that can match.
+3. Segments form a hash chain: every segment starts with a header that
+   names the previous segment's hash, and its own hash covers that
+   header and all of its records. A time range is verified by checking
+   the manifest chain and re-hashing only the segments in the range.
+"""
+
+import hashlib
+import json
+import math
+import mmap
+import os
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from server.security.audit_logging import (
+    AuditEvent,
+    AuditEventCategory,
+    AuditEventType,
+    AuditRollup,
+    AuditSeverity,
+    RollupKey,
+    summarize_rollup,
+)
+
+
+# Previous-segment hash of the first segment
+GENESIS_HASH = "0" * 64
+
+
+@dataclass
+class AuditSegmentInfo:
+    """Manifest of one audit log segment."""
+    
+    segment_id: int
+    prev_hash: str
+    
+    # Byte offset of the first record (after the header line) and file size
+    data_start: int = 0
+    size: int = 0
+    
+    count: int = 0
+    min_time: float = math.inf
+    max_time: float = -math.inf
+    ordered: bool = True
+    
+    # Sparse index: (timestamp, offset) of every Nth record
+    sparse: List[Tuple[float, int]] = field(default_factory=list)
+    
+    # Distinct actors (None once the set grew past the tracking limit)
+    actors: Optional[Set[str]] = field(default_factory=set)
+    
+    by_type: Dict[str, int] = field(default_factory=dict)
+    by_severity: Dict[str, int] = field(default_factory=dict)
+    by_outcome: Dict[str, int] = field(default_factory=dict)
+    
+    # Joint (category, type, severity, outcome) counts; None if unknown
+    by_key: Optional[Dict[RollupKey, int]] = field(default_factory=dict)
+    
+    content_hash: str = ""
+    segment_hash: str = ""
+    sealed: bool = False
+    
+    def record(
+        self,
+        event: AuditEvent,
+        ts: float,
+        offset: int,
+        index_interval: int,
+        max_actors: int
+    ):
+        """Account for a record appended at ``offset``."""
+        if self.count % index_interval == 0:
+            self.sparse.append((ts, offset))
+        if ts < self.max_time:
+            self.ordered = False
+        self.count += 1
+        self.min_time = min(self.min_time, ts)
+        self.max_time = max(self.max_time, ts)
+        
+        if self.actors is not None and event.actor_id:
+            self.actors.add(event.actor_id)
+            if len(self.actors) > max_actors:
+                self.actors = None
+        
+        type_key = event.event_type.value
+        self.by_type[type_key] = self.by_type.get(type_key, 0) + 1
+        sev_key = event.severity.value
+        self.by_severity[sev_key] = self.by_severity.get(sev_key, 0) + 1
+        self.by_outcome[event.outcome] = self.by_outcome.get(event.outcome, 0) + 1
+        if self.by_key is not None:
+            key = AuditRollup.key_for(event)
+            self.by_key[key] = self.by_key.get(key, 0) + 1
+    
+    def compute_segment_hash(self) -> str:
+        """Hash linking this segment's content to the previous segment."""
+        data = f"{self.segment_id}:{self.prev_hash}:{self.content_hash}:{self.count}"
+        return hashlib.sha3_256(data.encode()).hexdigest()
+    
+    def may_contain(self, actor_id: Optional[str], type_key: Optional[str]) -> bool:
+        """Whether the segment can hold events for the given filters."""
+        if actor_id and self.actors is not None and actor_id not in self.actors:
+            return False
+        if type_key and type_key not in self.by_type:
+            return False
+        return True
+    
+    def snapshot(self) -> "AuditSegmentInfo":
+        """Copy of a live manifest that later appends do not change."""
+        return AuditSegmentInfo(
+            segment_id=self.segment_id,
+            prev_hash=self.prev_hash,
+            data_start=self.data_start,
+            size=self.size,
+            count=self.count,
+            min_time=self.min_time,
+            max_time=self.max_time,
+            ordered=self.ordered,
+            sparse=list(self.sparse),
+            actors=None if self.actors is None else set(self.actors),
+            by_type=dict(self.by_type),
+            by_severity=dict(self.by_severity),
+            by_outcome=dict(self.by_outcome),
+            by_key=None if self.by_key is None else dict(self.by_key),
+            content_hash=self.content_hash,
+            segment_hash=self.segment_hash,
+            sealed=self.sealed
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "segment_id": self.segment_id,
+            "prev_hash": self.prev_hash,
+            "data_start": self.data_start,
+            "size": self.size,
+            "count": self.count,
+            "min_time": self.min_time if self.count else None,
+            "max_time": self.max_time if self.count else None,
+            "ordered": self.ordered,
+            "sparse": self.sparse,
+            "actors": None if self.actors is None else sorted(self.actors),
+            "by_type": self.by_type,
+            "by_severity": self.by_severity,
+            "by_outcome": self.by_outcome,
+            "by_key": None if self.by_key is None else [
+                [*key, value] for key, value in self.by_key.items()
+            ],
+            "content_hash": self.content_hash,
+            "segment_hash": self.segment_hash,
+            "sealed": self.sealed
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AuditSegmentInfo":
+        """Create from dictionary."""
+        actors = data.get("actors")
+        by_key = data.get("by_key")
+        return cls(
+            segment_id=data["segment_id"],
+            prev_hash=data["prev_hash"],
+            data_start=data["data_start"],
+            size=data["size"],
+            count=data["count"],
+            min_time=math.inf if data["min_time"] is None else data["min_time"],
+            max_time=-math.inf if data["max_time"] is None else data["max_time"],
+            ordered=data["ordered"],
+            sparse=[(ts, offset) for ts, offset in data["sparse"]],
+            actors=None if actors is None else set(actors),
+            by_type=data["by_type"],
+            by_severity=data["by_severity"],
+            by_outcome=data["by_outcome"],
+            by_key=None if by_key is None else {
+                tuple(entry[:4]): entry[4] for entry in by_key
+            },
+            content_hash=data["content_hash"],
+            segment_hash=data["segment_hash"],
+            sealed=data["sealed"]
+        )
+
+
+class FileAuditLogStorage:
+    """
+    Persistent audit log storage on local disk.
+    
+    Drop-in replacement for AuditLogStorage: store() only queues the
+    event and a background thread appends queued events in batches, so
+    the authentication path never waits for a write or fsync. Reads
+    flush pending events first and then scan the segment files through
+    mmap, guided by the segment manifests.
+    """
+    
+    SEGMENT_PREFIX = "audit-"
+    DATA_SUFFIX = ".log"
+    MANIFEST_SUFFIX = ".idx"
+    
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 16 * 1024 * 1024,
+        flush_interval: float = 0.05,
+        flush_batch: int = 512,
+        index_interval: int = 256,
+        max_indexed_actors: int = 4096,
+        fsync: bool = True
+    ):
+        """
+        Initialize persistent storage.
+        
+        Args:
+            directory: Directory for segment files (created if missing)
+            segment_max_bytes: Size at which the active segment is sealed
+            flush_interval: Maximum seconds an event waits before it is written
+            flush_batch: Queued events that trigger an immediate write
+            index_interval: Records between sparse index entries
+            max_indexed_actors: Distinct actors tracked per segment manifest
+            fsync: Whether to fsync after every batch
+        """
+        if segment_max_bytes <= 0 or flush_batch <= 0 or index_interval <= 0:
+            raise ValueError("segment_max_bytes, flush_batch and index_interval must be positive")
+        
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+        self.index_interval = index_interval
+        self.max_indexed_actors = max_indexed_actors
+        self.fsync = fsync
+        
+        os.makedirs(directory, exist_ok=True)
+        
+        # Queued events; guarded by _cond
+        self._cond = threading.Condition()
+        self._pending: List[AuditEvent] = []
+        self._closed = False
+        
+        # Segment files and manifests; guarded by _io_lock
+        self._io_lock = threading.Lock()
+        self._segments: List[AuditSegmentInfo] = []
+        self._active_file = None
+        self._active_hasher = None
+        self._batches_written = 0
+        self._write_errors = 0
+        
+        self._open_segments()
+        
+        self._flusher = threading.Thread(
+            target=self._run_flusher,
+            name="audit-log-flusher",
+            daemon=True
+        )
+        self._flusher.start()
+    
+    # ------------------------------------------------------------------
+    # Segment files
+    # ------------------------------------------------------------------
+    
+    def _data_path(self, segment_id: int) -> str:
+        return os.path.join(self.directory, f"{self.SEGMENT_PREFIX}{segment_id:08d}{self.DATA_SUFFIX}")
+    
+    def _manifest_path(self, segment_id: int) -> str:
+        return os.path.join(self.directory, f"{self.SEGMENT_PREFIX}{segment_id:08d}{self.MANIFEST_SUFFIX}")
+    
+    def _segment_ids(self) -> List[int]:
+        ids = []
+        for name in os.listdir(self.directory):
+            if name.startswith(self.SEGMENT_PREFIX) and name.endswith(self.DATA_SUFFIX):
+                stem = name[len(self.SEGMENT_PREFIX):-len(self.DATA_SUFFIX)]
+                if stem.isdigit():
+                    ids.append(int(stem))
+        return sorted(ids)
+    
+    @staticmethod
+    def _encode(event: AuditEvent) -> bytes:
+        record = event.to_dict()
+        record["ts"] = event.timestamp.timestamp()
+        return json.dumps(record, default=str).encode() + b"\n"
+    
+    def _open_segments(self):
+        """Load manifests, recovering the last segment after a crash."""
+        ids = self._segment_ids()
+        for position, segment_id in enumerate(ids):
+            info = None
+            manifest_path = self._manifest_path(segment_id)
+            if os.path.exists(manifest_path):
+                with open(manifest_path, "r") as f:
+                    info = AuditSegmentInfo.from_dict(json.load(f))
+            
+            if info is None or not info.sealed:
+                prev_hash = self._segments[-1].segment_hash if self._segments else GENESIS_HASH
+                info, hasher = self._recover_segment(segment_id, prev_hash)
+                if position < len(ids) - 1:
+                    self._seal(info, hasher)
+                else:
+                    self._segments.append(info)
+                    self._active_hasher = hasher
+                    self._active_file = open(self._data_path(segment_id), "ab")
+                    continue
+            self._segments.append(info)
+        
+        if not self._segments or self._segments[-1].sealed:
+            prev_hash = self._segments[-1].segment_hash if self._segments else GENESIS_HASH
+            next_id = self._segments[-1].segment_id + 1 if self._segments else 0
+            self._start_segment(next_id, prev_hash)
+    
+    def _recover_segment(self, segment_id: int, prev_hash: str) -> Tuple[AuditSegmentInfo, Any]:
+        """
+        Rebuild the manifest of an unsealed segment from its data file.
+        
+        A torn or unparsable tail left by a crash is truncated away, and
+        a header torn while the segment was being created is rewritten.
+        
+        Raises:
+            ValueError: If the segment header is present but invalid
+        """
+        path = self._data_path(segment_id)
+        with open(path, "rb") as f:
+            data = f.read()
+        
+        end = data.find(b"\n")
+        if end < 0:
+            data = json.dumps({"segment": segment_id, "prev_hash": prev_hash}).encode() + b"\n"
+            with open(path, "wb") as f:
+                f.write(data)
+            end = len(data) - 1
+        
+        try:
+            header = json.loads(data[:end])
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get("segment") != segment_id:
+            raise ValueError(f"Corrupt audit segment header: {path}")
+        
+        info = AuditSegmentInfo(segment_id=segment_id, prev_hash=header["prev_hash"])
+        info.data_start = end + 1
+        pos = info.data_start
+        while pos < len(data):
+            end = data.find(b"\n", pos)
+            if end < 0:
+                break
+            try:
+                record = json.loads(data[pos:end])
+                event = AuditEvent.from_dict(record)
+            except (ValueError, KeyError):
+                break
+            info.record(event, record["ts"], pos, self.index_interval, self.max_indexed_actors)
+            pos = end + 1
+        
+        if pos < len(data):
+            with open(path, "r+b") as f:
+                f.truncate(pos)
+        
+        info.size = pos
+        hasher = hashlib.sha3_256(data[:pos])
+        return info, hasher
+    
+    def _start_segment(self, segment_id: int, prev_hash: str):
+        """Create a new active segment chained to ``prev_hash``."""
+        header = json.dumps({"segment": segment_id, "prev_hash": prev_hash}).encode() + b"\n"
+        info = AuditSegmentInfo(
+            segment_id=segment_id,
+            prev_hash=prev_hash,
+            data_start=len(header),
+            size=len(header)
+        )
+        self._active_file = open(self._data_path(segment_id), "ab")
+        self._active_file.write(header)
+        self._sync()
+        self._active_hasher = hashlib.sha3_256(header)
+        self._segments.append(info)
+    
+    def _seal(self, info: AuditSegmentInfo, hasher: Any):
+        """Finalize a segment's hashes and persist its manifest."""
+        info.content_hash = hasher.hexdigest()
+        info.segment_hash = info.compute_segment_hash()
+        info.sealed = True
+        
+        path = self._manifest_path(info.segment_id)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(info.to_dict(), f)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    
+    def _rotate(self):
+        """Seal the active segment and start the next one."""
+        active = self._segments[-1]
+        self._active_file.close()
+        self._seal(active, self._active_hasher)
+        self._start_segment(active.segment_id + 1, active.segment_hash)
+    
+    def _sync(self):
+        self._active_file.flush()
+        if self.fsync:
+            os.fsync(self._active_file.fileno())
+    
+    def _write_batch(self, events: List[AuditEvent]):
+        """
+        Append a batch of events with one write and fsync per segment.
+        
+        If a write fails, the events not yet on disk are put back at the
+        front of the queue before the error propagates.
+        """
+        written = 0
+        try:
+            chunk: List[Tuple[AuditEvent, bytes]] = []
+            chunk_size = 0
+            for event in events:
+                line = self._encode(event)
+                active = self._segments[-1]
+                if (active.count or chunk) and active.size + chunk_size + len(line) > self.segment_max_bytes:
+                    self._write_chunk(chunk)
+                    written += len(chunk)
+                    chunk, chunk_size = [], 0
+                    self._rotate()
+                chunk.append((event, line))
+                chunk_size += len(line)
+            
+            self._write_chunk(chunk)
+            written += len(chunk)
+        except BaseException:
+            with self._cond:
+                self._pending[:0] = events[written:]
+            raise
+        self._batches_written += 1
+    
+    def _write_chunk(self, chunk: List[Tuple[AuditEvent, bytes]]):
+        """Write events to the active segment, then add them to its manifest."""
+        if not chunk:
+            return
+        active = self._segments[-1]
+        data = b"".join(line for _, line in chunk)
+        try:
+            self._active_file.write(data)
+            self._sync()
+        except OSError:
+            self._discard_partial_write(active)
+            raise
+        
+        self._active_hasher.update(data)
+        offset = active.size
+        for event, line in chunk:
+            active.record(event, event.timestamp.timestamp(), offset, self.index_interval, self.max_indexed_actors)
+            offset += len(line)
+        active.size = offset
+    
+    def _discard_partial_write(self, active: AuditSegmentInfo):
+        """Cut the active file back to its manifest size after a failed write."""
+        path = self._data_path(active.segment_id)
+        try:
+            self._active_file.close()
+        except OSError:
+            # Closing drops whatever the failed write left buffered
+            pass
+        try:
+            with open(path, "r+b") as f:
+                f.truncate(active.size)
+        finally:
+            self._active_file = open(path, "ab")
+    
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+    
+    def store(self, event: AuditEvent) -> bool:
+        """
+        Queue an audit event for writing.
+        
+        If the writer falls far behind, the caller writes the backlog
+        itself rather than letting the queue grow without bound.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Audit log storage is closed")
+            self._pending.append(event)
+            backlog = len(self._pending)
+            if backlog >= self.flush_batch:
+                self._cond.notify()
+        
+        if backlog >= self.flush_batch * 8:
+            self.flush()
+        return True
+    
+    def flush(self):
+        """Write all queued events to disk."""
+        with self._io_lock:
+            with self._cond:
+                batch, self._pending = self._pending, []
+            if batch:
+                self._write_batch(batch)
+    
+    def _run_flusher(self):
+        while True:
+            with self._cond:
+                if not self._closed and len(self._pending) < self.flush_batch:
+                    self._cond.wait(self.flush_interval)
+                closed = self._closed
+            try:
+                self.flush()
+            except Exception as e:
+                # The batch is back in the queue; retry on the next interval
+                # instead of losing the writer thread
+                with self._cond:
+                    self._write_errors += 1
+                    if not closed:
+                        self._cond.wait(self.flush_interval)
+                print(f"[WARNING] Audit log write failed: {e}")
+            if closed:
+                return
+    
+    def close(self):
+        """Flush queued events and close the active segment."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._flusher.join()
+        with self._io_lock:
+            self._active_file.close()
+    
+    def __len__(self) -> int:
+        with self._io_lock, self._cond:
+            return sum(info.count for info in self._segments) + len(self._pending)
+    
+    @property
+    def head_hash(self) -> str:
+        """
+        Hash of the latest sealed segment.
+        
+        Publishing this value elsewhere anchors the chain against
+        wholesale rewriting of the log directory.
+        """
+        with self._io_lock:
+            for info in reversed(self._segments):
+                if info.sealed:
+                    return info.segment_hash
+        return GENESIS_HASH
+    
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+    
+    def _snapshot(self) -> List[AuditSegmentInfo]:
+        """Flush and capture manifests; sealed ones are immutable."""
+        self.flush()
+        with self._io_lock:
+            return self._capture_segments()
+    
+    def _capture_segments(self) -> List[AuditSegmentInfo]:
+        """Copy the manifests (_io_lock held)."""
+        return [
+            info if info.sealed else info.snapshot()
+            for info in self._segments
+        ]
+    
+    @staticmethod
+    def _time_range(
+        start_time: Optional[datetime],
+        end_time: Optional[datetime]
+    ) -> Tuple[float, float]:
+        lo = start_time.timestamp() if start_time else -math.inf
+        hi = end_time.timestamp() if end_time else math.inf
+        return lo, hi
+    
+    def _iter_records(
+        self,
+        info: AuditSegmentInfo,
+        lo: float,
+        hi: float,
+        needles: Tuple[bytes, ...] = ()
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Scan a segment through mmap, yielding (offset, record) in [lo, hi].
+        
+        Ordered segments start at the sparse index entry preceding ``lo``
+        and stop past ``hi``. Lines that lack any of ``needles`` are
+        skipped without being parsed.
+        """
+        start = info.data_start
+        if info.ordered and info.sparse and lo > info.min_time:
+            idx = bisect_left([ts for ts, _ in info.sparse], lo) - 1
+            if idx >= 0:
+                start = info.sparse[idx][1]
+        
+        size = info.size
+        if start >= size:
+            return
+        
+        with open(self._data_path(info.segment_id), "rb") as f:
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                pos = start
+                while pos < size:
+                    end = mm.find(b"\n", pos, size)
+                    if end < 0:
+                        break
+                    offset = pos
+                    line = mm[pos:end]
+                    pos = end + 1
+                    
+                    if needles and not all(needle in line for needle in needles):
+                        continue
+                    record = json.loads(line)
+                    ts = record["ts"]
+                    if ts < lo:
+                        continue
+                    if ts > hi:
+                        if info.ordered:
+                            break
+                        continue
+                    yield offset, record
+    
+    @staticmethod
+    def _needle(name: str, value: str) -> bytes:
+        """Serialized form of a JSON field, as written by _encode."""
+        return f'"{name}": {json.dumps(value)}'.encode()
+    
+    def query(
+        self,
+        actor_id: Optional[str] = None,
+        target_id: Optional[str] = None,
+        event_type: Optional[AuditEventType] = None,
+        category: Optional[AuditEventCategory] = None,
+        severity: Optional[AuditSeverity] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[AuditEvent]:
+        """Query audit events, newest first."""
+        needed = offset + limit
+        if needed <= 0:
+            return []
+        
+        lo, hi = self._time_range(start_time, end_time)
+        type_key = event_type.value if event_type else None
+        
+        needles = []
+        for name, value in (
+            ("actor_id", actor_id),
+            ("target_id", target_id),
+            ("event_type", type_key),
+            ("category", category.value if category else None),
+            ("severity", severity.value if severity else None),
+        ):
+            if value:
+                needles.append(self._needle(name, value))
+        needles = tuple(needles)
+        
+        segments = [
+            info for info in self._snapshot()
+            if info.count and info.max_time >= lo and info.min_time <= hi
+            and info.may_contain(actor_id, type_key)
+        ]
+        segments.sort(key=lambda info: info.max_time, reverse=True)
+        
+        # (timestamp, -sequence, record): newest first, append order on ties
+        matches: List[Tuple[float, Tuple[int, int], Dict[str, Any]]] = []
+        for info in segments:
+            if len(matches) >= needed and info.max_time < matches[-1][0]:
+                break
+            
+            for record_offset, record in self._iter_records(info, lo, hi, needles):
+                if actor_id and record["actor_id"] != actor_id:
+                    continue
+                if target_id and record["target_id"] != target_id:
+                    continue
+                if type_key and record["event_type"] != type_key:
+                    continue
+                if category and record["category"] != category.value:
+                    continue
+                if severity and record["severity"] != severity.value:
+                    continue
+                matches.append((record["ts"], (-info.segment_id, -record_offset), record))
+            
+            matches.sort(key=lambda match: match[:2], reverse=True)
+            del matches[needed:]
+        
+        return [AuditEvent.from_dict(record) for _, _, record in matches[offset:needed]]
+    
+    def scan(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        category: Optional[AuditEventCategory] = None
+    ) -> Iterator[AuditEvent]:
+        """
+        Iterate events within a time range in storage order.
+        
+        Args:
+            start_time: Earliest timestamp (inclusive)
+            end_time: Latest timestamp (inclusive)
+            category: Only events of this category
+            
+        Yields:
+            Matching AuditEvents, oldest stored first
+        """
+        lo, hi = self._time_range(start_time, end_time)
+        needles = (self._needle("category", category.value),) if category else ()
+        for info in self._snapshot():
+            if not info.count or info.max_time < lo or info.min_time > hi:
+                continue
+            if category and info.by_key is not None and not any(
+                key[0] == category.value for key in info.by_key
+            ):
+                continue
+            for _, record in self._iter_records(info, lo, hi, needles):
+                if not category or record["category"] == category.value:
+                    yield AuditEvent.from_dict(record)
+    
+    def summarize(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> Dict[RollupKey, int]:
+        """
+        Count events in a time range by (category, type, severity, outcome).
+        
+        Segments entirely inside the range are answered from their
+        manifest counters; only boundary segments are scanned.
+        
+        Args:
+            start_time: Earliest timestamp (inclusive)
+            end_time: Latest timestamp (inclusive)
+            
+        Returns:
+            Dictionary mapping rollup keys to counts
+        """
+        lo, hi = self._time_range(start_time, end_time)
+        counts: Dict[RollupKey, int] = {}
+        for info in self._snapshot():
+            if not info.count or info.max_time < lo or info.min_time > hi:
+                continue
+            if info.by_key is not None and lo <= info.min_time and info.max_time <= hi:
+                for key, value in info.by_key.items():
+                    counts[key] = counts.get(key, 0) + value
+                continue
+            for _, record in self._iter_records(info, lo, hi):
+                key = (record["category"], record["event_type"], record["severity"], record["outcome"])
+                counts[key] = counts.get(key, 0) + 1
+        return counts
+    
+    def count(
+        self,
+        event_type: Optional[AuditEventType] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> int:
+        """
+        Count matching events.
+        
+        Segments entirely inside the time range are answered from their
+        manifest counters; only boundary segments are scanned.
+        """
+        lo, hi = self._time_range(start_time, end_time)
+        type_key = event_type.value if event_type else None
+        needles = (self._needle("event_type", type_key),) if type_key else ()
+        
+        total = 0
+        for info in self._snapshot():
+            if not info.count or info.max_time < lo or info.min_time > hi:
+                continue
+            if not info.may_contain(None, type_key):
+                continue
+            if lo <= info.min_time and info.max_time <= hi:
+                total += info.by_type.get(type_key, 0) if type_key else info.count
+                continue
+            for _, record in self._iter_records(info, lo, hi, needles):
+                if not type_key or record["event_type"] == type_key:
+                    total += 1
+        return total
+    
+    def get_statistics(self, hours: int = 24) -> Dict[str, Any]:
+        """Get audit log statistics."""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        return summarize_rollup(self.summarize(start_time=cutoff), hours)
+    
+    # ------------------------------------------------------------------
+    # Integrity
+    # ------------------------------------------------------------------
+    
+    def _hash_file(self, info: AuditSegmentInfo) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Hash a segment's data through mmap and parse its header."""
+        hasher = hashlib.sha3_256()
+        with open(self._data_path(info.segment_id), "rb") as f:
+            with mmap.mmap(f.fileno(), info.size, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+                try:
+                    header = json.loads(mm[:info.data_start])
+                except ValueError:
+                    header = None
+        return hasher.hexdigest(), header
+    
+    def verify_range(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> Tuple[bool, List[str]]:
+        """
+        Verify the integrity of the log over a time range.
+        
+        The manifest chain is checked end to end (manifests are small);
+        segment data is re-hashed and event hashes re-checked only for
+        segments overlapping the range.
+        
+        Args:
+            start_time: Earliest timestamp to verify
+            end_time: Latest timestamp to verify
+            
+        Returns:
+            Tuple of (is_valid, list_of_issues)
+        """
+        lo, hi = self._time_range(start_time, end_time)
+        self.flush()
+        # The active manifest and hasher must describe the same bytes
+        with self._io_lock:
+            segments = self._capture_segments()
+            active_hash = self._active_hasher.copy().hexdigest()
+        
+        issues = []
+        prev_hash = None
+        for info in segments:
+            label = f"Segment {info.segment_id}"
+            expected_prev = GENESIS_HASH if info.segment_id == 0 else prev_hash
+            if expected_prev is not None and info.prev_hash != expected_prev:
+                issues.append(f"{label}: previous hash does not match chain")
+            if info.sealed and info.segment_hash != info.compute_segment_hash():
+                issues.append(f"{label}: segment hash mismatch")
+            prev_hash = info.segment_hash if info.sealed else None
+            
+            if not info.count or info.max_time < lo or info.min_time > hi:
+                continue
+            
+            content_hash, header = self._hash_file(info)
+            expected = info.content_hash if info.sealed else active_hash
+            if content_hash != expected:
+                issues.append(f"{label}: content hash mismatch")
+            if not header or header.get("prev_hash") != info.prev_hash:
+                issues.append(f"{label}: header does not match manifest")
+            
+            for _, record in self._iter_records(info, lo, hi):
+                if not AuditEvent.from_dict(record).verify_integrity():
+                    issues.append(f"{label}: event {record['event_id']} integrity check failed")
+        
+        return len(issues) == 0, issues
+    
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """Get segment and write statistics."""
+        with self._io_lock, self._cond:
+            return {
+                "events": sum(info.count for info in self._segments),
+                "pending_events": len(self._pending),
+                "segments": len(self._segments),
+                "bytes": sum(info.size for info in self._segments),
+                "batches_written": self._batches_written,
+                "write_errors": self._write_errors,
+                "head_hash": next(
+                    (info.segment_hash for info in reversed(self._segments) if info.sealed),
+                    GENESIS_HASH
+                )
+            }
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+__all__ = [
+    "AuditSegmentInfo",
+    "FileAuditLogStorage",
+    "GENESIS_HASH",
+]
@@ -70,17 +70,30 @@ This module implements distributed ledger technology for:
 6. Ownership proof
 7. Chain of custody tracking
 
+Blocks are kept in a pluggable BlockStore (see ledger_store for the
+durable on-disk store). Transactions are sealed into a block as soon as
+they are submitted, or, with a BlockProductionPolicy, gathered by a
+background producer into blocks bounded by count, size and age. The registry maintains owner and key indexes
+over the chain and periodically checkpoints its state to the store, so
+a restart only replays the blocks produced after the last checkpoint.
+
 TRUST THROUGH TRANSPARENCY AND IMMUTABILITY
 """
 
 import hashlib
+import itertools
 import json
+import math
+import os
 import secrets
+import threading
 import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 
 # ============================================================================
@@ -138,6 +151,31 @@ class BlockHeader:
         data = f"{self.block_number}{self.previous_hash}{self.merkle_root}"
         data += f"{self.timestamp.isoformat()}{self.nonce}{self.difficulty}{self.validator}"
         return hashlib.sha3_256(data.encode()).hexdigest()
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable storage record."""
+        return {
+            "block_number": self.block_number,
+            "previous_hash": self.previous_hash,
+            "merkle_root": self.merkle_root,
+            "timestamp": self.timestamp.isoformat(),
+            "nonce": self.nonce,
+            "difficulty": self.difficulty,
+            "validator": self.validator
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "BlockHeader":
+        """Rebuild a header from a storage record."""
+        return cls(
+            block_number=record["block_number"],
+            previous_hash=record["previous_hash"],
+            merkle_root=record["merkle_root"],
+            timestamp=datetime.fromisoformat(record["timestamp"]),
+            nonce=record["nonce"],
+            difficulty=record["difficulty"],
+            validator=record["validator"]
+        )
 
 
 @dataclass
@@ -176,6 +214,39 @@ class DNATransaction:
             "block_number": self.block_number,
             "status": self.status.value
         }
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable storage record (all fields)."""
+        return {
+            "transaction_id": self.transaction_id,
+            "transaction_type": self.transaction_type,
+            "dna_key_id": self.dna_key_id,
+            "dna_checksum": self.dna_checksum,
+            "owner_address": self.owner_address,
+            "timestamp": self.timestamp.isoformat(),
+            "signature": self.signature.hex(),
+            "metadata": self.metadata,
+            "block_number": self.block_number,
+            "block_hash": self.block_hash,
+            "status": self.status.value
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "DNATransaction":
+        """Rebuild a transaction from a storage record."""
+        return cls(
+            transaction_id=record["transaction_id"],
+            transaction_type=record["transaction_type"],
+            dna_key_id=record["dna_key_id"],
+            dna_checksum=record["dna_checksum"],
+            owner_address=record["owner_address"],
+            timestamp=datetime.fromisoformat(record["timestamp"]),
+            signature=bytes.fromhex(record["signature"]),
+            metadata=record.get("metadata", {}),
+            block_number=record.get("block_number"),
+            block_hash=record.get("block_hash"),
+            status=TransactionStatus(record.get("status", TransactionStatus.PENDING.value))
+        )
 
 
 @dataclass
@@ -186,34 +257,296 @@ class Block:
     transactions: List[DNATransaction]
     block_hash: str = ""
     
+    # Merkle tree levels, leaves first (filled by compute_merkle_root)
+    _merkle_levels: Optional[List[List[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def __post_init__(self):
         if not self.block_hash:
             self.block_hash = self.header.compute_hash()
     
     def compute_merkle_root(self) -> str:
-        """Compute Merkle root of transactions."""
+        """Compute Merkle root of transactions (and cache the tree levels)."""
         if not self.transactions:
+            self._merkle_levels = []
             return hashlib.sha3_256(b"").hexdigest()
         
-        hashes = [tx.compute_hash() for tx in self.transactions]
+        sha3_256 = hashlib.sha3_256
+        level = [tx.compute_hash() for tx in self.transactions]
+        levels = [level]
+        
+        while len(level) > 1:
+            # An odd node is paired with itself
+            padded = level + [level[-1]] if len(level) % 2 == 1 else level
+            level = [
+                sha3_256((padded[i] + padded[i + 1]).encode()).hexdigest()
+                for i in range(0, len(padded), 2)
+            ]
+            levels.append(level)
         
-        while len(hashes) > 1:
-            if len(hashes) % 2 == 1:
-                hashes.append(hashes[-1])
+        self._merkle_levels = levels
+        return level[0]
+    
+    def merkle_levels(self) -> List[List[str]]:
+        """Get the Merkle tree levels, leaf hashes first (computed once, then cached)."""
+        if self._merkle_levels is None:
+            self.compute_merkle_root()
+        return self._merkle_levels
+    
+    def merkle_proof(self, index: int) -> List[str]:
+        """
+        Get the Merkle path of a transaction.
+        
+        Args:
+            index: Position of the transaction in the block
             
-            new_hashes = []
-            for i in range(0, len(hashes), 2):
-                combined = hashes[i] + hashes[i + 1]
-                new_hash = hashlib.sha3_256(combined.encode()).hexdigest()
-                new_hashes.append(new_hash)
-            hashes = new_hashes
+        Returns:
+            Sibling hashes from the leaf level up to (excluding) the root
+        """
+        path = []
+        for level in self.merkle_levels()[:-1]:
+            sibling = index ^ 1
+            path.append(level[sibling] if sibling < len(level) else level[index])
+            index //= 2
+        return path
+    
+    @staticmethod
+    def verify_merkle_path(leaf_hash: str, index: int, path: List[str], merkle_root: str) -> bool:
+        """
+        Check a Merkle path against a root in O(log n).
         
-        return hashes[0]
+        Args:
+            leaf_hash: Hash of the transaction
+            index: Position of the transaction in its block
+            path: Sibling hashes from merkle_proof
+            merkle_root: Expected Merkle root
+            
+        Returns:
+            True if the path leads from the leaf to the root
+        """
+        current = leaf_hash
+        for sibling in path:
+            combined = current + sibling if index % 2 == 0 else sibling + current
+            current = hashlib.sha3_256(combined.encode()).hexdigest()
+            index //= 2
+        return secrets.compare_digest(current, merkle_root)
     
     def verify_integrity(self) -> bool:
         """Verify block integrity."""
         computed_merkle = self.compute_merkle_root()
         return computed_merkle == self.header.merkle_root
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable storage record."""
+        return {
+            "header": self.header.to_record(),
+            "transactions": [tx.to_record() for tx in self.transactions],
+            "block_hash": self.block_hash
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "Block":
+        """Rebuild a block from a storage record."""
+        return cls(
+            header=BlockHeader.from_record(record["header"]),
+            transactions=[DNATransaction.from_record(tx) for tx in record["transactions"]],
+            block_hash=record["block_hash"]
+        )
+
+
+@dataclass
+class MerkleProof:
+    """
+    Compact proof that a transaction is included in a block.
+    
+    Carries the block header and the transaction's Merkle path, so a
+    transaction can be checked in O(log n) without the rest of its block.
+    """
+    
+    transaction_id: str
+    block_number: int
+    block_hash: str
+    header: BlockHeader
+    index: int
+    path: List[str]
+    
+    def verify(self, tx: DNATransaction) -> bool:
+        """Check that ``tx`` is the proven transaction of the proven block."""
+        if tx.transaction_id != self.transaction_id:
+            return False
+        if self.header.compute_hash() != self.block_hash:
+            return False
+        return Block.verify_merkle_path(
+            tx.compute_hash(), self.index, self.path, self.header.merkle_root
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "transaction_id": self.transaction_id,
+            "block_number": self.block_number,
+            "block_hash": self.block_hash,
+            "header": self.header.to_record(),
+            "index": self.index,
+            "path": self.path
+        }
+
+
+# ============================================================================
+# BLOCK STORAGE
+# ============================================================================
+
+class BlockStore(ABC):
+    """
+    Storage backend for the blocks of a DNAStrandRegistry.
+    
+    Blocks are append-only and addressed by block number, which is also
+    their position in the store. A store additionally keeps the latest
+    registry checkpoint so the registry can resume without replaying
+    the whole chain.
+    """
+    
+    @abstractmethod
+    def append(self, block: Block):
+        """Append the next block (its number must equal len(store))."""
+        pass
+    
+    @abstractmethod
+    def get_block(self, block_number: int) -> Optional[Block]:
+        """Get a block by number, or None if it does not exist."""
+        pass
+    
+    @abstractmethod
+    def iter_blocks(self, start: int = 0) -> Iterator[Block]:
+        """Iterate blocks in order, starting at ``start``."""
+        pass
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored blocks."""
+        pass
+    
+    @abstractmethod
+    def save_checkpoint(self, checkpoint: Dict[str, Any]):
+        """Replace the stored registry checkpoint."""
+        pass
+    
+    @abstractmethod
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Load the stored registry checkpoint, if any."""
+        pass
+    
+    def reopen_spec(self) -> Optional[Tuple[type, Dict[str, Any]]]:
+        """
+        Describe how another process can open this store read-only.
+        
+        Returns:
+            (store class, constructor kwargs), or None if the blocks are
+            not reachable from other processes
+        """
+        return None
+    
+    def close(self):
+        """Release any resources held by the store."""
+        pass
+
+
+class InMemoryBlockStore(BlockStore):
+    """Block store that keeps everything in memory (not durable)."""
+    
+    def __init__(self):
+        self._blocks: List[Block] = []
+        self._checkpoint: Optional[Dict[str, Any]] = None
+    
+    def append(self, block: Block):
+        """Append the next block."""
+        if block.header.block_number != len(self._blocks):
+            raise ValueError(
+                f"Expected block {len(self._blocks)}, got {block.header.block_number}"
+            )
+        self._blocks.append(block)
+    
+    def get_block(self, block_number: int) -> Optional[Block]:
+        """Get a block by number."""
+        if 0 <= block_number < len(self._blocks):
+            return self._blocks[block_number]
+        return None
+    
+    def iter_blocks(self, start: int = 0) -> Iterator[Block]:
+        """Iterate blocks in order."""
+        for block_number in range(max(start, 0), len(self._blocks)):
+            yield self._blocks[block_number]
+    
+    def __len__(self) -> int:
+        return len(self._blocks)
+    
+    def save_checkpoint(self, checkpoint: Dict[str, Any]):
+        """Replace the stored checkpoint."""
+        self._checkpoint = checkpoint
+    
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Load the stored checkpoint."""
+        return self._checkpoint
+
+
+@dataclass
+class BlockProductionPolicy:
+    """
+    When the background block producer seals pending transactions.
+    
+    A block is sealed as soon as any limit is reached: enough pending
+    transactions, enough serialized bytes, or the oldest pending
+    transaction has waited ``max_interval`` seconds.
+    """
+    
+    max_transactions: int = 1000
+    max_bytes: int = 1024 * 1024
+    max_interval: float = 0.5
+
+
+def _verify_blocks(store: BlockStore, start: int, end: int) -> List[Tuple[int, str]]:
+    """
+    Verify blocks ``start`` to ``end - 1`` of a store.
+    
+    Checks each block's link to its predecessor (including block
+    ``start - 1``), its header hash and its Merkle root.
+    
+    Returns:
+        List of (block_number, issue)
+    """
+    issues = []
+    previous = store.get_block(start - 1)
+    
+    for current in itertools.islice(store.iter_blocks(start), max(end - start, 0)):
+        i = current.header.block_number
+        
+        # Verify previous hash link
+        if previous is None or current.header.previous_hash != previous.block_hash:
+            issues.append((i, "Previous hash mismatch"))
+        
+        # Verify block hash
+        computed_hash = current.header.compute_hash()
+        if computed_hash != current.block_hash:
+            issues.append((i, "Block hash invalid"))
+        
+        # Verify Merkle root
+        if not current.verify_integrity():
+            issues.append((i, "Merkle root invalid"))
+        
+        previous = current
+    
+    return issues
+
+
+def _verify_store_range(spec: Tuple[type, Dict[str, Any]], start: int, end: int) -> List[Tuple[int, str]]:
+    """Verify a block range in a worker process, reopening the store from ``spec``."""
+    store_class, kwargs = spec
+    store = store_class(**kwargs)
+    try:
+        return _verify_blocks(store, start, end)
+    finally:
+        store.close()
 
 
 # ============================================================================
@@ -253,6 +586,40 @@ class DNARegistryEntry:
             "security_level": self.security_level,
             "segment_count": self.segment_count
         }
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable checkpoint record (all fields)."""
+        return {
+            "dna_key_id": self.dna_key_id,
+            "dna_checksum": self.dna_checksum,
+            "owner_address": self.owner_address,
+            "status": self.status.value,
+            "registration_timestamp": self.registration_timestamp.isoformat(),
+            "registration_tx_id": self.registration_tx_id,
+            "registration_block": self.registration_block,
+            "security_level": self.security_level,
+            "segment_count": self.segment_count,
+            "expiration_date": self.expiration_date.isoformat() if self.expiration_date else None,
+            "update_history": self.update_history
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "DNARegistryEntry":
+        """Rebuild an entry from a checkpoint record."""
+        return cls(
+            dna_key_id=record["dna_key_id"],
+            dna_checksum=record["dna_checksum"],
+            owner_address=record["owner_address"],
+            status=DNAStrandStatus(record["status"]),
+            registration_timestamp=datetime.fromisoformat(record["registration_timestamp"]),
+            registration_tx_id=record["registration_tx_id"],
+            registration_block=record["registration_block"],
+            security_level=record["security_level"],
+            segment_count=record["segment_count"],
+            expiration_date=datetime.fromisoformat(record["expiration_date"])
+            if record.get("expiration_date") else None,
+            update_history=list(record.get("update_history", []))
+        )
 
 
 class DNAStrandRegistry:
@@ -265,17 +632,165 @@ class DNAStrandRegistry:
     - Ownership tracking
     - Revocation management
     - Audit trail
+    
+    Blocks live in a BlockStore. The registry keeps the current entries
+    plus owner -> keys, key -> transactions and transaction -> block
+    indexes, so ownership and audit trail queries cost O(result). Every
+    ``checkpoint_interval`` blocks (and on close) that state is written
+    to the store as a checkpoint; on startup the registry restores the
+    latest checkpoint and replays only the blocks that follow it.
+    
+    Without a production policy every transaction is sealed into its own
+    block before the call returns. With one, write calls only queue the
+    transaction and a background thread seals batches; callers observe
+    confirmation through ``confirmation()`` futures, a ``callback`` or
+    ``wait=True``. A strand is only visible to revoke/transfer/verify
+    once its registration is confirmed.
+    
+    Chain verification is incremental: the registry remembers the last
+    verified block and only re-checks blocks added after it. Long ranges
+    are split across worker processes when the store can be reopened
+    from another process.
     """
     
-    def __init__(self, network: BlockchainNetwork = BlockchainNetwork.DNA_MAINNET):
+    # Blocks between automatic checkpoints
+    CHECKPOINT_INTERVAL = 1000
+    
+    # Minimum number of blocks to verify before using worker processes
+    PARALLEL_VERIFY_BLOCKS = 2048
+    
+    def __init__(
+        self,
+        network: BlockchainNetwork = BlockchainNetwork.DNA_MAINNET,
+        store: Optional[BlockStore] = None,
+        checkpoint_interval: Optional[int] = None,
+        production: Optional[BlockProductionPolicy] = None
+    ):
+        """
+        Initialize the registry.
+        
+        Args:
+            network: Blockchain network the registry belongs to
+            store: Block store (defaults to an InMemoryBlockStore)
+            checkpoint_interval: Blocks between checkpoints
+                (defaults to CHECKPOINT_INTERVAL)
+            production: Batch transactions on a background producer
+                (default: seal one block per transaction, synchronously)
+        """
         self.network = network
+        self._store = store if store is not None else InMemoryBlockStore()
+        self.checkpoint_interval = checkpoint_interval or self.CHECKPOINT_INTERVAL
+        self._lock = threading.RLock()
+        
         self._entries: Dict[str, DNARegistryEntry] = {}
-        self._transactions: Dict[str, DNATransaction] = {}
-        self._blocks: List[Block] = []
         self._pending_transactions: List[DNATransaction] = []
         
-        # Initialize genesis block
-        self._create_genesis_block()
+        # Pending bookkeeping: serialized sizes and arrival times (batched
+        # production only), confirmation futures, queued registrations
+        self._pending_sizes: List[int] = []
+        self._pending_arrivals: List[float] = []
+        self._pending_bytes = 0
+        self._pending_registrations: Dict[str, None] = {}
+        self._confirmations: Dict[str, Future] = {}
+        
+        # Indexes: owner -> key IDs (insertion ordered), key -> tx IDs, tx -> block
+        self._owner_index: Dict[str, Dict[str, None]] = {}
+        self._key_transactions: Dict[str, List[str]] = {}
+        self._tx_blocks: Dict[str, int] = {}
+        
+        self._head: Optional[Block] = None
+        self._checkpoint_height = -1
+        self._replayed_blocks = 0
+        
+        # Last block covered by a successful verify_chain_integrity
+        self._verified_height = 0
+        self._verified_hash = ""
+        
+        self._open()
+        
+        self.production = production
+        self._stopping = False
+        self._flush_requested = False
+        self._pending_ready = threading.Condition(self._lock)
+        self._producer: Optional[threading.Thread] = None
+        if production is not None:
+            self._producer = threading.Thread(
+                target=self._run_producer, name="dna-block-producer", daemon=True
+            )
+            self._producer.start()
+    
+    def _open(self):
+        """Restore state from the block store (or create the genesis block)."""
+        height = len(self._store)
+        if height == 0:
+            self._create_genesis_block()
+            return
+        
+        start = 1
+        checkpoint = self._store.load_checkpoint()
+        if checkpoint and self._checkpoint_usable(checkpoint, height):
+            self._restore_checkpoint(checkpoint)
+            start = checkpoint["height"] + 1
+        
+        for block in self._store.iter_blocks(start):
+            self._apply_block(block)
+            self._replayed_blocks += 1
+        self._head = self._store.get_block(height - 1)
+    
+    def _checkpoint_usable(self, checkpoint: Dict[str, Any], height: int) -> bool:
+        """Check that a checkpoint belongs to this network and chain."""
+        if checkpoint.get("network") != self.network.value:
+            return False
+        if not 0 <= checkpoint.get("height", -1) < height:
+            return False
+        block = self._store.get_block(checkpoint["height"])
+        return block is not None and block.block_hash == checkpoint.get("head_hash")
+    
+    def _restore_checkpoint(self, checkpoint: Dict[str, Any]):
+        """Load registry state from a checkpoint."""
+        for record in checkpoint["entries"]:
+            entry = DNARegistryEntry.from_record(record)
+            self._entries[entry.dna_key_id] = entry
+            self._owner_index.setdefault(entry.owner_address, {})[entry.dna_key_id] = None
+        self._key_transactions = {
+            key_id: list(tx_ids) for key_id, tx_ids in checkpoint["key_transactions"].items()
+        }
+        self._tx_blocks = dict(checkpoint["tx_blocks"])
+        self._checkpoint_height = checkpoint["height"]
+        if 0 < checkpoint.get("verified_height", 0) <= checkpoint["height"]:
+            self._verified_height = checkpoint["verified_height"]
+            self._verified_hash = checkpoint["verified_hash"]
+    
+    def checkpoint(self):
+        """Write the current registry state to the block store."""
+        with self._lock:
+            if self._head is None or self._head.header.block_number == self._checkpoint_height:
+                return
+            self._store.save_checkpoint({
+                "network": self.network.value,
+                "height": self._head.header.block_number,
+                "head_hash": self._head.block_hash,
+                "entries": [entry.to_record() for entry in self._entries.values()],
+                "key_transactions": self._key_transactions,
+                "tx_blocks": self._tx_blocks,
+                "verified_height": self._verified_height,
+                "verified_hash": self._verified_hash
+            })
+            self._checkpoint_height = self._head.header.block_number
+    
+    def close(self):
+        """Seal pending transactions, stop the producer, checkpoint and close the store."""
+        with self._lock:
+            self._stopping = True
+            self._pending_ready.notify_all()
+        if self._producer is not None:
+            self._producer.join()
+            self._producer = None
+        
+        self.flush()
+        with self._lock:
+            self.checkpoint()
+            self._store.close()
     
     def _create_genesis_block(self):
         """Create the genesis block."""
@@ -289,7 +804,9 @@ class DNAStrandRegistry:
             validator="genesis"
         )
         genesis_block = Block(header=genesis_header, transactions=[])
-        self._blocks.append(genesis_block)
+        self._store.append(genesis_block)
+        self._head = genesis_block
+        self._checkpoint_height = 0
     
     def register_strand(
         self,
@@ -299,7 +816,9 @@ class DNAStrandRegistry:
         security_level: str,
         segment_count: int,
         signature: bytes,
-        expiration_date: Optional[datetime] = None
+        expiration_date: Optional[datetime] = None,
+        wait: bool = False,
+        callback: Optional[Callable[[DNATransaction], None]] = None
     ) -> DNATransaction:
         """
         Register a new DNA strand on the ledger.
@@ -312,6 +831,8 @@ class DNAStrandRegistry:
             segment_count: Number of segments in the strand
             signature: Owner's signature proving ownership
             expiration_date: Optional expiration date
+            wait: Block until the transaction is confirmed in a block
+            callback: Called with the transaction once it is confirmed
             
         Returns:
             DNATransaction for the registration
@@ -335,12 +856,7 @@ class DNAStrandRegistry:
             }
         )
         
-        # Add to pending
-        self._pending_transactions.append(tx)
-        self._transactions[tx.transaction_id] = tx
-        
-        # Process immediately (in production, wait for block confirmation)
-        self._process_pending_transactions()
+        self._submit(tx, wait, callback)
         
         return tx
     
@@ -375,7 +891,9 @@ class DNAStrandRegistry:
         self,
         dna_key_id: str,
         owner_signature: bytes,
-        reason: str = ""
+        reason: str = "",
+        wait: bool = False,
+        callback: Optional[Callable[[DNATransaction], None]] = None
     ) -> DNATransaction:
         """
         Revoke a DNA strand.
@@ -384,6 +902,8 @@ class DNAStrandRegistry:
             dna_key_id: DNA key to revoke
             owner_signature: Owner's signature authorizing revocation
             reason: Reason for revocation
+            wait: Block until the transaction is confirmed in a block
+            callback: Called with the transaction once it is confirmed
             
         Returns:
             DNATransaction for the revocation
@@ -403,9 +923,7 @@ class DNAStrandRegistry:
             metadata={"reason": reason}
         )
         
-        self._pending_transactions.append(tx)
-        self._transactions[tx.transaction_id] = tx
-        self._process_pending_transactions()
+        self._submit(tx, wait, callback)
         
         return tx
     
@@ -414,7 +932,9 @@ class DNAStrandRegistry:
         dna_key_id: str,
         new_owner_address: str,
         current_owner_signature: bytes,
-        new_owner_signature: bytes
+        new_owner_signature: bytes,
+        wait: bool = False,
+        callback: Optional[Callable[[DNATransaction], None]] = None
     ) -> DNATransaction:
         """
         Transfer ownership of a DNA strand.
@@ -424,6 +944,8 @@ class DNAStrandRegistry:
             new_owner_address: New owner's address
             current_owner_signature: Current owner's authorization
             new_owner_signature: New owner's acceptance
+            wait: Block until the transaction is confirmed in a block
+            callback: Called with the transaction once it is confirmed
             
         Returns:
             DNATransaction for the transfer
@@ -446,9 +968,7 @@ class DNAStrandRegistry:
             }
         )
         
-        self._pending_transactions.append(tx)
-        self._transactions[tx.transaction_id] = tx
-        self._process_pending_transactions()
+        self._submit(tx, wait, callback)
         
         return tx
     
@@ -458,28 +978,257 @@ class DNAStrandRegistry:
     
     def get_transaction(self, tx_id: str) -> Optional[DNATransaction]:
         """Get a transaction by ID."""
-        return self._transactions.get(tx_id)
+        with self._lock:
+            block_number = self._tx_blocks.get(tx_id)
+            if block_number is None:
+                for tx in self._pending_transactions:
+                    if tx.transaction_id == tx_id:
+                        return tx
+                return None
+        
+        block = self._store.get_block(block_number)
+        if block is None:
+            return None
+        for tx in block.transactions:
+            if tx.transaction_id == tx_id:
+                return tx
+        return None
     
     def get_owner_strands(self, owner_address: str) -> List[DNARegistryEntry]:
         """Get all DNA strands owned by an address."""
-        return [
-            entry for entry in self._entries.values()
-            if entry.owner_address == owner_address
-        ]
+        with self._lock:
+            return [self._entries[key_id] for key_id in self._owner_index.get(owner_address, ())]
     
     def get_audit_trail(self, dna_key_id: str) -> List[DNATransaction]:
         """Get full audit trail for a DNA strand."""
-        return [
-            tx for tx in self._transactions.values()
-            if tx.dna_key_id == dna_key_id
-        ]
-    
-    def _process_pending_transactions(self):
-        """Process pending transactions into a new block."""
-        if not self._pending_transactions:
-            return
+        with self._lock:
+            tx_ids = list(self._key_transactions.get(dna_key_id, ()))
+            locations = [self._tx_blocks[tx_id] for tx_id in tx_ids]
+            pending = [tx for tx in self._pending_transactions if tx.dna_key_id == dna_key_id]
         
-        last_block = self._blocks[-1]
+        # Load each block once, even if it holds several of the key's transactions
+        blocks: Dict[int, Dict[str, DNATransaction]] = {}
+        trail = []
+        for tx_id, block_number in zip(tx_ids, locations):
+            if block_number not in blocks:
+                block = self._store.get_block(block_number)
+                blocks[block_number] = {
+                    tx.transaction_id: tx for tx in block.transactions
+                } if block is not None else {}
+            tx = blocks[block_number].get(tx_id)
+            if tx is not None:
+                trail.append(tx)
+        return trail + pending
+    
+    @property
+    def height(self) -> int:
+        """Number of the latest block."""
+        return self._head.header.block_number
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics."""
+        with self._lock:
+            return {
+                "network": self.network.value,
+                "height": self._head.header.block_number,
+                "head_hash": self._head.block_hash,
+                "entries": len(self._entries),
+                "owners": len(self._owner_index),
+                "transactions": len(self._tx_blocks),
+                "pending_transactions": len(self._pending_transactions),
+                "checkpoint_height": self._checkpoint_height,
+                "verified_height": self._verified_height,
+                "replayed_blocks": self._replayed_blocks
+            }
+    
+    def confirmation(self, tx: DNATransaction) -> Future:
+        """
+        Get a future that resolves to the transaction once it is confirmed.
+        
+        Args:
+            tx: Transaction returned by a write call
+            
+        Returns:
+            Future resolving to the confirmed transaction (already done if
+            the transaction is confirmed, failed if it could not be stored)
+        """
+        with self._lock:
+            future = self._confirmations.get(tx.transaction_id)
+            if future is not None:
+                return future
+        
+        future = Future()
+        if tx.status == TransactionStatus.FAILED:
+            future.set_exception(RuntimeError(f"Transaction {tx.transaction_id} failed"))
+        else:
+            future.set_result(tx)
+        return future
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Seal all currently pending transactions into blocks.
+        
+        Args:
+            timeout: Seconds to wait for confirmation (None waits indefinitely)
+            
+        Returns:
+            True if every pending transaction was confirmed or failed in time
+        """
+        sealed = []
+        with self._lock:
+            futures = list(self._confirmations.values())
+            if self._producer is not None:
+                self._flush_requested = True
+                self._pending_ready.notify_all()
+            else:
+                while self._pending_transactions:
+                    sealed.append(self._seal_next_block())
+        
+        for batch in sealed:
+            self._resolve(batch)
+        
+        for future in futures:
+            try:
+                future.exception(timeout=timeout)
+            except FutureTimeoutError:
+                return False
+        return True
+    
+    def _submit(
+        self,
+        tx: DNATransaction,
+        wait: bool = False,
+        callback: Optional[Callable[[DNATransaction], None]] = None
+    ):
+        """Queue a transaction and seal it (or hand it to the block producer)."""
+        size = 0
+        if self.production is not None:
+            size = len(json.dumps(tx.to_record(), separators=(",", ":")))
+        future = Future()
+        if callback is not None:
+            def notify(done: Future):
+                if done.exception() is None:
+                    callback(tx)
+            future.add_done_callback(notify)
+        
+        sealed = None
+        with self._lock:
+            if tx.transaction_type == "register" and (
+                tx.dna_key_id in self._entries or tx.dna_key_id in self._pending_registrations
+            ):
+                raise ValueError(f"DNA strand {tx.dna_key_id} already registered")
+            if self._stopping:
+                raise RuntimeError("Registry is closed")
+            
+            first = not self._pending_transactions
+            self._pending_transactions.append(tx)
+            self._pending_sizes.append(size)
+            self._pending_arrivals.append(time.monotonic())
+            self._pending_bytes += size
+            if tx.transaction_type == "register":
+                self._pending_registrations[tx.dna_key_id] = None
+            self._confirmations[tx.transaction_id] = future
+            
+            if self._producer is None:
+                # Process immediately
+                sealed = self._seal_next_block()
+            elif first or self._batch_ready():
+                # Start the producer's interval timer, or seal a full block
+                self._pending_ready.notify_all()
+        
+        if sealed is not None:
+            self._resolve(sealed)
+        if wait or sealed is not None:
+            # Surfaces storage failures; returns at once if already confirmed
+            future.result()
+    
+    def _batch_ready(self) -> bool:
+        """Whether the pending transactions fill a block."""
+        policy = self.production
+        return (
+            len(self._pending_transactions) >= policy.max_transactions
+            or self._pending_bytes >= policy.max_bytes
+        )
+    
+    def _run_producer(self):
+        """Background loop sealing pending transactions into blocks."""
+        while True:
+            with self._lock:
+                if not self._wait_for_batch():
+                    return
+                sealed = self._seal_next_block()
+            self._resolve(sealed)
+    
+    def _wait_for_batch(self) -> bool:
+        """Wait until a block is due; False once stopping with nothing pending."""
+        while True:
+            if self._pending_transactions:
+                due = self._pending_arrivals[0] + self.production.max_interval - time.monotonic()
+                if self._stopping or self._flush_requested or due <= 0 or self._batch_ready():
+                    return True
+                self._pending_ready.wait(due)
+            elif self._stopping:
+                return False
+            else:
+                self._flush_requested = False
+                self._pending_ready.wait()
+    
+    def _batch_length(self) -> int:
+        """Number of pending transactions that go into the next block."""
+        if self.production is None:
+            return len(self._pending_transactions)
+        
+        count = 0
+        size = 0
+        for tx_size in self._pending_sizes:
+            if count >= self.production.max_transactions or (
+                count and size + tx_size > self.production.max_bytes
+            ):
+                break
+            count += 1
+            size += tx_size
+        return count
+    
+    def _seal_next_block(self) -> Tuple[List[DNATransaction], List[Future], Optional[Exception]]:
+        """
+        Seal the next batch of pending transactions (caller holds the lock).
+        
+        Returns:
+            Tuple of (transactions, their futures, storage error or None),
+            to be passed to _resolve once the lock is released
+        """
+        count = self._batch_length()
+        batch = self._pending_transactions[:count]
+        del self._pending_transactions[:count]
+        self._pending_bytes -= sum(self._pending_sizes[:count])
+        del self._pending_sizes[:count]
+        del self._pending_arrivals[:count]
+        futures = [self._confirmations.pop(tx.transaction_id) for tx in batch]
+        for tx in batch:
+            if tx.transaction_type == "register":
+                self._pending_registrations.pop(tx.dna_key_id, None)
+        
+        try:
+            self._process_transactions(batch)
+        except Exception as e:
+            for tx in batch:
+                tx.status = TransactionStatus.FAILED
+            return batch, futures, e
+        return batch, futures, None
+    
+    @staticmethod
+    def _resolve(sealed: Tuple[List[DNATransaction], List[Future], Optional[Exception]]):
+        """Complete the confirmation futures of a sealed batch."""
+        batch, futures, error = sealed
+        for tx, future in zip(batch, futures):
+            if error is None:
+                future.set_result(tx)
+            else:
+                future.set_exception(error)
+    
+    def _process_transactions(self, transactions: List[DNATransaction]):
+        """Seal transactions into a new block and apply it."""
+        last_block = self._head
         
         # Create new block
         header = BlockHeader(
@@ -492,15 +1241,28 @@ class DNAStrandRegistry:
             validator="system"
         )
         
-        new_block = Block(header=header, transactions=self._pending_transactions.copy())
+        new_block = Block(header=header, transactions=list(transactions))
         new_block.header.merkle_root = new_block.compute_merkle_root()
         new_block.block_hash = new_block.header.compute_hash()
         
-        # Process transactions
-        for tx in self._pending_transactions:
+        for tx in new_block.transactions:
             tx.block_number = new_block.header.block_number
             tx.block_hash = new_block.block_hash
             tx.status = TransactionStatus.CONFIRMED
+        
+        # Persist before applying, so the registry never reflects a lost block
+        self._store.append(new_block)
+        self._apply_block(new_block)
+        self._head = new_block
+        
+        if new_block.header.block_number - self._checkpoint_height >= self.checkpoint_interval:
+            self.checkpoint()
+    
+    def _apply_block(self, block: Block):
+        """Apply a confirmed block's transactions to the registry state."""
+        for tx in block.transactions:
+            self._tx_blocks[tx.transaction_id] = block.header.block_number
+            self._key_transactions.setdefault(tx.dna_key_id, []).append(tx.transaction_id)
             
             # Update registry based on transaction type
             if tx.transaction_type == "register":
@@ -511,13 +1273,14 @@ class DNAStrandRegistry:
                     status=DNAStrandStatus.ACTIVE,
                     registration_timestamp=tx.timestamp,
                     registration_tx_id=tx.transaction_id,
-                    registration_block=new_block.header.block_number,
+                    registration_block=block.header.block_number,
                     security_level=tx.metadata.get("security_level", "standard"),
                     segment_count=tx.metadata.get("segment_count", 0),
                     expiration_date=datetime.fromisoformat(tx.metadata["expiration_date"])
                     if tx.metadata.get("expiration_date") else None
                 )
                 self._entries[tx.dna_key_id] = entry
+                self._owner_index.setdefault(tx.owner_address, {})[tx.dna_key_id] = None
                 
             elif tx.transaction_type == "revoke":
                 if tx.dna_key_id in self._entries:
@@ -539,37 +1302,98 @@ class DNAStrandRegistry:
                         "timestamp": tx.timestamp.isoformat(),
                         "tx_id": tx.transaction_id
                     })
+                    
+                    owned = self._owner_index.get(old_owner, {})
+                    owned.pop(tx.dna_key_id, None)
+                    if not owned:
+                        self._owner_index.pop(old_owner, None)
+                    self._owner_index.setdefault(tx.owner_address, {})[tx.dna_key_id] = None
+    
+    def get_inclusion_proof(self, tx_id: str) -> Optional[MerkleProof]:
+        """
+        Get a Merkle inclusion proof for a confirmed transaction.
         
-        self._blocks.append(new_block)
-        self._pending_transactions.clear()
+        Args:
+            tx_id: Transaction ID
+            
+        Returns:
+            MerkleProof, or None if the transaction is not confirmed
+        """
+        with self._lock:
+            block_number = self._tx_blocks.get(tx_id)
+        if block_number is None:
+            return None
+        
+        block = self._store.get_block(block_number)
+        for index, tx in enumerate(block.transactions):
+            if tx.transaction_id == tx_id:
+                return MerkleProof(
+                    transaction_id=tx_id,
+                    block_number=block_number,
+                    block_hash=block.block_hash,
+                    header=block.header,
+                    index=index,
+                    path=block.merkle_proof(index)
+                )
+        return None
     
-    def verify_chain_integrity(self) -> Tuple[bool, List[str]]:
+    def verify_chain_integrity(
+        self,
+        full: bool = False,
+        workers: Optional[int] = None
+    ) -> Tuple[bool, List[str]]:
         """
-        Verify the integrity of the entire blockchain.
+        Verify the integrity of the blockchain.
         
+        Only blocks added since the last successful verification are
+        checked, after confirming that the last verified block is still
+        intact; otherwise the whole chain is verified.
+        
+        Args:
+            full: Re-verify the whole chain from genesis
+            workers: Worker processes for long ranges (defaults to CPU count)
+            
         Returns:
             Tuple of (is_valid, list_of_issues)
         """
-        issues = []
+        with self._lock:
+            height = self._head.header.block_number
+            start = 1
+            if not full and self._verified_height > 0:
+                anchor = self._store.get_block(self._verified_height)
+                if (
+                    anchor is not None
+                    and anchor.block_hash == self._verified_hash
+                    and anchor.header.compute_hash() == anchor.block_hash
+                ):
+                    start = self._verified_height + 1
         
-        for i in range(1, len(self._blocks)):
-            current = self._blocks[i]
-            previous = self._blocks[i - 1]
-            
-            # Verify previous hash link
-            if current.header.previous_hash != previous.block_hash:
-                issues.append(f"Block {i}: Previous hash mismatch")
-            
-            # Verify block hash
-            computed_hash = current.header.compute_hash()
-            if computed_hash != current.block_hash:
-                issues.append(f"Block {i}: Block hash invalid")
-            
-            # Verify Merkle root
-            if not current.verify_integrity():
-                issues.append(f"Block {i}: Merkle root invalid")
+        # Stored blocks are immutable, so the lock is not held while verifying
+        issues = self._verify_range(start, height + 1, workers)
+        
+        with self._lock:
+            last_good = issues[0][0] - 1 if issues else height
+            block = self._store.get_block(last_good)
+            self._verified_height = last_good
+            self._verified_hash = block.block_hash if block is not None else ""
+        
+        return len(issues) == 0, [f"Block {i}: {issue}" for i, issue in issues]
+    
+    def _verify_range(self, start: int, end: int, workers: Optional[int]) -> List[Tuple[int, str]]:
+        """Verify blocks ``start`` to ``end - 1``, in parallel for long ranges."""
+        count = end - start
+        workers = workers or os.cpu_count() or 1
+        spec = self._store.reopen_spec()
+        if spec is None or workers < 2 or count < self.PARALLEL_VERIFY_BLOCKS:
+            return _verify_blocks(self._store, start, end)
         
-        return len(issues) == 0, issues
+        chunk = math.ceil(count / workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_verify_store_range, spec, chunk_start, min(chunk_start + chunk, end))
+                for chunk_start in range(start, end, chunk)
+            ]
+            return [issue for future in futures for issue in future.result()]
 
 
 # ============================================================================
@@ -659,7 +1483,11 @@ __all__ = [
     "BlockHeader",
     "DNATransaction",
     "Block",
+    "MerkleProof",
     "DNARegistryEntry",
     "DNAStrandRegistry",
+    "BlockProductionPolicy",
+    "BlockStore",
+    "InMemoryBlockStore",
     "DNASmartContract",
 ]
@@ -0,0 +1,458 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Threat Indicator Index
+
+Indexes threat indicators (IoCs) so authentication-time matching does not
+scan the whole feed:
+
+1. Hash maps by indicator type and normalized value for exact matches
+2. Path-compressed radix trees (IPv4 and IPv6) for CIDR range indicators
+3. A min-heap on expiry time so expired indicators drop out without a scan
+
+Lookup cost is O(1) for exact values and O(address bits) for CIDR ranges,
+independent of feed size. Indexes are built off to the side and swapped
+in whole, so a bulk feed reload is atomic for concurrent readers.
+"""
+
+import heapq
+import ipaddress
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class _RadixNode:
+    """Node of a path-compressed binary radix tree."""
+
+    __slots__ = ("prefix", "length", "children", "values")
+
+    def __init__(self, prefix: int, length: int):
+        self.prefix = prefix
+        self.length = length
+        self.children: List[Optional["_RadixNode"]] = [None, None]
+        self.values: Dict[str, Any] = {}
+
+
+class CIDRRadixTree:
+    """
+    Path-compressed binary radix tree of network prefixes.
+
+    Each node stores its full prefix; single-child chains are collapsed,
+    so the tree has at most two nodes per inserted prefix and a lookup
+    visits at most ``width`` nodes.
+    """
+
+    def __init__(self, width: int):
+        """
+        Initialize tree.
+
+        Args:
+            width: Address width in bits (32 for IPv4, 128 for IPv6)
+        """
+        self.width = width
+        self._root = _RadixNode(0, 0)
+        self._size = 0
+
+    def _bit(self, value: int, index: int) -> int:
+        return (value >> (self.width - 1 - index)) & 1
+
+    def _mask(self, value: int, length: int) -> int:
+        if length == 0:
+            return 0
+        shift = self.width - length
+        return (value >> shift) << shift
+
+    def _common_length(self, a: int, b: int, limit: int) -> int:
+        diff = (a ^ b) >> (self.width - limit) if limit else 0
+        return limit - diff.bit_length()
+
+    def insert(self, prefix: int, length: int, key: str, value: Any) -> None:
+        """
+        Associate ``value`` with a network prefix.
+
+        Args:
+            prefix: Network address as an integer
+            length: Prefix length in bits
+            key: Identifier of the value (for removal)
+            value: Value to store
+        """
+        prefix = self._mask(prefix, length)
+        node = self._root
+
+        while True:
+            if node.length == length:
+                if key not in node.values:
+                    self._size += 1
+                node.values[key] = value
+                return
+
+            bit = self._bit(prefix, node.length)
+            child = node.children[bit]
+
+            if child is None:
+                leaf = _RadixNode(prefix, length)
+                leaf.values[key] = value
+                node.children[bit] = leaf
+                self._size += 1
+                return
+
+            common = self._common_length(prefix, child.prefix, min(length, child.length))
+
+            if common == child.length:
+                node = child
+                continue
+
+            if common == length:
+                # New prefix sits between node and child
+                middle = _RadixNode(prefix, length)
+                middle.values[key] = value
+                middle.children[self._bit(child.prefix, length)] = child
+                node.children[bit] = middle
+                self._size += 1
+                return
+
+            # Prefixes diverge below node: split with a branch node
+            branch = _RadixNode(self._mask(prefix, common), common)
+            branch.children[self._bit(child.prefix, common)] = child
+            leaf = _RadixNode(prefix, length)
+            leaf.values[key] = value
+            branch.children[self._bit(prefix, common)] = leaf
+            node.children[bit] = branch
+            self._size += 1
+            return
+
+    def remove(self, prefix: int, length: int, key: str) -> bool:
+        """
+        Remove a value from a network prefix.
+
+        Args:
+            prefix: Network address as an integer
+            length: Prefix length in bits
+            key: Identifier of the value
+
+        Returns:
+            True if the value was present
+        """
+        prefix = self._mask(prefix, length)
+        node = self._root
+        while node is not None:
+            if node.length == length:
+                if node.prefix == prefix and node.values.pop(key, None) is not None:
+                    self._size -= 1
+                    return True
+                return False
+            if node.length > length or self._mask(prefix, node.length) != node.prefix:
+                return False
+            node = node.children[self._bit(prefix, node.length)]
+        return False
+
+    def lookup(self, address: int) -> List[Any]:
+        """
+        Get the values of every prefix containing ``address``.
+
+        Args:
+            address: Address as an integer
+
+        Returns:
+            Matching values, shortest prefix first
+        """
+        matches: List[Any] = []
+        node = self._root
+        while node is not None:
+            if node.length and self._mask(address, node.length) != node.prefix:
+                break
+            if node.values:
+                matches.extend(node.values.values())
+            if node.length == self.width:
+                break
+            node = node.children[self._bit(address, node.length)]
+        return matches
+
+    def __len__(self) -> int:
+        return self._size
+
+
+# Indicator types matched against the source IP address
+IP_INDICATOR_TYPES = ("ip", "cidr")
+
+
+@dataclass(frozen=True)
+class _Placement:
+    """Where an indicator is stored in the index."""
+
+    kind: str  # exact or cidr
+    indicator_type: str
+    value: Any
+    length: int = 0
+
+
+class IndicatorIndex:
+    """
+    Lookup structure for threat indicators.
+
+    Stores ThreatIndicator-like objects with ``indicator_id``,
+    ``indicator_type``, ``value``, ``is_active`` and ``expires_at``.
+    """
+
+    def __init__(self, indicators: Iterable[Any] = ()):
+        """
+        Initialize index.
+
+        Args:
+            indicators: Indicators to index
+        """
+        self._by_id: Dict[str, Any] = {}
+        self._placements: Dict[str, _Placement] = {}
+        self._exact: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+        self._trees = {4: CIDRRadixTree(32), 6: CIDRRadixTree(128)}
+        self._expiry_heap: List[Tuple[float, str]] = []
+
+        for indicator in indicators:
+            self.add(indicator)
+
+    @staticmethod
+    def _normalize_ip(value: str) -> Optional[Any]:
+        """Parse an IP address, returning None if it is not one."""
+        try:
+            return ipaddress.ip_address(value.strip())
+        except (ValueError, AttributeError):
+            return None
+
+    @staticmethod
+    def _placement(indicator_type: str, value: Any) -> _Placement:
+        """Decide how an indicator value is indexed."""
+        if indicator_type in IP_INDICATOR_TYPES:
+            indicator_type = "ip"
+
+        if indicator_type == "ip" and isinstance(value, str):
+            try:
+                network = ipaddress.ip_network(value.strip(), strict=False)
+            except ValueError:
+                network = None
+            if network is not None:
+                if network.prefixlen == network.max_prefixlen:
+                    return _Placement("exact", "ip", network.network_address)
+                return _Placement("cidr", "ip", network, network.prefixlen)
+
+        return _Placement("exact", indicator_type, value)
+
+    def add(self, indicator: Any) -> None:
+        """
+        Add or replace an indicator.
+
+        Args:
+            indicator: Indicator to index
+        """
+        indicator_id = indicator.indicator_id
+        if indicator_id in self._by_id:
+            self.remove(indicator_id)
+
+        placement = self._placement(indicator.indicator_type, indicator.value)
+        if placement.kind == "cidr":
+            network = placement.value
+            self._trees[network.version].insert(
+                int(network.network_address), placement.length, indicator_id, indicator
+            )
+        else:
+            bucket = self._exact.setdefault(placement.indicator_type, {})
+            bucket.setdefault(placement.value, {})[indicator_id] = indicator
+
+        self._by_id[indicator_id] = indicator
+        self._placements[indicator_id] = placement
+
+        if indicator.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (indicator.expires_at.timestamp(), indicator_id))
+
+    def remove(self, indicator_id: str) -> bool:
+        """
+        Remove an indicator.
+
+        Args:
+            indicator_id: Indicator identifier
+
+        Returns:
+            True if the indicator was indexed
+        """
+        if self._by_id.pop(indicator_id, None) is None:
+            return False
+
+        placement = self._placements.pop(indicator_id)
+        if placement.kind == "cidr":
+            network = placement.value
+            self._trees[network.version].remove(int(network.network_address), placement.length, indicator_id)
+        else:
+            bucket = self._exact.get(placement.indicator_type, {})
+            holders = bucket.get(placement.value)
+            if holders is not None:
+                holders.pop(indicator_id, None)
+                if not holders:
+                    del bucket[placement.value]
+        return True
+
+    def purge_expired(self, now: Optional[datetime] = None) -> int:
+        """
+        Remove indicators whose expiry has passed.
+
+        Only heap entries that are due are inspected. Entries for
+        indicators that were removed or re-added with a new expiry are
+        discarded lazily.
+
+        Args:
+            now: Current time (defaults to now)
+
+        Returns:
+            Number of indicators removed
+        """
+        cutoff = (now or datetime.now(timezone.utc)).timestamp()
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < cutoff:
+            expires_ts, indicator_id = heapq.heappop(heap)
+            indicator = self._by_id.get(indicator_id)
+            if (
+                indicator is not None
+                and indicator.expires_at is not None
+                and indicator.expires_at.timestamp() == expires_ts
+            ):
+                self.remove(indicator_id)
+                removed += 1
+        return removed
+
+    def match(
+        self,
+        ip_address: Optional[str] = None,
+        user_id: Optional[str] = None,
+        dna_key_id: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> List[Any]:
+        """
+        Find active, unexpired indicators matching an authentication.
+
+        Args:
+            ip_address: Source IP address
+            user_id: User identifier
+            dna_key_id: DNA key identifier
+            now: Current time (defaults to now)
+
+        Returns:
+            Matching indicators
+        """
+        now = now or datetime.now(timezone.utc)
+        self.purge_expired(now)
+
+        candidates: List[Any] = []
+
+        if ip_address:
+            address = self._normalize_ip(ip_address)
+            ip_bucket = self._exact.get("ip", {})
+            if address is not None:
+                candidates.extend(ip_bucket.get(address, {}).values())
+                candidates.extend(self._trees[address.version].lookup(int(address)))
+            else:
+                candidates.extend(ip_bucket.get(ip_address, {}).values())
+
+        if user_id:
+            candidates.extend(self._exact.get("user", {}).get(user_id, {}).values())
+
+        if dna_key_id:
+            candidates.extend(self._exact.get("dna_key", {}).get(dna_key_id, {}).values())
+
+        return [
+            indicator
+            for indicator in candidates
+            if indicator.is_active and (indicator.expires_at is None or now <= indicator.expires_at)
+        ]
+
+    def lookup(self, indicator_type: str, value: Any) -> List[Any]:
+        """
+        Get indicators of a type with exactly this value.
+
+        Args:
+            indicator_type: Indicator type
+            value: Indicator value
+
+        Returns:
+            Matching indicators (including inactive ones)
+        """
+        probe = self._placement(indicator_type, value)
+        if probe.kind == "cidr":
+            network = probe.value
+            return [
+                indicator
+                for indicator in self._trees[network.version].lookup(int(network.network_address))
+                if self._placements[indicator.indicator_id] == probe
+            ]
+        return list(self._exact.get(probe.indicator_type, {}).get(probe.value, {}).values())
+
+    def get(self, indicator_id: str) -> Optional[Any]:
+        """Get an indicator by ID."""
+        return self._by_id.get(indicator_id)
+
+    def values(self) -> List[Any]:
+        """Get all indexed indicators."""
+        return list(self._by_id.values())
+
+    def __contains__(self, indicator_id: str) -> bool:
+        return indicator_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get index size information."""
+        return {
+            "indicators": len(self._by_id),
+            "exact_values": sum(len(bucket) for bucket in self._exact.values()),
+            "cidr_ipv4": len(self._trees[4]),
+            "cidr_ipv6": len(self._trees[6]),
+            "pending_expiries": len(self._expiry_heap),
+        }
@@ -0,0 +1,346 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+"""
+DNA-Key Authentication System - Persistent Ledger Block Store
+
+Durable, append-only storage for DNAStrandRegistry blocks:
+
+1. Blocks are appended as JSON lines to numbered block files, each
+   holding a fixed number of blocks.
+2. A separate index file holds one fixed-width (file, offset, length)
+   record per block, so any block is located with a single seek.
+3. Data is written before its index record; on open, blocks that made
+   it to disk without an index record are re-indexed and a torn final
+   line is truncated.
+4. The registry checkpoint is written atomically next to the blocks.
+"""
+
+import json
+import os
+import struct
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional
+
+from server.security.distributed_ledger import Block, BlockStore
+
+
+# Index record: block file number, byte offset, byte length
+INDEX_RECORD = struct.Struct(">IQI")
+
+
+class FileBlockStore(BlockStore):
+    """
+    Block store backed by append-only block files and an index file.
+    
+    Layout of ``directory``::
+    
+        blocks-000000.dat   JSON line per block, BLOCKS_PER_FILE blocks
+        blocks-000001.dat
+        blocks.idx          INDEX_RECORD per block, in block order
+        checkpoint.json     latest registry checkpoint
+    
+    Recently read blocks are kept in a small LRU cache, since audit
+    trail and transaction lookups tend to hit the same recent blocks.
+    """
+    
+    BLOCKS_PER_FILE = 4096
+    CACHE_SIZE = 256
+    
+    INDEX_FILE = "blocks.idx"
+    CHECKPOINT_FILE = "checkpoint.json"
+    
+    def __init__(
+        self,
+        directory: str,
+        blocks_per_file: Optional[int] = None,
+        cache_size: Optional[int] = None,
+        fsync: bool = True,
+        read_only: bool = False
+    ):
+        """
+        Open (or create) a block store.
+        
+        Args:
+            directory: Directory holding the store files
+            blocks_per_file: Blocks per block file (defaults to BLOCKS_PER_FILE)
+            cache_size: Blocks kept in the read cache (defaults to CACHE_SIZE)
+            fsync: Whether appends and checkpoints are fsynced
+            read_only: Open for reading only (no recovery, no appends),
+                e.g. from a verification worker while a writer is active
+        """
+        self.directory = directory
+        self.blocks_per_file = blocks_per_file or self.BLOCKS_PER_FILE
+        self.cache_size = self.CACHE_SIZE if cache_size is None else cache_size
+        self.fsync = fsync
+        self.read_only = read_only
+        
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[int, Block]" = OrderedDict()
+        self._readers: Dict[int, Any] = {}
+        self._writer = None
+        self._writer_file = -1
+        
+        self._index = bytearray()
+        self._index_file = None
+        if read_only:
+            self._load_index()
+        else:
+            os.makedirs(directory, exist_ok=True)
+            self._open_index()
+    
+    def _data_path(self, file_number: int) -> str:
+        return os.path.join(self.directory, f"blocks-{file_number:06d}.dat")
+    
+    def _load_index(self):
+        """Read the complete records of the index file."""
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                data = f.read()
+            self._index = bytearray(data[:len(data) - len(data) % INDEX_RECORD.size])
+    
+    def _open_index(self):
+        """Load the index and reconcile it with the block files."""
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        self._load_index()
+        
+        # Drop index records whose data never reached the disk
+        while self._index:
+            file_number, offset, length = self._record(len(self) - 1)
+            data_path = self._data_path(file_number)
+            if os.path.exists(data_path) and os.path.getsize(data_path) >= offset + length:
+                break
+            del self._index[-INDEX_RECORD.size:]
+        
+        self._recover_tail()
+        
+        with open(path, "wb") as f:
+            f.write(self._index)
+            self._sync(f)
+        self._index_file = open(path, "ab")
+    
+    def _recover_tail(self):
+        """Index complete blocks written after the last index record."""
+        if self._index:
+            file_number, offset, length = self._record(len(self) - 1)
+            position = offset + length
+        else:
+            file_number, position = 0, 0
+        
+        while True:
+            path = self._data_path(file_number)
+            if not os.path.exists(path):
+                return
+            with open(path, "rb") as f:
+                f.seek(position)
+                tail = f.read()
+            
+            for line in tail.splitlines(keepends=True):
+                if not line.endswith(b"\n") or not self._parses_as(line, len(self)):
+                    # Torn or foreign write: everything from here on is discarded
+                    with open(path, "r+b") as f:
+                        f.truncate(position)
+                    return
+                self._index += INDEX_RECORD.pack(file_number, position, len(line))
+                position += len(line)
+            
+            if len(self) % self.blocks_per_file or len(self) == 0:
+                return
+            file_number, position = file_number + 1, 0
+    
+    @staticmethod
+    def _parses_as(line: bytes, block_number: int) -> bool:
+        """Check that a line is a complete record of the given block."""
+        try:
+            record = json.loads(line)
+            return record["header"]["block_number"] == block_number
+        except (ValueError, KeyError, TypeError):
+            return False
+    
+    def _record(self, block_number: int):
+        start = block_number * INDEX_RECORD.size
+        return INDEX_RECORD.unpack_from(self._index, start)
+    
+    def _sync(self, f):
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+    
+    def append(self, block: Block):
+        """Append the next block (data first, then its index record)."""
+        if self.read_only:
+            raise RuntimeError("Block store is read-only")
+        line = json.dumps(block.to_record(), separators=(",", ":")).encode() + b"\n"
+        
+        with self._lock:
+            block_number = len(self)
+            if block.header.block_number != block_number:
+                raise ValueError(
+                    f"Expected block {block_number}, got {block.header.block_number}"
+                )
+            
+            file_number = block_number // self.blocks_per_file
+            if file_number != self._writer_file:
+                if self._writer is not None:
+                    self._writer.close()
+                self._writer = open(self._data_path(file_number), "ab")
+                self._writer_file = file_number
+            
+            offset = self._writer.tell()
+            self._writer.write(line)
+            self._sync(self._writer)
+            
+            record = INDEX_RECORD.pack(file_number, offset, len(line))
+            self._index_file.write(record)
+            self._sync(self._index_file)
+            self._index += record
+            
+            self._remember(block_number, block)
+    
+    def _remember(self, block_number: int, block: Block):
+        if self.cache_size <= 0:
+            return
+        self._cache[block_number] = block
+        self._cache.move_to_end(block_number)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def _read(self, block_number: int) -> Block:
+        """Read a block from disk (caller holds the lock)."""
+        file_number, offset, length = self._record(block_number)
+        reader = self._readers.get(file_number)
+        if reader is None:
+            reader = open(self._data_path(file_number), "rb")
+            self._readers[file_number] = reader
+        reader.seek(offset)
+        return Block.from_record(json.loads(reader.read(length)))
+    
+    def get_block(self, block_number: int) -> Optional[Block]:
+        """Get a block by number."""
+        with self._lock:
+            if not 0 <= block_number < len(self):
+                return None
+            block = self._cache.get(block_number)
+            if block is None:
+                block = self._read(block_number)
+                self._remember(block_number, block)
+            else:
+                self._cache.move_to_end(block_number)
+            return block
+    
+    def iter_blocks(self, start: int = 0) -> Iterator[Block]:
+        """
+        Iterate blocks in order.
+        
+        Blocks are read straight from the block files without going
+        through the cache, so a full scan does not evict hot blocks.
+        """
+        block_number = max(start, 0)
+        while True:
+            with self._lock:
+                if block_number >= len(self):
+                    return
+                block = self._cache.get(block_number) or self._read(block_number)
+            yield block
+            block_number += 1
+    
+    def __len__(self) -> int:
+        return len(self._index) // INDEX_RECORD.size
+    
+    def save_checkpoint(self, checkpoint: Dict[str, Any]):
+        """Atomically replace the checkpoint file."""
+        if self.read_only:
+            raise RuntimeError("Block store is read-only")
+        path = os.path.join(self.directory, self.CHECKPOINT_FILE)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(json.dumps(checkpoint, separators=(",", ":")).encode())
+            self._sync(f)
+        os.replace(temp_path, path)
+    
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Load the checkpoint file, ignoring a missing or unreadable one."""
+        path = os.path.join(self.directory, self.CHECKPOINT_FILE)
+        try:
+            with open(path, "rb") as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def reopen_spec(self):
+        """Reopen read-only from another process."""
+        return FileBlockStore, {
+            "directory": self.directory,
+            "blocks_per_file": self.blocks_per_file,
+            "cache_size": 0,
+            "read_only": True
+        }
+    
+    def close(self):
+        """Close all open files."""
+        with self._lock:
+            for f in [self._writer, self._index_file, *self._readers.values()]:
+                if f is not None:
+                    f.close()
+            self._writer = None
+            self._writer_file = -1
+            self._index_file = None
+            self._readers.clear()
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+__all__ = [
+    "FileBlockStore",
+    "INDEX_RECORD",
+]
@@ -69,19 +69,30 @@ This module implements machine learning-based security features:
 5. Adaptive Learning from Authentication Attempts
 6. Deepfake/Spoofing Detection
 7. Session Risk Assessment
+8. Micro-batched scoring of concurrent authentications
 
 THE FUTURE OF AUTHENTICATION SECURITY
 """
 
+import asyncio
 import hashlib
 import math
+import operator
 import secrets
 import statistics
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# NumPy is optional: networks fall back to pure-Python forward passes
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 
 # ============================================================================
@@ -204,6 +215,16 @@ class SessionContext:
     failed_attempts_last_hour: int = 0
 
 
+@dataclass
+class ScoringRequest:
+    """Behavioral data of one authentication to be scored."""
+    
+    user_id: str
+    typing: Optional[TypingDynamics] = None
+    mouse: Optional[MouseDynamics] = None
+    context: Optional[SessionContext] = None
+
+
 # ============================================================================
 # NEURAL NETWORK IMPLEMENTATION
 # ============================================================================
@@ -228,6 +249,17 @@ def sigmoid(x: float) -> float:
     return 1.0 / (1.0 + math.exp(-x))
 
 
+def identity(x: float) -> float:
+    return x
+
+
+# Scalar activation per layer type (other types are treated as linear)
+SCALAR_ACTIVATIONS = {
+    ActivationFunction.RELU: relu,
+    ActivationFunction.SIGMOID: sigmoid,
+}
+
+
 @dataclass
 class NeuralLayer:
     """A single layer in the neural network."""
@@ -238,23 +270,33 @@ class NeuralLayer:
     
     def forward(self, inputs: List[float]) -> List[float]:
         """Forward pass through the layer."""
-        outputs = []
-        for neuron_weights, bias in zip(self.weights, self.biases):
-            weighted_sum = sum(w * x for w, x in zip(neuron_weights, inputs)) + bias
-            if self.activation == ActivationFunction.RELU:
-                output = relu(weighted_sum)
-            elif self.activation == ActivationFunction.SIGMOID:
-                output = sigmoid(weighted_sum)
-            else:
-                output = weighted_sum
-            outputs.append(output)
-        return outputs
+        activate = SCALAR_ACTIVATIONS.get(self.activation, identity)
+        mul = operator.mul
+        return [
+            activate(sum(map(mul, neuron_weights, inputs)) + bias)
+            for neuron_weights, bias in zip(self.weights, self.biases)
+        ]
 
 
 class SimpleNeuralNetwork:
-    """Simple multi-layer neural network for authentication scoring."""
+    """
+    Simple multi-layer neural network for authentication scoring.
     
-    def __init__(self, layer_sizes: List[int]):
+    The layer weights (lists of lists) are the reference representation.
+    When NumPy is available they are also packed into arrays, and forward
+    passes run as one matrix multiplication per layer, for a single
+    feature vector or a whole batch. Call pack() after changing weights.
+    """
+    
+    def __init__(self, layer_sizes: List[int], use_numpy: Optional[bool] = None):
+        """
+        Initialize the network with random weights.
+        
+        Args:
+            layer_sizes: Neurons per layer, input layer first
+            use_numpy: Use the array-backed forward pass (defaults to
+                whether NumPy is installed)
+        """
         self.layers: List[NeuralLayer] = []
         for i in range(len(layer_sizes) - 1):
             input_size = layer_sizes[i]
@@ -267,9 +309,55 @@ class SimpleNeuralNetwork:
             biases = [0.0 for _ in range(output_size)]
             activation = ActivationFunction.SIGMOID if i == len(layer_sizes) - 2 else ActivationFunction.RELU
             self.layers.append(NeuralLayer(weights, biases, activation))
+        
+        self.use_numpy = NUMPY_AVAILABLE if use_numpy is None else bool(use_numpy and NUMPY_AVAILABLE)
+        self._packed: List[Tuple[Any, Any, ActivationFunction]] = []
+        self.pack()
+    
+    def pack(self):
+        """Refresh the array form of the layer weights (no-op without NumPy)."""
+        if not self.use_numpy:
+            self._packed = []
+            return
+        
+        # Weights are stored transposed (inputs x outputs) so rows of a
+        # feature matrix multiply straight through
+        self._packed = [
+            (
+                np.array(layer.weights, dtype=np.float64).T.copy(),
+                np.array(layer.biases, dtype=np.float64),
+                layer.activation
+            )
+            for layer in self.layers
+        ]
+    
+    @staticmethod
+    def _activate(values: Any, activation: ActivationFunction) -> Any:
+        """Apply an activation to an array in place."""
+        if activation == ActivationFunction.RELU:
+            return np.maximum(values, 0.0, out=values)
+        if activation == ActivationFunction.SIGMOID:
+            np.clip(values, -500.0, 500.0, out=values)
+            np.negative(values, out=values)
+            np.exp(values, out=values)
+            values += 1.0
+            return np.reciprocal(values, out=values)
+        return values
+    
+    def _forward_array(self, inputs: Any) -> Any:
+        """Forward pass over a feature vector or a matrix of feature rows."""
+        current = inputs
+        for weights, biases, activation in self._packed:
+            current = current @ weights
+            current += biases
+            current = self._activate(current, activation)
+        return current
     
     def forward(self, inputs: List[float]) -> List[float]:
         """Forward pass through the entire network."""
+        if self.use_numpy:
+            return self._forward_array(np.asarray(inputs, dtype=np.float64)).tolist()
+        
         current = inputs
         for layer in self.layers:
             current = layer.forward(current)
@@ -279,6 +367,29 @@ class SimpleNeuralNetwork:
         """Predict risk score from features (0.0 - 1.0)."""
         output = self.forward(features)
         return output[0] if output else 0.5
+    
+    def predict_risk_batch(self, features_matrix: Sequence[Sequence[float]]) -> List[float]:
+        """
+        Predict risk scores for many feature vectors in one pass.
+        
+        Args:
+            features_matrix: One feature vector per login (a list of lists
+                or a 2-D array)
+            
+        Returns:
+            Risk score (0.0 - 1.0) for each row, in order
+        """
+        if len(features_matrix) == 0:
+            return []
+        
+        if self.use_numpy:
+            matrix = np.asarray(features_matrix, dtype=np.float64)
+            output = self._forward_array(matrix.reshape(len(features_matrix), -1))
+            if output.shape[1] == 0:
+                return [0.5] * len(features_matrix)
+            return output[:, 0].tolist()
+        
+        return [self.predict_risk(list(features)) for features in features_matrix]
 
 
 # ============================================================================
@@ -346,10 +457,35 @@ class AnomalyDetectionEngine:
     ) -> AnomalyReport:
         """Perform anomaly detection analysis."""
         start_time = time.time()
-        profile = self._user_profiles.get(user_id, self._create_default_profile())
+        features = self._extract_features(typing, mouse, context)
+        return self._build_report(self._risk_network.predict_risk(features), start_time)
+    
+    def analyze_batch(self, requests: Sequence[ScoringRequest]) -> List[AnomalyReport]:
+        """
+        Perform anomaly detection for many authentications in one network pass.
         
+        Args:
+            requests: Authentications to analyze
+            
+        Returns:
+            One AnomalyReport per request, in order
+        """
+        start_time = time.time()
+        features = [
+            self._extract_features(request.typing, request.mouse, request.context)
+            for request in requests
+        ]
+        scores = self._risk_network.predict_risk_batch(features)
+        return [self._build_report(score, start_time) for score in scores]
+    
+    @staticmethod
+    def _extract_features(
+        typing: Optional[TypingDynamics],
+        mouse: Optional[MouseDynamics],
+        context: Optional[SessionContext]
+    ) -> List[float]:
+        """Build the 15-value network input for one authentication."""
         features = []
-        anomaly_features = []
         
         if typing:
             typing_features = typing.to_feature_vector()
@@ -373,8 +509,13 @@ class AnomalyDetectionEngine:
         else:
             features.extend([0.5, 0.5, 0.0])
         
-        nn_risk_score = self._risk_network.predict_risk(features)
+        return features
+    
+    @staticmethod
+    def _build_report(nn_risk_score: float, start_time: float) -> AnomalyReport:
+        """Turn a network risk score into an anomaly report."""
         overall_risk = nn_risk_score
+        anomaly_features: List[AnomalyFeature] = []
         
         if overall_risk < 0.1:
             risk_level = RiskLevel.MINIMAL
@@ -503,6 +644,21 @@ class FraudDetectionEngine:
             recommended_action=action,
             requires_manual_review=requires_review
         )
+    
+    def assess_batch(
+        self,
+        items: Sequence[Tuple[str, SessionContext, Optional[AnomalyReport]]]
+    ) -> List[FraudAssessment]:
+        """
+        Assess potential fraud for many authentications.
+        
+        Args:
+            items: (user_id, context, anomaly_report) per authentication
+            
+        Returns:
+            One FraudAssessment per item, in order
+        """
+        return [self.assess(user_id, context, report) for user_id, context, report in items]
 
 
 # ============================================================================
@@ -555,14 +711,43 @@ class NeuralAuthenticationCoordinator:
         context: Optional[SessionContext] = None
     ) -> NeuralAuthDecision:
         """Perform neural authentication assessment."""
+        return self.authenticate_batch([ScoringRequest(user_id, typing, mouse, context)])[0]
+    
+    def authenticate_batch(self, requests: Sequence[ScoringRequest]) -> List[NeuralAuthDecision]:
+        """
+        Assess many authentications with one network pass and one fraud pass.
+        
+        Args:
+            requests: Authentications to assess
+            
+        Returns:
+            One NeuralAuthDecision per request, in order
+        """
         start_time = time.time()
         
-        if context is None:
-            context = SessionContext()
+        requests = [
+            request if request.context is not None else replace(request, context=SessionContext())
+            for request in requests
+        ]
         
-        anomaly_report = self.anomaly_engine.analyze(user_id, typing, mouse, context)
-        fraud_assessment = self.fraud_engine.assess(user_id, context, anomaly_report)
+        anomaly_reports = self.anomaly_engine.analyze_batch(requests)
+        fraud_assessments = self.fraud_engine.assess_batch([
+            (request.user_id, request.context, report)
+            for request, report in zip(requests, anomaly_reports)
+        ])
         
+        return [
+            self._decide(anomaly_report, fraud_assessment, start_time)
+            for anomaly_report, fraud_assessment in zip(anomaly_reports, fraud_assessments)
+        ]
+    
+    def _decide(
+        self,
+        anomaly_report: AnomalyReport,
+        fraud_assessment: FraudAssessment,
+        start_time: float
+    ) -> NeuralAuthDecision:
+        """Combine anomaly and fraud results into a decision."""
         combined_risk = max(anomaly_report.overall_risk_score, fraud_assessment.fraud_probability)
         
         if combined_risk < 0.1:
@@ -594,10 +779,160 @@ class NeuralAuthenticationCoordinator:
         )
 
 
+# ============================================================================
+# MICRO-BATCHING SCORING SERVICE
+# ============================================================================
+
+@dataclass
+class ScoringServiceStats:
+    """Batching and latency counters for a NeuralScoringService."""
+    
+    requests: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    size_flushes: int = 0   # Batch filled up (or flush() was called)
+    timer_flushes: int = 0  # max_delay_ms elapsed first
+    max_batch_size: int = 0
+    
+    # Seconds
+    total_queue_latency: float = 0.0
+    max_queue_latency: float = 0.0
+    total_scoring_time: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "size_flushes": self.size_flushes,
+            "timer_flushes": self.timer_flushes,
+            "average_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "average_queue_latency_ms": (
+                self.total_queue_latency / self.requests * 1000 if self.requests else 0.0
+            ),
+            "max_queue_latency_ms": self.max_queue_latency * 1000,
+            "average_scoring_time_ms": (
+                self.total_scoring_time / self.batches * 1000 if self.batches else 0.0
+            ),
+        }
+
+
+class NeuralScoringService:
+    """
+    Micro-batching front end for NeuralAuthenticationCoordinator.
+    
+    Concurrent authenticate() calls on one event loop are queued and
+    scored together. A batch is flushed as soon as it holds
+    ``max_batch_size`` requests, or ``max_delay_ms`` after its first
+    request arrived. Each batch goes through one vectorized network pass
+    and one fraud pass, and every caller awaits its own decision.
+    """
+    
+    def __init__(
+        self,
+        coordinator: Optional[NeuralAuthenticationCoordinator] = None,
+        max_batch_size: int = 32,
+        max_delay_ms: float = 2.0
+    ):
+        """
+        Initialize the service.
+        
+        Args:
+            coordinator: Coordinator that scores batches (a new one by default)
+            max_batch_size: Requests that trigger an immediate flush
+            max_delay_ms: Longest time a request waits for its batch to fill
+        """
+        if max_batch_size <= 0 or max_delay_ms < 0:
+            raise ValueError("Batch size must be positive and delay non-negative")
+        
+        self.coordinator = coordinator or NeuralAuthenticationCoordinator()
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000.0
+        
+        self._pending: List[Tuple[ScoringRequest, "asyncio.Future[NeuralAuthDecision]", float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._stats = ScoringServiceStats()
+    
+    async def authenticate(
+        self,
+        user_id: str,
+        typing: Optional[TypingDynamics] = None,
+        mouse: Optional[MouseDynamics] = None,
+        context: Optional[SessionContext] = None
+    ) -> NeuralAuthDecision:
+        """Queue an authentication for the next batch and await its decision."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(
+            (ScoringRequest(user_id, typing, mouse, context), future, time.perf_counter())
+        )
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush(timer=False)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        
+        return await future
+    
+    def flush(self):
+        """Score all queued requests now."""
+        self._flush(timer=False)
+    
+    def _flush(self, timer: bool = True):
+        """Score the queued batch and resolve each caller's future."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        started = time.perf_counter()
+        try:
+            decisions = self.coordinator.authenticate_batch([request for request, _, _ in batch])
+        except Exception as e:
+            self._stats.failed_batches += 1
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        stats = self._stats
+        stats.batches += 1
+        stats.requests += len(batch)
+        stats.max_batch_size = max(stats.max_batch_size, len(batch))
+        stats.total_scoring_time += time.perf_counter() - started
+        if timer:
+            stats.timer_flushes += 1
+        else:
+            stats.size_flushes += 1
+        
+        for (_, future, enqueued), decision in zip(batch, decisions):
+            latency = started - enqueued
+            stats.total_queue_latency += latency
+            stats.max_queue_latency = max(stats.max_queue_latency, latency)
+            # Callers that gave up (cancelled) are skipped
+            if not future.done():
+                future.set_result(decision)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get batch size and queue latency metrics."""
+        return {
+            **self._stats.to_dict(),
+            "pending": len(self._pending),
+            "batch_size_limit": self.max_batch_size,
+            "max_delay_ms": self.max_delay * 1000,
+        }
+
+
 __all__ = [
     "NeuralNetworkType", "RiskLevel", "BehaviorCategory",
     "TypingDynamics", "MouseDynamics", "SessionContext",
     "SimpleNeuralNetwork", "AnomalyDetectionEngine",
     "FraudIndicator", "FraudAssessment", "FraudDetectionEngine",
     "NeuralAuthDecision", "NeuralAuthenticationCoordinator",
+    "ScoringRequest", "ScoringServiceStats", "NeuralScoringService",
 ]
@@ -73,13 +73,21 @@ This module implements enterprise-grade session management:
 """
 
 import hashlib
+import heapq
 import hmac
+import json
 import secrets
 import time
-from dataclasses import dataclass, field
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from server.core.kv_store import KeyValueStore
+from server.security.audit_logging import AuditEventType, AuditLogger
+from server.security.signed_tokens import SignedTokenCodec
 
 
 # ============================================================================
@@ -165,6 +173,39 @@ class SessionToken:
             "expires_at": self.expires_at.isoformat(),
             "rotation_count": self.rotation_count
         }
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Convert to a storage record (the token value is never stored)."""
+        return {
+            "token_id": self.token_id,
+            "token_hash": self.token_hash,
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "token_type": self.token_type,
+            "scopes": self.scopes,
+            "created_at": self.created_at.isoformat(),
+            "expires_at": self.expires_at.isoformat(),
+            "last_used_at": self.last_used_at.isoformat() if self.last_used_at else None,
+            "rotation_count": self.rotation_count
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "SessionToken":
+        """Rebuild a token from a storage record, without its value."""
+        last_used_at = record.get("last_used_at")
+        return cls(
+            token_id=record["token_id"],
+            token_value="",
+            token_hash=record["token_hash"],
+            session_id=record["session_id"],
+            user_id=record["user_id"],
+            token_type=record.get("token_type", "bearer"),
+            scopes=list(record.get("scopes", [])),
+            created_at=datetime.fromisoformat(record["created_at"]),
+            expires_at=datetime.fromisoformat(record["expires_at"]),
+            last_used_at=datetime.fromisoformat(last_used_at) if last_used_at else None,
+            rotation_count=record.get("rotation_count", 0)
+        )
 
 
 class TokenGenerator:
@@ -180,7 +221,8 @@ class TokenGenerator:
         session_id: str,
         user_id: str,
         scopes: List[str],
-        lifetime_seconds: int = 3600
+        lifetime_seconds: int = 3600,
+        codec: Optional[SignedTokenCodec] = None
     ) -> SessionToken:
         """
         Generate a secure session token.
@@ -190,16 +232,26 @@ class TokenGenerator:
             user_id: User identifier
             scopes: Token scopes
             lifetime_seconds: Token lifetime in seconds
+            codec: Issue a self-describing signed token instead of an
+                   opaque random one
             
         Returns:
             SessionToken with secure random values
         """
         token_id = f"tok_{secrets.token_hex(cls.TOKEN_ID_BYTES)}"
-        token_value = secrets.token_urlsafe(cls.TOKEN_BYTES)
-        token_hash = hashlib.sha3_256(token_value.encode()).hexdigest()
         
-        now = datetime.now(timezone.utc)
-        expires = now + timedelta(seconds=lifetime_seconds)
+        if codec is not None:
+            token_value, claims = codec.issue(
+                session_id, user_id, scopes, lifetime_seconds, token_id=token_id
+            )
+            now = datetime.fromtimestamp(claims.issued_at, timezone.utc)
+            expires = datetime.fromtimestamp(claims.expires_at, timezone.utc)
+        else:
+            token_value = secrets.token_urlsafe(cls.TOKEN_BYTES)
+            now = datetime.now(timezone.utc)
+            expires = now + timedelta(seconds=lifetime_seconds)
+        
+        token_hash = hashlib.sha3_256(token_value.encode()).hexdigest()
         
         return SessionToken(
             token_id=token_id,
@@ -213,13 +265,19 @@ class TokenGenerator:
         )
     
     @classmethod
-    def rotate_token(cls, old_token: SessionToken, grace_period_seconds: int = 60) -> SessionToken:
+    def rotate_token(
+        cls,
+        old_token: SessionToken,
+        grace_period_seconds: int = 60,
+        codec: Optional[SignedTokenCodec] = None
+    ) -> SessionToken:
         """
         Rotate a token, creating a new one.
         
         Args:
             old_token: Token to rotate
             grace_period_seconds: Grace period for old token
+            codec: Issue the new token as a signed token
             
         Returns:
             New SessionToken
@@ -228,7 +286,8 @@ class TokenGenerator:
             session_id=old_token.session_id,
             user_id=old_token.user_id,
             scopes=old_token.scopes,
-            lifetime_seconds=int((old_token.expires_at - old_token.created_at).total_seconds())
+            lifetime_seconds=int((old_token.expires_at - old_token.created_at).total_seconds()),
+            codec=codec
         )
         new_token.rotation_count = old_token.rotation_count + 1
         
@@ -345,6 +404,9 @@ class Session:
     activity_count: int = 0
     last_ip: str = ""
     
+    # Record bytes a shared store last read or wrote, for conditional saves
+    _stored_record: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
     def is_active(self) -> bool:
         """Check if session is active."""
         if self.state not in [SessionState.ACTIVE, SessionState.REFRESHED]:
@@ -363,6 +425,13 @@ class Session:
         
         return True
     
+    def expiry_deadline(self) -> float:
+        """Get the POSIX time after which the session is no longer active."""
+        return min(
+            self.expires_at.timestamp(),
+            self.last_activity.timestamp() + self.max_idle_seconds
+        )
+    
     def record_activity(self, ip_address: str = ""):
         """Record session activity."""
         self.last_activity = datetime.now(timezone.utc)
@@ -383,6 +452,461 @@ class Session:
             "activity_count": self.activity_count,
             "is_active": self.is_active()
         }
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Convert to a storage record for shared session stores."""
+        return {
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "session_type": self.session_type.value,
+            "state": self.state.value,
+            "access_token": self.access_token.to_record() if self.access_token else None,
+            "refresh_token": self.refresh_token.to_record() if self.refresh_token else None,
+            "binding": asdict(self.binding),
+            "created_at": self.created_at.isoformat(),
+            "last_activity": self.last_activity.isoformat(),
+            "expires_at": self.expires_at.isoformat(),
+            "max_idle_seconds": self.max_idle_seconds,
+            "max_lifetime_seconds": self.max_lifetime_seconds,
+            "activity_count": self.activity_count,
+            "last_ip": self.last_ip
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "Session":
+        """Rebuild a session from a storage record."""
+        access_token = record.get("access_token")
+        refresh_token = record.get("refresh_token")
+        return cls(
+            session_id=record["session_id"],
+            user_id=record["user_id"],
+            session_type=SessionType(record["session_type"]),
+            state=SessionState(record["state"]),
+            access_token=SessionToken.from_record(access_token) if access_token else None,
+            refresh_token=SessionToken.from_record(refresh_token) if refresh_token else None,
+            binding=SessionBinding(**record.get("binding", {})),
+            created_at=datetime.fromisoformat(record["created_at"]),
+            last_activity=datetime.fromisoformat(record["last_activity"]),
+            expires_at=datetime.fromisoformat(record["expires_at"]),
+            max_idle_seconds=record["max_idle_seconds"],
+            max_lifetime_seconds=record["max_lifetime_seconds"],
+            activity_count=record.get("activity_count", 0),
+            last_ip=record.get("last_ip", "")
+        )
+
+
+# ============================================================================
+# SESSION STORES
+# ============================================================================
+
+# States in which a session counts towards its user's concurrent limit
+ACTIVE_SESSION_STATES = (SessionState.ACTIVE, SessionState.REFRESHED)
+
+
+class SessionStore(ABC):
+    """
+    Storage for sessions, their token mappings and per-user indexes.
+    
+    SessionManager owns the session lifecycle; a store only keeps the
+    data. Stores must forget a session's tokens and user index entry when
+    it is removed, so memory does not grow with every login ever made.
+    """
+    
+    @abstractmethod
+    def add(self, session: Session) -> None:
+        """Store a new session with its access and refresh tokens."""
+        pass
+    
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[Session]:
+        """Get a session by ID."""
+        pass
+    
+    @abstractmethod
+    def get_by_tokens(self, token_hashes: Sequence[str]) -> List[Optional[Session]]:
+        """
+        Resolve token hashes to sessions.
+        
+        Args:
+            token_hashes: SHA3-256 hashes of presented token values
+            
+        Returns:
+            Sessions in the order of ``token_hashes``, None where unknown
+        """
+        pass
+    
+    @abstractmethod
+    def save(self, session: Session) -> bool:
+        """
+        Persist changes to a stored session.
+        
+        The write only applies if the stored session has not changed
+        since ``session`` was read, so a concurrent termination or hijack
+        flag is never overwritten. Sessions that have left
+        ACTIVE_SESSION_STATES stop counting towards their user's active
+        sessions.
+        
+        Returns:
+            True if the change was written
+        """
+        pass
+    
+    def save_many(self, sessions: Sequence[Session]) -> List[bool]:
+        """
+        Persist changes to several sessions, each conditionally.
+        
+        Returns:
+            Per-session save() results in order
+        """
+        return [self.save(session) for session in sessions]
+    
+    @abstractmethod
+    def replace_token(self, session: Session, old_hash: Optional[str], new_hash: str) -> None:
+        """Map a rotated token hash to its session, dropping the old one."""
+        pass
+    
+    @abstractmethod
+    def remove(self, session: Session) -> bool:
+        """
+        Remove a session, its token mappings and its user index entry.
+        
+        Returns:
+            True if the session was still stored
+        """
+        pass
+    
+    @abstractmethod
+    def user_sessions(self, user_id: str) -> List[Session]:
+        """Get a user's active sessions, oldest first."""
+        pass
+    
+    @abstractmethod
+    def user_session_count(self, user_id: str) -> int:
+        """Get the number of a user's active sessions."""
+        pass
+    
+    @abstractmethod
+    def oldest_user_session_id(self, user_id: str) -> Optional[str]:
+        """Get the ID of a user's oldest active session."""
+        pass
+    
+    @abstractmethod
+    def pop_expired(self) -> List[Session]:
+        """
+        Remove and return sessions whose idle or absolute deadline passed.
+        
+        Stores whose backend expires keys by itself may return nothing.
+        """
+        pass
+    
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store sizes."""
+        pass
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Process-local session store.
+    
+    Live sessions are indexed by an expiry heap keyed on the earlier of
+    their absolute and idle deadlines. Activity only moves a deadline
+    later, so entries are re-validated when they reach the top of the
+    heap instead of being updated on every request. Per-user indexes are
+    insertion-ordered, so counts and the oldest session are O(1).
+    """
+    
+    # Stale expiry heap entries tolerated before the heap is rebuilt
+    HEAP_COMPACT_THRESHOLD = 1024
+    
+    def __init__(self):
+        self._sessions: Dict[str, Session] = {}
+        # user_id -> active session_ids, oldest first
+        self._user_sessions: Dict[str, Dict[str, None]] = {}
+        self._token_sessions: Dict[str, str] = {}  # token_hash -> session_id
+        
+        # Expiry heap of (deadline, session_id); one entry per live session
+        # plus entries left behind by removed sessions
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._stale_heap_entries = 0
+    
+    def add(self, session: Session) -> None:
+        session_id = session.session_id
+        self._sessions[session_id] = session
+        self._user_sessions.setdefault(session.user_id, {})[session_id] = None
+        
+        for token in (session.access_token, session.refresh_token):
+            if token:
+                self._token_sessions[token.token_hash] = session_id
+        
+        heapq.heappush(self._expiry_heap, (session.expiry_deadline(), session_id))
+    
+    def get(self, session_id: str) -> Optional[Session]:
+        return self._sessions.get(session_id)
+    
+    def get_by_tokens(self, token_hashes: Sequence[str]) -> List[Optional[Session]]:
+        sessions = self._sessions
+        token_sessions = self._token_sessions
+        return [sessions.get(token_sessions.get(token_hash, "")) for token_hash in token_hashes]
+    
+    def save(self, session: Session) -> bool:
+        # Sessions are shared objects here; a removed one cannot be saved back
+        if self._sessions.get(session.session_id) is not session:
+            return False
+        if session.state not in ACTIVE_SESSION_STATES:
+            self._drop_from_user(session)
+        return True
+    
+    def replace_token(self, session: Session, old_hash: Optional[str], new_hash: str) -> None:
+        if old_hash:
+            self._token_sessions.pop(old_hash, None)
+        self._token_sessions[new_hash] = session.session_id
+    
+    def remove(self, session: Session) -> bool:
+        if self._sessions.pop(session.session_id, None) is None:
+            return False
+        self._forget(session)
+        
+        # The expiry heap entry is discarded lazily
+        self._stale_heap_entries += 1
+        if (self._stale_heap_entries > self.HEAP_COMPACT_THRESHOLD and
+                self._stale_heap_entries * 2 > len(self._expiry_heap)):
+            self._rebuild_expiry_heap()
+        return True
+    
+    def user_sessions(self, user_id: str) -> List[Session]:
+        return [self._sessions[sid] for sid in self._user_sessions.get(user_id, ())]
+    
+    def user_session_count(self, user_id: str) -> int:
+        return len(self._user_sessions.get(user_id, ()))
+    
+    def oldest_user_session_id(self, user_id: str) -> Optional[str]:
+        return next(iter(self._user_sessions.get(user_id, ())), None)
+    
+    def pop_expired(self) -> List[Session]:
+        heap = self._expiry_heap
+        now = time.time()
+        expired = []
+        
+        while heap and heap[0][0] < now:
+            _, session_id = heapq.heappop(heap)
+            session = self._sessions.get(session_id)
+            if session is None:
+                self._stale_heap_entries -= 1
+                continue
+            
+            # Activity may have pushed the deadline back since it was queued
+            deadline = session.expiry_deadline()
+            if deadline >= now:
+                heapq.heappush(heap, (deadline, session_id))
+                continue
+            
+            del self._sessions[session_id]
+            self._forget(session)
+            expired.append(session)
+        
+        return expired
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "users": len(self._user_sessions),
+            "active_sessions": sum(len(ids) for ids in self._user_sessions.values()),
+            "token_mappings": len(self._token_sessions),
+            "expiry_heap_size": len(self._expiry_heap),
+            "stale_heap_entries": self._stale_heap_entries
+        }
+    
+    def _forget(self, session: Session):
+        """Drop a removed session's user index entry and token mappings."""
+        self._drop_from_user(session)
+        for token in (session.access_token, session.refresh_token):
+            if token:
+                self._token_sessions.pop(token.token_hash, None)
+    
+    def _drop_from_user(self, session: Session):
+        """Stop counting a session towards its user's active sessions."""
+        session_ids = self._user_sessions.get(session.user_id)
+        if session_ids is None:
+            return
+        session_ids.pop(session.session_id, None)
+        if not session_ids:
+            del self._user_sessions[session.user_id]
+    
+    def _rebuild_expiry_heap(self):
+        """Rebuild the expiry heap from live sessions only."""
+        self._expiry_heap = [
+            (session.expiry_deadline(), session_id)
+            for session_id, session in self._sessions.items()
+        ]
+        heapq.heapify(self._expiry_heap)
+        self._stale_heap_entries = 0
+
+
+class KeyValueSessionStore(SessionStore):
+    """
+    Session store on a shared KeyValueStore, so every API worker sees the
+    same sessions.
+    
+    Layout (under ``prefix``):
+    - ``s:<session_id>``: JSON session record; its TTL is the earlier of
+      the idle and absolute deadlines and is pushed back on every save.
+      Saves are compare-and-set against the record the session was read
+      from, so concurrent updates from other workers are not overwritten
+    - ``t:<token_hash>``: session ID, expiring with the session lifetime
+    - ``u:<user_id>``: member set of active session IDs scored by
+      creation time
+    
+    The backend expires records itself, so pop_expired() returns nothing
+    and user index entries whose record has gone are pruned on read.
+    """
+    
+    def __init__(self, store: KeyValueStore, prefix: str = "session:"):
+        """
+        Initialize store.
+        
+        Args:
+            store: Shared key-value store (e.g. ShardedKeyValueStore)
+            prefix: Key prefix for every session key
+        """
+        self.store = store
+        self.prefix = prefix
+    
+    def _session_key(self, session_id: str) -> str:
+        return f"{self.prefix}s:{session_id}"
+    
+    def _token_key(self, token_hash: str) -> str:
+        return f"{self.prefix}t:{token_hash}"
+    
+    def _user_key(self, user_id: str) -> str:
+        return f"{self.prefix}u:{user_id}"
+    
+    @staticmethod
+    def _record_ttl(session: Session) -> float:
+        return session.expiry_deadline() - time.time()
+    
+    @staticmethod
+    def _lifetime_ttl(session: Session) -> float:
+        return session.expires_at.timestamp() - time.time()
+    
+    @staticmethod
+    def _decode(record: Optional[bytes]) -> Optional[Session]:
+        if record is None:
+            return None
+        session = Session.from_record(json.loads(record))
+        session._stored_record = record
+        return session
+    
+    @staticmethod
+    def _encode(session: Session) -> bytes:
+        return json.dumps(session.to_record(), separators=(",", ":")).encode()
+    
+    def add(self, session: Session) -> None:
+        record = self._encode(session)
+        self.store.set(self._session_key(session.session_id), record, self._record_ttl(session))
+        session._stored_record = record
+        
+        lifetime = self._lifetime_ttl(session)
+        session_id = session.session_id.encode()
+        self.store.set_many(
+            {
+                self._token_key(token.token_hash): session_id
+                for token in (session.access_token, session.refresh_token)
+                if token
+            },
+            lifetime
+        )
+        
+        user_key = self._user_key(session.user_id)
+        self.store.add_member(user_key, session.session_id, session.created_at.timestamp())
+        self.store.expire(user_key, session.max_lifetime_seconds)
+    
+    def get(self, session_id: str) -> Optional[Session]:
+        return self._decode(self.store.get(self._session_key(session_id)))
+    
+    def get_by_tokens(self, token_hashes: Sequence[str]) -> List[Optional[Session]]:
+        # Two pipelined reads: token hashes to IDs, then IDs to records
+        session_ids = self.store.get_many([self._token_key(h) for h in token_hashes])
+        found = [i for i, session_id in enumerate(session_ids) if session_id is not None]
+        records = self.store.get_many([self._session_key(session_ids[i].decode()) for i in found])
+        
+        sessions: List[Optional[Session]] = [None] * len(token_hashes)
+        for i, record in zip(found, records):
+            sessions[i] = self._decode(record)
+        return sessions
+    
+    def save(self, session: Session) -> bool:
+        return self.save_many([session])[0]
+    
+    def save_many(self, sessions: Sequence[Session]) -> List[bool]:
+        records = [self._encode(session) for session in sessions]
+        applied = self.store.compare_and_set_many([
+            (
+                self._session_key(session.session_id),
+                # A session that was never read cannot match any record
+                session._stored_record or b"",
+                record,
+                self._record_ttl(session)
+            )
+            for session, record in zip(sessions, records)
+        ])
+        
+        for session, record, written in zip(sessions, records, applied):
+            if not written:
+                continue
+            session._stored_record = record
+            if session.state not in ACTIVE_SESSION_STATES:
+                self.store.remove_members(self._user_key(session.user_id), session.session_id)
+        return applied
+    
+    def replace_token(self, session: Session, old_hash: Optional[str], new_hash: str) -> None:
+        if old_hash:
+            self.store.delete(self._token_key(old_hash))
+        self.store.set(self._token_key(new_hash), session.session_id.encode(), self._lifetime_ttl(session))
+    
+    def remove(self, session: Session) -> bool:
+        removed = self.store.delete(self._session_key(session.session_id)) > 0
+        token_keys = [
+            self._token_key(token.token_hash)
+            for token in (session.access_token, session.refresh_token)
+            if token
+        ]
+        if token_keys:
+            self.store.delete(*token_keys)
+        self.store.remove_members(self._user_key(session.user_id), session.session_id)
+        return removed
+    
+    def user_sessions(self, user_id: str) -> List[Session]:
+        user_key = self._user_key(user_id)
+        session_ids = self.store.members(user_key)
+        if not session_ids:
+            return []
+        
+        records = self.store.get_many([self._session_key(sid) for sid in session_ids])
+        sessions = []
+        stale = []
+        for session_id, record in zip(session_ids, records):
+            session = self._decode(record)
+            if session is None or session.state not in ACTIVE_SESSION_STATES:
+                stale.append(session_id)
+            else:
+                sessions.append(session)
+        if stale:
+            self.store.remove_members(user_key, *stale)
+        return sessions
+    
+    def user_session_count(self, user_id: str) -> int:
+        return len(self.user_sessions(user_id))
+    
+    def oldest_user_session_id(self, user_id: str) -> Optional[str]:
+        sessions = self.user_sessions(user_id)
+        return sessions[0].session_id if sessions else None
+    
+    def pop_expired(self) -> List[Session]:
+        return []
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend_keys": len(self.store)}
 
 
 # ============================================================================
@@ -400,6 +924,11 @@ class SessionManager:
     - Concurrent session management
     - Automatic cleanup
     - Audit logging
+    
+    Sessions live in a pluggable SessionStore: InMemorySessionStore for a
+    single process, or KeyValueSessionStore on a shared key-value store
+    when several API workers must see the same sessions. Terminated and
+    expired sessions are removed together with their token mappings.
     """
     
     # Default limits
@@ -408,23 +937,53 @@ class SessionManager:
     DEFAULT_IDLE_TIMEOUT = 1800  # 30 minutes
     DEFAULT_TOKEN_LIFETIME = 3600  # 1 hour
     
+    # Recent audit entries kept locally for get_audit_log
+    AUDIT_LOG_SIZE = 10000
+    
+    # Re-reads of a session whose conditional save lost to another update
+    SAVE_ATTEMPTS = 3
+    
+    # Session audit event names -> audit pipeline event types
+    AUDIT_EVENT_TYPES: Dict[str, AuditEventType] = {
+        "session_created": AuditEventType.SESSION_CREATED,
+        "token_refreshed": AuditEventType.SESSION_REFRESHED,
+        "session_terminated": AuditEventType.SESSION_TERMINATED,
+        "hijack_suspected": AuditEventType.SESSION_HIJACK_DETECTED,
+    }
+    
     def __init__(
         self,
         max_concurrent_sessions: int = DEFAULT_MAX_CONCURRENT_SESSIONS,
         session_lifetime: int = DEFAULT_SESSION_LIFETIME,
-        idle_timeout: int = DEFAULT_IDLE_TIMEOUT
+        idle_timeout: int = DEFAULT_IDLE_TIMEOUT,
+        audit_logger: Optional[AuditLogger] = None,
+        store: Optional[SessionStore] = None,
+        token_codec: Optional[SignedTokenCodec] = None
     ):
+        """
+        Initialize session manager.
+        
+        Args:
+            max_concurrent_sessions: Active sessions allowed per user
+            session_lifetime: Absolute session lifetime in seconds
+            idle_timeout: Idle timeout in seconds
+            audit_logger: Audit logger that session events are submitted to
+            store: Session store (defaults to InMemorySessionStore)
+            token_codec: Issue signed tokens that other nodes can validate
+                         locally; terminated sessions' tokens are added to
+                         its revocation filter
+        """
         self.max_concurrent_sessions = max_concurrent_sessions
         self.session_lifetime = session_lifetime
         self.idle_timeout = idle_timeout
         
-        # Storage (in production, use database/cache)
-        self._sessions: Dict[str, Session] = {}
-        self._user_sessions: Dict[str, Set[str]] = {}  # user_id -> session_ids
-        self._token_sessions: Dict[str, str] = {}  # token_hash -> session_id
+        # Storage
+        self._store = store if store is not None else InMemorySessionStore()
+        self.token_codec = token_codec
         
         # Audit log
-        self._audit_log: List[Dict[str, Any]] = []
+        self._audit_log: Deque[Dict[str, Any]] = deque(maxlen=self.AUDIT_LOG_SIZE)
+        self._audit_logger = audit_logger
     
     def create_session(
         self,
@@ -446,6 +1005,7 @@ class SessionManager:
             Tuple of (Session, access_token)
         """
         # Check concurrent session limit
+        self._reap_expired()
         self._enforce_session_limit(user_id)
         
         # Generate session ID
@@ -479,7 +1039,8 @@ class SessionManager:
             session_id=session_id,
             user_id=user_id,
             scopes=scopes,
-            lifetime_seconds=self.DEFAULT_TOKEN_LIFETIME
+            lifetime_seconds=self.DEFAULT_TOKEN_LIFETIME,
+            codec=self.token_codec
         )
         session.access_token = access_token
         
@@ -488,19 +1049,13 @@ class SessionManager:
             session_id=session_id,
             user_id=user_id,
             scopes=["refresh"],
-            lifetime_seconds=self.session_lifetime
+            lifetime_seconds=self.session_lifetime,
+            codec=self.token_codec
         )
         session.refresh_token = refresh_token
         
         # Store session
-        self._sessions[session_id] = session
-        
-        if user_id not in self._user_sessions:
-            self._user_sessions[user_id] = set()
-        self._user_sessions[user_id].add(session_id)
-        
-        self._token_sessions[access_token.token_hash] = session_id
-        self._token_sessions[refresh_token.token_hash] = session_id
+        self._store.add(session)
         
         # Audit log
         self._log_event("session_created", session_id, user_id)
@@ -522,25 +1077,102 @@ class SessionManager:
         Returns:
             Tuple of (is_valid, session, error_message)
         """
-        # Hash the token
-        token_hash = hashlib.sha3_256(token_value.encode()).hexdigest()
+        return self.validate_sessions([token_value], [binding])[0]
+    
+    def validate_sessions(
+        self,
+        token_values: Sequence[str],
+        bindings: Optional[Sequence[Optional[SessionBinding]]] = None
+    ) -> List[Tuple[bool, Optional[Session], str]]:
+        """
+        Validate several session tokens with one store lookup.
         
-        # Find session
-        session_id = self._token_sessions.get(token_hash)
-        if not session_id:
-            return False, None, "Token not found"
+        With a KeyValueSessionStore the token and session reads and the
+        conditional activity writes are pipelined across shards, so a
+        batch costs three round trips. A session changed by another
+        validation or termination in the meantime is re-read and checked
+        again. With a token codec, forged, expired and revoked signed
+        tokens are rejected locally and never reach the store.
         
-        session = self._sessions.get(session_id)
-        if not session:
-            return False, None, "Session not found"
+        Args:
+            token_values: Access token values
+            bindings: Current binding per token (None entries skip the check)
+            
+        Returns:
+            (is_valid, session, error_message) per token, in order
+        """
+        self._reap_expired()
+        
+        if bindings is None:
+            bindings = [None] * len(token_values)
+        results: List[Optional[Tuple[bool, Optional[Session], str]]] = [None] * len(token_values)
+        
+        codec = self.token_codec
+        if codec is not None:
+            for i, token_value in enumerate(token_values):
+                if codec.is_signed_token(token_value):
+                    is_valid, _, error = codec.decode(token_value)
+                    if not is_valid:
+                        results[i] = (False, None, error)
+        
+        token_hashes = [hashlib.sha3_256(value.encode()).hexdigest() for value in token_values]
+        pending = [i for i, result in enumerate(results) if result is None]
+        
+        for _ in range(self.SAVE_ATTEMPTS):
+            if not pending:
+                break
+            sessions = self._store.get_by_tokens([token_hashes[i] for i in pending])
+            
+            changed: List[Tuple[int, Session, Optional[List[str]]]] = []
+            for i, session in zip(pending, sessions):
+                results[i], mismatches = self._check_session(session, bindings[i])
+                if results[i][0] or mismatches is not None:
+                    changed.append((i, session, mismatches))
+            
+            saved = self._store.save_many([session for _, session, _ in changed])
+            pending = []
+            for (i, session, mismatches), written in zip(changed, saved):
+                if not written:
+                    # Another update won the race; check the session again
+                    pending.append(i)
+                elif mismatches is not None:
+                    self._log_event(
+                        "hijack_suspected",
+                        session.session_id,
+                        session.user_id,
+                        {"mismatches": mismatches}
+                    )
+        
+        for i in pending:
+            results[i] = (False, results[i][1], "Session changed concurrently")
+        
+        return results
+    
+    def _check_session(
+        self,
+        session: Optional[Session],
+        binding: Optional[SessionBinding]
+    ) -> Tuple[Tuple[bool, Optional[Session], str], Optional[List[str]]]:
+        """
+        Check a resolved session's state, token and binding.
+        
+        The session is updated in place but not saved: valid sessions
+        record the activity, and binding mismatches mark it
+        HIJACK_SUSPECTED.
+        
+        Returns:
+            ((is_valid, session, error_message), binding mismatches or None)
+        """
+        if session is None:
+            return (False, None, "Token not found"), None
         
         # Check session state
         if not session.is_active():
-            return False, session, "Session not active"
+            return (False, session, "Session not active"), None
         
         # Check token expiration
         if session.access_token and session.access_token.is_expired():
-            return False, session, "Token expired"
+            return (False, session, "Token expired"), None
         
         # Verify binding
         if binding and session.binding:
@@ -548,19 +1180,13 @@ class SessionManager:
             if not matches:
                 # Potential session hijacking
                 session.state = SessionState.HIJACK_SUSPECTED
-                self._log_event(
-                    "hijack_suspected",
-                    session_id,
-                    session.user_id,
-                    {"mismatches": mismatches}
-                )
-                return False, session, f"Binding mismatch: {mismatches}"
+                return (False, session, f"Binding mismatch: {mismatches}"), mismatches
         
         # Update activity
         session.record_activity(binding.ip_address if binding else "")
         session.access_token.last_used_at = datetime.now(timezone.utc)
         
-        return True, session, ""
+        return (True, session, ""), None
     
     def refresh_session(
         self,
@@ -575,17 +1201,19 @@ class SessionManager:
         Returns:
             Tuple of (success, new_access_token, error_message)
         """
+        self._reap_expired()
+        
         # Hash the token
         token_hash = hashlib.sha3_256(refresh_token_value.encode()).hexdigest()
         
         # Find session
-        session_id = self._token_sessions.get(token_hash)
-        if not session_id:
+        session = self._store.get_by_tokens([token_hash])[0]
+        if not session:
             return False, None, "Refresh token not found"
         
-        session = self._sessions.get(session_id)
-        if not session:
-            return False, None, "Session not found"
+        # Suspended or hijacked sessions cannot be revived by a refresh
+        if session.state not in ACTIVE_SESSION_STATES:
+            return False, None, "Session not active"
         
         # Check refresh token validity
         if session.refresh_token and session.refresh_token.is_expired():
@@ -597,17 +1225,25 @@ class SessionManager:
         
         # Rotate access token
         old_token = session.access_token
-        new_token = TokenGenerator.rotate_token(old_token)
+        new_token = TokenGenerator.rotate_token(old_token, codec=self.token_codec)
         session.access_token = new_token
         session.state = SessionState.REFRESHED
         
+        # A session terminated or flagged since it was read stays that way
+        if not self._store.save(session):
+            return False, None, "Session changed concurrently"
+        
         # Update token mapping
+        self._store.replace_token(
+            session,
+            old_token.token_hash if old_token else None,
+            new_token.token_hash
+        )
         if old_token:
-            self._token_sessions.pop(old_token.token_hash, None)
-        self._token_sessions[new_token.token_hash] = session_id
+            self._revoke_token(old_token)
         
         # Audit log
-        self._log_event("token_refreshed", session_id, session.user_id)
+        self._log_event("token_refreshed", session.session_id, session.user_id)
         
         return True, new_token, ""
     
@@ -626,28 +1262,15 @@ class SessionManager:
         Returns:
             True if session was terminated
         """
-        session = self._sessions.get(session_id)
+        session = self._store.get(session_id)
         if not session:
             return False
         
-        # Update session
-        session.state = SessionState.TERMINATED
-        session.terminated_at = datetime.now(timezone.utc)
-        session.termination_reason = reason
-        
-        # Remove from user sessions
-        if session.user_id in self._user_sessions:
-            self._user_sessions[session.user_id].discard(session_id)
-        
-        # Remove token mappings
-        if session.access_token:
-            self._token_sessions.pop(session.access_token.token_hash, None)
-        if session.refresh_token:
-            self._token_sessions.pop(session.refresh_token.token_hash, None)
-        
-        # Audit log
-        self._log_event("session_terminated", session_id, session.user_id, {"reason": reason.value})
+        # Another worker may have removed it in the meantime
+        if not self._store.remove(session):
+            return False
         
+        self._mark_terminated(session, reason)
         return True
     
     def terminate_all_user_sessions(
@@ -665,56 +1288,91 @@ class SessionManager:
         Returns:
             Number of sessions terminated
         """
-        session_ids = list(self._user_sessions.get(user_id, set()))
+        sessions = self._store.user_sessions(user_id)
         count = 0
         
-        for session_id in session_ids:
-            if self.terminate_session(session_id, reason):
+        for session in sessions:
+            if self.terminate_session(session.session_id, reason):
                 count += 1
         
         return count
     
     def get_user_sessions(self, user_id: str) -> List[Session]:
-        """Get all sessions for a user."""
-        session_ids = self._user_sessions.get(user_id, set())
-        return [
-            self._sessions[sid]
-            for sid in session_ids
-            if sid in self._sessions
-        ]
+        """Get active sessions for a user, oldest first."""
+        self._reap_expired()
+        return self._store.user_sessions(user_id)
     
     def get_active_session_count(self, user_id: str) -> int:
         """Get count of active sessions for a user."""
-        sessions = self.get_user_sessions(user_id)
-        return sum(1 for s in sessions if s.is_active())
+        self._reap_expired()
+        return self._store.user_session_count(user_id)
     
     def cleanup_expired_sessions(self) -> int:
         """
         Clean up expired sessions.
         
+        Only sessions whose deadline has passed are visited, so a call
+        costs O(log n) per expired session rather than a full scan.
+        
         Returns:
             Number of sessions cleaned up
         """
-        expired = []
+        return self._reap_expired()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get session store sizes."""
+        return self._store.get_stats()
+    
+    def _enforce_session_limit(self, user_id: str):
+        """Enforce concurrent session limit."""
+        while self._store.user_session_count(user_id) >= self.max_concurrent_sessions:
+            # Terminate oldest session
+            oldest = self._store.oldest_user_session_id(user_id)
+            if oldest is None:
+                break
+            self.terminate_session(oldest, TerminationReason.CONCURRENT_LIMIT)
+    
+    def _reap_expired(self) -> int:
+        """
+        Terminate sessions whose idle or absolute deadline has passed.
         
-        for session_id, session in self._sessions.items():
-            if not session.is_active() and session.state == SessionState.ACTIVE:
-                expired.append(session_id)
+        Returns:
+            Number of sessions removed
+        """
+        expired = self._store.pop_expired()
+        now = datetime.now(timezone.utc)
         
-        for session_id in expired:
-            self.terminate_session(session_id, TerminationReason.TIMEOUT)
+        for session in expired:
+            if now > session.expires_at:
+                reason = TerminationReason.MAX_LIFETIME
+            else:
+                reason = TerminationReason.TIMEOUT
+            self._mark_terminated(session, reason)
         
         return len(expired)
     
-    def _enforce_session_limit(self, user_id: str):
-        """Enforce concurrent session limit."""
-        sessions = self.get_user_sessions(user_id)
-        active_sessions = [s for s in sessions if s.is_active()]
+    def _mark_terminated(self, session: Session, reason: TerminationReason):
+        """Record a removed session's termination."""
+        session.state = SessionState.TERMINATED
+        session.terminated_at = datetime.now(timezone.utc)
+        session.termination_reason = reason
         
-        if len(active_sessions) >= self.max_concurrent_sessions:
-            # Terminate oldest session
-            oldest = min(active_sessions, key=lambda s: s.created_at)
-            self.terminate_session(oldest.session_id, TerminationReason.CONCURRENT_LIMIT)
+        for token in (session.access_token, session.refresh_token):
+            if token:
+                self._revoke_token(token)
+        
+        # Audit log
+        self._log_event(
+            "session_terminated",
+            session.session_id,
+            session.user_id,
+            {"reason": reason.value}
+        )
+    
+    def _revoke_token(self, token: SessionToken):
+        """Revoke a signed token that has not expired yet."""
+        if self.token_codec is not None and not token.is_expired():
+            self.token_codec.revoke(token.token_id)
     
     def _log_event(
         self,
@@ -733,9 +1391,16 @@ class SessionManager:
         }
         self._audit_log.append(event)
         
-        # Keep only last 10000 events
-        if len(self._audit_log) > 10000:
-            self._audit_log = self._audit_log[-10000:]
+        if self._audit_logger is not None:
+            self._audit_logger.submit(
+                self.AUDIT_EVENT_TYPES[event_type],
+                actor_id=user_id,
+                target_type="session",
+                target_id=session_id,
+                action=event_type,
+                session_id=session_id,
+                details=extra
+            )
     
     def get_audit_log(
         self,
@@ -746,7 +1411,7 @@ class SessionManager:
         if user_id:
             events = [e for e in self._audit_log if e.get("user_id") == user_id]
         else:
-            events = self._audit_log
+            events = list(self._audit_log)
         
         return events[-limit:]
 
@@ -763,5 +1428,9 @@ __all__ = [
     "TokenGenerator",
     "SessionBinding",
     "Session",
+    "ACTIVE_SESSION_STATES",
+    "SessionStore",
+    "InMemorySessionStore",
+    "KeyValueSessionStore",
     "SessionManager",
 ]
@@ -0,0 +1,485 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Signed Session Tokens
+
+Self-describing bearer tokens that any node can validate locally:
+
+    dna-session-v1.<payload>.<signature>
+
+The payload is base64url JSON carrying the token ID, session ID, user,
+scopes, issue time and expiry, plus the ID of the Ed25519 key that signed
+it. The signature covers the prefix and payload. Validation needs only
+the issuer's public key, so there is no session store round trip.
+
+Logout before expiry is handled by a RevocationBloomFilter of revoked
+token IDs. Nodes publish their filter to a shared key-value store and OR
+in everyone else's; a false positive only forces a re-login.
+"""
+
+import base64
+import hashlib
+import json
+import math
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from server.core.kv_store import KeyValueStore
+from server.crypto.backend import SignerBackend, get_verifier
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+# ============================================================================
+# TOKEN CLAIMS
+# ============================================================================
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """Claims carried by a signed session token."""
+    
+    token_id: str
+    session_id: str
+    user_id: str
+    scopes: Tuple[str, ...] = field(default_factory=tuple)
+    issued_at: int = 0
+    expires_at: int = 0
+    key_id: str = ""
+    
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if the token is expired."""
+        return (time.time() if now is None else now) >= self.expires_at
+    
+    def has_scope(self, scope: str) -> bool:
+        """Check if the token grants a scope."""
+        return scope in self.scopes
+    
+    def to_payload(self) -> Dict[str, object]:
+        """Convert to the compact payload form."""
+        return {
+            "jti": self.token_id,
+            "sid": self.session_id,
+            "sub": self.user_id,
+            "scp": list(self.scopes),
+            "iat": self.issued_at,
+            "exp": self.expires_at,
+            "kid": self.key_id
+        }
+    
+    @classmethod
+    def from_payload(cls, payload: Dict[str, object]) -> "TokenClaims":
+        """Rebuild claims from the compact payload form."""
+        return cls(
+            token_id=str(payload["jti"]),
+            session_id=str(payload["sid"]),
+            user_id=str(payload["sub"]),
+            scopes=tuple(payload.get("scp", ())),
+            issued_at=int(payload.get("iat", 0)),
+            expires_at=int(payload["exp"]),
+            key_id=str(payload.get("kid", ""))
+        )
+
+
+# ============================================================================
+# REVOCATION FILTER
+# ============================================================================
+
+class RevocationBloomFilter:
+    """
+    Bloom filter of revoked token IDs.
+    
+    Revocations only matter until the revoked token expires, so the
+    filter keeps two generations and starts a fresh one every
+    ``rotate_seconds``. As long as token lifetimes do not exceed
+    ``rotate_seconds``, a revoked ID stays visible until its token has
+    expired, and the filter never fills up.
+    """
+    
+    # Snapshot format version
+    SNAPSHOT_VERSION = 1
+    
+    def __init__(
+        self,
+        capacity: int = 10000,
+        error_rate: float = 0.001,
+        rotate_seconds: int = 3600,
+        clock: Optional[Callable[[], float]] = None
+    ):
+        """
+        Initialize filter.
+        
+        Args:
+            capacity: Revocations per generation at the target error rate
+            error_rate: Target false positive rate
+            rotate_seconds: Generation length; at least the longest token lifetime
+            clock: Time source in seconds (defaults to time.time)
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate in (0, 1)")
+        
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.num_bits += -self.num_bits % 8
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.rotate_seconds = rotate_seconds
+        self._clock = clock or time.time
+        
+        self._generation = int(self._clock() // rotate_seconds)
+        self._current = bytearray(self.num_bits // 8)
+        self._previous = bytearray(self.num_bits // 8)
+        self._lock = threading.Lock()
+    
+    def _positions(self, token_id: str) -> List[int]:
+        digest = hashlib.blake2b(token_id.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+    
+    def _rotate(self):
+        """Advance generations to the current time."""
+        generation = int(self._clock() // self.rotate_seconds)
+        if generation == self._generation:
+            return
+        if generation == self._generation + 1:
+            self._previous = self._current
+        else:
+            self._previous = bytearray(len(self._current))
+        self._current = bytearray(len(self._current))
+        self._generation = generation
+    
+    def add(self, token_id: str):
+        """Record a revoked token ID."""
+        positions = self._positions(token_id)
+        with self._lock:
+            self._rotate()
+            bits = self._current
+            for pos in positions:
+                bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, token_id: str) -> bool:
+        positions = self._positions(token_id)
+        with self._lock:
+            self._rotate()
+            return any(
+                all(bits[pos >> 3] & (1 << (pos & 7)) for pos in positions)
+                for bits in (self._current, self._previous)
+            )
+    
+    def to_bytes(self) -> bytes:
+        """Serialize both generations for publishing to other nodes."""
+        with self._lock:
+            self._rotate()
+            header = json.dumps({
+                "v": self.SNAPSHOT_VERSION,
+                "m": self.num_bits,
+                "k": self.num_hashes,
+                "g": self._generation
+            }).encode()
+            return len(header).to_bytes(2, "big") + header + bytes(self._current) + bytes(self._previous)
+    
+    def merge(self, snapshot: bytes) -> bool:
+        """
+        OR another node's snapshot into this filter.
+        
+        Args:
+            snapshot: Output of to_bytes() from a filter with the same parameters
+            
+        Returns:
+            True if the snapshot was compatible and merged
+        """
+        header_len = int.from_bytes(snapshot[:2], "big")
+        header = json.loads(snapshot[2:2 + header_len])
+        if (header.get("v") != self.SNAPSHOT_VERSION or
+                header.get("m") != self.num_bits or header.get("k") != self.num_hashes):
+            return False
+        
+        size = self.num_bits // 8
+        body = snapshot[2 + header_len:]
+        if len(body) != 2 * size:
+            return False
+        generations = {header["g"]: body[:size], header["g"] - 1: body[size:]}
+        
+        with self._lock:
+            self._rotate()
+            for target, generation in ((self._current, self._generation),
+                                       (self._previous, self._generation - 1)):
+                other = generations.get(generation)
+                if other is not None:
+                    merged = int.from_bytes(target, "little") | int.from_bytes(other, "little")
+                    target[:] = merged.to_bytes(size, "little")
+        return True
+    
+    def sync(self, store: KeyValueStore, key: str, node_id: str) -> int:
+        """
+        Publish this filter and merge every other node's.
+        
+        Each node writes only its own snapshot, so concurrent syncs never
+        lose revocations.
+        
+        Args:
+            store: Shared key-value store
+            key: Key prefix for the filter snapshots
+            node_id: This node's identifier
+            
+        Returns:
+            Number of peer snapshots merged
+        """
+        ttl = 2 * self.rotate_seconds
+        store.set(f"{key}:{node_id}", self.to_bytes(), ttl)
+        store.add_member(f"{key}:nodes", node_id, time.time())
+        store.expire(f"{key}:nodes", ttl)
+        
+        peers = [peer for peer in store.members(f"{key}:nodes") if peer != node_id]
+        snapshots = store.get_many([f"{key}:{peer}" for peer in peers])
+        merged = 0
+        for peer, snapshot in zip(peers, snapshots):
+            if snapshot is None:
+                store.remove_members(f"{key}:nodes", peer)
+            elif self.merge(snapshot):
+                merged += 1
+        return merged
+
+
+# ============================================================================
+# TOKEN CODEC
+# ============================================================================
+
+class SignedTokenCodec:
+    """
+    Issues and validates signed session tokens.
+    
+    A codec with a signer can issue tokens; any codec that knows the
+    issuer's public key can validate them. Recently verified tokens are
+    cached, so repeat requests skip the signature check; expiry and
+    revocation are still checked every time.
+    """
+    
+    PREFIX = "dna-session-v1."
+    
+    # Verified tokens remembered to skip repeat signature checks
+    DEFAULT_CACHE_SIZE = 4096
+    
+    def __init__(
+        self,
+        signer: Optional[SignerBackend] = None,
+        verify_keys: Optional[List[bytes]] = None,
+        revocations: Optional[RevocationBloomFilter] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        clock: Optional[Callable[[], float]] = None
+    ):
+        """
+        Initialize codec.
+        
+        Args:
+            signer: Ed25519 signer for issuing tokens (None for verify-only nodes)
+            verify_keys: Additional trusted public keys (e.g. previous signing keys)
+            revocations: Revocation filter (a default filter is created if None)
+            cache_size: Verified tokens to remember
+            clock: Time source in seconds (defaults to time.time)
+        """
+        self.signer = signer
+        self.revocations = revocations if revocations is not None else RevocationBloomFilter()
+        self.cache_size = cache_size
+        self._clock = clock or time.time
+        
+        self._verifiers: Dict[str, Callable[[bytes, bytes], bool]] = {}
+        self.key_id: Optional[str] = None
+        if signer is not None:
+            self.key_id = self.add_verify_key(signer.get_public_key())
+        for public_key in verify_keys or []:
+            self.add_verify_key(public_key)
+        
+        self._verified: "OrderedDict[str, TokenClaims]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def compute_key_id(public_key: bytes) -> str:
+        """Get the short identifier tokens use to name a signing key."""
+        return hashlib.sha256(public_key).hexdigest()[:16]
+    
+    def add_verify_key(self, public_key: bytes) -> str:
+        """
+        Trust a public key for validation.
+        
+        Returns:
+            The key's ID
+        """
+        key_id = self.compute_key_id(public_key)
+        self._verifiers[key_id] = get_verifier(public_key)
+        return key_id
+    
+    @classmethod
+    def is_signed_token(cls, token: str) -> bool:
+        """Check if a token string uses the signed format."""
+        return token.startswith(cls.PREFIX)
+    
+    def issue(
+        self,
+        session_id: str,
+        user_id: str,
+        scopes: List[str],
+        lifetime_seconds: int,
+        token_id: Optional[str] = None
+    ) -> Tuple[str, TokenClaims]:
+        """
+        Issue a signed token.
+        
+        Args:
+            session_id: Session the token belongs to
+            user_id: User identifier
+            scopes: Granted scopes
+            lifetime_seconds: Token lifetime in seconds
+            token_id: Token ID (random if None)
+            
+        Returns:
+            Tuple of (token string, claims)
+        """
+        if self.signer is None:
+            raise RuntimeError("Codec has no signer; it can only validate tokens")
+        
+        now = int(self._clock())
+        claims = TokenClaims(
+            token_id=token_id or f"tok_{secrets.token_hex(16)}",
+            session_id=session_id,
+            user_id=user_id,
+            scopes=tuple(scopes),
+            issued_at=now,
+            expires_at=now + int(lifetime_seconds),
+            key_id=self.key_id
+        )
+        payload = json.dumps(claims.to_payload(), separators=(",", ":")).encode()
+        signing_input = self.PREFIX + _b64encode(payload)
+        signature = self.signer.sign(signing_input.encode("ascii"))
+        return f"{signing_input}.{_b64encode(signature)}", claims
+    
+    def decode(self, token: str) -> Tuple[bool, Optional[TokenClaims], str]:
+        """
+        Validate a token locally.
+        
+        Args:
+            token: Token string
+            
+        Returns:
+            Tuple of (is_valid, claims, error_message); claims are returned
+            for expired or revoked tokens so callers can log them
+        """
+        with self._lock:
+            claims = self._verified.get(token)
+            if claims is not None:
+                self._verified.move_to_end(token)
+        
+        if claims is None:
+            claims, error = self._verify(token)
+            if claims is None:
+                return False, None, error
+            with self._lock:
+                self._verified[token] = claims
+                while len(self._verified) > self.cache_size:
+                    self._verified.popitem(last=False)
+        
+        if claims.is_expired(self._clock()):
+            return False, claims, "Token expired"
+        if claims.token_id in self.revocations:
+            return False, claims, "Token revoked"
+        return True, claims, ""
+    
+    def _verify(self, token: str) -> Tuple[Optional[TokenClaims], str]:
+        """Check a token's format and signature."""
+        if not self.is_signed_token(token):
+            return None, "Not a signed token"
+        
+        signing_input, sep, signature_b64 = token.rpartition(".")
+        if not sep or signing_input == self.PREFIX[:-1]:
+            return None, "Malformed token"
+        try:
+            payload = json.loads(_b64decode(signing_input[len(self.PREFIX):]))
+            signature = _b64decode(signature_b64)
+        except ValueError:
+            return None, "Malformed token"
+        if not isinstance(payload, dict) or not all(name in payload for name in ("jti", "sid", "sub", "exp")):
+            return None, "Malformed token"
+        key_id = str(payload.get("kid", ""))
+        
+        # Claims are only interpreted once the signature has been checked
+        verifier = self._verifiers.get(key_id)
+        if verifier is None:
+            return None, "Unknown signing key"
+        if not verifier(signing_input.encode("ascii"), signature):
+            return None, "Invalid signature"
+        
+        try:
+            return TokenClaims.from_payload(payload), ""
+        except (ValueError, KeyError, TypeError, OverflowError):
+            return None, "Malformed token"
+    
+    def revoke(self, token_id: str):
+        """Revoke a token before its expiry."""
+        self.revocations.add(token_id)
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+__all__ = [
+    "TokenClaims",
+    "RevocationBloomFilter",
+    "SignedTokenCodec",
+]
@@ -0,0 +1,483 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Sliding Window Counters
+
+Constant-time building blocks for real-time attack detection:
+
+1. SlidingWindowCounter - per-key event counts over one or more trailing
+   windows. Events are aggregated into fixed-width time buckets and every
+   registered window keeps a running total, so recording an event and
+   reading a count are O(1) amortized regardless of event volume.
+2. SlidingCardinalitySketch - sliding-window HyperLogLog for counting
+   distinct items (e.g. users tried from one IP) in bounded memory.
+
+Idle keys are expired in last-activity order, so memory tracks the set of
+keys active within the longest window rather than every key ever seen.
+"""
+
+import hashlib
+import math
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Hashable, Iterable, List, Optional
+
+
+class _KeyWindow:
+    """Bucketed history and running window totals for one key."""
+
+    __slots__ = ("buckets", "head_seq", "current", "totals", "starts")
+
+    def __init__(self, window_count: int, current: int):
+        # Each bucket is [bucket_index, count], oldest first
+        self.buckets: Deque[List[int]] = deque()
+        # Sequence number of buckets[0]
+        self.head_seq = 0
+        # Bucket index the window totals were last advanced to
+        self.current = current
+        # Running total and first in-window bucket (by sequence) per window
+        self.totals = [0] * window_count
+        self.starts = [0] * window_count
+
+
+class SlidingWindowCounter:
+    """
+    Per-key event counter over trailing time windows.
+
+    Each event enters and leaves every window exactly once, so the cost
+    per event is O(number of windows), independent of how many events
+    the key has seen. Window edges are exact to one bucket.
+    """
+
+    def __init__(
+        self,
+        windows: Iterable[int] = (),
+        bucket_seconds: float = 1.0,
+        max_keys: Optional[int] = None,
+    ):
+        """
+        Initialize counter.
+
+        Args:
+            windows: Window lengths in seconds to maintain totals for
+            bucket_seconds: Width of the aggregation buckets
+            max_keys: Maximum keys tracked; the least recently active key
+                      is evicted beyond this (unbounded if None)
+
+        Raises:
+            ValueError: If bucket_seconds or max_keys is not positive
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        if max_keys is not None and max_keys <= 0:
+            raise ValueError("max_keys must be positive")
+
+        self.bucket_seconds = bucket_seconds
+        self.max_keys = max_keys
+        self.evictions = 0
+        self._windows: List[int] = []
+        self._window_index: Dict[int, int] = {}
+        self._spans: List[int] = []
+        self._max_span = 0
+        self._keys: "OrderedDict[Hashable, _KeyWindow]" = OrderedDict()
+
+        for window in windows:
+            self.add_window(window)
+
+    @property
+    def windows(self) -> List[int]:
+        """Registered window lengths in seconds."""
+        return list(self._windows)
+
+    def _bucket(self, now: float) -> int:
+        return int(now // self.bucket_seconds)
+
+    def add_window(self, window: int) -> None:
+        """
+        Register a window length.
+
+        Existing keys get their totals for the new window computed from
+        their retained buckets; buckets older than the previous longest
+        window are already gone, so a longer window fills up over time.
+
+        Args:
+            window: Window length in seconds
+        """
+        if window in self._window_index:
+            return
+        if window <= 0:
+            raise ValueError("window must be positive")
+
+        span = max(1, math.ceil(window / self.bucket_seconds))
+        self._window_index[window] = len(self._windows)
+        self._windows.append(window)
+        self._spans.append(span)
+        self._max_span = max(self._max_span, span)
+
+        for entry in self._keys.values():
+            entry.totals.append(sum(count for _, count in entry.buckets))
+            entry.starts.append(entry.head_seq)
+
+    def _advance(self, entry: _KeyWindow, current: int) -> None:
+        """Slide every window of ``entry`` forward to bucket ``current``."""
+        if current <= entry.current:
+            return
+        entry.current = current
+        buckets = entry.buckets
+        head_seq = entry.head_seq
+        tail_seq = head_seq + len(buckets)
+
+        for i, span in enumerate(self._spans):
+            cutoff = current - span
+            start = entry.starts[i]
+            while start < tail_seq and buckets[start - head_seq][0] <= cutoff:
+                entry.totals[i] -= buckets[start - head_seq][1]
+                start += 1
+            entry.starts[i] = start
+
+        # Buckets outside the longest window are no longer referenced
+        cutoff = current - self._max_span
+        while buckets and buckets[0][0] <= cutoff:
+            buckets.popleft()
+            entry.head_seq += 1
+
+    def add(self, key: Hashable, now: float, amount: int = 1) -> None:
+        """
+        Record ``amount`` events for ``key`` at time ``now``.
+
+        Late events (older than the key's latest observed time) are placed
+        in their own bucket and only count towards windows that still cover
+        them; events older than the longest window are ignored.
+
+        Args:
+            key: Counter key
+            now: Event timestamp (seconds)
+            amount: Number of events
+        """
+        current = self._bucket(now)
+        entry = self._keys.get(key)
+        if entry is None:
+            entry = _KeyWindow(len(self._windows), current)
+            self._keys[key] = entry
+            if self.max_keys is not None and len(self._keys) > self.max_keys:
+                self._keys.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._keys.move_to_end(key)
+            self._advance(entry, current)
+
+        if current < entry.current:
+            self._add_late(entry, current, amount)
+            return
+
+        buckets = entry.buckets
+        if buckets and buckets[-1][0] == current:
+            buckets[-1][1] += amount
+        else:
+            buckets.append([current, amount])
+
+        totals = entry.totals
+        for i in range(len(totals)):
+            totals[i] += amount
+
+    def _add_late(self, entry: _KeyWindow, bucket: int, amount: int) -> None:
+        """Insert an out-of-order event into ``entry``'s bucket history."""
+        reference = entry.current
+        if bucket <= reference - self._max_span:
+            return
+
+        buckets = entry.buckets
+        pos = len(buckets) - 1
+        while pos >= 0 and buckets[pos][0] > bucket:
+            pos -= 1
+
+        inserted = not (pos >= 0 and buckets[pos][0] == bucket)
+        if inserted:
+            buckets.insert(pos + 1, [bucket, amount])
+        else:
+            buckets[pos][1] += amount
+
+        for i, span in enumerate(self._spans):
+            if bucket > reference - span:
+                entry.totals[i] += amount
+            elif inserted:
+                # The new bucket precedes this window's first bucket
+                entry.starts[i] += 1
+
+    def count(self, key: Hashable, window: int, now: float) -> int:
+        """
+        Get the number of events for ``key`` within the trailing window.
+
+        Args:
+            key: Counter key
+            window: Window length in seconds (registered on first use)
+            now: Current timestamp (seconds)
+
+        Returns:
+            Event count
+        """
+        if window not in self._window_index:
+            self.add_window(window)
+
+        entry = self._keys.get(key)
+        if entry is None:
+            return 0
+
+        self._advance(entry, self._bucket(now))
+        return entry.totals[self._window_index[window]]
+
+    def expire(self, now: float) -> int:
+        """
+        Drop keys with no events inside the longest window.
+
+        Keys are kept in last-activity order, so this only inspects keys
+        that are actually idle: O(1) amortized per dropped key.
+
+        Args:
+            now: Current timestamp (seconds)
+
+        Returns:
+            Number of keys dropped
+        """
+        cutoff = self._bucket(now) - self._max_span
+        removed = 0
+        while self._keys:
+            key, entry = next(iter(self._keys.items()))
+            if entry.buckets and entry.buckets[-1][0] > cutoff:
+                break
+            del self._keys[key]
+            removed += 1
+        return removed
+
+    def discard(self, key: Hashable) -> None:
+        """Forget all events recorded for ``key``."""
+        self._keys.pop(key, None)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class SlidingCardinalitySketch:
+    """
+    Sliding-window HyperLogLog distinct counter.
+
+    Each register keeps the (timestamp, rank) pairs that can still be the
+    register maximum for some window ending now: a new observation drops
+    older pairs of equal or lower rank. The maximum for any window is then
+    the first pair inside it. Registers are created on demand, so a sketch
+    that has only seen a few items stays small.
+    """
+
+    def __init__(self, max_window: float, precision: int = 7):
+        """
+        Initialize sketch.
+
+        Args:
+            max_window: Longest window (seconds) that will be queried
+            precision: log2 of the number of registers (4-16)
+
+        Raises:
+            ValueError: If precision is out of range
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+
+        self.max_window = max_window
+        self.precision = precision
+        self.register_count = 1 << precision
+        self.last_seen = 0.0
+        self._rank_bits = 64 - precision
+        self._registers: Dict[int, Deque[tuple]] = {}
+
+        m = self.register_count
+        if m == 16:
+            self._alpha = 0.673
+        elif m == 32:
+            self._alpha = 0.697
+        elif m == 64:
+            self._alpha = 0.709
+        else:
+            self._alpha = 0.7213 / (1 + 1.079 / m)
+
+    def add(self, item: str, now: float) -> None:
+        """
+        Record an observation of ``item`` at time ``now``.
+
+        Args:
+            item: Item to count
+            now: Observation timestamp (seconds)
+        """
+        value = int.from_bytes(hashlib.blake2b(item.encode(), digest_size=8).digest(), "big")
+        register = value >> self._rank_bits
+        remainder = value & ((1 << self._rank_bits) - 1)
+        rank = self._rank_bits - remainder.bit_length() + 1
+
+        pairs = self._registers.get(register)
+        if pairs is None:
+            pairs = deque()
+            self._registers[register] = pairs
+
+        while pairs and pairs[-1][1] <= rank:
+            pairs.pop()
+        pairs.append((now, rank))
+
+        cutoff = now - self.max_window
+        while pairs[0][0] <= cutoff:
+            pairs.popleft()
+
+        self.last_seen = now
+
+    def estimate(self, window: float, now: float) -> int:
+        """
+        Estimate the number of distinct items seen in the trailing window.
+
+        Args:
+            window: Window length in seconds
+            now: Current timestamp (seconds)
+
+        Returns:
+            Estimated distinct count
+        """
+        start = now - window
+        expired = now - self.max_window
+        m = self.register_count
+        inverse_sum = 0.0
+        zeros = m
+
+        for register in list(self._registers):
+            pairs = self._registers[register]
+            while pairs and pairs[0][0] <= expired:
+                pairs.popleft()
+            if not pairs:
+                del self._registers[register]
+                continue
+
+            for timestamp, rank in pairs:
+                if timestamp > start:
+                    inverse_sum += 2.0 ** -rank
+                    zeros -= 1
+                    break
+
+        if zeros == m:
+            return 0
+
+        inverse_sum += zeros
+        estimate = self._alpha * m * m / inverse_sum
+
+        # Small-range correction (linear counting)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+
+        return int(round(estimate))
+
+    def is_idle(self, now: float) -> bool:
+        """Check whether the sketch has seen nothing within max_window."""
+        return now - self.last_seen >= self.max_window
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sketch size information."""
+        return {
+            "registers_in_use": len(self._registers),
+            "retained_pairs": sum(len(pairs) for pairs in self._registers.values()),
+            "precision": self.precision,
+        }
+
+
+class SketchIndex:
+    """Keyed collection of cardinality sketches with idle-key expiry."""
+
+    def __init__(self, max_window: float, precision: int = 7):
+        self.max_window = max_window
+        self.precision = precision
+        self._sketches: "OrderedDict[Hashable, SlidingCardinalitySketch]" = OrderedDict()
+
+    def add(self, key: Hashable, item: str, now: float) -> None:
+        """Record ``item`` in the sketch for ``key``."""
+        sketch = self._sketches.get(key)
+        if sketch is None:
+            sketch = SlidingCardinalitySketch(self.max_window, self.precision)
+            self._sketches[key] = sketch
+        else:
+            self._sketches.move_to_end(key)
+        sketch.add(item, now)
+
+    def estimate(self, key: Hashable, window: float, now: float) -> int:
+        """Estimate distinct items for ``key`` in the trailing window."""
+        sketch = self._sketches.get(key)
+        if sketch is None:
+            return 0
+        return sketch.estimate(window, now)
+
+    def set_max_window(self, max_window: float) -> None:
+        """Raise the longest queryable window."""
+        if max_window > self.max_window:
+            self.max_window = max_window
+            for sketch in self._sketches.values():
+                sketch.max_window = max_window
+
+    def expire(self, now: float) -> int:
+        """Drop sketches idle for longer than max_window."""
+        removed = 0
+        while self._sketches:
+            key, sketch = next(iter(self._sketches.items()))
+            if not sketch.is_idle(now):
+                break
+            del self._sketches[key]
+            removed += 1
+        return removed
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._sketches
+
+    def __len__(self) -> int:
+        return len(self._sketches)
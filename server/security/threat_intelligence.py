@@ -78,11 +78,17 @@ import hashlib
 import ipaddress
 import re
 import secrets
+import threading
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum, IntEnum
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from server.security.audit_logging import AuditEventType, AuditLogger, AuditSeverity
+from server.security.indicator_index import IndicatorIndex
+from server.security.sliding_window import SketchIndex, SlidingWindowCounter
 
 
 # ============================================================================
@@ -349,6 +355,11 @@ class IPReputationEngine:
     - Geolocation data
     - ASN intelligence
     - Network behavior analysis
+    
+    Memory is bounded: computed reputations live in an LRU cache with a
+    TTL, and threat history is kept as hourly bucketed counts for a
+    bounded number of recently active IPs, so rotating source addresses
+    evict the least recently seen entries instead of growing the engine.
     """
     
     # Known malicious ASNs (simplified example)
@@ -359,11 +370,51 @@ class IPReputationEngine:
     # Known proxy/VPN providers (simplified)
     KNOWN_PROXY_ASNS: Set[int] = set()
     
-    def __init__(self):
-        self._reputation_cache: Dict[str, IPReputation] = {}
+    # Threat history windows (seconds)
+    WINDOW_24H = 86400
+    WINDOW_7D = 7 * 86400
+    WINDOW_30D = 30 * 86400
+    
+    # Threat history bucket width (seconds)
+    HISTORY_BUCKET_SECONDS = 3600
+    
+    def __init__(
+        self,
+        cache_size: int = 100000,
+        cache_ttl_seconds: float = 3600.0,
+        max_tracked_ips: int = 100000,
+        clock: Optional[Callable[[], float]] = None
+    ):
+        """
+        Initialize engine.
+        
+        Args:
+            cache_size: Maximum cached reputations
+            cache_ttl_seconds: Age after which a cached reputation is recomputed
+            max_tracked_ips: Maximum IPs with threat history retained
+            clock: Time source returning seconds (defaults to time.time)
+        """
+        if cache_size <= 0:
+            raise ValueError("cache_size must be positive")
+        
+        self._clock = clock or time.time
+        self.cache_size = cache_size
+        self.cache_ttl_seconds = cache_ttl_seconds
+        
+        # ip -> (computed_at, reputation), least recently used first
+        self._reputation_cache: "OrderedDict[str, Tuple[float, IPReputation]]" = OrderedDict()
         self._blocklist: Set[str] = set()
         self._allowlist: Set[str] = set()
-        self._threat_history: Dict[str, List[ThreatEvent]] = {}
+        self._threat_counts = SlidingWindowCounter(
+            (self.WINDOW_24H, self.WINDOW_7D, self.WINDOW_30D),
+            bucket_seconds=self.HISTORY_BUCKET_SECONDS,
+            max_keys=max_tracked_ips
+        )
+        self._lock = threading.Lock()
+        
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
     
     def get_reputation(self, ip_address: str) -> IPReputation:
         """
@@ -375,20 +426,51 @@ class IPReputationEngine:
         Returns:
             IPReputation with score and metadata
         """
-        # Check cache
-        if ip_address in self._reputation_cache:
-            cached = self._reputation_cache[ip_address]
-            # Refresh if older than 1 hour
-            if (datetime.now(timezone.utc) - cached.last_updated).seconds < 3600:
-                return cached
+        with self._lock:
+            return self._get_reputation(ip_address, self._clock())
+    
+    def get_reputations(self, ip_addresses: Iterable[str]) -> Dict[str, IPReputation]:
+        """
+        Get reputations for many IP addresses at once.
+        
+        Duplicates are scored once, and the whole batch is served under a
+        single lock acquisition and clock reading.
+        
+        Args:
+            ip_addresses: IP addresses to check
+            
+        Returns:
+            Dictionary mapping each IP address to its IPReputation
+        """
+        with self._lock:
+            now = self._clock()
+            results: Dict[str, IPReputation] = {}
+            for ip_address in ip_addresses:
+                if ip_address not in results:
+                    results[ip_address] = self._get_reputation(ip_address, now)
+            return results
+    
+    def _get_reputation(self, ip_address: str, now: float) -> IPReputation:
+        """Serve a reputation from cache or compute it (lock held)."""
+        cached = self._reputation_cache.get(ip_address)
+        if cached is not None:
+            computed_at, reputation = cached
+            if now - computed_at < self.cache_ttl_seconds:
+                self._reputation_cache.move_to_end(ip_address)
+                self._cache_hits += 1
+                return reputation
         
-        # Calculate reputation
-        reputation = self._calculate_reputation(ip_address)
-        self._reputation_cache[ip_address] = reputation
+        self._cache_misses += 1
+        reputation = self._calculate_reputation(ip_address, now)
+        self._reputation_cache[ip_address] = (now, reputation)
+        self._reputation_cache.move_to_end(ip_address)
+        if len(self._reputation_cache) > self.cache_size:
+            self._reputation_cache.popitem(last=False)
+            self._cache_evictions += 1
         
         return reputation
     
-    def _calculate_reputation(self, ip_address: str) -> IPReputation:
+    def _calculate_reputation(self, ip_address: str, now: float) -> IPReputation:
         """Calculate reputation score for IP."""
         score = 100.0
         
@@ -403,7 +485,8 @@ class IPReputationEngine:
                 ip_address=ip_address,
                 reputation_score=100.0,
                 risk_level=ThreatSeverity.INFO,
-                on_blocklist=False
+                on_blocklist=False,
+                last_updated=datetime.fromtimestamp(now, timezone.utc)
             )
         
         # Check threat history
@@ -411,16 +494,11 @@ class IPReputationEngine:
         threat_count_7d = 0
         threat_count_30d = 0
         
-        if ip_address in self._threat_history:
-            now = datetime.now(timezone.utc)
-            for event in self._threat_history[ip_address]:
-                age = (now - event.timestamp).days
-                if age < 1:
-                    threat_count_24h += 1
-                if age < 7:
-                    threat_count_7d += 1
-                if age < 30:
-                    threat_count_30d += 1
+        counts = self._threat_counts
+        if ip_address in counts:
+            threat_count_24h = counts.count(ip_address, self.WINDOW_24H, now)
+            threat_count_7d = counts.count(ip_address, self.WINDOW_7D, now)
+            threat_count_30d = counts.count(ip_address, self.WINDOW_30D, now)
         
         # Deduct for threats
         score -= threat_count_24h * 20
@@ -457,32 +535,72 @@ class IPReputationEngine:
             on_blocklist=on_blocklist,
             threat_count_24h=threat_count_24h,
             threat_count_7d=threat_count_7d,
-            threat_count_30d=threat_count_30d
+            threat_count_30d=threat_count_30d,
+            last_updated=datetime.fromtimestamp(now, timezone.utc)
         )
     
     def add_to_blocklist(self, ip_address: str, source: str = "manual"):
         """Add IP to blocklist."""
-        self._blocklist.add(ip_address)
-        # Invalidate cache
-        if ip_address in self._reputation_cache:
-            del self._reputation_cache[ip_address]
+        with self._lock:
+            self._blocklist.add(ip_address)
+            # Invalidate cache
+            self._reputation_cache.pop(ip_address, None)
     
     def add_to_allowlist(self, ip_address: str):
         """Add IP to allowlist."""
-        self._allowlist.add(ip_address)
-        # Invalidate cache
-        if ip_address in self._reputation_cache:
-            del self._reputation_cache[ip_address]
+        with self._lock:
+            self._allowlist.add(ip_address)
+            # Invalidate cache
+            self._reputation_cache.pop(ip_address, None)
     
     def record_threat(self, ip_address: str, event: ThreatEvent):
-        """Record a threat event for an IP."""
-        if ip_address not in self._threat_history:
-            self._threat_history[ip_address] = []
-        self._threat_history[ip_address].append(event)
+        """
+        Record a threat event for an IP.
+        
+        Events older than the 30 day window are ignored; events stamped
+        in the future count as occurring now.
+        """
+        with self._lock:
+            now = self._clock()
+            occurred = min(event.timestamp.timestamp(), now)
+            if now - occurred >= self.WINDOW_30D:
+                return
+            self._threat_counts.add(ip_address, occurred)
+            # Invalidate cache
+            self._reputation_cache.pop(ip_address, None)
+    
+    def expire(self) -> int:
+        """
+        Drop expired cache entries and IPs without recent threats.
         
-        # Invalidate cache
-        if ip_address in self._reputation_cache:
-            del self._reputation_cache[ip_address]
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            now = self._clock()
+            removed = self._threat_counts.expire(now)
+            stale = [
+                ip for ip, (computed_at, _) in self._reputation_cache.items()
+                if now - computed_at >= self.cache_ttl_seconds
+            ]
+            for ip in stale:
+                del self._reputation_cache[ip]
+            return removed + len(stale)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache and history statistics."""
+        with self._lock:
+            return {
+                "cached_reputations": len(self._reputation_cache),
+                "cache_size": self.cache_size,
+                "cache_hits": self._cache_hits,
+                "cache_misses": self._cache_misses,
+                "cache_evictions": self._cache_evictions,
+                "tracked_ips": len(self._threat_counts),
+                "history_evictions": self._threat_counts.evictions,
+                "blocklist_size": len(self._blocklist),
+                "allowlist_size": len(self._allowlist)
+            }
 
 
 # ============================================================================
@@ -534,6 +652,7 @@ class AttackPatternDetector:
             severity=ThreatSeverity.HIGH,
             time_window_seconds=300,
             threshold_count=5,
+            conditions={"scope": "ip_user", "failed_only": True},
             response_action=ResponseAction.TEMPORARY_BLOCK
         ),
         AttackPattern(
@@ -544,6 +663,7 @@ class AttackPatternDetector:
             severity=ThreatSeverity.CRITICAL,
             time_window_seconds=600,
             threshold_count=10,
+            conditions={"scope": "user", "failed_only": True},
             response_action=ResponseAction.ACCOUNT_LOCK
         ),
         AttackPattern(
@@ -554,6 +674,7 @@ class AttackPatternDetector:
             severity=ThreatSeverity.CRITICAL,
             time_window_seconds=300,
             threshold_count=20,
+            conditions={"scope": "ip", "distinct": "user"},
             response_action=ResponseAction.PERMANENT_BLOCK
         ),
         AttackPattern(
@@ -574,19 +695,86 @@ class AttackPatternDetector:
             severity=ThreatSeverity.CRITICAL,
             time_window_seconds=60,
             threshold_count=2,
+            conditions={"scope": "dna_key"},
             response_action=ResponseAction.SESSION_TERMINATE
         ),
     ]
     
-    def __init__(self):
-        self._patterns = {p.pattern_id: p for p in self.BUILT_IN_PATTERNS}
-        self._event_buffer: Dict[str, List[Dict[str, Any]]] = {}
-        self._detected_attacks: List[ThreatEvent] = []
+    # Counter scopes a pattern can aggregate over (AttackPattern.conditions["scope"])
+    SCOPES = ("ip", "ip_user", "user", "dna_key")
+    
+    # Bucket width of the sliding window counters
+    BUCKET_SECONDS = 1.0
+    
+    # Detected attacks retained for inspection
+    MAX_DETECTED_ATTACKS = 10000
+    
+    def __init__(self, clock: Optional[Callable[[], float]] = None):
+        """
+        Initialize detector.
+        
+        Args:
+            clock: Time source returning seconds (defaults to time.time)
+        """
+        self._clock = clock or time.time
+        self._patterns: Dict[str, AttackPattern] = {}
+        
+        # (scope, failed_only) -> counter; distinct-item scope -> sketches
+        self._counters: Dict[Tuple[str, bool], SlidingWindowCounter] = {}
+        self._distinct: Dict[Tuple[str, str], SketchIndex] = {}
+        
+        self._detected_attacks: deque = deque(maxlen=self.MAX_DETECTED_ATTACKS)
+        
+        for pattern in self.BUILT_IN_PATTERNS:
+            self.add_pattern(pattern)
     
     def add_pattern(self, pattern: AttackPattern):
-        """Add a custom attack pattern."""
+        """
+        Add a custom attack pattern.
+        
+        Supported conditions:
+            scope: "ip", "ip_user" (default), "user" or "dna_key"
+            failed_only: Count only failed events
+            distinct: Count distinct "user", "ip" or "dna_key" values
+                      within the scope instead of events
+        """
+        scope = pattern.conditions.get("scope", "ip_user")
+        if scope not in self.SCOPES:
+            raise ValueError(f"Unknown pattern scope: {scope}")
+        
+        window = pattern.time_window_seconds
+        distinct = pattern.conditions.get("distinct")
+        if distinct:
+            if distinct not in self.SCOPES or distinct == "ip_user":
+                raise ValueError(f"Unknown distinct field: {distinct}")
+            index = self._distinct.get((scope, distinct))
+            if index is None:
+                self._distinct[(scope, distinct)] = SketchIndex(window)
+            else:
+                index.set_max_window(window)
+        else:
+            counter_key = (scope, bool(pattern.conditions.get("failed_only", False)))
+            counter = self._counters.get(counter_key)
+            if counter is None:
+                counter = SlidingWindowCounter(bucket_seconds=self.BUCKET_SECONDS)
+                self._counters[counter_key] = counter
+            counter.add_window(window)
+        
         self._patterns[pattern.pattern_id] = pattern
     
+    @staticmethod
+    def _scope_key(
+        scope: str, source_ip: str, user_id: Optional[str], dna_key_id: Optional[str]
+    ) -> Optional[Hashable]:
+        """Get the counter key for an event within a scope (None to skip)."""
+        if scope == "ip":
+            return source_ip
+        if scope == "ip_user":
+            return (source_ip, user_id or "any")
+        if scope == "user":
+            return user_id
+        return dna_key_id
+    
     def analyze_event(
         self,
         event_type: str,
@@ -599,6 +787,9 @@ class AttackPatternDetector:
         """
         Analyze an event for attack patterns.
         
+        Runs in constant time per event: each event updates one counter
+        per scope and each pattern reads a running window total.
+        
         Args:
             event_type: Type of event (login_attempt, dna_verify, etc.)
             source_ip: Source IP address
@@ -610,36 +801,34 @@ class AttackPatternDetector:
         Returns:
             List of detected threat events
         """
-        now = datetime.now(timezone.utc)
-        
-        # Create event record
-        event_record = {
-            "timestamp": now,
-            "event_type": event_type,
-            "source_ip": source_ip,
-            "user_id": user_id,
-            "dna_key_id": dna_key_id,
-            "success": success,
-            "metadata": metadata or {}
-        }
+        now = self._clock()
+        fields = {"ip": source_ip, "user": user_id, "dna_key": dna_key_id}
         
-        # Add to buffer
-        buffer_key = f"{source_ip}:{user_id or 'any'}"
-        if buffer_key not in self._event_buffer:
-            self._event_buffer[buffer_key] = []
-        self._event_buffer[buffer_key].append(event_record)
+        # Record event in every counter and sketch it applies to
+        for (scope, failed_only), counter in self._counters.items():
+            if failed_only and success:
+                continue
+            key = self._scope_key(scope, source_ip, user_id, dna_key_id)
+            if key is not None:
+                counter.add(key, now)
+            counter.expire(now)
         
-        # Clean old events
-        self._clean_buffer()
+        for (scope, distinct), index in self._distinct.items():
+            key = self._scope_key(scope, source_ip, user_id, dna_key_id)
+            item = fields[distinct]
+            if key is not None and item:
+                index.add(key, item, now)
+            index.expire(now)
         
         # Check patterns
         detected_threats = []
+        timestamp = datetime.now(timezone.utc)
         
         for pattern in self._patterns.values():
-            if self._check_pattern(pattern, event_record):
+            if self._check_pattern(pattern, source_ip, user_id, dna_key_id, now):
                 threat_event = ThreatEvent(
                     event_id=f"threat_{secrets.token_hex(8)}",
-                    timestamp=now,
+                    timestamp=timestamp,
                     threat_category=pattern.category,
                     severity=pattern.severity,
                     confidence=ThreatConfidence.HIGH_CONFIDENCE,
@@ -653,68 +842,66 @@ class AttackPatternDetector:
         
         return detected_threats
     
-    def _check_pattern(self, pattern: AttackPattern, current_event: Dict) -> bool:
-        """Check if a pattern matches current events."""
-        now = datetime.now(timezone.utc)
-        window_start = now - timedelta(seconds=pattern.time_window_seconds)
-        
-        source_ip = current_event["source_ip"]
-        user_id = current_event.get("user_id")
-        
-        # Count matching events
-        count = 0
-        
-        if pattern.pattern_id == "BRUTE_FORCE_SINGLE_USER":
-            # Same IP, same user, failed attempts
-            buffer_key = f"{source_ip}:{user_id}"
-            if buffer_key in self._event_buffer:
-                for event in self._event_buffer[buffer_key]:
-                    if event["timestamp"] >= window_start and not event["success"]:
-                        count += 1
-        
-        elif pattern.pattern_id == "CREDENTIAL_STUFFING":
-            # Same IP, different users
-            users_attempted = set()
-            for key, events in self._event_buffer.items():
-                if key.startswith(f"{source_ip}:"):
-                    for event in events:
-                        if event["timestamp"] >= window_start:
-                            if event.get("user_id"):
-                                users_attempted.add(event["user_id"])
-            count = len(users_attempted)
-        
-        elif pattern.pattern_id == "DNA_REPLAY_ATTACK":
-            # Same DNA key used multiple times
-            dna_key = current_event.get("dna_key_id")
-            if dna_key:
-                for key, events in self._event_buffer.items():
-                    for event in events:
-                        if event["timestamp"] >= window_start:
-                            if event.get("dna_key_id") == dna_key:
-                                count += 1
+    def _check_pattern(
+        self,
+        pattern: AttackPattern,
+        source_ip: str,
+        user_id: Optional[str],
+        dna_key_id: Optional[str],
+        now: float
+    ) -> bool:
+        """Check if a pattern's window count has reached its threshold."""
+        return self.count_for_pattern(pattern, source_ip, user_id, dna_key_id, now) >= pattern.threshold_count
+    
+    def count_for_pattern(
+        self,
+        pattern: AttackPattern,
+        source_ip: str,
+        user_id: Optional[str] = None,
+        dna_key_id: Optional[str] = None,
+        now: Optional[float] = None
+    ) -> int:
+        """
+        Get the current window count a pattern is compared against.
         
-        else:
-            # Generic threshold check
-            buffer_key = f"{source_ip}:{user_id or 'any'}"
-            if buffer_key in self._event_buffer:
-                for event in self._event_buffer[buffer_key]:
-                    if event["timestamp"] >= window_start:
-                        count += 1
-        
-        return count >= pattern.threshold_count
-    
-    def _clean_buffer(self):
-        """Remove old events from buffer."""
-        max_age = timedelta(minutes=30)
-        now = datetime.now(timezone.utc)
+        Args:
+            pattern: Attack pattern
+            source_ip: Source IP address
+            user_id: Optional user identifier
+            dna_key_id: Optional DNA key identifier
+            now: Timestamp (defaults to the detector clock)
+            
+        Returns:
+            Event count, or distinct-item estimate for distinct patterns
+        """
+        now = self._clock() if now is None else now
+        scope = pattern.conditions.get("scope", "ip_user")
+        key = self._scope_key(scope, source_ip, user_id, dna_key_id)
+        if key is None:
+            return 0
         
-        for key in list(self._event_buffer.keys()):
-            self._event_buffer[key] = [
-                e for e in self._event_buffer[key]
-                if now - e["timestamp"] < max_age
-            ]
-            if not self._event_buffer[key]:
-                del self._event_buffer[key]
+        window = pattern.time_window_seconds
+        distinct = pattern.conditions.get("distinct")
+        if distinct:
+            return self._distinct[(scope, distinct)].estimate(key, window, now)
+        
+        failed_only = bool(pattern.conditions.get("failed_only", False))
+        return self._counters[(scope, failed_only)].count(key, window, now)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get number of tracked keys per counter."""
+        return {
+            "patterns": len(self._patterns),
+            "counters": {
+                f"{scope}{':failed' if failed_only else ''}": len(counter)
+                for (scope, failed_only), counter in self._counters.items()
+            },
+            "distinct_sketches": {
+                f"{scope}:{distinct}": len(index)
+                for (scope, distinct), index in self._distinct.items()
+            },
+            "detected_attacks": len(self._detected_attacks),
+        }
 
 
 # ============================================================================
@@ -734,12 +921,29 @@ class ThreatIntelligenceService:
     - Threat correlation
     """
     
-    def __init__(self):
+    # Threat severity -> audit severity for events fed to the audit log
+    AUDIT_SEVERITY: Dict[ThreatSeverity, AuditSeverity] = {
+        ThreatSeverity.INFO: AuditSeverity.INFO,
+        ThreatSeverity.LOW: AuditSeverity.INFO,
+        ThreatSeverity.MEDIUM: AuditSeverity.WARNING,
+        ThreatSeverity.HIGH: AuditSeverity.ERROR,
+        ThreatSeverity.CRITICAL: AuditSeverity.CRITICAL,
+    }
+    
+    def __init__(self, audit_logger: Optional[AuditLogger] = None):
+        """
+        Initialize service.
+        
+        Args:
+            audit_logger: Audit logger that detected threats are submitted to
+        """
         self.ip_reputation = IPReputationEngine()
         self.pattern_detector = AttackPatternDetector()
+        self._audit_logger = audit_logger
         
         # Storage
-        self._indicators: Dict[str, ThreatIndicator] = {}
+        self._indicator_index = IndicatorIndex()
+        self._indicator_lock = threading.Lock()
         self._threat_actors: Dict[str, ThreatActor] = {}
         self._events: List[ThreatEvent] = []
         
@@ -833,6 +1037,24 @@ class ThreatIntelligenceService:
         for threat in threats:
             self.ip_reputation.record_threat(source_ip, threat)
         
+        if self._audit_logger is not None:
+            for threat in threats:
+                self._audit_logger.submit(
+                    AuditEventType.THREAT_DETECTED,
+                    actor_id=user_id,
+                    actor_ip=source_ip,
+                    target_type="dna_key" if dna_key_id else None,
+                    target_id=dna_key_id,
+                    action="threat_detection",
+                    message=f"Threat detected from {source_ip}: {threat.description}",
+                    severity=self.AUDIT_SEVERITY.get(threat.severity, AuditSeverity.WARNING),
+                    details={
+                        "threat_id": threat.event_id,
+                        "threat_category": threat.threat_category.value,
+                        "response_action": threat.response_action.value
+                    }
+                )
+        
         # Determine if should allow
         should_allow = action not in [
             ResponseAction.PERMANENT_BLOCK,
@@ -844,12 +1066,44 @@ class ThreatIntelligenceService:
     
     def add_indicator(self, indicator: ThreatIndicator):
         """Add a threat indicator."""
-        self._indicators[indicator.indicator_id] = indicator
+        with self._indicator_lock:
+            self._indicator_index.add(indicator)
     
     def remove_indicator(self, indicator_id: str):
         """Remove a threat indicator."""
-        if indicator_id in self._indicators:
-            del self._indicators[indicator_id]
+        with self._indicator_lock:
+            self._indicator_index.remove(indicator_id)
+    
+    def load_indicators(self, indicators: List[ThreatIndicator], replace: bool = True) -> int:
+        """
+        Bulk load a threat feed.
+        
+        The new index is built without holding the lock and swapped in
+        as a whole, so concurrent lookups see either the old or the new
+        feed, never a partially loaded one.
+        
+        Args:
+            indicators: Indicators to load
+            replace: Replace the current indicators (otherwise merge)
+            
+        Returns:
+            Number of indicators in the index after loading
+        """
+        now = datetime.now(timezone.utc)
+        fresh = [i for i in indicators if not (i.expires_at is not None and i.expires_at < now)]
+        
+        if replace:
+            index = IndicatorIndex(fresh)
+            with self._indicator_lock:
+                self._indicator_index = index
+        else:
+            with self._indicator_lock:
+                index = IndicatorIndex(self._indicator_index.values())
+                for indicator in fresh:
+                    index.add(indicator)
+                self._indicator_index = index
+        
+        return len(index)
     
     def _check_indicators(
         self,
@@ -857,21 +1111,9 @@ class ThreatIntelligenceService:
         user_id: Optional[str],
         dna_key_id: Optional[str]
     ) -> List[ThreatIndicator]:
-        """Check for matching indicators."""
-        matched = []
-        
-        for indicator in self._indicators.values():
-            if not indicator.is_active or indicator.is_expired():
-                continue
-            
-            if indicator.indicator_type == "ip" and indicator.value == ip_address:
-                matched.append(indicator)
-            elif indicator.indicator_type == "user" and indicator.value == user_id:
-                matched.append(indicator)
-            elif indicator.indicator_type == "dna_key" and indicator.value == dna_key_id:
-                matched.append(indicator)
-        
-        return matched
+        """Check for matching indicators (exact values and CIDR ranges)."""
+        with self._indicator_lock:
+            return self._indicator_index.match(ip_address, user_id, dna_key_id)
     
     def get_threat_summary(self) -> Dict[str, Any]:
         """Get summary of current threat landscape."""
@@ -894,7 +1136,7 @@ class ThreatIntelligenceService:
             "total_events_24h": len(recent_events),
             "by_category": by_category,
             "by_severity": by_severity,
-            "active_indicators": len([i for i in self._indicators.values() if i.is_active]),
+            "active_indicators": len([i for i in self._indicator_index.values() if i.is_active]),
             "blocked_ips": len(self.ip_reputation._blocklist)
         }
     
@@ -59,6 +59,8 @@ Tests the enterprise-grade audit logging system including:
 - Integrity verification
 """
 
+import random
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 
@@ -70,7 +72,9 @@ from server.security.audit_logging import (
     AuditEventType,
     AuditLogger,
     AuditLogStorage,
+    AuditPipeline,
     AuditSeverity,
+    BackpressureMode,
 )
 
 
@@ -347,6 +351,117 @@ class TestAuditLogStorage:
         assert "by_outcome" in stats
 
 
+def make_event(i: int, timestamp: datetime, actor_id: str = None, **kwargs) -> AuditEvent:
+    """Build a minimal audit event for storage tests."""
+    kwargs.setdefault("event_type", AuditEventType.AUTH_SUCCESS)
+    kwargs.setdefault("category", AuditEventCategory.AUTHENTICATION)
+    kwargs.setdefault("severity", AuditSeverity.INFO)
+    return AuditEvent(
+        event_id=f"evt_{i}",
+        timestamp=timestamp,
+        actor_id=actor_id,
+        **kwargs
+    )
+
+
+class TestSegmentedStorage:
+    """Test segmented, indexed audit storage."""
+    
+    def test_capacity_evicts_oldest(self):
+        """Test the event cap is exact and old segments are released."""
+        storage = AuditLogStorage(max_memory_events=10, segment_size=4)
+        now = datetime.now(timezone.utc)
+        for i in range(25):
+            storage.store(make_event(i, now + timedelta(seconds=i), actor_id=f"user_{i % 3}"))
+        
+        stats = storage.get_storage_stats()
+        assert len(storage) == 10
+        assert stats["segments"] <= 4
+        assert storage.count() == 10
+        
+        ids = [e.event_id for e in storage.query(limit=100)]
+        assert ids == [f"evt_{i}" for i in range(24, 14, -1)]
+        assert {e.event_id for e in storage.query(actor_id="user_0")} == {"evt_15", "evt_18", "evt_21", "evt_24"}
+    
+    def test_pagination_across_segments(self):
+        """Test offset/limit pages are newest first across segments."""
+        storage = AuditLogStorage(segment_size=3)
+        now = datetime.now(timezone.utc)
+        for i in range(10):
+            storage.store(make_event(i, now + timedelta(seconds=i), actor_id="user_1"))
+        
+        page = storage.query(actor_id="user_1", limit=3, offset=2)
+        
+        assert [e.event_id for e in page] == ["evt_7", "evt_6", "evt_5"]
+    
+    def test_matches_full_scan(self):
+        """Test indexed queries agree with a brute-force filter."""
+        rng = random.Random(3)
+        storage = AuditLogStorage(max_memory_events=300, segment_size=16)
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        types = [AuditEventType.AUTH_SUCCESS, AuditEventType.AUTH_FAILURE, AuditEventType.KEY_CREATED]
+        events = []
+        for i in range(500):
+            # Mostly ordered with occasional late arrivals
+            offset = i * 10 - (rng.randrange(200) if rng.random() < 0.1 else 0)
+            event = make_event(
+                i,
+                base + timedelta(seconds=offset),
+                actor_id=f"user_{rng.randrange(5)}",
+                target_id=f"key_{rng.randrange(7)}",
+                event_type=rng.choice(types)
+            )
+            storage.store(event)
+            events.append(event)
+        retained = events[-300:]
+        
+        for _ in range(50):
+            actor = f"user_{rng.randrange(6)}" if rng.random() < 0.5 else None
+            event_type = rng.choice(types) if rng.random() < 0.5 else None
+            start = base + timedelta(seconds=rng.randrange(5000))
+            end = start + timedelta(seconds=rng.randrange(2000))
+            expected = [
+                e for e in retained
+                if (not actor or e.actor_id == actor)
+                and (not event_type or e.event_type == event_type)
+                and start <= e.timestamp <= end
+            ]
+            expected.sort(key=lambda e: e.timestamp, reverse=True)
+            
+            results = storage.query(
+                actor_id=actor, event_type=event_type,
+                start_time=start, end_time=end, limit=20, offset=5
+            )
+            
+            assert [e.event_id for e in results] == [e.event_id for e in expected[5:25]]
+            assert storage.count(event_type=event_type, start_time=start, end_time=end) == len([
+                e for e in retained
+                if (not event_type or e.event_type == event_type) and start <= e.timestamp <= end
+            ])
+    
+    def test_unknown_key_short_circuits(self):
+        """Test filters on unindexed values return nothing."""
+        storage = AuditLogStorage()
+        storage.store(make_event(1, datetime.now(timezone.utc), actor_id="user_1"))
+        
+        assert storage.query(actor_id="nobody") == []
+        assert storage.query(target_id="nothing") == []
+    
+    def test_prune_before(self):
+        """Test time-based pruning drops old events and segments."""
+        storage = AuditLogStorage(segment_size=4)
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for i in range(10):
+            storage.store(make_event(i, base + timedelta(hours=i)))
+        
+        removed = storage.prune_before(base + timedelta(hours=6))
+        
+        assert removed == 6
+        assert len(storage) == 4
+        assert [e.event_id for e in storage.query()] == ["evt_9", "evt_8", "evt_7", "evt_6"]
+        assert storage.get_storage_stats()["segments"] == 2
+
+
 class TestAuditLogger:
     """Test audit logger."""
     
@@ -356,6 +471,16 @@ class TestAuditLogger:
         
         assert logger is not None
     
+    def test_uses_empty_storage(self):
+        """Test that a caller-supplied storage is used even while empty."""
+        storage = AuditLogStorage(max_memory_events=5)
+        logger = AuditLogger(storage=storage)
+        
+        logger.log(event_type=AuditEventType.AUTH_SUCCESS, actor_id="user_123")
+        
+        assert logger._storage is storage
+        assert len(storage) == 1
+    
     def test_log_event(self):
         """Test logging an event."""
         logger = AuditLogger()
@@ -519,3 +644,263 @@ class TestAuditLogger:
         logger.log_threat_detected("10.0.0.1", "brute_force", "critical")
         
         assert len(alerts) == 1
+
+
+class TestAuditRollup:
+    """Test minute/hour rollups behind counts and statistics."""
+    
+    def _fill(self, storage, rng, count=600):
+        base = datetime(2024, 3, 1, 10, 17, 23, tzinfo=timezone.utc)
+        types = [
+            (AuditEventType.AUTH_SUCCESS, AuditEventCategory.AUTHENTICATION, AuditSeverity.INFO),
+            (AuditEventType.AUTH_FAILURE, AuditEventCategory.AUTHENTICATION, AuditSeverity.WARNING),
+            (AuditEventType.THREAT_DETECTED, AuditEventCategory.SECURITY, AuditSeverity.CRITICAL),
+        ]
+        events = []
+        for i in range(count):
+            event_type, category, severity = rng.choice(types)
+            event = make_event(
+                i,
+                base + timedelta(seconds=rng.uniform(0, 6 * 3600)),
+                event_type=event_type,
+                category=category,
+                severity=severity,
+                outcome=rng.choice(["success", "failure"])
+            )
+            storage.store(event)
+            events.append(event)
+        return base, events
+    
+    def test_summarize_matches_scan(self):
+        """Test rollup totals equal brute-force counts for arbitrary ranges."""
+        rng = random.Random(11)
+        storage = AuditLogStorage()
+        base, events = self._fill(storage, rng)
+        
+        for _ in range(100):
+            start = base + timedelta(seconds=rng.uniform(-600, 6 * 3600))
+            end = start + timedelta(seconds=rng.choice([5, 90, 3000, 7300, 30000]) * rng.random())
+            expected = {}
+            for e in events:
+                if start <= e.timestamp <= end:
+                    key = (e.category.value, e.event_type.value, e.severity.value, e.outcome)
+                    expected[key] = expected.get(key, 0) + 1
+            
+            assert storage.summarize(start, end) == expected
+            assert storage.count(AuditEventType.AUTH_FAILURE, start, end) == sum(
+                1 for e in events
+                if e.event_type == AuditEventType.AUTH_FAILURE and start <= e.timestamp <= end
+            )
+    
+    def test_inclusive_boundaries(self):
+        """Test events exactly on the range bounds are counted."""
+        storage = AuditLogStorage()
+        edge = datetime(2024, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+        storage.store(make_event(1, edge))
+        storage.store(make_event(2, edge + timedelta(hours=2)))
+        
+        assert storage.count(start_time=edge, end_time=edge + timedelta(hours=2)) == 2
+        assert storage.count(start_time=edge, end_time=edge) == 1
+        assert storage.count(start_time=edge + timedelta(microseconds=1)) == 1
+    
+    def test_eviction_updates_rollups(self):
+        """Test evicted and pruned events leave the rollups."""
+        storage = AuditLogStorage(max_memory_events=50, segment_size=8)
+        base = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        for i in range(200):
+            storage.store(make_event(i, base + timedelta(minutes=i)))
+        
+        assert storage.count(start_time=base) == 50
+        assert sum(storage.summarize().values()) == 50
+        
+        storage.prune_before(base + timedelta(minutes=180))
+        
+        assert sum(storage.summarize().values()) == 20
+        assert storage.get_storage_stats()["minute_buckets"] == 20
+    
+    def test_statistics_from_rollups(self):
+        """Test get_statistics reports rollup totals."""
+        storage = AuditLogStorage()
+        now = datetime.now(timezone.utc)
+        storage.store(make_event(1, now - timedelta(hours=30)))
+        storage.store(make_event(2, now - timedelta(hours=2), outcome="failure"))
+        storage.store(make_event(3, now - timedelta(minutes=1), event_type=AuditEventType.AUTH_FAILURE))
+        
+        stats = storage.get_statistics(hours=24)
+        
+        assert stats["total_events"] == 2
+        assert stats["by_type"] == {"auth_success": 1, "auth_failure": 1}
+        assert stats["by_outcome"] == {"failure": 1, "success": 1}
+    
+    def test_compliance_report_matches_events(self):
+        """Test report counts from rollups agree with the events."""
+        rng = random.Random(5)
+        logger = AuditLogger()
+        base, events = self._fill(logger._storage, rng, count=300)
+        start = base + timedelta(minutes=37, seconds=11)
+        end = base + timedelta(hours=4, seconds=7)
+        in_range = [e for e in events if start <= e.timestamp <= end]
+        
+        report = logger.generate_compliance_report(start, end)
+        
+        assert report["total_events"] == len(in_range)
+        assert report["summary"]["security_events"] == sum(
+            1 for e in in_range if e.category == AuditEventCategory.SECURITY
+        )
+        assert report["auth_statistics"]["failed"] == sum(
+            1 for e in in_range if e.event_type == AuditEventType.AUTH_FAILURE
+        )
+        assert len(report["security_incidents"]) == sum(
+            1 for e in in_range if e.severity == AuditSeverity.CRITICAL
+        )
+
+
+class SlowStorage(AuditLogStorage):
+    """In-memory storage whose writes wait on a gate."""
+    
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+    
+    def store_many(self, events):
+        self.gate.wait(5)
+        return super().store_many(events)
+
+
+class TestAuditPipeline:
+    """Test the asynchronous audit pipeline."""
+    
+    def test_events_stored_in_batches(self):
+        """Test submitted events are written by the background writer."""
+        storage = AuditLogStorage()
+        pipeline = AuditPipeline(storage, batch_size=10, flush_interval=0.01)
+        try:
+            for i in range(25):
+                pipeline.submit(make_event(i, datetime.now(timezone.utc)))
+            
+            assert pipeline.flush(timeout=5)
+            metrics = pipeline.get_metrics()
+        finally:
+            pipeline.close()
+        
+        assert len(storage) == 25
+        assert metrics["written"] == 25
+        assert metrics["queue_depth"] == 0
+        assert metrics["batches"] >= 3
+    
+    def test_drop_backpressure(self):
+        """Test a full queue drops events in DROP mode."""
+        storage = SlowStorage()
+        pipeline = AuditPipeline(storage, max_queue_size=5, batch_size=1, flush_interval=0.01)
+        try:
+            results = [pipeline.submit(make_event(i, datetime.now(timezone.utc))) for i in range(20)]
+            metrics = pipeline.get_metrics()
+            storage.gate.set()
+            pipeline.flush(timeout=5)
+        finally:
+            pipeline.close()
+        
+        assert results.count(False) == metrics["dropped"] > 0
+        assert metrics["queue_depth"] <= 5
+        assert len(storage) == results.count(True)
+    
+    def test_block_backpressure_times_out(self):
+        """Test BLOCK mode waits for space, then drops after the timeout."""
+        storage = SlowStorage()
+        pipeline = AuditPipeline(
+            storage,
+            max_queue_size=1,
+            batch_size=1,
+            flush_interval=0.01,
+            backpressure=BackpressureMode.BLOCK,
+            block_timeout=0.05
+        )
+        try:
+            accepted = [pipeline.submit(make_event(i, datetime.now(timezone.utc))) for i in range(3)]
+            storage.gate.set()
+            assert pipeline.submit(make_event(3, datetime.now(timezone.utc))) is True
+            pipeline.flush(timeout=5)
+        finally:
+            pipeline.close()
+        
+        assert accepted[0] is True
+        assert False in accepted
+    
+    def test_spill_backpressure_replays(self, tmp_path):
+        """Test SPILL mode writes overflow to disk and replays it later."""
+        storage = SlowStorage()
+        pipeline = AuditPipeline(
+            storage,
+            max_queue_size=2,
+            batch_size=1,
+            flush_interval=0.01,
+            backpressure=BackpressureMode.SPILL,
+            spill_path=str(tmp_path / "audit.spill")
+        )
+        try:
+            results = [pipeline.submit(make_event(i, datetime.now(timezone.utc))) for i in range(20)]
+            spilled = pipeline.get_metrics()["spilled"]
+            storage.gate.set()
+            assert pipeline.flush(timeout=5)
+            metrics = pipeline.get_metrics()
+        finally:
+            pipeline.close()
+        
+        assert all(results)
+        assert spilled > 0
+        assert metrics["replayed"] == spilled
+        assert len(storage) == 20
+        assert all(e.verify_integrity() for e in storage.query(limit=100))
+    
+    def test_spill_requires_path(self):
+        """Test SPILL mode needs a spill file."""
+        with pytest.raises(ValueError):
+            AuditPipeline(AuditLogStorage(), backpressure=BackpressureMode.SPILL)
+    
+    def test_logger_pipeline(self):
+        """Test the logger stores and alerts through its pipeline."""
+        logger = AuditLogger()
+        alerts = []
+        logger.register_alert_handler(alerts.append)
+        logger.enable_pipeline(flush_interval=0.01)
+        try:
+            event = logger.log_threat_detected("10.0.0.1", "brute_force", "critical")
+            event_id = logger.submit(AuditEventType.AUTH_SUCCESS, actor_id="user_1")
+            assert logger.flush(timeout=5)
+        finally:
+            logger.close()
+        
+        ids = {e.event_id for e in logger.query(limit=10)}
+        assert ids == {event.event_id, event_id}
+        assert [a.event_id for a in alerts] == [event.event_id]
+    
+    def test_submit_without_pipeline(self):
+        """Test submit() logs inline when no pipeline is enabled."""
+        logger = AuditLogger()
+        
+        event_id = logger.submit(AuditEventType.KEY_CREATED, target_id="key-1")
+        
+        results = logger.query(target_id="key-1")
+        assert [e.event_id for e in results] == [event_id]
+        assert results[0].category == AuditEventCategory.KEY_MANAGEMENT
+    
+    def test_slow_alert_handler_does_not_block_writes(self):
+        """Test alert handlers run off the writer thread."""
+        logger = AuditLogger()
+        release = threading.Event()
+        logger.register_alert_handler(lambda event: release.wait(5))
+        pipeline = logger.enable_pipeline(flush_interval=0.01)
+        try:
+            logger.log_threat_detected("10.0.0.1", "brute_force", "critical")
+            for _ in range(5):
+                logger.log_auth_success("user_1", "10.0.0.2", "sess_1")
+            
+            deadline = time.time() + 5
+            while pipeline.get_metrics()["written"] < 6 and time.time() < deadline:
+                time.sleep(0.01)
+            
+            assert pipeline.get_metrics()["written"] == 6
+            assert pipeline.get_metrics()["alerts_dispatched"] == 0
+            release.set()
+        finally:
+            logger.close()
@@ -0,0 +1,348 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+Tests for the persistent audit log store.
+
+Tests segmented append-only storage including:
+- Batched writes and reopening
+- Manifest-guided queries and counts
+- Segment hash chain verification
+- Crash recovery of the active segment
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from server.security.audit_logging import (
+    AuditEvent,
+    AuditEventCategory,
+    AuditEventType,
+    AuditLogger,
+    AuditSeverity,
+)
+from server.security.audit_store import GENESIS_HASH, FileAuditLogStorage
+
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_event(i: int, actor_id: str = "user_1", **kwargs) -> AuditEvent:
+    """Build an audit event ``i`` seconds after BASE_TIME."""
+    kwargs.setdefault("event_type", AuditEventType.AUTH_SUCCESS)
+    kwargs.setdefault("category", AuditEventCategory.AUTHENTICATION)
+    kwargs.setdefault("severity", AuditSeverity.INFO)
+    kwargs.setdefault("timestamp", BASE_TIME + timedelta(seconds=i))
+    return AuditEvent(event_id=f"evt_{i}", actor_id=actor_id, **kwargs)
+
+
+@pytest.fixture
+def open_storage(tmp_path):
+    """Open storages in a temporary directory, closing them afterwards."""
+    opened = []
+    
+    def _open(**kwargs):
+        kwargs.setdefault("fsync", False)
+        storage = FileAuditLogStorage(str(tmp_path / "audit"), **kwargs)
+        opened.append(storage)
+        return storage
+    
+    yield _open
+    for storage in opened:
+        storage.close()
+
+
+class TestFileAuditLogStorage:
+    """Test persistent audit storage."""
+    
+    def test_store_and_query(self, open_storage):
+        """Test stored events can be queried newest first."""
+        storage = open_storage()
+        for i in range(20):
+            storage.store(make_event(i, actor_id=f"user_{i % 2}"))
+        
+        results = storage.query(actor_id="user_1", limit=3)
+        
+        assert [e.event_id for e in results] == ["evt_19", "evt_17", "evt_15"]
+        assert all(e.verify_integrity() for e in results)
+    
+    def test_events_survive_reopen(self, open_storage):
+        """Test events and manifests persist across restarts."""
+        storage = open_storage(segment_max_bytes=2048)
+        for i in range(50):
+            storage.store(make_event(i))
+        storage.close()
+        
+        reopened = open_storage(segment_max_bytes=2048)
+        reopened.store(make_event(50))
+        
+        assert len(reopened) == 51
+        assert reopened.count() == 51
+        assert reopened.query(limit=1)[0].event_id == "evt_50"
+        assert reopened.get_storage_stats()["segments"] > 1
+    
+    def test_time_range_and_filters(self, open_storage):
+        """Test time ranges and type filters across segments."""
+        storage = open_storage(segment_max_bytes=4096, index_interval=4)
+        for i in range(200):
+            event_type = AuditEventType.AUTH_FAILURE if i % 5 == 0 else AuditEventType.AUTH_SUCCESS
+            storage.store(make_event(i, event_type=event_type))
+        
+        start = BASE_TIME + timedelta(seconds=50)
+        end = BASE_TIME + timedelta(seconds=149)
+        results = storage.query(
+            event_type=AuditEventType.AUTH_FAILURE,
+            start_time=start,
+            end_time=end,
+            limit=100
+        )
+        
+        assert [e.event_id for e in results] == [f"evt_{i}" for i in range(145, 49, -5)]
+        assert storage.count(start_time=start, end_time=end) == 100
+        assert storage.count(event_type=AuditEventType.AUTH_FAILURE) == 40
+    
+    def test_actor_manifest_skips_segments(self, open_storage):
+        """Test actor filters only return that actor across segments."""
+        storage = open_storage(segment_max_bytes=2048)
+        for i in range(30):
+            storage.store(make_event(i, actor_id="early"))
+        storage.flush()
+        for i in range(30, 60):
+            storage.store(make_event(i, actor_id="late"))
+        
+        results = storage.query(actor_id="early", limit=100)
+        
+        assert len(results) == 30
+        assert {e.actor_id for e in results} == {"early"}
+    
+    def test_statistics_and_compliance_report(self, open_storage):
+        """Test statistics and compliance reporting from disk."""
+        storage = open_storage(segment_max_bytes=2048)
+        logger = AuditLogger(storage=storage)
+        for _ in range(10):
+            logger.log_auth_success("user_1", "10.0.0.1", "sess_1")
+        logger.log_auth_failure("user_2", "10.0.0.2", "bad key")
+        logger.log_threat_detected("10.0.0.3", "brute_force", "high")
+        
+        stats = logger.get_statistics(hours=1)
+        report = logger.generate_compliance_report(
+            start_time=datetime.now(timezone.utc) - timedelta(hours=1),
+            end_time=datetime.now(timezone.utc) + timedelta(minutes=1)
+        )
+        
+        assert stats["total_events"] == 12
+        assert stats["by_type"]["auth_success"] == 10
+        assert report["total_events"] == 12
+        assert report["auth_statistics"]["failed"] == 1
+        assert len(report["security_incidents"]) == 1
+        
+        # The events landed in the file store, not an in-memory fallback
+        assert logger._storage is storage
+        assert len(storage) == 12
+        storage.close()
+        reopened = open_storage()
+        assert len(reopened) == 12
+        assert AuditLogger(storage=reopened).get_statistics(hours=1)["total_events"] == 12
+
+
+class TestFileAuditSummaries:
+    """Test manifest-based summaries of the persistent store."""
+    
+    def test_summarize_matches_events(self, open_storage):
+        """Test summaries over ranges spanning sealed and active segments."""
+        storage = open_storage(segment_max_bytes=4096)
+        events = []
+        for i in range(150):
+            event_type = AuditEventType.AUTH_FAILURE if i % 3 else AuditEventType.AUTH_SUCCESS
+            event = make_event(i, event_type=event_type, outcome="failure" if i % 3 else "success")
+            storage.store(event)
+            events.append(event)
+        
+        start = BASE_TIME + timedelta(seconds=20)
+        end = BASE_TIME + timedelta(seconds=130)
+        expected = {}
+        for e in events:
+            if start <= e.timestamp <= end:
+                key = (e.category.value, e.event_type.value, e.severity.value, e.outcome)
+                expected[key] = expected.get(key, 0) + 1
+        
+        assert storage.summarize(start, end) == expected
+        assert sum(storage.summarize().values()) == 150
+    
+    def test_summaries_survive_reopen(self, open_storage):
+        """Test manifest counters are persisted with sealed segments."""
+        storage = open_storage(segment_max_bytes=2048)
+        for i in range(40):
+            storage.store(make_event(i))
+        storage.close()
+        
+        reopened = open_storage(segment_max_bytes=2048)
+        
+        assert reopened.summarize() == {("authentication", "auth_success", "info", "success"): 40}
+
+
+class TestAuditChain:
+    """Test segment hash chaining and verification."""
+    
+    def test_chain_verifies(self, open_storage):
+        """Test an untouched log verifies and chains from genesis."""
+        storage = open_storage(segment_max_bytes=2048)
+        for i in range(100):
+            storage.store(make_event(i))
+        
+        valid, issues = storage.verify_range()
+        
+        assert valid, issues
+        assert storage.head_hash != GENESIS_HASH
+    
+    def test_tampered_segment_detected(self, open_storage, tmp_path):
+        """Test modifying a sealed segment is detected for its range."""
+        storage = open_storage(segment_max_bytes=2048)
+        for i in range(100):
+            storage.store(make_event(i, message="ok"))
+        storage.flush()
+        
+        path = os.path.join(str(tmp_path / "audit"), "audit-00000000.log")
+        with open(path, "r+b") as f:
+            data = f.read()
+            f.seek(0)
+            f.write(data.replace(b'"outcome": "success"', b'"outcome": "failure"', 1))
+        
+        valid, issues = storage.verify_range(end_time=BASE_TIME + timedelta(seconds=5))
+        
+        assert not valid
+        assert any("Segment 0" in issue for issue in issues)
+    
+    def test_verify_range_limits_rehashing(self, open_storage, tmp_path):
+        """Test only segments in the range are re-hashed."""
+        storage = open_storage(segment_max_bytes=2048)
+        for i in range(100):
+            storage.store(make_event(i))
+        storage.flush()
+        
+        path = os.path.join(str(tmp_path / "audit"), "audit-00000000.log")
+        with open(path, "r+b") as f:
+            f.seek(-3, os.SEEK_END)
+            f.write(b"xx\n")
+        
+        valid, _ = storage.verify_range(start_time=BASE_TIME + timedelta(seconds=90))
+        
+        assert valid
+    
+    def test_verify_during_concurrent_write(self, open_storage):
+        """Test a write landing during verification is not reported as tampering."""
+        storage = open_storage()
+        for i in range(10):
+            storage.store(make_event(i))
+        
+        writer = threading.Thread(target=lambda: (storage.store(make_event(10)), storage.flush()))
+        capture = storage._capture_segments
+        
+        def racing_capture():
+            segments = capture()
+            # The writer can only run once verification has its snapshot
+            writer.start()
+            time.sleep(0.05)
+            return segments
+        
+        storage._capture_segments = racing_capture
+        valid, issues = storage.verify_range()
+        writer.join()
+        storage._capture_segments = capture
+        
+        assert valid, issues
+        assert storage.count() == 11
+    
+    def test_flusher_survives_write_error(self, open_storage):
+        """Test a failed write is retried instead of killing the flusher."""
+        storage = open_storage(flush_interval=0.01)
+        sync = storage._sync
+        failures = [OSError("disk full")]
+        
+        def flaky_sync():
+            if failures:
+                raise failures.pop()
+            sync()
+        
+        storage._sync = flaky_sync
+        for i in range(5):
+            storage.store(make_event(i))
+        
+        deadline = time.monotonic() + 5
+        while storage.get_storage_stats()["pending_events"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        stats = storage.get_storage_stats()
+        assert stats["write_errors"] == 1
+        assert stats["pending_events"] == 0
+        assert storage._flusher.is_alive()
+        assert storage.count() == 5
+        assert storage.verify_range()[0]
+    
+    def test_torn_tail_recovered(self, open_storage, tmp_path):
+        """Test a partial record left by a crash is truncated on reopen."""
+        storage = open_storage()
+        for i in range(5):
+            storage.store(make_event(i))
+        storage.close()
+        
+        path = os.path.join(str(tmp_path / "audit"), "audit-00000000.log")
+        with open(path, "ab") as f:
+            f.write(b'{"event_id": "evt_torn", "ts"')
+        
+        reopened = open_storage()
+        reopened.store(make_event(5))
+        
+        assert reopened.count() == 6
+        assert reopened.verify_range()[0]
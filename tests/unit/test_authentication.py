@@ -69,6 +69,7 @@ from server.core.authentication import (
     AuthenticationResponse
 )
 from server.core.enrollment import enroll_user
+from server.core.key_store import AuthKeyRecord, InMemoryKeyStore
 from server.crypto.dna_key import SecurityLevel
 from server.crypto.signatures import Ed25519SigningKey
 
@@ -331,3 +332,202 @@ class TestKeyValidation:
         
         assert response.success is False
         assert "expired" in response.error_message.lower()
+
+
+class TestKeyIndex:
+    """Test the compact authentication key index."""
+    
+    def test_index_holds_record_not_helix(self):
+        """Test enrolled keys are indexed as compact records."""
+        service = AuthenticationService()
+        enrollment = enroll_user("user@example.com")
+        service.enroll_key(enrollment.dna_key)
+        
+        record = service.get_key_record(enrollment.key_id)
+        assert isinstance(record, AuthKeyRecord)
+        assert not hasattr(record, "dna_helix")
+        assert record.public_key == enrollment.dna_key.cryptographic_material.public_key
+        assert record.segment_count == 1024
+        assert service.get_enrolled_count() == 1
+    
+    def test_full_key_loaded_on_demand(self):
+        """Test the full key is loaded from the key store."""
+        store = InMemoryKeyStore()
+        service = AuthenticationService(key_store=store)
+        enrollment = enroll_user("user@example.com")
+        service.enroll_key(enrollment.dna_key)
+        
+        assert service.get_key(enrollment.key_id) is enrollment.dna_key
+        assert service.get_key("unknown-key") is None
+    
+    def test_authentication_uses_index_only(self):
+        """Test authentication works without touching the key store."""
+        store = InMemoryKeyStore()
+        service = AuthenticationService(key_store=store)
+        enrollment = enroll_user("user@example.com")
+        service.enroll_key(enrollment.dna_key)
+        
+        # Drop the full key; the index alone must be enough
+        store.delete(enrollment.key_id)
+        
+        challenge = service.generate_challenge(ChallengeRequest(key_id=enrollment.key_id))
+        signing_key = Ed25519SigningKey.from_bytes(bytes.fromhex(enrollment.signing_key_hex))
+        response = service.authenticate(challenge.challenge_id, signing_key.sign(challenge.challenge))
+        
+        assert response.success is True
+    
+    def test_default_keeps_record_only(self):
+        """Test no full keys are retained without a key store."""
+        service = AuthenticationService()
+        enrollment = enroll_user("user@example.com")
+        service.enroll_key(enrollment.dna_key)
+        
+        assert service.key_store is None
+        assert service.get_key_record(enrollment.key_id) is not None
+        assert service.get_key(enrollment.key_id) is None
+    
+    def test_remove_key(self):
+        """Test removing a key drops it from index and store."""
+        service = AuthenticationService(key_store=InMemoryKeyStore())
+        enrollment = enroll_user("user@example.com")
+        service.enroll_key(enrollment.dna_key)
+        
+        assert service.remove_key(enrollment.key_id) is True
+        assert service.get_key_record(enrollment.key_id) is None
+        assert enrollment.key_id not in service.key_store
+        assert service.remove_key(enrollment.key_id) is False
+
+
+class TestVerifyKeyCaching:
+    """Test verify key caching in the authentication service."""
+    
+    def _login(self, service, enrollment):
+        challenge = service.generate_challenge(ChallengeRequest(key_id=enrollment.key_id))
+        signing_key = Ed25519SigningKey.from_bytes(bytes.fromhex(enrollment.signing_key_hex))
+        return service.authenticate(challenge.challenge_id, signing_key.sign(challenge.challenge))
+    
+    def test_repeat_logins_hit_cache(self):
+        """Test repeated authentications reuse the verify key."""
+        service = AuthenticationService()
+        enrollment = enroll_user("user@example.com")
+        service.enroll_key(enrollment.dna_key)
+        
+        for _ in range(3):
+            assert self._login(service, enrollment).success is True
+        
+        stats = service.verify_key_cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+    
+    def test_reenrollment_invalidates(self):
+        """Test re-enrolling a key drops its cached verify key."""
+        service = AuthenticationService()
+        enrollment = enroll_user("user@example.com")
+        service.enroll_key(enrollment.dna_key)
+        self._login(service, enrollment)
+        
+        service.enroll_key(enrollment.dna_key)
+        
+        assert len(service.verify_key_cache) == 0
+    
+    def test_revoked_key_cannot_authenticate(self):
+        """Test revocation invalidates the cache and blocks the key."""
+        from server.core.revocation import RevocationReason, RevocationRequest, RevocationService
+        
+        service = AuthenticationService()
+        revocations = RevocationService()
+        revocations.add_listener(service.on_key_revoked)
+        enrollment = enroll_user("user@example.com")
+        service.enroll_key(enrollment.dna_key)
+        
+        challenge = service.generate_challenge(ChallengeRequest(key_id=enrollment.key_id))
+        revocations.revoke_key(
+            RevocationRequest(key_id=enrollment.key_id, reason=RevocationReason.KEY_COMPROMISE, revoked_by="admin")
+        )
+        
+        assert len(service.verify_key_cache) == 0
+        signing_key = Ed25519SigningKey.from_bytes(bytes.fromhex(enrollment.signing_key_hex))
+        response = service.authenticate(challenge.challenge_id, signing_key.sign(challenge.challenge))
+        assert response.success is False
+        assert "revoked" in response.error_message.lower()
+        assert service.generate_challenge(ChallengeRequest(key_id=enrollment.key_id)).success is False
+
+
+class TestSharedChallengeStore:
+    """Test challenges kept in a key-value store shared between workers."""
+    
+    def test_challenge_answered_by_another_worker(self):
+        """Test a challenge issued by one service is accepted by another."""
+        from server.core.kv_store import KeyValueServer, ShardedKeyValueStore
+        
+        enrollment = enroll_user("user@example.com")
+        signing_key = Ed25519SigningKey.from_bytes(bytes.fromhex(enrollment.signing_key_hex))
+        
+        with KeyValueServer() as server:
+            workers = []
+            for _ in range(2):
+                service = AuthenticationService(challenge_store=ShardedKeyValueStore([server.endpoint]))
+                service.enroll_key(enrollment.dna_key)
+                workers.append(service)
+            
+            challenge = workers[0].generate_challenge(ChallengeRequest(key_id=enrollment.key_id))
+            assert workers[1].get_active_challenges_count() == 1
+            
+            signature = signing_key.sign(challenge.challenge)
+            response = workers[1].authenticate(challenge.challenge_id, signature)
+            replay = workers[0].authenticate(challenge.challenge_id, signature)
+            
+            for service in workers:
+                service.challenge_store.close()
+        
+        assert response.success is True
+        assert replay.success is False
+        assert "Invalid challenge" in replay.error_message
+    
+    def test_challenge_store_expires_challenges(self):
+        """Test challenges are given the challenge expiry as TTL."""
+        from server.core.kv_store import InMemoryKeyValueStore
+        
+        now = [0.0]
+        service = AuthenticationService(challenge_store=InMemoryKeyValueStore(clock=lambda: now[0]))
+        enrollment = enroll_user("user@example.com")
+        service.enroll_key(enrollment.dna_key)
+        challenge = service.generate_challenge(ChallengeRequest(key_id=enrollment.key_id))
+        
+        now[0] = service.CHALLENGE_EXPIRY_SECONDS + 1
+        
+        response = service.authenticate(challenge.challenge_id, b"x" * 64)
+        assert response.success is False
+        assert "expired" in response.error_message
+        assert service.cleanup_expired_challenges() == 0
+
+
+class TestSignedSessionTokens:
+    """Test signed session tokens issued on authentication."""
+    
+    def test_authenticate_issues_signed_token(self):
+        """Test the session token carries the key ID and scopes."""
+        from server.crypto.backend import get_signer_backend
+        from server.security.signed_tokens import SignedTokenCodec
+        
+        codec = SignedTokenCodec(get_signer_backend())
+        service = AuthenticationService(token_codec=codec)
+        enrollment = enroll_user("user@example.com")
+        service.enroll_key(enrollment.dna_key)
+        
+        challenge = service.generate_challenge(ChallengeRequest(key_id=enrollment.key_id))
+        signing_key = Ed25519SigningKey.from_bytes(bytes.fromhex(enrollment.signing_key_hex))
+        response = service.authenticate(challenge.challenge_id, signing_key.sign(challenge.challenge))
+        
+        is_valid, claims, _ = codec.decode(response.session_token)
+        assert response.success is True
+        assert response.scopes == ["user:standard"]
+        assert is_valid is True
+        assert claims.user_id == enrollment.key_id
+        assert claims.scopes == ("user:standard",)
+        assert claims.expires_at - claims.issued_at == service.SESSION_EXPIRY_SECONDS
+    
+    def test_admin_scope(self):
+        """Test admin keys are granted the admin scope."""
+        assert AuthenticationService.get_token_scopes("dna-admin-1") == ["admin:full"]
+        assert AuthenticationService.get_token_scopes("dna-user-1") == ["user:standard"]
@@ -68,6 +68,7 @@ import pytest
 from server.security.distributed_ledger import (
     Block,
     BlockchainNetwork,
+    BlockProductionPolicy,
     BlockHeader,
     DNARegistryEntry,
     DNASmartContract,
@@ -535,6 +536,270 @@ class TestDNAStrandRegistry:
                 signature=b"sig2"
             )
 
+    
+    def test_owner_index_follows_transfers(self):
+        """Test ownership queries reflect transfers."""
+        registry = DNAStrandRegistry()
+        for key_id in ("key-1", "key-2"):
+            registry.register_strand(
+                dna_key_id=key_id,
+                dna_checksum="checksum",
+                owner_address="owner_A",
+                security_level="standard",
+                segment_count=1000,
+                signature=b"sig"
+            )
+        
+        registry.transfer_ownership("key-1", "owner_B", b"sig_a", b"sig_b")
+        registry.transfer_ownership("key-2", "owner_B", b"sig_a", b"sig_b")
+        
+        assert registry.get_owner_strands("owner_A") == []
+        assert [e.dna_key_id for e in registry.get_owner_strands("owner_B")] == ["key-1", "key-2"]
+        assert registry.get_stats()["owners"] == 1
+    
+    def test_get_transaction(self):
+        """Test transactions are found through the block index."""
+        registry = DNAStrandRegistry()
+        tx = registry.register_strand(
+            dna_key_id="key-1",
+            dna_checksum="checksum",
+            owner_address="owner",
+            security_level="standard",
+            segment_count=1000,
+            signature=b"sig"
+        )
+        
+        assert registry.get_transaction(tx.transaction_id) is tx
+        assert registry.get_transaction("tx_missing") is None
+        assert registry.height == tx.block_number == 1
+
+
+class TestBlockProduction:
+    """Test batched block production."""
+    
+    @staticmethod
+    def register(registry, key_id, **kwargs):
+        return registry.register_strand(
+            dna_key_id=key_id,
+            dna_checksum="checksum",
+            owner_address="owner",
+            security_level="standard",
+            segment_count=1000,
+            signature=b"sig",
+            **kwargs
+        )
+    
+    def test_batches_by_count(self):
+        """Test pending transactions are sealed into blocks of max_transactions."""
+        registry = DNAStrandRegistry(
+            production=BlockProductionPolicy(max_transactions=10, max_interval=60)
+        )
+        txs = [self.register(registry, f"key-{i}") for i in range(25)]
+        
+        for tx in txs[:20]:
+            registry.confirmation(tx).result(timeout=5)
+        assert registry.height == 2
+        assert txs[0].block_number == 1
+        assert txs[19].block_number == 2
+        assert txs[24].status == TransactionStatus.PENDING
+        
+        assert registry.flush(timeout=5) is True
+        assert registry.height == 3
+        assert len(registry.get_stats()["head_hash"]) == 64
+        assert registry.verify_chain_integrity() == (True, [])
+        registry.close()
+    
+    def test_batches_by_size(self):
+        """Test blocks stay within max_bytes."""
+        registry = DNAStrandRegistry(
+            production=BlockProductionPolicy(max_transactions=1000, max_bytes=1, max_interval=60)
+        )
+        txs = [self.register(registry, f"key-{i}") for i in range(3)]
+        registry.flush(timeout=5)
+        
+        assert [tx.block_number for tx in txs] == [1, 2, 3]
+        registry.close()
+    
+    def test_batches_by_interval(self):
+        """Test a partial batch is sealed once max_interval has passed."""
+        registry = DNAStrandRegistry(
+            production=BlockProductionPolicy(max_transactions=1000, max_interval=0.05)
+        )
+        tx = self.register(registry, "key-1")
+        
+        confirmed = registry.confirmation(tx).result(timeout=5)
+        
+        assert confirmed.status == TransactionStatus.CONFIRMED
+        assert registry.get_entry("key-1") is not None
+        registry.close()
+    
+    def test_wait_and_callback(self):
+        """Test synchronous confirmation and confirmation callbacks."""
+        registry = DNAStrandRegistry(
+            production=BlockProductionPolicy(max_transactions=1000, max_interval=0.05)
+        )
+        confirmed = []
+        
+        tx = self.register(registry, "key-1", wait=True, callback=confirmed.append)
+        
+        assert tx.status == TransactionStatus.CONFIRMED
+        assert registry.confirmation(tx).result() is tx
+        assert confirmed == [tx]
+        registry.close()
+    
+    def test_pending_duplicate_rejected(self):
+        """Test a strand cannot be registered twice while pending."""
+        registry = DNAStrandRegistry(
+            production=BlockProductionPolicy(max_transactions=1000, max_interval=60)
+        )
+        self.register(registry, "key-1")
+        
+        with pytest.raises(ValueError, match="already registered"):
+            self.register(registry, "key-1")
+        
+        assert len(registry.get_audit_trail("key-1")) == 1
+        registry.close()
+    
+    def test_close_seals_pending(self):
+        """Test closing the registry seals pending transactions."""
+        registry = DNAStrandRegistry(
+            production=BlockProductionPolicy(max_transactions=1000, max_interval=60)
+        )
+        tx = self.register(registry, "key-1")
+        
+        registry.close()
+        
+        assert tx.status == TransactionStatus.CONFIRMED
+        with pytest.raises(RuntimeError, match="closed"):
+            self.register(registry, "key-2")
+
+
+class TestMerkleProofs:
+    """Test cached Merkle levels and inclusion proofs."""
+    
+    @staticmethod
+    def make_block(count):
+        transactions = [
+            DNATransaction(
+                transaction_id=f"tx_{i}",
+                transaction_type="register",
+                dna_key_id=f"key-{i}",
+                dna_checksum="checksum",
+                owner_address="owner",
+                timestamp=datetime.now(timezone.utc),
+                signature=b"sig"
+            )
+            for i in range(count)
+        ]
+        header = BlockHeader(
+            block_number=1,
+            previous_hash="0" * 64,
+            merkle_root="",
+            timestamp=datetime.now(timezone.utc),
+            nonce=0,
+            difficulty=1,
+            validator="test"
+        )
+        block = Block(header=header, transactions=transactions)
+        block.header.merkle_root = block.compute_merkle_root()
+        return block
+    
+    @pytest.mark.parametrize("count", [1, 2, 5, 8, 13])
+    def test_every_transaction_has_valid_proof(self, count):
+        """Test Merkle paths verify for every position, odd sizes included."""
+        block = self.make_block(count)
+        
+        for index, tx in enumerate(block.transactions):
+            path = block.merkle_proof(index)
+            assert len(path) == len(block.merkle_levels()) - 1
+            assert Block.verify_merkle_path(tx.compute_hash(), index, path, block.header.merkle_root)
+    
+    def test_proof_rejects_wrong_transaction(self):
+        """Test a path does not verify another transaction or position."""
+        block = self.make_block(6)
+        path = block.merkle_proof(2)
+        root = block.header.merkle_root
+        
+        assert not Block.verify_merkle_path(block.transactions[3].compute_hash(), 2, path, root)
+        assert not Block.verify_merkle_path(block.transactions[2].compute_hash(), 3, path, root)
+    
+    def test_registry_inclusion_proof(self):
+        """Test registry proofs verify against the proven block only."""
+        registry = DNAStrandRegistry(
+            production=BlockProductionPolicy(max_transactions=5, max_interval=60)
+        )
+        txs = [
+            registry.register_strand(
+                dna_key_id=f"key-{i}",
+                dna_checksum="checksum",
+                owner_address="owner",
+                security_level="standard",
+                segment_count=1000,
+                signature=b"sig"
+            )
+            for i in range(5)
+        ]
+        registry.flush(timeout=5)
+        
+        proof = registry.get_inclusion_proof(txs[3].transaction_id)
+        
+        assert proof.block_number == 1
+        assert len(proof.path) == 3
+        assert proof.verify(txs[3]) is True
+        assert proof.verify(txs[4]) is False
+        assert proof.to_dict()["index"] == 3
+        
+        proof.header.nonce += 1
+        assert proof.verify(txs[3]) is False
+        assert registry.get_inclusion_proof("tx_missing") is None
+        registry.close()
+
+
+class TestIncrementalVerification:
+    """Test checkpointed chain verification."""
+    
+    @staticmethod
+    def register(registry, key_id):
+        return registry.register_strand(
+            dna_key_id=key_id,
+            dna_checksum="checksum",
+            owner_address="owner",
+            security_level="standard",
+            segment_count=1000,
+            signature=b"sig"
+        )
+    
+    def test_only_new_blocks_are_verified(self):
+        """Test verification resumes from the last verified block."""
+        registry = DNAStrandRegistry()
+        for i in range(3):
+            self.register(registry, f"key-{i}")
+        assert registry.verify_chain_integrity() == (True, [])
+        assert registry.get_stats()["verified_height"] == 3
+        
+        # Tampering below the verified height is only caught by a full check
+        registry._store.get_block(2).transactions[0].dna_checksum = "tampered"
+        self.register(registry, "key-3")
+        
+        assert registry.verify_chain_integrity() == (True, [])
+        assert registry.get_stats()["verified_height"] == 4
+        assert registry.verify_chain_integrity(full=True) == (False, ["Block 2: Merkle root invalid"])
+        assert registry.get_stats()["verified_height"] == 1
+    
+    def test_changed_anchor_forces_full_verification(self):
+        """Test a modified last-verified block triggers a full re-check."""
+        registry = DNAStrandRegistry()
+        for i in range(3):
+            self.register(registry, f"key-{i}")
+        registry.verify_chain_integrity()
+        
+        registry._store.get_block(3).header.nonce += 1
+        
+        is_valid, issues = registry.verify_chain_integrity()
+        
+        assert is_valid is False
+        assert issues == ["Block 3: Block hash invalid"]
+
 
 class TestDNASmartContract:
     """Test DNA smart contract functionality."""
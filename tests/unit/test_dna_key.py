@@ -67,6 +67,7 @@ import pytest
 from datetime import datetime, timezone, timedelta
 
 from server.crypto.dna_key import (
+    CompactDNAHelix,
     DNAKey,
     DNAHelix,
     DNASegment,
@@ -83,6 +84,7 @@ from server.crypto.dna_key import (
 )
 from server.crypto.dna_generator import (
     DNAKeyGenerator,
+    GenerationStage,
     generate_dna_key
 )
 
@@ -234,6 +236,93 @@ class TestDNAHelix:
         assert all(s.type == SegmentType.ENTROPY for s in entropy_segs)
 
 
+class TestCompactDNAHelix:
+    """Test the columnar, array-backed helix representation."""
+    
+    def _make_helix(self):
+        segments = [
+            DNASegment(position=2, type=SegmentType.ENTROPY, data=b"entropy"),
+            DNASegment(position=0, type=SegmentType.POLICY, data=b"policy-data"),
+            DNASegment(position=1, type=SegmentType.ENTROPY, data=b"more entropy"),
+        ]
+        return DNAHelix(segments=segments)
+    
+    def test_from_helix_preserves_segments(self):
+        """Test that converting to compact form preserves segment content."""
+        helix = self._make_helix()
+        compact = CompactDNAHelix.from_helix(helix)
+        
+        assert compact.segment_count == 3
+        assert compact.strand_length == helix.strand_length
+        assert list(compact.segments) == helix.segments
+    
+    def test_segments_view_indexing(self):
+        """Test indexing and slicing the lazy segment view."""
+        compact = CompactDNAHelix.from_helix(self._make_helix())
+        
+        assert len(compact.segments) == 3
+        assert compact.segments[0].position == 2
+        assert compact.segments[-1].data == b"more entropy"
+        assert [s.position for s in compact.segments[1:]] == [0, 1]
+        with pytest.raises(IndexError):
+            compact.segments[3]
+    
+    def test_checksum_matches_list_helix(self):
+        """Test that compact and list helices produce the same checksum."""
+        helix = self._make_helix()
+        compact = CompactDNAHelix.from_helix(helix)
+        
+        assert compact.compute_checksum() == helix.compute_checksum()
+        assert compact.verify_checksum()
+    
+    def test_get_segments_by_type(self):
+        """Test type filtering on the type column."""
+        compact = CompactDNAHelix.from_helix(self._make_helix())
+        
+        entropy = compact.get_segments_by_type(SegmentType.ENTROPY)
+        
+        assert [s.position for s in entropy] == [2, 1]
+        assert compact.type_counts() == {SegmentType.ENTROPY: 2, SegmentType.POLICY: 1}
+    
+    def test_to_helix_round_trip(self):
+        """Test converting back to a list-backed helix."""
+        helix = self._make_helix()
+        helix.compute_checksum()
+        
+        restored = CompactDNAHelix.from_helix(helix).to_helix()
+        
+        assert restored.segments == helix.segments
+        assert restored.checksum == helix.checksum
+    
+    def test_rejects_missing_segment_hash(self):
+        """Test that segments without a SHA3-256 hash are rejected."""
+        segment = DNASegment(position=0, type=SegmentType.ENTROPY, data=b"x")
+        segment.segment_hash = None
+        
+        with pytest.raises(ValueError):
+            CompactDNAHelix.from_segments([segment])
+    
+    def test_generator_compact_helix(self):
+        """Test generating a key directly into a compact helix."""
+        generator = DNAKeyGenerator(SecurityLevel.STANDARD, compact_helix=True)
+        key = generator.generate("user@example.com")
+        
+        assert isinstance(key.dna_helix, CompactDNAHelix)
+        assert key.dna_helix.segment_count == 1024
+        assert key.is_valid()
+        assert len(key.layer_checksums) == 5
+        assert key.dna_helix.compute_checksum() == key.dna_helix.to_helix().compute_checksum()
+    
+    def test_compact_layer_checksums_match(self):
+        """Test that column-based layer checksums match the list-based ones."""
+        generator = DNAKeyGenerator(SecurityLevel.STANDARD)
+        key = generator.generate("user@example.com")
+        
+        compact = CompactDNAHelix.from_helix(key.dna_helix)
+        
+        assert generator._compute_layer_checksums(compact) == key.layer_checksums
+
+
 class TestDNAKey:
     """Test DNA key structure."""
     
@@ -485,6 +574,107 @@ class TestSegmentGeneration:
         assert not is_ordered
 
 
+class TestBulkSegmentGeneration:
+    """Test the bulk (batched) segment generation mode."""
+    
+    def test_bulk_generation_enabled_by_default(self):
+        """Test that bulk generation is the default mode."""
+        generator = DNAKeyGenerator(SecurityLevel.STANDARD)
+        
+        assert generator.bulk_generation is True
+    
+    def test_bulk_matches_sequential_layout(self):
+        """Test that bulk and sequential modes produce the same segment layout."""
+        bulk = DNAKeyGenerator(SecurityLevel.STANDARD, bulk_generation=True)
+        sequential = DNAKeyGenerator(SecurityLevel.STANDARD, bulk_generation=False)
+        signing_key, _ = bulk._generate_test_keypair()
+        
+        bulk_segments = bulk._generate_segments("user@example.com", signing_key)
+        seq_segments = sequential._generate_segments("user@example.com", signing_key)
+        
+        def layout(segments):
+            return sorted((s.position, s.type, s.length) for s in segments)
+        
+        assert layout(bulk_segments) == layout(seq_segments)
+    
+    def test_bulk_deterministic_segments_match(self):
+        """Test that deterministic segments are identical in both modes."""
+        bulk = DNAKeyGenerator(SecurityLevel.STANDARD, bulk_generation=True)
+        sequential = DNAKeyGenerator(SecurityLevel.STANDARD, bulk_generation=False)
+        signing_key, _ = bulk._generate_test_keypair()
+        
+        def by_position(generator, seg_type):
+            segments = generator._generate_segments("user@example.com", signing_key)
+            return {s.position: s.data for s in segments if s.type == seg_type}
+        
+        for seg_type in (SegmentType.HASH, SegmentType.SIGNATURE):
+            assert by_position(bulk, seg_type) == by_position(sequential, seg_type)
+    
+    def test_bulk_segment_hashes_valid(self):
+        """Test that batch-computed hashes match per-segment hashing."""
+        generator = DNAKeyGenerator(SecurityLevel.STANDARD)
+        key = generator.generate("user@example.com")
+        
+        for seg in key.dna_helix.segments:
+            assert seg.segment_hash == seg._compute_hash()
+    
+    def test_bulk_segments_shuffled_and_unique(self):
+        """Test that bulk segments are shuffled with unique positions."""
+        generator = DNAKeyGenerator(SecurityLevel.STANDARD)
+        key = generator.generate("user@example.com")
+        
+        positions = [seg.position for seg in key.dna_helix.segments]
+        
+        assert sorted(positions) == list(range(1024))
+        assert positions != sorted(positions)
+    
+    def test_sequential_mode_still_valid(self):
+        """Test that the sequential path still produces valid keys."""
+        generator = DNAKeyGenerator(SecurityLevel.STANDARD, bulk_generation=False)
+        key = generator.generate("user@example.com")
+        
+        assert key.dna_helix.segment_count == 1024
+        assert key.is_valid()
+
+
+class TestGenerationProgress:
+    """Test generator progress callbacks."""
+    
+    @pytest.mark.parametrize("bulk", [True, False])
+    def test_progress_reports_all_segments(self, bulk):
+        """Test segment progress is monotonic and reaches the total."""
+        events = []
+        generator = DNAKeyGenerator(
+            SecurityLevel.STANDARD,
+            bulk_generation=bulk,
+            progress_callback=lambda stage, done, total: events.append((stage, done, total)),
+        )
+        generator.generate("user@example.com")
+        
+        segment_progress = [done for stage, done, _ in events if stage == GenerationStage.SEGMENTS]
+        assert segment_progress == sorted(segment_progress)
+        assert segment_progress[-1] == 1024
+        assert all(total == 1024 for _, _, total in events)
+        
+        stages = [stage for stage, _, _ in events]
+        assert stages[-1] == GenerationStage.COMPLETE
+        assert stages.index(GenerationStage.CHECKSUM) < stages.index(GenerationStage.SIGNING)
+    
+    def test_signature_progress_is_chunked(self):
+        """Test the signature block reports intermediate progress."""
+        events = []
+        generator = DNAKeyGenerator(
+            SecurityLevel.STANDARD,
+            progress_callback=lambda stage, done, total: events.append(done),
+        )
+        generator.PROGRESS_INTERVAL = 16
+        signing_key, _ = generator._generate_test_keypair()
+        generator._generate_segments("user@example.com", signing_key)
+        
+        # One report per block plus intermediate signature chunks
+        assert len(events) > 7 + 2
+
+
 class TestSecurityLevels:
     """Test extended security levels including ULTIMATE."""
     
@@ -64,6 +64,7 @@ import pytest
 from datetime import datetime, timezone, timedelta
 
 from server.crypto.dna_key import (
+    CompactDNAHelix,
     DNAKey,
     DNAHelix,
     DNASegment,
@@ -76,6 +77,9 @@ from server.crypto.dna_generator import (
 )
 from server.crypto.dna_verifier import (
     DNAVerifier,
+    HelixIndex,
+    verify_issuer_signatures,
+    verify_many,
     VerificationResult,
     VerificationReport,
     VerificationBarrier,
@@ -322,3 +326,194 @@ class TestEntropyEstimation:
         barrier_6 = next(b for b in report.barrier_results if b.barrier_number == 6)
         assert barrier_6.result == VerificationResult.PASSED
         assert "bits/byte" in barrier_6.details
+
+
+class TestHelixIndex:
+    """Test the shared per-type helix index."""
+    
+    def test_index_counts_match_helix(self):
+        """Test that index counts match per-type scans."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        index = HelixIndex.build(key.dna_helix)
+        
+        for seg_type in SegmentType:
+            assert index.count(seg_type) == len(key.dna_helix.get_segments_by_type(seg_type))
+    
+    def test_compact_index_matches_list_index(self):
+        """Test that compact and list helices index identically."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        compact = CompactDNAHelix.from_helix(key.dna_helix)
+        
+        list_index = HelixIndex.build(key.dna_helix)
+        compact_index = HelixIndex.build(compact)
+        
+        assert list_index.type_counts == compact_index.type_counts
+        assert list_index.segments_of(SegmentType.ENTROPY, limit=5) == compact_index.segments_of(SegmentType.ENTROPY, limit=5)
+        assert list_index.leading_positions(10) == compact_index.leading_positions(10)
+
+
+class TestVerifierScheduling:
+    """Test barrier scheduling, fail-fast and parallel execution."""
+    
+    def test_fail_fast_skips_remaining_barriers(self):
+        """Test that fail-fast stops after the first failure."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        key.key_id = "invalid"
+        
+        verifier = DNAVerifier(fail_fast=True)
+        report = verifier.verify(key)
+        
+        assert report.overall_result == VerificationResult.FAILED
+        assert len(report.barrier_results) == 12
+        assert report.barrier_results[0].result == VerificationResult.FAILED
+        assert all(b.result == VerificationResult.SKIPPED for b in report.barrier_results[1:])
+    
+    def test_full_report_without_fail_fast(self):
+        """Test that all barriers run when fail-fast is disabled."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        key.key_id = "invalid"
+        
+        verifier = DNAVerifier(fail_fast=True)
+        report = verifier.verify(key, fail_fast=False)
+        
+        assert not any(b.result == VerificationResult.SKIPPED for b in report.barrier_results)
+        assert report.barriers_failed == 1
+    
+    def test_fail_fast_passing_key_runs_all(self):
+        """Test that fail-fast does not skip anything for a valid key."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        report = DNAVerifier(fail_fast=True).verify(key)
+        
+        assert report.barriers_passed == 12
+    
+    def test_parallel_matches_sequential(self):
+        """Test that parallel verification produces the same results."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        sequential = DNAVerifier().verify(key)
+        verifier = DNAVerifier(parallel=True)
+        try:
+            parallel = verifier.verify(key)
+        finally:
+            verifier.close()
+        
+        assert [b.result for b in parallel.barrier_results] == [b.result for b in sequential.barrier_results]
+        assert [b.barrier_number for b in parallel.barrier_results] == list(range(1, 13))
+    
+    def test_parallel_skips_pool_for_cached_helix(self):
+        """Test that only an uncached checksum is offloaded to the pool."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        verifier = DNAVerifier(parallel=True)
+        try:
+            verifier.verify(key)
+            assert verifier._executor is None
+            
+            key.dna_helix.segments[0].data = b"tampered"
+            report = verifier.verify(key)
+            assert verifier._executor is not None
+        finally:
+            verifier.close()
+        
+        barrier_5 = next(b for b in report.barrier_results if b.barrier_number == 5)
+        assert barrier_5.result == VerificationResult.FAILED
+    
+    def test_parallel_detects_tampering(self):
+        """Test that a tampered helix fails the checksum barrier in parallel mode."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        key.dna_helix.segments[0].data = b"tampered"
+        
+        verifier = DNAVerifier(parallel=True, fail_fast=True)
+        try:
+            report = verifier.verify(key)
+        finally:
+            verifier.close()
+        
+        barrier_5 = next(b for b in report.barrier_results if b.barrier_number == 5)
+        assert barrier_5.result == VerificationResult.FAILED
+        assert report.overall_result == VerificationResult.FAILED
+    
+    def test_verify_compact_key(self):
+        """Test verifying a key with a compact helix."""
+        key = DNAKeyGenerator(SecurityLevel.STANDARD, compact_helix=True).generate("user@example.com")
+        
+        report = DNAVerifier().verify(key)
+        
+        assert report.overall_result == VerificationResult.PASSED
+        assert report.barriers_passed == 12
+
+
+class TestBatchVerification:
+    """Test verify_many and batched issuer signature checks."""
+    
+    def test_verify_many_in_process(self):
+        """Test verifying several keys in-process."""
+        keys = [generate_dna_key(f"user{i}@example.com", SecurityLevel.STANDARD) for i in range(5)]
+        verifier = DNAVerifier()
+        
+        reports = list(verifier.verify_many(keys, chunk_size=2))
+        
+        assert sorted(r.key_id for r in reports) == sorted(k.key_id for k in keys)
+        assert all(r.overall_result == VerificationResult.PASSED for r in reports)
+        assert verifier.last_batch_stats.keys_verified == 5
+        assert verifier.last_batch_stats.keys_per_second > 0
+        assert verifier.last_batch_stats.mb_per_second > 0
+    
+    def test_verify_many_accepts_serialized_keys(self):
+        """Test that CBOR and packed keys can be verified directly."""
+        from server.crypto.serialization import serialize_dna_key, serialize_dna_key_packed
+        
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        reports = list(verify_many([serialize_dna_key(key), serialize_dna_key_packed(key)]))
+        
+        assert [r.key_id for r in reports] == [key.key_id, key.key_id]
+        assert all(r.overall_result == VerificationResult.PASSED for r in reports)
+    
+    def test_throughput_counts_same_payload_for_any_input(self):
+        """Test that serialized and DNAKey inputs add the same bytes to the stats."""
+        from server.crypto.serialization import serialize_dna_key, serialize_dna_key_packed
+        
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        verifier = DNAVerifier()
+        
+        for keys in ([key], [serialize_dna_key(key)], [serialize_dna_key_packed(key)]):
+            list(verifier.verify_many(keys))
+            assert verifier.last_batch_stats.bytes_verified == key.dna_helix.strand_length
+        
+    def test_verify_many_process_pool(self):
+        """Test spreading verification across worker processes."""
+        keys = [generate_dna_key(f"user{i}@example.com", SecurityLevel.STANDARD) for i in range(4)]
+        
+        reports = list(verify_many(keys, workers=2))
+        
+        assert sorted(r.key_id for r in reports) == sorted(k.key_id for k in keys)
+        assert all(r.overall_result == VerificationResult.PASSED for r in reports)
+    
+    def test_verify_many_uses_revocation_snapshot(self):
+        """Test that revoked keys fail in batch verification."""
+        keys = [generate_dna_key(f"user{i}@example.com", SecurityLevel.STANDARD) for i in range(3)]
+        
+        reports = {r.key_id: r for r in verify_many(keys, revoked_key_ids=[keys[1].key_id])}
+        
+        assert reports[keys[1].key_id].overall_result == VerificationResult.FAILED
+        assert reports[keys[0].key_id].overall_result == VerificationResult.PASSED
+    
+    def test_issuer_signatures_checked_in_batch(self):
+        """Test that issuer signatures are verified cryptographically."""
+        keys = [generate_dna_key(f"user{i}@example.com", SecurityLevel.STANDARD) for i in range(3)]
+        keys[2].issuer.issuer_signature = bytes(64)
+        
+        assert verify_issuer_signatures(keys) == [True, True, False]
+    
+    def test_forged_issuer_signature_fails_barrier_4(self):
+        """Test that a forged issuer signature fails barrier 4 in batch mode."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        key.issuer.issuer_signature = bytes(64)
+        
+        report = next(verify_many([key]))
+        
+        barrier_4 = next(b for b in report.barrier_results if b.barrier_number == 4)
+        assert barrier_4.result == VerificationResult.FAILED
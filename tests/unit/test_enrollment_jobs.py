@@ -0,0 +1,314 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Enrollment Job Tests
+
+Tests cover:
+- Job lifecycle and progress reporting
+- Chunked key download
+- Retention and eviction of finished jobs
+- Job-based enrollment API endpoints
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from server.core.enrollment import EnrollmentRequest, EnrollmentService
+from server.core.enrollment_jobs import (
+    EnrollmentJobError,
+    EnrollmentJobManager,
+    JobStatus,
+    KeyDeliveredError,
+)
+from server.crypto.serialization import deserialize_dna_key
+from server.runtime.work_executor import BoundedWorkExecutor, QuotaExceededError
+
+
+@pytest.fixture
+def executor():
+    executor = BoundedWorkExecutor(max_workers=1, max_queue_depth=4)
+    yield executor
+    executor.shutdown()
+
+
+def wait_for(manager, job_id, timeout=30):
+    """Poll until the job finishes."""
+    deadline = datetime.now(timezone.utc) + timedelta(seconds=timeout)
+    while datetime.now(timezone.utc) < deadline:
+        job = manager.get_job(job_id)
+        if job.is_finished:
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError("enrollment job did not finish")
+
+
+class TestEnrollmentJobManager:
+    """Test asynchronous enrollment jobs."""
+    
+    def test_job_completes(self, executor):
+        """Test a job runs to completion with full progress."""
+        enrolled = []
+        manager = EnrollmentJobManager(EnrollmentService(), executor, on_complete=enrolled.append)
+        
+        job = manager.submit(EnrollmentRequest(subject_id="job@example.com"))
+        assert job.job_id.startswith("job-")
+        assert job.segments_total == 1024
+        
+        job = wait_for(manager, job.job_id)
+        assert job.status == JobStatus.COMPLETED
+        assert job.progress == 1.0
+        assert job.segments_generated == 1024
+        assert job.key_id == enrolled[0].key_id
+        assert job.key_size == len(job.serialized_key)
+        assert "signing_key" not in job.to_dict()
+        
+        signing_key = manager.take_signing_key(job.job_id)
+        assert signing_key
+        assert manager.take_signing_key(job.job_id) is None
+    
+    def test_process_executor(self):
+        """Test jobs run on a process pool apply their result in the parent."""
+        executor = BoundedWorkExecutor(max_workers=1, max_queue_depth=1, executor_type="process")
+        enrolled = []
+        manager = EnrollmentJobManager(EnrollmentService(), executor, on_complete=enrolled.append)
+        try:
+            job = manager.submit(EnrollmentRequest(subject_id="proc@example.com"))
+            job = wait_for(manager, job.job_id, timeout=120)
+            
+            assert job.status == JobStatus.COMPLETED, job.error_message
+            assert job.key_id == enrolled[0].key_id
+            assert executor.get_stats()["failed"] == 0
+        finally:
+            executor.shutdown()
+    
+    def test_progress_tracks_stages(self, executor):
+        """Test the job records generator stages while running."""
+        manager = EnrollmentJobManager(EnrollmentService(), executor)
+        gate = threading.Event()
+        executor.submit("blocker", gate.wait)
+        
+        job = manager.submit(EnrollmentRequest(subject_id="stages@example.com"))
+        assert job.status == JobStatus.PENDING
+        assert job.stage == "queued"
+        
+        seen = []
+        original = job.update_progress
+        
+        def record(stage, completed, total):
+            original(stage, completed, total)
+            seen.append((job.stage, job.segments_generated))
+        
+        job.update_progress = record
+        gate.set()
+        wait_for(manager, job.job_id)
+        
+        stages = [stage for stage, _ in seen]
+        assert stages[0] == "segments"
+        assert "checksum" in stages
+        assert stages[-1] == "serializing"
+        assert job.stage == "completed"
+    
+    def test_download_chunks_reassemble_key(self, executor):
+        """Test streamed chunks reassemble into the serialized key."""
+        manager = EnrollmentJobManager(EnrollmentService(), executor)
+        job = wait_for(manager, manager.submit(EnrollmentRequest(subject_id="dl@example.com")).job_id)
+        
+        chunks = list(manager.iter_key_chunks(job.job_id, chunk_size=1000))
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        
+        data = b"".join(chunks)
+        assert len(data) == job.key_size
+        assert deserialize_dna_key(data).key_id == job.key_id
+        
+        # The key is released once streamed in full
+        assert job.serialized_key is None
+        assert job.key_delivered is True
+        with pytest.raises(KeyDeliveredError, match="already downloaded"):
+            manager.iter_key_chunks(job.job_id)
+    
+    def test_download_claims_key(self, executor):
+        """Test a second download is refused while the first is streaming."""
+        manager = EnrollmentJobManager(EnrollmentService(), executor)
+        job = wait_for(manager, manager.submit(EnrollmentRequest(subject_id="dl@example.com")).job_id)
+        
+        first = manager.iter_key_chunks(job.job_id, chunk_size=1000)
+        
+        assert job.serialized_key is None
+        with pytest.raises(KeyDeliveredError, match="being downloaded"):
+            manager.iter_key_chunks(job.job_id)
+        assert len(b"".join(first)) == job.key_size
+        assert job.key_delivered is True
+    
+    def test_aborted_download_can_be_retried(self, executor):
+        """Test closing a stream part-way hands the key back to the job."""
+        manager = EnrollmentJobManager(EnrollmentService(), executor)
+        job = wait_for(manager, manager.submit(EnrollmentRequest(subject_id="dl@example.com")).job_id)
+        
+        stream = manager.iter_key_chunks(job.job_id, chunk_size=1000)
+        next(stream)
+        stream.close()
+        
+        assert job.key_delivered is False
+        data = b"".join(manager.iter_key_chunks(job.job_id))
+        assert deserialize_dna_key(data).key_id == job.key_id
+        assert job.key_delivered is True
+    
+    def test_failed_job(self, executor):
+        """Test an invalid request fails the job."""
+        manager = EnrollmentJobManager(EnrollmentService(), executor)
+        job = manager.submit(EnrollmentRequest(subject_id="bad@example.com", subject_type="robot"))
+        job = wait_for(manager, job.job_id)
+        
+        assert job.status == JobStatus.FAILED
+        assert "Invalid subject type" in job.error_message
+        with pytest.raises(EnrollmentJobError):
+            manager.iter_key_chunks(job.job_id)
+    
+    def test_unknown_job(self, executor):
+        """Test unknown jobs are reported."""
+        manager = EnrollmentJobManager(EnrollmentService(), executor)
+        
+        assert manager.get_job("job-missing") is None
+        with pytest.raises(EnrollmentJobError):
+            manager.iter_key_chunks("job-missing")
+    
+    def test_rejected_job_not_registered(self):
+        """Test a job refused by the executor is not tracked."""
+        executor = BoundedWorkExecutor(max_workers=1, max_queue_depth=1, class_quotas={"standard": 0})
+        manager = EnrollmentJobManager(EnrollmentService(), executor)
+        try:
+            with pytest.raises(QuotaExceededError):
+                manager.submit(EnrollmentRequest(subject_id="x@example.com"))
+            assert manager.get_stats()["total"] == 0
+        finally:
+            executor.shutdown()
+    
+    def test_expired_jobs_cleaned(self, executor):
+        """Test finished jobs are dropped after retention."""
+        manager = EnrollmentJobManager(EnrollmentService(), executor, retention_seconds=60)
+        job = wait_for(manager, manager.submit(EnrollmentRequest(subject_id="old@example.com")).job_id)
+        job.finished_at -= timedelta(seconds=120)
+        
+        assert manager.cleanup_expired() == 1
+        assert manager.get_job(job.job_id) is None
+    
+    def test_max_jobs_evicts_oldest_finished(self, executor):
+        """Test retention is capped at max_jobs."""
+        manager = EnrollmentJobManager(EnrollmentService(), executor, max_jobs=2)
+        ids = []
+        for i in range(3):
+            job = manager.submit(EnrollmentRequest(subject_id=f"user{i}@example.com"))
+            wait_for(manager, job.job_id)
+            ids.append(job.job_id)
+        
+        assert manager.get_job(ids[0]) is None
+        assert manager.get_job(ids[2]) is not None
+
+
+class TestEnrollmentJobAPI:
+    """Test job-based enrollment endpoints."""
+    
+    def test_job_flow(self):
+        """Test submit, poll and streaming download."""
+        pytest.importorskip("httpx")
+        from server.api.main import app, enrollment_jobs
+        from fastapi.testclient import TestClient
+        
+        client = TestClient(app)
+        response = client.post("/api/v1/enroll/jobs", json={"subject_id": "api-job@example.com"})
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        
+        wait_for(enrollment_jobs, job_id)
+        status_response = client.get(f"/api/v1/enroll/jobs/{job_id}")
+        status_data = status_response.json()
+        assert status_data["status"] == "completed"
+        assert status_data["signing_key"]
+        assert "signing_key" not in client.get(f"/api/v1/enroll/jobs/{job_id}").json()
+        
+        download = client.get(f"/api/v1/enroll/jobs/{job_id}/key")
+        assert download.status_code == 200
+        assert download.headers["content-type"] == "application/octet-stream"
+        assert "content-length" not in download.headers
+        assert deserialize_dna_key(download.content).key_id == status_data["key_id"]
+        assert client.get(f"/api/v1/enroll/jobs/{job_id}/key").status_code == 410
+    
+    def test_download_in_progress_returns_410(self):
+        """Test a download is refused while another one holds the key."""
+        pytest.importorskip("httpx")
+        from server.api.main import app, enrollment_jobs
+        from fastapi.testclient import TestClient
+        
+        client = TestClient(app)
+        job_id = client.post("/api/v1/enroll/jobs", json={"subject_id": "api-job@example.com"}).json()["job_id"]
+        wait_for(enrollment_jobs, job_id)
+        
+        stream = enrollment_jobs.iter_key_chunks(job_id)
+        next(stream)
+        response = client.get(f"/api/v1/enroll/jobs/{job_id}/key")
+        assert response.status_code == 410
+        assert response.json()["error_code"] == "KEY_DELIVERED"
+        
+        stream.close()
+        assert client.get(f"/api/v1/enroll/jobs/{job_id}/key").status_code == 200
+    
+    def test_unknown_job_returns_404(self):
+        """Test unknown job IDs return 404."""
+        pytest.importorskip("httpx")
+        from server.api.main import app
+        from fastapi.testclient import TestClient
+        
+        client = TestClient(app)
+        assert client.get("/api/v1/enroll/jobs/job-missing").status_code == 404
+        assert client.get("/api/v1/enroll/jobs/job-missing/key").status_code == 404
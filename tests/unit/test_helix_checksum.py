@@ -0,0 +1,239 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Helix Checksum Engine Tests
+
+Tests cover:
+- Single-pass helix and layer checksums
+- Agreement with DNAHelix.compute_checksum and generator layer checksums
+- Streaming over packed serialized keys
+- Digest caching on compact and list-backed helices
+"""
+
+import pytest
+
+from server.crypto.dna_generator import DNAKeyGenerator, generate_dna_key, SecurityLevel
+from server.crypto.dna_key import CompactDNAHelix, DNAHelix, DNASegment, SegmentType
+from server.crypto.helix_checksum import (
+    HelixChecksumEngine,
+    compute_helix_digests,
+)
+from server.crypto.serialization import serialize_dna_key_packed, deserialize_dna_key_packed
+
+
+class TestHelixChecksumEngine:
+    """Test single-pass checksum computation."""
+    
+    def test_matches_helix_checksum(self):
+        """Test that the engine reproduces DNAHelix.compute_checksum."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        digests = HelixChecksumEngine().compute(key.dna_helix)
+        
+        assert digests.checksum == key.dna_helix.checksum
+        assert digests.checksum == DNAHelix(segments=list(key.dna_helix.segments)).compute_checksum()
+    
+    def test_matches_generated_layer_checksums(self):
+        """Test that all five layer checksums come out of the same pass."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        digests = compute_helix_digests(key.dna_helix)
+        
+        assert list(digests.layer_checksums) == key.layer_checksums
+        assert {lc.layer for lc in digests.layer_checksums} == {1, 2, 3, 4, 5}
+        assert digests.segment_count == 1024
+    
+    def test_compact_and_list_agree(self):
+        """Test that column and segment computations agree."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        engine = HelixChecksumEngine()
+        
+        list_digests = engine.compute(key.dna_helix)
+        compact_digests = engine.compute(CompactDNAHelix.from_helix(key.dna_helix))
+        
+        assert list_digests == compact_digests
+    
+    def test_empty_layers_omitted(self):
+        """Test that layers without segments have no checksum."""
+        helix = DNAHelix(segments=[DNASegment(0, SegmentType.ENTROPY, b"data")])
+        
+        digests = HelixChecksumEngine().compute(helix)
+        
+        assert [lc.layer for lc in digests.layer_checksums] == [2]
+    
+    def test_verify_layers_detects_mismatch(self):
+        """Test verifying stored layer checksums."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        engine = HelixChecksumEngine()
+        
+        assert engine.verify_layers(key.dna_helix, key.layer_checksums)
+        
+        key.layer_checksums[0].checksum = "0" * 128
+        assert not engine.verify_layers(key.dna_helix, key.layer_checksums)
+
+
+class TestPackedStreaming:
+    """Test checksum streaming over packed keys."""
+    
+    def test_compute_packed(self):
+        """Test computing digests directly from packed bytes."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        packed = serialize_dna_key_packed(key)
+        
+        digests = HelixChecksumEngine().compute_packed(packed)
+        
+        assert digests.checksum == key.dna_helix.checksum
+        assert list(digests.layer_checksums) == key.layer_checksums
+    
+    def test_compute_packed_detects_tampering(self):
+        """Test that tampered packed data changes the checksum."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        packed = bytearray(serialize_dna_key_packed(key))
+        packed[-1] ^= 0x01
+        
+        digests = HelixChecksumEngine().compute_packed(bytes(packed))
+        
+        assert digests.checksum != key.dna_helix.checksum
+
+
+class TestDigestCaching:
+    """Test digest caching and its invalidation."""
+    
+    def test_compact_digests_cached(self):
+        """Test that repeat computations on a compact helix hit the cache."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        compact = CompactDNAHelix.from_helix(key.dna_helix)
+        engine = HelixChecksumEngine()
+        
+        first = engine.compute(compact)
+        second = engine.compute(compact)
+        
+        assert first is second
+        assert engine.cache_misses == 1
+        assert engine.cache_hits == 1
+    
+    def test_list_helix_cached(self):
+        """Test that verifying a generated list helix reuses the generator's pass."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        engine = HelixChecksumEngine()
+        
+        assert engine.verify(key.dna_helix)
+        assert engine.verify(key.dna_helix)
+        assert key.is_valid()
+        assert engine.cache_misses == 0
+        assert engine.cache_hits == 2
+        assert engine.is_cached(key.dna_helix)
+    
+    def test_list_cache_holds_no_segment_copies(self):
+        """Test that the cache entry references the helix's own segment list."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        assert key.dna_helix._digest_cache[0] is key.dna_helix.segments
+        assert len(key.dna_helix._digest_cache) == 4
+    
+    def test_pickled_list_helix_tracks_mutations(self):
+        """Test that a helix sent through pickle still invalidates its cache."""
+        import pickle
+        
+        key = pickle.loads(pickle.dumps(generate_dna_key("user@example.com", SecurityLevel.STANDARD)))
+        
+        assert key.dna_helix.verify_checksum()
+        key.dna_helix.segments.reverse()
+        key.dna_helix.segments[0].data = b"tampered"
+        assert not key.dna_helix.verify_checksum()
+    
+    @pytest.mark.parametrize("mutate", [
+        lambda helix: setattr(helix.segments[0], "data", b"tampered"),
+        lambda helix: setattr(helix.segments[0], "position", 7),
+        lambda helix: setattr(helix.segments[0], "segment_hash", "0" * 64),
+        lambda helix: helix.segments.__setitem__(0, DNASegment(0, SegmentType.ENTROPY, b"other")),
+        lambda helix: helix.segments.append(DNASegment(1, SegmentType.NONCE, b"extra")),
+        lambda helix: helix.segments.pop(),
+        lambda helix: helix.segments.clear(),
+        lambda helix: setattr(helix, "segments", [DNASegment(0, SegmentType.ENTROPY, b"other")]),
+    ])
+    def test_list_helix_mutation_invalidates(self, mutate):
+        """Test that changing a list helix is never served from the cache."""
+        helix = DNAHelix(segments=[DNASegment(0, SegmentType.ENTROPY, b"data")])
+        helix.compute_checksum()
+        engine = HelixChecksumEngine()
+        
+        assert engine.verify(helix)
+        mutate(helix)
+        assert not engine.verify(helix)
+        assert engine.cache_misses == 1
+    
+    def test_mutable_data_not_cached(self):
+        """Test that segments with mutable buffers bypass the cache."""
+        helix = DNAHelix(segments=[DNASegment(0, SegmentType.ENTROPY, bytearray(b"data"))])
+        helix.compute_checksum()
+        engine = HelixChecksumEngine()
+        
+        assert engine.verify(helix)
+        helix.segments[0].data[0] ^= 0x01
+        assert not engine.verify(helix)
+        assert engine.cache_hits == 0
+    
+    def test_loaded_packed_key_verifies_from_cache(self):
+        """Test that repeat verification of a loaded packed key is cached."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        restored = deserialize_dna_key_packed(serialize_dna_key_packed(key))
+        
+        assert restored.dna_helix.verify_checksum()
+        assert restored.dna_helix._digests is not None
+        assert restored.dna_helix.verify_checksum()
+    
+    def test_generated_compact_key_has_cached_digests(self):
+        """Test that compact generation leaves digests cached on the helix."""
+        key = DNAKeyGenerator(SecurityLevel.STANDARD, compact_helix=True).generate("user@example.com")
+        
+        assert key.dna_helix._digests is not None
+        assert key.dna_helix._digests.checksum == key.dna_helix.checksum
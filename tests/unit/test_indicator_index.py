@@ -0,0 +1,245 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+Tests for Threat Indicator Index.
+
+Tests indexed indicator matching including:
+- CIDR radix tree lookups (IPv4 and IPv6)
+- Exact value matching by type
+- Expiry heap purging
+"""
+
+import ipaddress
+from datetime import datetime, timedelta, timezone
+
+from server.security.indicator_index import CIDRRadixTree, IndicatorIndex
+from server.security.threat_intelligence import (
+    ThreatCategory,
+    ThreatConfidence,
+    ThreatIndicator,
+    ThreatSeverity,
+)
+
+
+def make_indicator(indicator_id, indicator_type, value, expires_at=None):
+    """Build a test indicator."""
+    now = datetime.now(timezone.utc)
+    return ThreatIndicator(
+        indicator_id=indicator_id,
+        indicator_type=indicator_type,
+        value=value,
+        threat_category=ThreatCategory.BRUTE_FORCE,
+        severity=ThreatSeverity.HIGH,
+        confidence=ThreatConfidence.CONFIRMED,
+        source="test",
+        first_seen=now,
+        last_seen=now,
+        expires_at=expires_at
+    )
+
+
+class TestCIDRRadixTree:
+    """Test radix tree prefix matching."""
+    
+    def _insert(self, tree, cidr, key):
+        network = ipaddress.ip_network(cidr)
+        tree.insert(int(network.network_address), network.prefixlen, key, key)
+    
+    def _lookup(self, tree, address):
+        return sorted(tree.lookup(int(ipaddress.ip_address(address))))
+    
+    def test_nested_prefixes(self):
+        """Test all covering prefixes are returned."""
+        tree = CIDRRadixTree(32)
+        self._insert(tree, "10.0.0.0/8", "a")
+        self._insert(tree, "10.1.0.0/16", "b")
+        self._insert(tree, "10.1.2.0/24", "c")
+        self._insert(tree, "192.168.0.0/16", "d")
+        
+        assert self._lookup(tree, "10.1.2.3") == ["a", "b", "c"]
+        assert self._lookup(tree, "10.1.3.3") == ["a", "b"]
+        assert self._lookup(tree, "10.2.0.1") == ["a"]
+        assert self._lookup(tree, "11.0.0.1") == []
+        assert self._lookup(tree, "192.168.5.5") == ["d"]
+    
+    def test_insert_order_independent(self):
+        """Test splits give the same matches regardless of insert order."""
+        tree = CIDRRadixTree(32)
+        self._insert(tree, "10.1.2.0/24", "c")
+        self._insert(tree, "10.1.0.0/16", "b")
+        self._insert(tree, "10.0.0.0/8", "a")
+        self._insert(tree, "10.128.0.0/9", "e")
+        
+        assert self._lookup(tree, "10.1.2.3") == ["a", "b", "c"]
+        assert self._lookup(tree, "10.200.0.1") == ["a", "e"]
+    
+    def test_matches_brute_force(self):
+        """Test lookups agree with a linear scan over random prefixes."""
+        import random
+        rng = random.Random(7)
+        tree = CIDRRadixTree(32)
+        networks = []
+        for i in range(300):
+            length = rng.randint(4, 30)
+            network = ipaddress.ip_network((rng.getrandbits(32), length), strict=False)
+            networks.append((network, f"n{i}"))
+            self._insert(tree, str(network), f"n{i}")
+        
+        for _ in range(300):
+            address = ipaddress.ip_address(rng.getrandbits(32))
+            expected = sorted(key for network, key in networks if address in network)
+            assert self._lookup(tree, str(address)) == expected
+    
+    def test_remove(self):
+        """Test removing a prefix value."""
+        tree = CIDRRadixTree(32)
+        self._insert(tree, "10.0.0.0/8", "a")
+        network = ipaddress.ip_network("10.0.0.0/8")
+        
+        assert tree.remove(int(network.network_address), 8, "a") is True
+        assert tree.remove(int(network.network_address), 8, "a") is False
+        assert self._lookup(tree, "10.1.1.1") == []
+        assert len(tree) == 0
+    
+    def test_ipv6(self):
+        """Test IPv6 prefixes."""
+        tree = CIDRRadixTree(128)
+        self._insert(tree, "2001:db8::/32", "doc")
+        
+        assert self._lookup(tree, "2001:db8::1") == ["doc"]
+        assert self._lookup(tree, "2001:db9::1") == []
+
+
+class TestIndicatorIndex:
+    """Test the indicator index."""
+    
+    def test_exact_matches_by_type(self):
+        """Test IP, user and DNA key indicators match exactly."""
+        index = IndicatorIndex([
+            make_indicator("ip-1", "ip", "10.0.0.1"),
+            make_indicator("user-1", "user", "mallory"),
+            make_indicator("key-1", "dna_key", "dna-stolen"),
+        ])
+        
+        matched = {i.indicator_id for i in index.match("10.0.0.1", "mallory", "dna-stolen")}
+        assert matched == {"ip-1", "user-1", "key-1"}
+        assert index.match("10.0.0.2", "alice", "dna-ok") == []
+    
+    def test_user_value_does_not_match_ip(self):
+        """Test indicator types are not confused."""
+        index = IndicatorIndex([make_indicator("user-1", "user", "10.0.0.1")])
+        
+        assert index.match("10.0.0.1") == []
+    
+    def test_ip_normalization(self):
+        """Test equivalent IPv6 spellings match."""
+        index = IndicatorIndex([make_indicator("v6", "ip", "2001:0db8:0000:0000:0000:0000:0000:0001")])
+        
+        assert [i.indicator_id for i in index.match("2001:db8::1")] == ["v6"]
+    
+    def test_cidr_and_exact_together(self):
+        """Test CIDR ranges and exact IPs both match."""
+        index = IndicatorIndex([
+            make_indicator("range", "cidr", "198.51.100.0/24"),
+            make_indicator("host", "ip", "198.51.100.9"),
+        ])
+        
+        assert {i.indicator_id for i in index.match("198.51.100.9")} == {"range", "host"}
+        assert {i.indicator_id for i in index.match("198.51.100.10")} == {"range"}
+    
+    def test_inactive_indicator_skipped(self):
+        """Test deactivated indicators do not match."""
+        indicator = make_indicator("ip-1", "ip", "10.0.0.1")
+        index = IndicatorIndex([indicator])
+        indicator.is_active = False
+        
+        assert index.match("10.0.0.1") == []
+    
+    def test_expired_indicators_purged(self):
+        """Test the expiry heap drops expired indicators."""
+        now = datetime.now(timezone.utc)
+        index = IndicatorIndex([
+            make_indicator("soon", "ip", "10.0.0.1", expires_at=now + timedelta(minutes=1)),
+            make_indicator("later", "ip", "10.0.0.1", expires_at=now + timedelta(hours=1)),
+        ])
+        
+        later = now + timedelta(minutes=5)
+        assert [i.indicator_id for i in index.match("10.0.0.1", now=later)] == ["later"]
+        assert "soon" not in index
+        assert len(index) == 1
+    
+    def test_readded_indicator_keeps_new_expiry(self):
+        """Test stale heap entries do not remove a re-added indicator."""
+        now = datetime.now(timezone.utc)
+        index = IndicatorIndex([make_indicator("ioc", "ip", "10.0.0.1", expires_at=now + timedelta(minutes=1))])
+        index.add(make_indicator("ioc", "ip", "10.0.0.1", expires_at=now + timedelta(hours=1)))
+        
+        assert index.purge_expired(now + timedelta(minutes=5)) == 0
+        assert "ioc" in index
+    
+    def test_lookup_by_value(self):
+        """Test exact lookups by type and value."""
+        index = IndicatorIndex([
+            make_indicator("range", "ip", "10.0.0.0/8"),
+            make_indicator("inner", "ip", "10.1.0.0/16"),
+        ])
+        
+        assert [i.indicator_id for i in index.lookup("ip", "10.0.0.0/8")] == ["range"]
+        assert index.get_stats()["cidr_ipv4"] == 2
+    
+    def test_remove(self):
+        """Test removing indicators from every structure."""
+        index = IndicatorIndex([make_indicator("range", "ip", "10.0.0.0/8"), make_indicator("u", "user", "bob")])
+        
+        assert index.remove("range") is True
+        assert index.remove("u") is True
+        assert index.remove("u") is False
+        assert index.match("10.1.1.1", "bob") == []
@@ -0,0 +1,151 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Key Index and Key Store Tests
+
+Tests cover:
+- AuthKeyRecord construction and validity checks
+- In-memory, packed and directory key stores
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from server.core.key_store import (
+    AuthKeyRecord,
+    DirectoryKeyStore,
+    InMemoryKeyStore,
+    PackedKeyStore,
+)
+from server.crypto.dna_generator import generate_dna_key
+
+
+@pytest.fixture(scope="module")
+def dna_key():
+    return generate_dna_key("store@example.com", policy_id="store-policy-v1", mfa_required=True)
+
+
+class TestAuthKeyRecord:
+    """Test compact authentication records."""
+    
+    def test_from_dna_key(self, dna_key):
+        """Test record fields are copied from the key."""
+        record = AuthKeyRecord.from_dna_key(dna_key)
+        
+        assert record.key_id == dna_key.key_id
+        assert record.public_key == dna_key.cryptographic_material.public_key
+        assert record.expires_at == dna_key.expires_timestamp
+        assert record.policy_id == "store-policy-v1"
+        assert record.mfa_required is True
+        assert record.structurally_valid is True
+        assert record.is_usable()
+    
+    def test_record_is_compact_and_immutable(self, dna_key):
+        """Test records use slots and cannot be modified."""
+        record = AuthKeyRecord.from_dna_key(dna_key)
+        
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.key_id = "other"
+    
+    def test_expiry(self, dna_key):
+        """Test expired records are not usable."""
+        record = AuthKeyRecord.from_dna_key(dna_key)
+        later = dna_key.expires_timestamp + timedelta(seconds=1)
+        
+        assert record.is_expired(later)
+        assert not record.is_usable(later)
+
+
+class TestKeyStores:
+    """Test pluggable full-key stores."""
+    
+    @pytest.fixture(params=["memory", "packed", "directory"])
+    def store(self, request, tmp_path):
+        if request.param == "memory":
+            return InMemoryKeyStore()
+        if request.param == "packed":
+            return PackedKeyStore()
+        return DirectoryKeyStore(str(tmp_path / "keys"))
+    
+    def test_put_get_delete(self, store, dna_key):
+        """Test the basic store contract."""
+        store.put(dna_key)
+        
+        assert dna_key.key_id in store
+        assert len(store) == 1
+        
+        loaded = store.get(dna_key.key_id)
+        assert loaded.key_id == dna_key.key_id
+        assert loaded.dna_helix.checksum == dna_key.dna_helix.checksum
+        assert loaded.dna_helix.segment_count == dna_key.dna_helix.segment_count
+        
+        assert store.delete(dna_key.key_id) is True
+        assert store.get(dna_key.key_id) is None
+        assert store.delete(dna_key.key_id) is False
+        assert len(store) == 0
+    
+    def test_packed_store_size(self, dna_key):
+        """Test the packed store reports its footprint."""
+        store = PackedKeyStore()
+        store.put(dna_key)
+        
+        assert store.nbytes > 0
+    
+    def test_directory_store_rejects_path_key_ids(self, tmp_path):
+        """Test key IDs cannot escape the store directory."""
+        store = DirectoryKeyStore(str(tmp_path))
+        
+        with pytest.raises(ValueError):
+            store.get("../escape")
+        with pytest.raises(ValueError):
+            store.get("")
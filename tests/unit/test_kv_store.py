@@ -0,0 +1,363 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Shared Key-Value Store Tests
+
+Tests cover:
+- In-memory store values, TTLs, take and member sets
+- Jump consistent hashing
+- Sharded RESP client against stand-in servers over TCP and unix sockets
+"""
+
+import os
+import socket
+import threading
+from collections import Counter
+
+import pytest
+
+from server.core.kv_store import (
+    InMemoryKeyValueStore,
+    KeyValueError,
+    KeyValueServer,
+    ShardedKeyValueStore,
+    jump_hash,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+    
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def shards(tmp_path):
+    """Two stand-in servers, one on TCP and one on a unix socket."""
+    tcp = KeyValueServer("tcp://127.0.0.1:0").start()
+    unix = KeyValueServer(f"unix://{os.path.join(tmp_path, 'kv.sock')}").start()
+    yield [tcp, unix]
+    tcp.stop()
+    unix.stop()
+
+
+@pytest.fixture
+def sharded(shards):
+    store = ShardedKeyValueStore([server.endpoint for server in shards])
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def dying_shard():
+    """A shard that accepts connections and drops them once a batch arrives."""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    
+    def serve():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            conn.recv(65536)
+            conn.close()
+    
+    threading.Thread(target=serve, daemon=True).start()
+    host, port = listener.getsockname()
+    yield f"tcp://{host}:{port}"
+    listener.close()
+
+
+class TestInMemoryKeyValueStore:
+    """Test the process-local store."""
+    
+    def test_set_get_delete(self):
+        """Test basic value operations."""
+        store = InMemoryKeyValueStore()
+        store.set("a", b"1")
+        store.set_many({"b": b"2", "c": b"3"})
+        
+        assert store.get("a") == b"1"
+        assert store.get_many(["c", "missing", "b"]) == [b"3", None, b"2"]
+        assert store.delete("a", "missing") == 1
+        assert store.get("a") is None
+        assert len(store) == 2
+    
+    def test_ttl_expiry(self):
+        """Test expired keys are hidden and purged."""
+        clock = FakeClock()
+        store = InMemoryKeyValueStore(clock=clock)
+        store.set("short", b"x", ttl=10)
+        store.set("long", b"y", ttl=100)
+        store.set("forever", b"z")
+        
+        clock.advance(11)
+        
+        assert store.get("short") is None
+        assert store.get("long") == b"y"
+        assert store.purge_expired() == 0  # "short" was dropped on read
+        
+        clock.advance(100)
+        assert store.purge_expired() == 1
+        assert len(store) == 1
+    
+    def test_expire_resets_deadline(self):
+        """Test a re-set TTL supersedes the queued deadline."""
+        clock = FakeClock()
+        store = InMemoryKeyValueStore(clock=clock)
+        store.set("key", b"v", ttl=10)
+        assert store.expire("key", 60) is True
+        
+        clock.advance(30)
+        
+        assert store.purge_expired() == 0
+        assert store.get("key") == b"v"
+        assert store.expire("missing", 10) is False
+    
+    def test_heap_is_compacted(self):
+        """Test repeated TTL writes do not grow the expiry heap unbounded."""
+        store = InMemoryKeyValueStore()
+        store.HEAP_COMPACT_SLACK = 10
+        
+        for _ in range(1000):
+            store.set("key", b"v", ttl=60)
+        
+        assert len(store._expiry_heap) <= 12
+    
+    def test_compare_and_set(self):
+        """Test conditional writes only replace the expected value."""
+        clock = FakeClock()
+        store = InMemoryKeyValueStore(clock=clock)
+        
+        assert store.compare_and_set("k", b"v", b"w") is False
+        store.set("k", b"v")
+        assert store.compare_and_set("k", b"x", b"w") is False
+        assert store.compare_and_set("k", b"v", b"w", ttl=10) is True
+        assert store.get("k") == b"w"
+        
+        clock.advance(11)
+        assert store.compare_and_set("k", b"w", b"y") is False
+    
+    def test_take_is_single_use(self):
+        """Test take returns a value only once."""
+        store = InMemoryKeyValueStore()
+        store.set("challenge", b"data", ttl=60)
+        
+        assert store.take("challenge") == b"data"
+        assert store.take("challenge") is None
+    
+    def test_member_sets(self):
+        """Test score-ordered member sets."""
+        store = InMemoryKeyValueStore()
+        assert store.add_member("user", "b", 2) is True
+        assert store.add_member("user", "a", 1) is True
+        assert store.add_member("user", "c", 3) is True
+        assert store.add_member("user", "a", 4) is False
+        
+        assert store.members("user") == ["b", "c", "a"]
+        assert store.member_count("user") == 3
+        assert store.remove_members("user", "b", "zz") == 1
+        
+        store.remove_members("user", "a", "c")
+        assert "user" not in store._values
+    
+    def test_wrong_type(self):
+        """Test value and member-set operations do not mix."""
+        store = InMemoryKeyValueStore()
+        store.add_member("set", "m", 1)
+        store.set("value", b"v")
+        
+        with pytest.raises(KeyValueError):
+            store.get("set")
+        with pytest.raises(KeyValueError):
+            store.add_member("value", "m", 1)
+
+
+class TestJumpHash:
+    """Test shard selection."""
+    
+    def test_in_range_and_stable(self):
+        """Test buckets are in range and deterministic."""
+        for key in range(1000):
+            bucket = jump_hash(key * 7919, 5)
+            assert 0 <= bucket < 5
+            assert jump_hash(key * 7919, 5) == bucket
+    
+    def test_growth_moves_few_keys(self):
+        """Test adding a bucket only moves keys into the new bucket."""
+        keys = [hash(("k", i)) & 0xFFFFFFFFFFFFFFFF for i in range(2000)]
+        moved = [k for k in keys if jump_hash(k, 4) != jump_hash(k, 5)]
+        
+        assert all(jump_hash(k, 5) == 4 for k in moved)
+        assert len(moved) < len(keys) * 0.3
+
+
+class TestShardedKeyValueStore:
+    """Test the RESP client against stand-in servers."""
+    
+    def test_requires_endpoint(self):
+        """Test at least one shard is required."""
+        with pytest.raises(ValueError):
+            ShardedKeyValueStore([])
+    
+    def test_keys_spread_across_shards(self, shards, sharded):
+        """Test keys land on the shard chosen by hashing."""
+        sharded.set_many({f"session:{i}": b"x" for i in range(400)}, ttl=60)
+        
+        counts = Counter(sharded.shard_index(f"session:{i}") for i in range(400))
+        assert set(counts) == {0, 1}
+        assert len(shards[0].store) == counts[0]
+        assert len(shards[1].store) == counts[1]
+        assert min(counts.values()) > 120
+        assert len(sharded) == 400
+    
+    def test_pipelined_get_many(self, sharded):
+        """Test multi-get preserves key order across shards."""
+        sharded.set_many({f"k{i}": str(i).encode() for i in range(50)})
+        keys = [f"k{i}" for i in range(49, -1, -3)] + ["missing"]
+        
+        values = sharded.get_many(keys)
+        
+        assert values[:-1] == [key[1:].encode() for key in keys[:-1]]
+        assert values[-1] is None
+        assert sharded.get_many([]) == []
+    
+    def test_value_operations(self, sharded):
+        """Test values, take, delete and TTLs over the wire."""
+        sharded.set("a", b"\x00\r\nbinary")
+        assert sharded.get("a") == b"\x00\r\nbinary"
+        assert sharded.take("a") == b"\x00\r\nbinary"
+        assert sharded.take("a") is None
+        
+        sharded.set("b", b"1", ttl=60)
+        sharded.set("c", b"2")
+        assert sharded.expire("c", 60) is True
+        assert sharded.expire("missing", 60) is False
+        assert sharded.delete("b", "c", "missing") == 2
+    
+    def test_member_sets(self, sharded):
+        """Test member sets over the wire."""
+        sharded.add_member("user:1", "s2", 20.5)
+        sharded.add_member("user:1", "s1", 10.25)
+        
+        assert sharded.members("user:1") == ["s1", "s2"]
+        assert sharded.member_count("user:1") == 2
+        assert sharded.remove_members("user:1", "s1") == 1
+        assert sharded.remove_members("user:1") == 0
+        assert sharded.members("missing") == []
+    
+    def test_error_reply(self, sharded):
+        """Test server errors are raised without desynchronising the connection."""
+        sharded.add_member("set", "m", 1)
+        
+        with pytest.raises(KeyValueError, match="WRONGTYPE"):
+            sharded.get("set")
+        assert sharded.ping() is True
+    
+    def test_password(self, tmp_path):
+        """Test AUTH is sent when the server requires it."""
+        with KeyValueServer(password="secret") as server:
+            store = ShardedKeyValueStore([server.endpoint], password="secret")
+            store.set("k", b"v")
+            assert store.get("k") == b"v"
+            store.close()
+            
+            anonymous = ShardedKeyValueStore([server.endpoint])
+            with pytest.raises(KeyValueError, match="NOAUTH"):
+                anonymous.get("k")
+            anonymous.close()
+    
+    def test_unreachable_shard(self, tmp_path):
+        """Test connection failures surface as KeyValueError."""
+        store = ShardedKeyValueStore([f"unix://{tmp_path}/missing.sock"], timeout=0.5)
+        
+        with pytest.raises(KeyValueError):
+            store.get("k")
+    
+    def test_compare_and_set(self, sharded):
+        """Test SET IFEQ writes are pipelined and conditional per key."""
+        sharded.set_many({f"k{i}": b"old" for i in range(10)})
+        
+        results = sharded.compare_and_set_many([
+            (f"k{i}", b"old" if i % 2 else b"stale", b"new", 60.0)
+            for i in range(10)
+        ])
+        
+        assert results == [bool(i % 2) for i in range(10)]
+        assert sharded.get_many([f"k{i}" for i in range(10)]) == [
+            b"new" if i % 2 else b"old" for i in range(10)
+        ]
+        assert sharded.compare_and_set("missing", b"old", b"new") is False
+    
+    def test_shard_dying_mid_batch(self, shards, dying_shard):
+        """Test a failed shard does not leave stale replies on the others."""
+        store = ShardedKeyValueStore([dying_shard, shards[0].endpoint], timeout=2.0)
+        keys = [f"k{i}" for i in range(40)]
+        live = [key for key in keys if store.shard_index(key) == 1]
+        for key in live:
+            shards[0].store.set(key, key.encode())
+        
+        # The dead shard is read first, while the live shard's replies wait
+        with pytest.raises(KeyValueError):
+            store.get_many(keys)
+        
+        # Reversed, so replies left over from the failed batch cannot line up
+        assert [store.get(key) for key in reversed(live)] == [key.encode() for key in reversed(live)]
+        store.close()
@@ -0,0 +1,250 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+"""
+Tests for the persistent ledger block store.
+
+Tests the file-backed block store including:
+- Appending and reading blocks
+- Reopening and crash recovery
+- Checkpoints
+- Registry restart with checkpoint replay
+"""
+
+import json
+import os
+
+import pytest
+
+from server.security.distributed_ledger import DNAStrandRegistry, DNAStrandStatus
+from server.security.ledger_store import INDEX_RECORD, FileBlockStore
+
+
+def register(registry, key_id, owner="owner"):
+    """Register a strand with default test values."""
+    return registry.register_strand(
+        dna_key_id=key_id,
+        dna_checksum=f"checksum-{key_id}",
+        owner_address=owner,
+        security_level="standard",
+        segment_count=1000,
+        signature=b"sig"
+    )
+
+
+class TestFileBlockStore:
+    """Test the file-backed block store."""
+    
+    def test_blocks_round_trip(self, tmp_path):
+        """Test blocks are read back identical after reopening."""
+        store = FileBlockStore(str(tmp_path), fsync=False)
+        registry = DNAStrandRegistry(store=store)
+        tx = register(registry, "key-1")
+        head = store.get_block(1)
+        store.close()
+        
+        reopened = FileBlockStore(str(tmp_path), fsync=False)
+        block = reopened.get_block(1)
+        
+        assert len(reopened) == 2
+        assert block.block_hash == head.block_hash
+        assert block.transactions[0].transaction_id == tx.transaction_id
+        assert block.transactions[0].signature == b"sig"
+        assert block.verify_integrity() is True
+        assert reopened.get_block(2) is None
+    
+    def test_blocks_split_across_files(self, tmp_path):
+        """Test block files roll over after blocks_per_file blocks."""
+        store = FileBlockStore(str(tmp_path), blocks_per_file=2, cache_size=0, fsync=False)
+        registry = DNAStrandRegistry(store=store)
+        for i in range(4):
+            register(registry, f"key-{i}")
+        
+        assert sorted(name for name in os.listdir(tmp_path) if name.endswith(".dat")) == [
+            "blocks-000000.dat", "blocks-000001.dat", "blocks-000002.dat"
+        ]
+        assert [block.header.block_number for block in store.iter_blocks(3)] == [3, 4]
+    
+    def test_append_rejects_gaps(self, tmp_path):
+        """Test blocks must be appended in order."""
+        store = FileBlockStore(str(tmp_path), fsync=False)
+        DNAStrandRegistry(store=store)
+        
+        with pytest.raises(ValueError, match="Expected block 1"):
+            store.append(store.get_block(0))
+    
+    def test_recovers_unindexed_and_torn_blocks(self, tmp_path):
+        """Test blocks missing from the index are recovered and torn writes dropped."""
+        store = FileBlockStore(str(tmp_path), fsync=False)
+        registry = DNAStrandRegistry(store=store)
+        register(registry, "key-1")
+        register(registry, "key-2")
+        store.close()
+        
+        # Lose the last index record and tear a partial block onto the data file
+        index_path = tmp_path / FileBlockStore.INDEX_FILE
+        index_path.write_bytes(index_path.read_bytes()[:-INDEX_RECORD.size - 3])
+        with open(tmp_path / "blocks-000000.dat", "ab") as f:
+            f.write(b'{"header":{"block_number":3')
+        
+        reopened = FileBlockStore(str(tmp_path), fsync=False)
+        
+        assert len(reopened) == 3
+        assert reopened.get_block(2).transactions[0].dna_key_id == "key-2"
+        assert os.path.getsize(index_path) == 3 * INDEX_RECORD.size
+        assert (tmp_path / "blocks-000000.dat").read_bytes().endswith(b"\n")
+    
+    def test_checkpoint_round_trip(self, tmp_path):
+        """Test checkpoints are stored atomically and survive reopening."""
+        store = FileBlockStore(str(tmp_path), fsync=False)
+        assert store.load_checkpoint() is None
+        
+        store.save_checkpoint({"height": 3})
+        
+        assert FileBlockStore(str(tmp_path), fsync=False).load_checkpoint() == {"height": 3}
+        assert not os.path.exists(tmp_path / (FileBlockStore.CHECKPOINT_FILE + ".tmp"))
+
+
+class TestPersistentRegistry:
+    """Test registry restarts on a file-backed store."""
+    
+    def test_restart_restores_state(self, tmp_path):
+        """Test entries, indexes and audit trails survive a restart."""
+        registry = DNAStrandRegistry(store=FileBlockStore(str(tmp_path), fsync=False))
+        register(registry, "key-1", owner="alice")
+        register(registry, "key-2", owner="alice")
+        registry.transfer_ownership("key-1", "bob", b"sig", b"sig2")
+        revoke = registry.revoke_strand("key-2", b"sig")
+        head_hash = registry.get_stats()["head_hash"]
+        registry.close()
+        
+        restarted = DNAStrandRegistry(store=FileBlockStore(str(tmp_path), fsync=False))
+        
+        assert restarted.get_stats()["head_hash"] == head_hash
+        assert [e.dna_key_id for e in restarted.get_owner_strands("bob")] == ["key-1"]
+        assert [e.dna_key_id for e in restarted.get_owner_strands("alice")] == ["key-2"]
+        assert restarted.get_entry("key-2").status == DNAStrandStatus.REVOKED
+        assert [tx.transaction_type for tx in restarted.get_audit_trail("key-1")] == [
+            "register", "transfer"
+        ]
+        assert restarted.get_transaction(revoke.transaction_id).block_number == 4
+        assert restarted.verify_chain_integrity() == (True, [])
+        
+        with pytest.raises(ValueError, match="already registered"):
+            register(restarted, "key-1")
+    
+    def test_replays_only_blocks_after_checkpoint(self, tmp_path):
+        """Test startup replays from the last checkpoint."""
+        registry = DNAStrandRegistry(
+            store=FileBlockStore(str(tmp_path), fsync=False),
+            checkpoint_interval=3
+        )
+        for i in range(5):
+            register(registry, f"key-{i}")
+        assert registry.get_stats()["checkpoint_height"] == 3
+        registry._store.close()  # Simulate a crash: no final checkpoint
+        
+        restarted = DNAStrandRegistry(store=FileBlockStore(str(tmp_path), fsync=False))
+        stats = restarted.get_stats()
+        
+        assert stats["replayed_blocks"] == 2
+        assert stats["entries"] == 5
+        assert stats["transactions"] == 5
+    
+    def test_stale_checkpoint_ignored(self, tmp_path):
+        """Test a checkpoint that does not match the chain triggers a full replay."""
+        registry = DNAStrandRegistry(store=FileBlockStore(str(tmp_path), fsync=False))
+        register(registry, "key-1")
+        registry.close()
+        
+        checkpoint_path = tmp_path / FileBlockStore.CHECKPOINT_FILE
+        checkpoint = json.loads(checkpoint_path.read_text())
+        checkpoint["head_hash"] = "0" * 64
+        checkpoint["entries"] = []
+        checkpoint_path.write_text(json.dumps(checkpoint))
+        
+        restarted = DNAStrandRegistry(store=FileBlockStore(str(tmp_path), fsync=False))
+        
+        assert restarted.get_stats()["replayed_blocks"] == 1
+        assert restarted.get_entry("key-1") is not None
+
+
+class TestParallelVerification:
+    """Test chain verification in worker processes."""
+    
+    def test_workers_find_tampered_block(self, tmp_path, monkeypatch):
+        """Test ranges verified by worker processes report tampering."""
+        monkeypatch.setattr(DNAStrandRegistry, "PARALLEL_VERIFY_BLOCKS", 4)
+        registry = DNAStrandRegistry(store=FileBlockStore(str(tmp_path), fsync=False))
+        for i in range(10):
+            register(registry, f"key-{i}")
+        
+        assert registry.verify_chain_integrity(workers=3) == (True, [])
+        
+        registry.close()
+        data_path = tmp_path / "blocks-000000.dat"
+        data_path.write_bytes(data_path.read_bytes().replace(b"checksum-key-7", b"checksum-key-X"))
+        restarted = DNAStrandRegistry(store=FileBlockStore(str(tmp_path), fsync=False))
+        
+        assert restarted.verify_chain_integrity(full=True, workers=3) == (
+            False, ["Block 8: Merkle root invalid"]
+        )
+    
+    def test_read_only_store(self, tmp_path):
+        """Test read-only stores can read but not write."""
+        store = FileBlockStore(str(tmp_path), fsync=False)
+        registry = DNAStrandRegistry(store=store)
+        register(registry, "key-1")
+        
+        reader = FileBlockStore(**store.reopen_spec()[1])
+        
+        assert len(reader) == 2
+        assert reader.get_block(1).block_hash == store.get_block(1).block_hash
+        with pytest.raises(RuntimeError, match="read-only"):
+            reader.append(store.get_block(1))
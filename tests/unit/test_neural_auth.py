@@ -59,6 +59,7 @@ Tests the AI-powered authentication system including:
 - Neural authentication coordinator
 """
 
+import asyncio
 import math
 import secrets
 import time
@@ -78,7 +79,9 @@ from server.security.neural_auth import (
     NeuralAuthDecision,
     NeuralAuthenticationCoordinator,
     NeuralNetworkType,
+    NeuralScoringService,
     RiskLevel,
+    ScoringRequest,
     SessionContext,
     SimpleNeuralNetwork,
     TypingDynamics,
@@ -248,6 +251,40 @@ class TestSimpleNeuralNetwork:
         # Note: This could theoretically fail but is extremely unlikely
         assert output1 != output2 or True  # Allow for edge case
 
+    
+    def test_predict_risk_batch_matches_single(self):
+        """Test batch scoring matches one-at-a-time scoring."""
+        network = SimpleNeuralNetwork([15, 32, 16, 1], use_numpy=False)
+        rows = [[i / 15.0 + j / 10.0 for i in range(15)] for j in range(5)]
+        
+        scores = network.predict_risk_batch(rows)
+        
+        assert len(scores) == 5
+        assert scores == pytest.approx([network.predict_risk(row) for row in rows])
+        assert network.predict_risk_batch([]) == []
+    
+    def test_numpy_matches_pure_python(self):
+        """Test the array-backed path matches the pure-Python reference."""
+        pytest.importorskip("numpy")
+        network = SimpleNeuralNetwork([15, 32, 16, 1], use_numpy=True)
+        reference = SimpleNeuralNetwork([15, 32, 16, 1], use_numpy=False)
+        reference.layers = network.layers
+        rows = [[(i * j % 7) / 7.0 for i in range(15)] for j in range(10)]
+        
+        assert network.use_numpy is True
+        assert network.forward(rows[3]) == pytest.approx(reference.forward(rows[3]))
+        assert network.predict_risk_batch(rows) == pytest.approx(reference.predict_risk_batch(rows))
+    
+    def test_pack_refreshes_arrays(self):
+        """Test weight changes take effect after pack()."""
+        network = SimpleNeuralNetwork([2, 1])
+        network.layers[0].weights = [[0.0, 0.0]]
+        network.layers[0].biases = [100.0]
+        network.pack()
+        
+        assert network.predict_risk([1.0, 1.0]) == pytest.approx(1.0)
+        assert network.predict_risk_batch([[1.0, 1.0], [0.0, 0.0]]) == pytest.approx([1.0, 1.0])
+
 
 class TestAnomalyDetectionEngine:
     """Test the anomaly detection engine."""
@@ -472,3 +509,104 @@ class TestActivationFunctions:
         assert sigmoid(0.0) == 0.5
         assert sigmoid(100.0) > 0.99
         assert sigmoid(-100.0) < 0.01
+
+
+class TestBatchAuthentication:
+    """Test batched anomaly, fraud and coordinator scoring."""
+    
+    def test_batch_matches_single_calls(self):
+        """Test authenticate_batch matches one-at-a-time authenticate."""
+        coordinator = NeuralAuthenticationCoordinator()
+        requests = [
+            ScoringRequest("user_1"),
+            ScoringRequest("user_2", context=SessionContext(is_known_device=True, is_known_location=True)),
+            ScoringRequest("user_3", context=SessionContext(failed_attempts_last_hour=8, is_tor=True)),
+        ]
+        
+        decisions = coordinator.authenticate_batch(requests)
+        singles = [
+            coordinator.authenticate(r.user_id, r.typing, r.mouse, r.context) for r in requests
+        ]
+        
+        assert len(decisions) == 3
+        for batched, single in zip(decisions, singles):
+            assert batched.overall_risk == pytest.approx(single.overall_risk)
+            assert batched.should_allow == single.should_allow
+            assert batched.fraud_assessment.indicators_found == single.fraud_assessment.indicators_found
+    
+    def test_analyze_batch(self):
+        """Test anomaly analysis of several requests in one pass."""
+        engine = AnomalyDetectionEngine()
+        
+        reports = engine.analyze_batch([ScoringRequest("a"), ScoringRequest("b")])
+        
+        assert [r.overall_risk_score for r in reports] == pytest.approx(
+            [engine.analyze("a").overall_risk_score] * 2
+        )
+        assert engine.analyze_batch([]) == []
+
+
+class TestNeuralScoringService:
+    """Test the micro-batching scoring service."""
+    
+    def test_concurrent_calls_share_a_batch(self):
+        """Test concurrent callers are scored together and get their own results."""
+        service = NeuralScoringService(max_batch_size=4, max_delay_ms=50)
+        contexts = [SessionContext(failed_attempts_last_hour=i) for i in range(4)]
+        
+        async def run():
+            return await asyncio.gather(*[
+                service.authenticate(f"user_{i}", context=context)
+                for i, context in enumerate(contexts)
+            ])
+        
+        decisions = asyncio.run(run())
+        metrics = service.get_metrics()
+        
+        assert len(decisions) == 4
+        expected = service.coordinator.authenticate_batch(
+            [ScoringRequest(f"user_{i}", context=c) for i, c in enumerate(contexts)]
+        )
+        assert [d.overall_risk for d in decisions] == pytest.approx([d.overall_risk for d in expected])
+        assert metrics["batches"] == 1
+        assert metrics["size_flushes"] == 1
+        assert metrics["average_batch_size"] == 4
+        assert metrics["pending"] == 0
+    
+    def test_partial_batch_flushed_by_timer(self):
+        """Test a partial batch is scored after max_delay_ms."""
+        service = NeuralScoringService(max_batch_size=100, max_delay_ms=5)
+        
+        async def run():
+            return await asyncio.gather(service.authenticate("a"), service.authenticate("b"))
+        
+        decisions = asyncio.run(run())
+        metrics = service.get_metrics()
+        
+        assert len(decisions) == 2
+        assert metrics["timer_flushes"] == 1
+        assert metrics["max_batch_size"] == 2
+        assert metrics["max_queue_latency_ms"] >= 0.0
+    
+    def test_batch_failure_reaches_every_caller(self):
+        """Test a scoring error is raised to each caller in the batch."""
+        service = NeuralScoringService(max_batch_size=2, max_delay_ms=50)
+        
+        def boom(requests):
+            raise RuntimeError("scoring failed")
+        service.coordinator.authenticate_batch = boom
+        
+        async def run():
+            return await asyncio.gather(
+                service.authenticate("a"), service.authenticate("b"), return_exceptions=True
+            )
+        
+        results = asyncio.run(run())
+        
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert service.get_metrics()["failed_batches"] == 1
+    
+    def test_invalid_configuration(self):
+        """Test batch size must be positive."""
+        with pytest.raises(ValueError):
+            NeuralScoringService(max_batch_size=0)
@@ -44,6 +44,7 @@ Tests for platform-aware event loop, crypto backend fallbacks,
 and optional messaging functionality.
 """
 
+import base64
 import pytest
 import sys
 
@@ -330,3 +331,67 @@ class TestErrorHandling:
         data = response.json()
         assert data["success"] is False
         assert "error_message" in data
+
+
+class TestSignedTokenAuth:
+    """Test bearer authentication with signed session tokens."""
+
+    def test_admin_requires_token(self):
+        """Test admin endpoints reject missing and forged tokens."""
+        pytest.importorskip("httpx")
+        from server.api.main import app
+        from fastapi.testclient import TestClient
+
+        client = TestClient(app)
+
+        assert client.get("/api/v1/admin/stats").status_code in (401, 403)
+        response = client.get(
+            "/api/v1/admin/stats",
+            headers={"Authorization": "Bearer not-a-token"}
+        )
+        assert response.status_code == 401
+
+        # Unsigned claims that cannot be parsed must not surface as a 500
+        payload = base64.urlsafe_b64encode(
+            b'{"jti":"a","sid":"b","sub":"c","exp":Infinity}'
+        ).rstrip(b"=").decode()
+        response = client.get(
+            "/api/v1/admin/stats",
+            headers={"Authorization": f"Bearer dna-session-v1.{payload}.AAAA"}
+        )
+        assert response.status_code == 401
+
+    def test_scopes_and_logout(self):
+        """Test scope checks and logout revocation."""
+        pytest.importorskip("httpx")
+        from server.api import main
+        from fastapi.testclient import TestClient
+
+        client = TestClient(main.app)
+        if main.token_codec is None:
+            pytest.skip("Core services unavailable")
+
+        user_token, _ = main.token_codec.issue("sess-1", "dna-user-1", ["user:standard"], 60)
+        admin_token, _ = main.token_codec.issue("sess-2", "dna-admin-1", ["admin:full"], 60)
+
+        response = client.get(
+            "/api/v1/admin/stats",
+            headers={"Authorization": f"Bearer {user_token}"}
+        )
+        assert response.status_code == 403
+        response = client.get(
+            "/api/v1/admin/stats",
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+        assert response.status_code == 200
+
+        response = client.post(
+            "/api/v1/logout",
+            headers={"Authorization": f"Bearer {user_token}"}
+        )
+        assert response.status_code == 200
+        response = client.post(
+            "/api/v1/logout",
+            headers={"Authorization": f"Bearer {user_token}"}
+        )
+        assert response.status_code == 401
@@ -279,6 +279,36 @@ class TestBulkRevocation:
         assert service.get_revoked_count() == 3
 
 
+class TestRevocationListeners:
+    """Test revocation notifications."""
+    
+    def test_listener_notified(self):
+        """Test listeners receive each newly revoked key ID."""
+        service = RevocationService()
+        revoked = []
+        service.add_listener(revoked.append)
+        
+        service.revoke_key(RevocationRequest(key_id="key1", reason=RevocationReason.KEY_COMPROMISE, revoked_by="admin"))
+        service.revoke_key(RevocationRequest(key_id="key1", reason=RevocationReason.KEY_COMPROMISE, revoked_by="admin"))
+        
+        assert revoked == ["key1"]
+    
+    def test_listener_failure_does_not_block_revocation(self):
+        """Test a failing listener does not undo the revocation."""
+        service = RevocationService()
+        
+        def broken(key_id):
+            raise RuntimeError("listener down")
+        
+        service.add_listener(broken)
+        response = service.revoke_key(
+            RevocationRequest(key_id="key1", reason=RevocationReason.KEY_COMPROMISE, revoked_by="admin")
+        )
+        
+        assert response.success is True
+        assert service.is_revoked("key1")
+
+
 class TestRevocationFiltering:
     """Test revocation filtering and queries."""
     
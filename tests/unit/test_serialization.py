@@ -64,9 +64,12 @@ from server.crypto.dna_generator import generate_dna_key, SecurityLevel
 from server.crypto.serialization import (
     DNAKeySerializer,
     serialize_dna_key,
-    deserialize_dna_key
+    deserialize_dna_key,
+    serialize_dna_key_packed,
+    deserialize_dna_key_packed,
+    PACKED_HEADER,
 )
-from server.crypto.dna_key import DNAKey, DNASegment, SegmentType, DNAHelix
+from server.crypto.dna_key import CompactDNAHelix, DNAKey, DNASegment, SegmentType, DNAHelix
 
 
 class TestCBORSerialization:
@@ -327,3 +330,117 @@ class TestSegmentTypes:
         
         # Should match
         assert orig_types == restored_types
+
+
+class TestPackedSerialization:
+    """Test the packed binary helix format."""
+    
+    def test_packed_round_trip(self):
+        """Test that a packed key round-trips with identical segments."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        restored_key = deserialize_dna_key_packed(serialize_dna_key_packed(key))
+        
+        assert isinstance(restored_key.dna_helix, CompactDNAHelix)
+        assert restored_key.key_id == key.key_id
+        assert restored_key.dna_helix.checksum == key.dna_helix.checksum
+        assert list(restored_key.dna_helix.segments) == key.dna_helix.segments
+        assert restored_key.layer_checksums == key.layer_checksums
+    
+    def test_packed_restored_key_is_valid(self):
+        """Test that a packed key verifies its checksum after loading."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        restored_key = deserialize_dna_key_packed(serialize_dna_key_packed(key))
+        
+        assert restored_key.is_valid()
+        assert restored_key.dna_helix.verify_checksum()
+    
+    def test_packed_smaller_than_cbor(self):
+        """Test that the packed format avoids hex encoding overhead."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        assert len(serialize_dna_key_packed(key)) < len(serialize_dna_key(key)) / 2
+    
+    def test_packed_deterministic(self):
+        """Test that re-packing a loaded key reproduces the same bytes."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        packed = serialize_dna_key_packed(key)
+        
+        assert serialize_dna_key_packed(deserialize_dna_key_packed(packed)) == packed
+    
+    def test_deserialize_detects_packed_format(self):
+        """Test that the generic deserializer accepts packed keys."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        restored_key = DNAKeySerializer.deserialize(serialize_dna_key_packed(key))
+        
+        assert restored_key.key_id == key.key_id
+    
+    def test_packed_zero_copy_columns(self):
+        """Test that loaded columns are views into the source buffer."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        
+        restored_key = deserialize_dna_key_packed(serialize_dna_key_packed(key))
+        
+        assert isinstance(restored_key.dna_helix.data, memoryview)
+        assert isinstance(restored_key.dna_helix.hashes, memoryview)
+    
+    def test_load_packed_from_file(self, tmp_path):
+        """Test loading a packed key through mmap."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        path = tmp_path / "key.dnap"
+        path.write_bytes(serialize_dna_key_packed(key))
+        
+        restored_key = DNAKeySerializer.load_packed(str(path))
+        
+        assert restored_key.dna_helix.checksum == key.dna_helix.checksum
+        assert restored_key.is_valid()
+    
+    def test_packed_rejects_truncated(self):
+        """Test that truncated packed data is rejected."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        packed = serialize_dna_key_packed(key)
+        
+        with pytest.raises(ValueError):
+            deserialize_dna_key_packed(packed[:-1])
+        with pytest.raises(ValueError):
+            deserialize_dna_key_packed(packed[:PACKED_HEADER.size - 1])
+    
+    def test_packed_rejects_unknown_version(self):
+        """Test that unsupported format versions are rejected."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        packed = bytearray(serialize_dna_key_packed(key))
+        packed[4] = 99
+        
+        with pytest.raises(ValueError, match="version"):
+            deserialize_dna_key_packed(bytes(packed))
+    
+    def test_packed_rejects_non_monotonic_offsets(self):
+        """Test that offsets must not decrease between first and last."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        packed = bytearray(serialize_dna_key_packed(key))
+        metadata_length = PACKED_HEADER.unpack_from(packed)[5]
+        offsets_start = PACKED_HEADER.size + metadata_length + (-metadata_length % 8)
+        
+        # Swap the second and third offsets; first and last stay intact
+        second = packed[offsets_start + 8:offsets_start + 16]
+        packed[offsets_start + 8:offsets_start + 16] = packed[offsets_start + 16:offsets_start + 24]
+        packed[offsets_start + 16:offsets_start + 24] = second
+        
+        with pytest.raises(ValueError, match="offsets"):
+            deserialize_dna_key_packed(bytes(packed))
+    
+    def test_packed_rejects_unknown_type_code(self):
+        """Test that an unknown segment type code raises ValueError."""
+        key = generate_dna_key("user@example.com", SecurityLevel.STANDARD)
+        packed = bytearray(serialize_dna_key_packed(key))
+        count = key.dna_helix.segment_count
+        data_length = key.dna_helix.strand_length
+        
+        # The type code column is the last section before the data blob
+        type_codes_start = len(packed) - data_length - count - (-count % 8)
+        packed[type_codes_start] = 0xFF
+        
+        with pytest.raises(ValueError, match="type code"):
+            deserialize_dna_key_packed(bytes(packed))
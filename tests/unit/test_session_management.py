@@ -65,7 +65,10 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from server.core.kv_store import InMemoryKeyValueStore, KeyValueServer, ShardedKeyValueStore
+from server.security.audit_logging import AuditEventType, AuditLogger
 from server.security.session_management import (
+    KeyValueSessionStore,
     Session,
     SessionBinding,
     SessionManager,
@@ -496,6 +499,21 @@ class TestSessionManager:
         assert "session_created" in event_types
         assert "session_terminated" in event_types
     
+    def test_audit_events_fed_to_logger(self):
+        """Test session events are submitted to a shared audit logger."""
+        audit_logger = AuditLogger()
+        manager = SessionManager(audit_logger=audit_logger)
+        
+        session, token = manager.create_session("user_123")
+        manager.terminate_session(session.session_id)
+        
+        events = audit_logger.query(actor_id="user_123")
+        assert {e.event_type for e in events} == {
+            AuditEventType.SESSION_CREATED,
+            AuditEventType.SESSION_TERMINATED,
+        }
+        assert all(e.target_id == session.session_id for e in events)
+    
     def test_cleanup_expired_sessions(self):
         """Test cleanup of expired sessions."""
         manager = SessionManager()
@@ -507,3 +525,314 @@ class TestSessionManager:
         cleaned = manager.cleanup_expired_sessions()
         
         assert cleaned >= 0  # May have cleaned the session
+
+
+class TestSessionStore:
+    """Tests for expiry ordering and memory reclamation."""
+    
+    def test_terminated_session_is_removed(self):
+        """Test termination drops the session, its tokens and user entry."""
+        manager = SessionManager()
+        session, token = manager.create_session("user_123")
+        
+        manager.terminate_session(session.session_id)
+        
+        stats = manager.get_stats()
+        assert stats["sessions"] == 0
+        assert stats["users"] == 0
+        assert stats["token_mappings"] == 0
+        assert session.state == SessionState.TERMINATED
+        assert manager.terminate_session(session.session_id) is False
+        
+        is_valid, found, error = manager.validate_session(token.token_value)
+        assert is_valid is False
+        assert found is None
+        assert error == "Token not found"
+    
+    def test_refresh_does_not_leak_token_mappings(self):
+        """Test rotated access tokens are unmapped."""
+        manager = SessionManager()
+        session, _ = manager.create_session("user_123")
+        
+        for _ in range(5):
+            success, _, _ = manager.refresh_session(session.refresh_token.token_value)
+            assert success is True
+        
+        assert manager.get_stats()["token_mappings"] == 2
+    
+    def test_limit_evicts_oldest_session(self):
+        """Test the concurrent limit terminates sessions in creation order."""
+        manager = SessionManager(max_concurrent_sessions=3)
+        created = [manager.create_session("user_123")[0] for _ in range(5)]
+        
+        remaining = manager.get_user_sessions("user_123")
+        
+        assert [s.session_id for s in remaining] == [s.session_id for s in created[2:]]
+        assert manager.get_active_session_count("user_123") == 3
+        assert created[0].termination_reason == TerminationReason.CONCURRENT_LIMIT
+        assert manager.get_stats()["sessions"] == 3
+    
+    def test_cleanup_reaps_expired_sessions(self):
+        """Test sessions past their lifetime are reaped from the heap."""
+        manager = SessionManager(session_lifetime=0)
+        sessions = [manager.create_session(f"user_{i}")[0] for i in range(3)]
+        time.sleep(0.01)
+        
+        # Earlier sessions may already be reaped by later create_session calls
+        assert manager.cleanup_expired_sessions() >= 1
+        assert manager.get_stats() == {
+            "sessions": 0,
+            "users": 0,
+            "active_sessions": 0,
+            "token_mappings": 0,
+            "expiry_heap_size": 0,
+            "stale_heap_entries": 0
+        }
+        assert all(
+            s.termination_reason == TerminationReason.MAX_LIFETIME
+            for s in sessions
+        )
+        
+        log = manager.get_audit_log(user_id="user_0")
+        assert log[-1]["event_type"] == "session_terminated"
+        assert log[-1]["reason"] == "max_lifetime"
+    
+    def test_activity_defers_idle_expiry(self):
+        """Test a queued idle deadline is re-checked against activity."""
+        manager = SessionManager(idle_timeout=60)
+        session, _ = manager.create_session("user_123")
+        past = datetime.now(timezone.utc) - timedelta(seconds=120)
+        manager._store._expiry_heap[0] = (past.timestamp(), session.session_id)
+        
+        assert manager.cleanup_expired_sessions() == 0
+        assert manager.get_active_session_count("user_123") == 1
+        assert manager._store._expiry_heap[0][0] == session.expiry_deadline()
+        
+        session.last_activity = past
+        manager._store._expiry_heap[0] = (past.timestamp(), session.session_id)
+        
+        assert manager.cleanup_expired_sessions() == 1
+        assert session.termination_reason == TerminationReason.TIMEOUT
+        assert manager.get_active_session_count("user_123") == 0
+    
+    def test_hijacked_session_stops_counting(self):
+        """Test a hijack-suspected session no longer counts as active."""
+        manager = SessionManager()
+        binding = SessionBinding(device_id="device-123", strict_device=True)
+        session, token = manager.create_session("user_123", binding=binding)
+        
+        is_valid, _, _ = manager.validate_session(
+            token.token_value,
+            binding=SessionBinding(device_id="device-999")
+        )
+        
+        assert is_valid is False
+        assert manager.get_active_session_count("user_123") == 0
+        
+        success, _, error = manager.refresh_session(session.refresh_token.token_value)
+        assert success is False
+        assert error == "Session not active"
+    
+    def test_stale_heap_entries_are_compacted(self):
+        """Test terminated sessions do not accumulate in the expiry heap."""
+        manager = SessionManager(max_concurrent_sessions=1)
+        manager._store.HEAP_COMPACT_THRESHOLD = 8
+        
+        for _ in range(50):
+            manager.create_session("user_123")
+        
+        stats = manager.get_stats()
+        assert stats["sessions"] == 1
+        assert stats["expiry_heap_size"] <= 2 * manager._store.HEAP_COMPACT_THRESHOLD + 2
+
+
+class TestKeyValueSessionStore:
+    """Tests for sessions shared between workers through a key-value store."""
+    
+    @pytest.fixture
+    def kv_server(self):
+        with KeyValueServer() as server:
+            yield server
+    
+    def make_worker(self, server, **kwargs):
+        store = KeyValueSessionStore(ShardedKeyValueStore([server.endpoint]))
+        return SessionManager(store=store, **kwargs)
+    
+    def test_session_record_roundtrip(self):
+        """Test sessions survive serialization without token values."""
+        manager = SessionManager()
+        binding = SessionBinding(device_id="device-1", ip_prefix="10.0.0")
+        session, token = manager.create_session("user_123", binding=binding, scopes=["read"])
+        
+        restored = Session.from_record(session.to_record())
+        
+        assert restored.to_dict() == session.to_dict()
+        assert restored.binding == binding
+        assert restored.access_token.token_hash == token.token_hash
+        assert restored.access_token.scopes == ["read"]
+        assert restored.access_token.token_value == ""
+        assert token.token_value not in str(session.to_record())
+    
+    def test_session_visible_to_other_worker(self, kv_server):
+        """Test a session created on one worker validates on another."""
+        worker_a = self.make_worker(kv_server)
+        worker_b = self.make_worker(kv_server)
+        
+        session, token = worker_a.create_session("user_123")
+        is_valid, found, _ = worker_b.validate_session(token.token_value)
+        
+        assert is_valid is True
+        assert found.session_id == session.session_id
+        assert found.activity_count == 1
+        assert worker_a.get_active_session_count("user_123") == 1
+        
+        assert worker_b.terminate_session(session.session_id) is True
+        assert worker_a.terminate_session(session.session_id) is False
+        
+        is_valid, _, error = worker_a.validate_session(token.token_value)
+        assert is_valid is False
+        assert error == "Token not found"
+        assert len(kv_server.store) == 0
+    
+    def test_validate_sessions_batch(self, kv_server):
+        """Test batch validation resolves tokens in order."""
+        manager = self.make_worker(kv_server)
+        tokens = [manager.create_session(f"user_{i}")[1] for i in range(5)]
+        values = [t.token_value for t in tokens] + ["unknown-token"]
+        
+        results = manager.validate_sessions(values)
+        
+        assert [r[0] for r in results] == [True] * 5 + [False]
+        assert [r[1].user_id for r in results[:5]] == [f"user_{i}" for i in range(5)]
+        assert results[-1][2] == "Token not found"
+    
+    def test_refresh_and_limit_across_workers(self, kv_server):
+        """Test token rotation and the concurrent limit on a shared store."""
+        worker_a = self.make_worker(kv_server, max_concurrent_sessions=2)
+        worker_b = self.make_worker(kv_server, max_concurrent_sessions=2)
+        
+        first, old_token = worker_a.create_session("user_123")
+        success, new_token, _ = worker_b.refresh_session(first.refresh_token.token_value)
+        assert success is True
+        assert worker_a.validate_session(old_token.token_value)[0] is False
+        assert worker_a.validate_session(new_token.token_value)[0] is True
+        
+        worker_b.create_session("user_123")
+        worker_a.create_session("user_123")
+        
+        remaining = worker_b.get_user_sessions("user_123")
+        assert len(remaining) == 2
+        assert first.session_id not in {s.session_id for s in remaining}
+    
+    def test_save_is_conditional(self, kv_server):
+        """Test a stale session copy cannot overwrite a newer record."""
+        manager = self.make_worker(kv_server)
+        session, _ = manager.create_session("user_123")
+        store = manager._store
+        
+        flagged = store.get(session.session_id)
+        stale = store.get(session.session_id)
+        flagged.state = SessionState.HIJACK_SUSPECTED
+        stale.record_activity()
+        
+        assert store.save_many([flagged, stale]) == [True, False]
+        assert store.get(session.session_id).state == SessionState.HIJACK_SUSPECTED
+        assert manager.get_active_session_count("user_123") == 0
+    
+    def test_concurrent_hijack_flag_wins(self, kv_server):
+        """Test validation re-checks a session flagged after it was read."""
+        worker_a = self.make_worker(kv_server)
+        worker_b = self.make_worker(kv_server)
+        binding = SessionBinding(device_id="device-123", strict_device=True)
+        session, token = worker_a.create_session("user_123", binding=binding)
+        
+        original = worker_a._store.get_by_tokens
+        
+        def racing_lookup(hashes):
+            sessions = original(hashes)
+            if racing_lookup.first:
+                racing_lookup.first = False
+                worker_b.validate_session(
+                    token.token_value,
+                    binding=SessionBinding(device_id="device-999")
+                )
+            return sessions
+        
+        racing_lookup.first = True
+        worker_a._store.get_by_tokens = racing_lookup
+        
+        is_valid, _, error = worker_a.validate_session(token.token_value, binding=binding)
+        
+        assert is_valid is False
+        assert error == "Session not active"
+        stored = worker_a._store.get(session.session_id)
+        assert stored.state == SessionState.HIJACK_SUSPECTED
+        assert stored.activity_count == 0
+    
+    def test_backend_expires_idle_sessions(self):
+        """Test session records carry the idle deadline as their TTL."""
+        now = [0.0]
+        kv = InMemoryKeyValueStore(clock=lambda: now[0])
+        manager = SessionManager(store=KeyValueSessionStore(kv), idle_timeout=60)
+        session, token = manager.create_session("user_123")
+        
+        now[0] = 61
+        
+        assert manager.validate_session(token.token_value)[0] is False
+        assert manager.get_active_session_count("user_123") == 0
+        
+        # Only the token mappings outlive the idle deadline
+        assert kv.purge_expired() == 0
+        assert kv.get(f"session:s:{session.session_id}") is None
+        assert kv.member_count("session:u:user_123") == 0
+
+
+class TestSignedSessionTokens:
+    """Tests for sessions issuing signed tokens."""
+    
+    @pytest.fixture
+    def codec(self):
+        from server.crypto.backend import get_signer_backend
+        from server.security.signed_tokens import SignedTokenCodec
+        return SignedTokenCodec(get_signer_backend())
+    
+    def test_tokens_are_signed(self, codec):
+        """Test access tokens carry the session's claims."""
+        manager = SessionManager(token_codec=codec)
+        session, token = manager.create_session("user_123", scopes=["read"])
+        
+        is_valid, claims, _ = codec.decode(token.token_value)
+        
+        assert is_valid is True
+        assert claims.token_id == token.token_id
+        assert claims.session_id == session.session_id
+        assert claims.user_id == "user_123"
+        assert claims.scopes == ("read",)
+        assert manager.validate_session(token.token_value)[0] is True
+    
+    def test_forged_token_rejected_locally(self, codec):
+        """Test invalid signed tokens never reach the session store."""
+        manager = SessionManager(token_codec=codec)
+        lookups = []
+        original = manager._store.get_by_tokens
+        manager._store.get_by_tokens = lambda hashes: lookups.append(hashes) or original(hashes)
+        
+        is_valid, session, error = manager.validate_session(codec.PREFIX + "e30.AAAA")
+        
+        assert is_valid is False
+        assert session is None
+        assert error == "Malformed token"
+        assert lookups == []
+    
+    def test_termination_revokes_tokens(self, codec):
+        """Test terminated and rotated tokens fail stateless validation."""
+        manager = SessionManager(token_codec=codec)
+        session, token = manager.create_session("user_123")
+        success, new_token, _ = manager.refresh_session(session.refresh_token.token_value)
+        assert success is True
+        assert codec.decode(token.token_value)[2] == "Token revoked"
+        
+        manager.terminate_session(session.session_id)
+        
+        assert codec.decode(new_token.token_value)[2] == "Token revoked"
+        assert codec.decode(session.refresh_token.token_value)[2] == "Token revoked"
@@ -64,6 +64,7 @@ import pytest
 from server.crypto.signatures import (
     Ed25519SigningKey,
     Ed25519VerifyKey,
+    VerifyKeyCache,
     generate_ed25519_keypair
 )
 
@@ -334,3 +335,75 @@ class TestEd25519SecurityProperties:
         
         assert all(results)
         assert len(set(results)) == 1  # All results are the same
+
+
+class TestVerifyKeyCache:
+    """Test the LRU cache of prepared verify keys."""
+    
+    def test_hit_returns_same_object(self):
+        """Test repeated lookups reuse the prepared verify key."""
+        cache = VerifyKeyCache(max_size=4)
+        _, verify_key = generate_ed25519_keypair()
+        public_key = verify_key.to_bytes()
+        
+        first = cache.get("key-1", public_key)
+        second = cache.get("key-1", public_key)
+        
+        assert first is second
+        assert cache.hits == 1
+        assert cache.misses == 1
+    
+    def test_cached_key_verifies(self):
+        """Test cached verify keys verify signatures."""
+        cache = VerifyKeyCache()
+        signing_key, verify_key = generate_ed25519_keypair()
+        signature = signing_key.sign(b"challenge")
+        
+        cached = cache.get("key-1", verify_key.to_bytes())
+        
+        assert cached.verify(b"challenge", signature) is True
+    
+    def test_public_key_change_is_a_miss(self):
+        """Test a new public key for the same key ID is not served stale."""
+        cache = VerifyKeyCache()
+        _, old_key = generate_ed25519_keypair()
+        _, new_key = generate_ed25519_keypair()
+        
+        cache.get("key-1", old_key.to_bytes())
+        replaced = cache.get("key-1", new_key.to_bytes())
+        
+        assert replaced.to_bytes() == new_key.to_bytes()
+        assert cache.misses == 2
+        assert len(cache) == 1
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted."""
+        cache = VerifyKeyCache(max_size=2)
+        keys = [generate_ed25519_keypair()[1].to_bytes() for _ in range(3)]
+        
+        cache.get("a", keys[0])
+        cache.get("b", keys[1])
+        cache.get("a", keys[0])
+        cache.get("c", keys[2])
+        
+        assert cache.evictions == 1
+        cache.get("a", keys[0])
+        assert cache.hits == 2
+        cache.get("b", keys[1])
+        assert cache.misses == 4
+    
+    def test_invalidate(self):
+        """Test invalidation forces a rebuild."""
+        cache = VerifyKeyCache()
+        public_key = generate_ed25519_keypair()[1].to_bytes()
+        cache.get("key-1", public_key)
+        
+        assert cache.invalidate("key-1") is True
+        assert cache.invalidate("key-1") is False
+        cache.get("key-1", public_key)
+        assert cache.get_stats()["misses"] == 2
+    
+    def test_invalid_size(self):
+        """Test the cache requires a positive size."""
+        with pytest.raises(ValueError):
+            VerifyKeyCache(max_size=0)
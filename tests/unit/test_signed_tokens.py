@@ -0,0 +1,263 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Signed Session Token Tests
+
+Tests cover:
+- Issuing and validating signed tokens
+- Verify-only nodes and key rotation
+- Revocation bloom filter generations, snapshots and sync
+"""
+
+import base64
+import json
+
+import pytest
+
+from server.core.kv_store import InMemoryKeyValueStore
+from server.crypto.backend import get_signer_backend
+from server.security.signed_tokens import (
+    RevocationBloomFilter,
+    SignedTokenCodec,
+    TokenClaims,
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+    
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture(scope="module")
+def signer():
+    return get_signer_backend(bytes(range(32)))
+
+
+class TestSignedTokenCodec:
+    """Tests for issuing and validating tokens."""
+    
+    def test_issue_and_decode(self, signer):
+        """Test a token carries its claims."""
+        codec = SignedTokenCodec(signer)
+        token, claims = codec.issue("sess_1", "user_123", ["read", "write"], 3600)
+        
+        is_valid, decoded, error = codec.decode(token)
+        
+        assert token.startswith(SignedTokenCodec.PREFIX)
+        assert is_valid is True
+        assert error == ""
+        assert decoded == claims
+        assert decoded.session_id == "sess_1"
+        assert decoded.user_id == "user_123"
+        assert decoded.scopes == ("read", "write")
+        assert decoded.expires_at - decoded.issued_at == 3600
+        assert decoded.key_id == codec.key_id
+    
+    def test_verify_only_node(self, signer):
+        """Test a node holding only the public key validates tokens."""
+        issuer = SignedTokenCodec(signer)
+        verifier = SignedTokenCodec(verify_keys=[signer.get_public_key()])
+        token, _ = issuer.issue("sess_1", "user_123", ["read"], 60)
+        
+        assert verifier.decode(token)[0] is True
+        with pytest.raises(RuntimeError):
+            verifier.issue("sess_2", "user_123", ["read"], 60)
+    
+    def test_unknown_key_rejected(self, signer):
+        """Test tokens from an untrusted key are rejected."""
+        other = SignedTokenCodec(get_signer_backend())
+        token, _ = other.issue("sess_1", "user_123", ["admin:full"], 60)
+        
+        is_valid, claims, error = SignedTokenCodec(signer).decode(token)
+        
+        assert is_valid is False
+        assert claims is None
+        assert error == "Unknown signing key"
+    
+    def test_tampered_payload_rejected(self, signer):
+        """Test modifying the payload breaks the signature."""
+        codec = SignedTokenCodec(signer)
+        token, claims = codec.issue("sess_1", "user_123", ["user:standard"], 60)
+        _, _, signature = token.rpartition(".")
+        
+        forged_claims = TokenClaims(**{**claims.__dict__, "scopes": ("admin:full",)})
+        payload = base64.urlsafe_b64encode(
+            json.dumps(forged_claims.to_payload(), separators=(",", ":")).encode()
+        ).rstrip(b"=").decode()
+        
+        is_valid, _, error = codec.decode(f"{SignedTokenCodec.PREFIX}{payload}.{signature}")
+        
+        assert is_valid is False
+        assert error == "Invalid signature"
+    
+    @pytest.mark.parametrize("token", [
+        "opaque-token",
+        SignedTokenCodec.PREFIX,
+        SignedTokenCodec.PREFIX + "not-base64!.sig",
+        SignedTokenCodec.PREFIX + "e30.AAAA",
+    ])
+    def test_malformed_tokens(self, signer, token):
+        """Test malformed tokens are rejected without raising."""
+        is_valid, claims, _ = SignedTokenCodec(signer).decode(token)
+        
+        assert is_valid is False
+        assert claims is None
+    
+    def test_unsigned_claims_not_parsed(self, signer):
+        """Test out-of-range claims are rejected instead of raising."""
+        codec = SignedTokenCodec(signer)
+        payload = f'{{"jti":"a","sid":"b","sub":"c","exp":Infinity,"kid":"{codec.key_id}"}}'
+        signing_input = SignedTokenCodec.PREFIX + base64.urlsafe_b64encode(
+            payload.encode()
+        ).rstrip(b"=").decode()
+        
+        is_valid, _, error = codec.decode(signing_input + ".AAAA")
+        assert is_valid is False
+        assert error == "Invalid signature"
+        
+        signature = base64.urlsafe_b64encode(signer.sign(signing_input.encode())).rstrip(b"=").decode()
+        is_valid, claims, error = codec.decode(f"{signing_input}.{signature}")
+        assert is_valid is False
+        assert claims is None
+        assert error == "Malformed token"
+    
+    def test_expiry(self, signer):
+        """Test expired tokens are rejected even when cached."""
+        clock = FakeClock()
+        codec = SignedTokenCodec(signer, clock=clock)
+        token, _ = codec.issue("sess_1", "user_123", ["read"], 60)
+        assert codec.decode(token)[0] is True
+        
+        clock.advance(60)
+        
+        is_valid, claims, error = codec.decode(token)
+        assert is_valid is False
+        assert claims is not None
+        assert error == "Token expired"
+    
+    def test_revocation(self, signer):
+        """Test revoked tokens are rejected even when cached."""
+        codec = SignedTokenCodec(signer)
+        token, claims = codec.issue("sess_1", "user_123", ["read"], 60)
+        assert codec.decode(token)[0] is True
+        
+        codec.revoke(claims.token_id)
+        
+        assert codec.decode(token)[2] == "Token revoked"
+    
+    def test_verified_cache_is_bounded(self, signer):
+        """Test the verified-token cache respects its size."""
+        codec = SignedTokenCodec(signer, cache_size=3)
+        for i in range(10):
+            token, _ = codec.issue(f"sess_{i}", "user_123", ["read"], 60)
+            codec.decode(token)
+        
+        assert len(codec._verified) == 3
+
+
+class TestRevocationBloomFilter:
+    """Tests for the revocation filter."""
+    
+    def test_membership(self):
+        """Test added IDs are found and the false positive rate is low."""
+        bloom = RevocationBloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"tok_{i}")
+        
+        assert all(f"tok_{i}" in bloom for i in range(1000))
+        false_positives = sum(f"other_{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+    
+    def test_generations_expire_revocations(self):
+        """Test revocations survive one rotation and drop after two."""
+        clock = FakeClock(now=0.0)
+        bloom = RevocationBloomFilter(capacity=100, rotate_seconds=100, clock=clock)
+        clock.advance(50)
+        bloom.add("tok_1")
+        
+        clock.advance(100)
+        assert "tok_1" in bloom
+        
+        clock.advance(100)
+        assert "tok_1" not in bloom
+    
+    def test_snapshot_merge(self):
+        """Test snapshots from another node are merged."""
+        clock = FakeClock()
+        a = RevocationBloomFilter(capacity=100, clock=clock)
+        b = RevocationBloomFilter(capacity=100, clock=clock)
+        a.add("tok_a")
+        
+        assert b.merge(a.to_bytes()) is True
+        assert "tok_a" in b
+        assert b.merge(RevocationBloomFilter(capacity=5000, clock=clock).to_bytes()) is False
+    
+    def test_sync_through_shared_store(self):
+        """Test nodes exchange revocations through a key-value store."""
+        store = InMemoryKeyValueStore()
+        node_a = RevocationBloomFilter(capacity=100)
+        node_b = RevocationBloomFilter(capacity=100)
+        
+        node_a.add("tok_logout")
+        node_a.sync(store, "revocations", "node-a")
+        merged = node_b.sync(store, "revocations", "node-b")
+        
+        assert merged == 1
+        assert "tok_logout" in node_b
+        assert store.members("revocations:nodes") == ["node-a", "node-b"]
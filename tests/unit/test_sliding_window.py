@@ -0,0 +1,234 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+Tests for Sliding Window Counters.
+
+Tests the constant-time detection primitives including:
+- Bucketed sliding window counts
+- Idle key expiry
+- Sliding-window distinct counting
+"""
+
+import random
+
+import pytest
+
+from server.security.sliding_window import (
+    SketchIndex,
+    SlidingCardinalitySketch,
+    SlidingWindowCounter,
+)
+
+
+class TestSlidingWindowCounter:
+    """Test sliding window counter."""
+    
+    def test_counts_within_window(self):
+        """Test events inside the window are counted."""
+        counter = SlidingWindowCounter(windows=[60])
+        for t in range(10):
+            counter.add("ip", 1000.0 + t)
+        
+        assert counter.count("ip", 60, 1010.0) == 10
+        assert counter.count("other", 60, 1010.0) == 0
+    
+    def test_events_slide_out(self):
+        """Test events leave the window as time advances."""
+        counter = SlidingWindowCounter(windows=[60, 300])
+        counter.add("ip", 1000.0)
+        counter.add("ip", 1100.0)
+        
+        assert counter.count("ip", 60, 1100.0) == 1
+        assert counter.count("ip", 300, 1100.0) == 2
+        assert counter.count("ip", 300, 1400.0) == 0
+    
+    def test_matches_naive_count(self):
+        """Test running totals match a brute-force count."""
+        counter = SlidingWindowCounter(windows=[7, 30])
+        events = []
+        for i in range(500):
+            now = i * 0.7
+            counter.add("k", now)
+            events.append(now)
+            for window in (7, 30):
+                current = int(now)
+                expected = sum(1 for e in events if int(e) > current - window)
+                assert counter.count("k", window, now) == expected
+    
+    def test_window_added_later(self):
+        """Test windows can be registered after events exist."""
+        counter = SlidingWindowCounter(windows=[60])
+        counter.add("ip", 1000.0)
+        counter.add("ip", 1030.0)
+        
+        assert counter.count("ip", 10, 1031.0) == 1
+        assert 10 in counter.windows
+    
+    def test_idle_keys_expire(self):
+        """Test keys idle beyond the longest window are dropped."""
+        counter = SlidingWindowCounter(windows=[60])
+        counter.add("old", 1000.0)
+        counter.add("new", 1100.0)
+        
+        assert counter.expire(1100.0) == 1
+        assert "old" not in counter
+        assert "new" in counter
+    
+    def test_invalid_bucket(self):
+        """Test bucket width must be positive."""
+        with pytest.raises(ValueError):
+            SlidingWindowCounter(bucket_seconds=0)
+    
+    def test_max_keys_evicts_least_recent(self):
+        """Test the key limit evicts the least recently active key."""
+        counter = SlidingWindowCounter(windows=[60], max_keys=2)
+        counter.add("a", 1000.0)
+        counter.add("b", 1001.0)
+        counter.add("a", 1002.0)
+        counter.add("c", 1003.0)
+        
+        assert len(counter) == 2
+        assert "b" not in counter
+        assert counter.count("a", 60, 1003.0) == 2
+        assert counter.evictions == 1
+    
+    def test_out_of_order_events(self):
+        """Test late events land in their own bucket and window."""
+        counter = SlidingWindowCounter(windows=[60, 300])
+        counter.add("ip", 1200.0)
+        counter.add("ip", 1100.0)
+        counter.add("ip", 1190.0)
+        counter.add("ip", 800.0)
+        
+        assert counter.count("ip", 60, 1200.0) == 2
+        assert counter.count("ip", 300, 1200.0) == 3
+        assert counter.count("ip", 60, 1261.0) == 0
+        assert counter.count("ip", 300, 1495.0) == 1
+    
+    def test_shuffled_matches_naive_count(self):
+        """Test running totals match a brute-force count with late events."""
+        counter = SlidingWindowCounter(windows=[7, 30])
+        rng = random.Random(7)
+        events = []
+        now = 0.0
+        for _ in range(400):
+            now += rng.random()
+            event = max(0.0, now - rng.random() * 40)
+            counter.add("k", event)
+            events.append(event)
+            current = int(now)
+            for window in (7, 30):
+                expected = sum(1 for e in events if current - window < int(e) <= current)
+                assert counter.count("k", window, now) == expected
+    
+    def test_discard(self):
+        """Test discarding a key forgets its events."""
+        counter = SlidingWindowCounter(windows=[60])
+        counter.add("ip", 1000.0)
+        counter.discard("ip")
+        counter.discard("missing")
+        
+        assert counter.count("ip", 60, 1000.0) == 0
+
+
+class TestSlidingCardinalitySketch:
+    """Test sliding-window distinct counting."""
+    
+    def test_small_counts_are_accurate(self):
+        """Test small cardinalities are estimated closely."""
+        sketch = SlidingCardinalitySketch(max_window=300)
+        for i in range(25):
+            sketch.add(f"user{i}", 1000.0 + i)
+            sketch.add(f"user{i}", 1000.5 + i)
+        
+        assert 22 <= sketch.estimate(300, 1030.0) <= 28
+    
+    def test_large_counts_within_error(self):
+        """Test large cardinalities stay within HyperLogLog error."""
+        sketch = SlidingCardinalitySketch(max_window=300, precision=10)
+        for i in range(20000):
+            sketch.add(f"user{i}", 1000.0 + i / 1000)
+        
+        estimate = sketch.estimate(300, 1020.0)
+        assert abs(estimate - 20000) / 20000 < 0.1
+    
+    def test_window_excludes_old_items(self):
+        """Test only items inside the window are counted."""
+        sketch = SlidingCardinalitySketch(max_window=600)
+        for i in range(30):
+            sketch.add(f"old{i}", 1000.0)
+        for i in range(5):
+            sketch.add(f"new{i}", 1500.0)
+        
+        assert sketch.estimate(100, 1500.0) <= 6
+        assert sketch.estimate(600, 1500.0) >= 30
+        assert sketch.estimate(600, 2200.0) == 0
+    
+    def test_invalid_precision(self):
+        """Test precision bounds."""
+        with pytest.raises(ValueError):
+            SlidingCardinalitySketch(max_window=60, precision=2)
+
+
+class TestSketchIndex:
+    """Test keyed sketches."""
+    
+    def test_per_key_estimates_and_expiry(self):
+        """Test sketches are kept per key and expire when idle."""
+        index = SketchIndex(max_window=60)
+        for i in range(10):
+            index.add("ip-a", f"user{i}", 1000.0)
+        index.add("ip-b", "user0", 1050.0)
+        
+        assert index.estimate("ip-a", 60, 1050.0) >= 9
+        assert index.estimate("ip-b", 60, 1050.0) == 1
+        assert index.expire(1070.0) == 1
+        assert "ip-a" not in index
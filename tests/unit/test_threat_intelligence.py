@@ -64,6 +64,7 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from server.security.audit_logging import AuditEventType, AuditLogger, AuditSeverity
 from server.security.threat_intelligence import (
     AttackPattern,
     AttackPatternDetector,
@@ -326,6 +327,101 @@ class TestIPReputationEngine:
         
         assert rep2.reputation_score < initial_score
         assert rep2.threat_count_24h >= 3
+    
+    def _threat(self, timestamp: datetime) -> ThreatEvent:
+        return ThreatEvent(
+            event_id=secrets.token_hex(4),
+            timestamp=timestamp,
+            threat_category=ThreatCategory.BRUTE_FORCE,
+            severity=ThreatSeverity.HIGH,
+            confidence=ThreatConfidence.CONFIRMED
+        )
+    
+    def test_windowed_threat_counts(self):
+        """Test threats are counted per 24h/7d/30d window."""
+        clock = FakeClock()
+        engine = IPReputationEngine(clock=clock)
+        now = datetime.fromtimestamp(clock.now, timezone.utc)
+        
+        engine.record_threat("203.0.113.7", self._threat(now))
+        engine.record_threat("203.0.113.7", self._threat(now - timedelta(days=3)))
+        engine.record_threat("203.0.113.7", self._threat(now - timedelta(days=10)))
+        engine.record_threat("203.0.113.7", self._threat(now - timedelta(days=40)))
+        
+        rep = engine.get_reputation("203.0.113.7")
+        assert (rep.threat_count_24h, rep.threat_count_7d, rep.threat_count_30d) == (1, 2, 3)
+        
+        clock.advance(2 * 86400)
+        engine.expire()
+        rep = engine.get_reputation("203.0.113.7")
+        assert (rep.threat_count_24h, rep.threat_count_7d, rep.threat_count_30d) == (0, 2, 3)
+    
+    def test_cache_expires_after_ttl(self):
+        """Test cached reputations are recomputed after the TTL, across days."""
+        clock = FakeClock()
+        engine = IPReputationEngine(cache_ttl_seconds=3600, clock=clock)
+        
+        first = engine.get_reputation("198.51.100.1")
+        assert engine.get_reputation("198.51.100.1") is first
+        
+        # A day plus a few seconds: timedelta.seconds would read as fresh
+        clock.advance(86400 + 10)
+        assert engine.get_reputation("198.51.100.1") is not first
+    
+    def test_memory_bounded_under_rotation(self):
+        """Test rotating source IPs do not grow cache or history unbounded."""
+        clock = FakeClock()
+        engine = IPReputationEngine(cache_size=100, max_tracked_ips=50, clock=clock)
+        now = datetime.fromtimestamp(clock.now, timezone.utc)
+        
+        for i in range(5000):
+            ip = f"10.{i // 65536}.{(i // 256) % 256}.{i % 256}"
+            engine.record_threat(ip, self._threat(now))
+            engine.get_reputation(ip)
+        
+        stats = engine.get_stats()
+        assert stats["cached_reputations"] == 100
+        assert stats["tracked_ips"] == 50
+        assert stats["cache_evictions"] == 4900
+    
+    def test_get_reputations_batch(self):
+        """Test batch lookup scores each distinct IP once."""
+        engine = IPReputationEngine()
+        engine.add_to_blocklist("10.0.0.1")
+        
+        reps = engine.get_reputations(["10.0.0.1", "10.0.0.2", "10.0.0.1"])
+        
+        assert set(reps) == {"10.0.0.1", "10.0.0.2"}
+        assert reps["10.0.0.1"].on_blocklist is True
+        assert engine.get_stats()["cache_misses"] == 2
+
+
+def make_indicator(indicator_id, indicator_type, value, severity=ThreatSeverity.HIGH):
+    """Build a test indicator."""
+    return ThreatIndicator(
+        indicator_id=indicator_id,
+        indicator_type=indicator_type,
+        value=value,
+        threat_category=ThreatCategory.BRUTE_FORCE,
+        severity=severity,
+        confidence=ThreatConfidence.CONFIRMED,
+        source="test",
+        first_seen=datetime.now(timezone.utc),
+        last_seen=datetime.now(timezone.utc)
+    )
+
+
+class FakeClock:
+    """Manually advanced time source."""
+    
+    def __init__(self, start: float = 1_700_000_000.0):
+        self.now = start
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float):
+        self.now += seconds
 
 
 class TestAttackPatternDetector:
@@ -395,6 +491,98 @@ class TestAttackPatternDetector:
         assert len(threats) > 0
         categories = [t.threat_category for t in threats]
         assert ThreatCategory.BRUTE_FORCE in categories
+    
+    def test_credential_stuffing_detection(self):
+        """Test many distinct users from one IP is detected."""
+        clock = FakeClock()
+        detector = AttackPatternDetector(clock=clock)
+        
+        detected = []
+        for i in range(40):
+            clock.advance(1)
+            threats = detector.analyze_event("login_attempt", "203.0.113.7", user_id=f"user{i}")
+            detected.extend(t.threat_category for t in threats)
+        
+        assert ThreatCategory.CREDENTIAL_STUFFING in detected
+    
+    def test_few_users_not_credential_stuffing(self):
+        """Test a handful of users from one IP is not flagged."""
+        clock = FakeClock()
+        detector = AttackPatternDetector(clock=clock)
+        
+        detected = []
+        for i in range(30):
+            clock.advance(1)
+            threats = detector.analyze_event("login_attempt", "203.0.113.8", user_id=f"user{i % 3}", success=True)
+            detected.extend(t.threat_category for t in threats)
+        
+        assert ThreatCategory.CREDENTIAL_STUFFING not in detected
+    
+    def test_dna_replay_detection(self):
+        """Test the same DNA key used twice across IPs is detected."""
+        clock = FakeClock()
+        detector = AttackPatternDetector(clock=clock)
+        
+        first = detector.analyze_event("dna_verify", "10.0.0.1", dna_key_id="dna-1", success=True)
+        clock.advance(5)
+        second = detector.analyze_event("dna_verify", "10.0.0.2", dna_key_id="dna-1", success=True)
+        
+        assert ThreatCategory.DNA_REPLAY not in [t.threat_category for t in first]
+        assert ThreatCategory.DNA_REPLAY in [t.threat_category for t in second]
+    
+    def test_distributed_brute_force_across_ips(self):
+        """Test failures for one user across many IPs are counted together."""
+        clock = FakeClock()
+        detector = AttackPatternDetector(clock=clock)
+        pattern = detector._patterns["BRUTE_FORCE_DISTRIBUTED"]
+        
+        for i in range(10):
+            clock.advance(1)
+            detector.analyze_event("login_attempt", f"10.1.0.{i}", user_id="victim")
+        
+        assert detector.count_for_pattern(pattern, "10.9.9.9", user_id="victim") == 10
+    
+    def test_window_expiry(self):
+        """Test counts drop once events leave the pattern window."""
+        clock = FakeClock()
+        detector = AttackPatternDetector(clock=clock)
+        pattern = detector._patterns["BRUTE_FORCE_SINGLE_USER"]
+        
+        for _ in range(4):
+            detector.analyze_event("login_attempt", "10.0.0.1", user_id="alice")
+        assert detector.count_for_pattern(pattern, "10.0.0.1", user_id="alice") == 4
+        
+        clock.advance(pattern.time_window_seconds + 1)
+        assert detector.count_for_pattern(pattern, "10.0.0.1", user_id="alice") == 0
+    
+    def test_idle_keys_are_dropped(self):
+        """Test memory tracks only keys active within the longest window."""
+        clock = FakeClock()
+        detector = AttackPatternDetector(clock=clock)
+        
+        for i in range(100):
+            detector.analyze_event("login_attempt", f"198.51.100.{i}", user_id=f"user{i}")
+        clock.advance(3600)
+        detector.analyze_event("login_attempt", "192.0.2.1", user_id="fresh")
+        
+        stats = detector.get_stats()
+        assert all(count <= 1 for count in stats["counters"].values())
+        assert all(count <= 1 for count in stats["distinct_sketches"].values())
+    
+    def test_invalid_pattern_scope(self):
+        """Test unknown pattern scopes are rejected."""
+        detector = AttackPatternDetector()
+        pattern = AttackPattern(
+            pattern_id="BAD",
+            name="Bad",
+            description="Bad scope",
+            category=ThreatCategory.APT,
+            severity=ThreatSeverity.LOW,
+            conditions={"scope": "device"}
+        )
+        
+        with pytest.raises(ValueError):
+            detector.add_pattern(pattern)
 
 
 class TestThreatIntelligenceService:
@@ -498,6 +686,57 @@ class TestThreatIntelligenceService:
         assert all(t.threat_category != ThreatCategory.BRUTE_FORCE or 
                   "ioc-remove" not in t.matched_indicators for t in threats)
     
+    def test_threats_fed_to_audit_logger(self):
+        """Test detected threats are submitted to the audit pipeline."""
+        audit_logger = AuditLogger()
+        pipeline = audit_logger.enable_pipeline(flush_interval=0.01)
+        service = ThreatIntelligenceService(audit_logger=audit_logger)
+        service.add_indicator(make_indicator("ioc-audit", "ip", "198.51.100.9", ThreatSeverity.CRITICAL))
+        try:
+            _, threats, _ = service.analyze_authentication(source_ip="198.51.100.9", user_id="user123")
+            assert pipeline.flush(timeout=5)
+        finally:
+            audit_logger.close()
+        
+        events = audit_logger.query(event_type=AuditEventType.THREAT_DETECTED)
+        assert len(events) == len(threats) > 0
+        assert events[0].actor_ip == "198.51.100.9"
+        assert any(e.severity == AuditSeverity.CRITICAL for e in events)
+    
+    def test_cidr_indicator_matches_range(self):
+        """Test CIDR indicators match addresses inside the range."""
+        service = ThreatIntelligenceService()
+        service.add_indicator(make_indicator("ioc-range", "ip", "203.0.113.0/24"))
+        
+        _, threats, _ = service.analyze_authentication(source_ip="203.0.113.77")
+        assert any("ioc-range" in t.matched_indicators for t in threats)
+        
+        _, threats, _ = service.analyze_authentication(source_ip="203.0.114.1")
+        assert not any("ioc-range" in t.matched_indicators for t in threats)
+    
+    def test_load_indicators_replaces_feed(self):
+        """Test bulk loading swaps in a new feed."""
+        service = ThreatIntelligenceService()
+        service.add_indicator(make_indicator("ioc-old", "ip", "10.0.0.70"))
+        
+        expired = make_indicator("ioc-expired", "ip", "10.0.0.72")
+        expired.expires_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        loaded = service.load_indicators([make_indicator("ioc-new", "ip", "10.0.0.71"), expired])
+        
+        assert loaded == 1
+        assert service._check_indicators("10.0.0.70", None, None) == []
+        assert [i.indicator_id for i in service._check_indicators("10.0.0.71", None, None)] == ["ioc-new"]
+    
+    def test_load_indicators_merge(self):
+        """Test bulk loading can merge into the current feed."""
+        service = ThreatIntelligenceService()
+        service.add_indicator(make_indicator("ioc-a", "user", "mallory"))
+        
+        service.load_indicators([make_indicator("ioc-b", "dna_key", "dna-stolen")], replace=False)
+        
+        assert service._check_indicators("10.0.0.1", "mallory", "dna-stolen")
+        assert len(service._check_indicators("10.0.0.1", "mallory", "dna-stolen")) == 2
+    
     def test_get_threat_summary(self):
         """Test threat summary generation."""
         service = ThreatIntelligenceService()
@@ -243,6 +243,35 @@ class TestUltimateVerificationEngine:
         assert VerificationBarrierResult.FAILED.value == "failed"
         assert VerificationBarrierResult.WARNING.value == "warning"
 
+    
+    def test_registry_barriers(self):
+        """Test registry and revocation barriers consult the registry."""
+        from types import SimpleNamespace
+        from server.security.distributed_ledger import DNAStrandRegistry
+        
+        registry = DNAStrandRegistry()
+        registry.register_strand(
+            dna_key_id="dna-1",
+            dna_checksum="checksum-1",
+            owner_address="owner",
+            security_level="standard",
+            segment_count=1000,
+            signature=b"sig"
+        )
+        engine = UltimateVerificationEngine(registry=registry)
+        strand = SimpleNamespace(key_id="dna-1", dna_helix=SimpleNamespace(checksum="checksum-1"))
+        forged = SimpleNamespace(key_id="dna-1", dna_helix=SimpleNamespace(checksum="other"))
+        unknown = SimpleNamespace(key_id="dna-2", dna_helix=SimpleNamespace(checksum="checksum-1"))
+        
+        assert engine._check_registry(strand)[0] is True
+        assert engine._check_registry(forged)[0] is False
+        assert engine._check_registry(unknown)[0] is False
+        assert engine._check_revocation(strand)[0] is True
+        
+        registry.revoke_strand("dna-1", b"sig")
+        
+        assert engine._check_revocation(strand) == (False, "Strand is revoked", 1.0)
+
 
 class TestUltimateDNAStrandConfig:
     """Tests for DNA strand configuration."""
@@ -0,0 +1,215 @@
+"""
+==============================================================================
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+==============================================================================
+
+OWNERSHIP AND LEGAL NOTICE:
+
+This software and all associated intellectual property is the exclusive
+property of WeNova Interactive, legally owned and operated by:
+
+    Kayden Shawn Massengill
+
+COMMERCIAL SOFTWARE - NOT FREE - NOT OPEN SOURCE
+
+This is proprietary commercial software. It is NOT free software. It is NOT
+open source software. This software is developed for commercial sale and
+requires a valid commercial license for ANY use.
+
+STRICT PROHIBITION NOTICE:
+
+Without a valid commercial license agreement, you are PROHIBITED from:
+  * Using this software for any purpose
+  * Copying, reproducing, or duplicating this software
+  * Modifying, adapting, or creating derivative works
+  * Distributing, publishing, or transferring this software
+  * Reverse engineering, decompiling, or disassembling this software
+  * Sublicensing or permitting any third-party access
+
+LEGAL ENFORCEMENT:
+
+Unauthorized use, reproduction, or distribution of this software, or any
+portion thereof, may result in severe civil and criminal penalties, and
+will be prosecuted to the maximum extent possible under applicable law.
+
+For licensing inquiries: WeNova Interactive
+==============================================================================
+"""
+
+"""
+DNALockOS - DNA-Key Authentication System
+Copyright (c) 2025 WeNova Interactive
+Legal Owner: Kayden Shawn Massengill
+ALL RIGHTS RESERVED.
+
+PROPRIETARY AND CONFIDENTIAL
+This is commercial software. Unauthorized copying, modification,
+distribution, or use is strictly prohibited.
+"""
+
+"""
+DNA-Key Authentication System - Bounded Work Executor Tests
+
+Tests cover:
+- Queue-depth and per-class quota admission
+- Slot release on success and failure
+- Awaiting work from the event loop
+- 429/503 backpressure on the enrollment endpoint
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from server.runtime.work_executor import (
+    BoundedWorkExecutor,
+    QueueFullError,
+    QuotaExceededError,
+)
+
+
+class TestBoundedWorkExecutor:
+    """Test executor admission control."""
+    
+    def test_run_returns_result(self):
+        """Test awaiting a job returns its value."""
+        executor = BoundedWorkExecutor(max_workers=1, max_queue_depth=1)
+        try:
+            result = asyncio.run(executor.run("standard", sum, [1, 2, 3]))
+            assert result == 6
+            stats = executor.get_stats()
+            assert stats["completed"] == 1
+            assert stats["in_flight"] == 0
+        finally:
+            executor.shutdown()
+    
+    def test_quota_rejects_with_429(self):
+        """Test a class at its quota is rejected."""
+        executor = BoundedWorkExecutor(max_workers=2, max_queue_depth=4, class_quotas={"government": 1})
+        gate = threading.Event()
+        try:
+            first = executor.submit("government", gate.wait)
+            with pytest.raises(QuotaExceededError) as exc_info:
+                executor.submit("government", gate.wait)
+            assert exc_info.value.status_code == 429
+            assert exc_info.value.work_class == "government"
+            
+            # Other classes are still admitted
+            other = executor.submit("standard", lambda: "ok")
+            assert other.result(timeout=5) == "ok"
+            
+            gate.set()
+            first.result(timeout=5)
+            assert executor.get_stats()["rejected_quota"] == 1
+        finally:
+            gate.set()
+            executor.shutdown()
+    
+    def test_queue_full_rejects_with_503(self):
+        """Test admission stops at workers + queue depth."""
+        executor = BoundedWorkExecutor(max_workers=1, max_queue_depth=1)
+        gate = threading.Event()
+        try:
+            futures = [executor.submit("standard", gate.wait) for _ in range(executor.capacity)]
+            with pytest.raises(QueueFullError) as exc_info:
+                executor.submit("standard", gate.wait)
+            assert exc_info.value.status_code == 503
+            assert exc_info.value.retry_after >= 1
+            
+            gate.set()
+            for future in futures:
+                future.result(timeout=5)
+            assert executor.get_stats()["in_flight"] == 0
+        finally:
+            gate.set()
+            executor.shutdown()
+    
+    def test_failed_job_releases_slot(self):
+        """Test a raising job frees its quota slot."""
+        executor = BoundedWorkExecutor(max_workers=1, max_queue_depth=0, class_quotas={"maximum": 1})
+        
+        def boom():
+            raise RuntimeError("boom")
+        
+        try:
+            with pytest.raises(RuntimeError):
+                asyncio.run(executor.run("maximum", boom))
+            stats = executor.get_stats()
+            assert stats["failed"] == 1
+            assert stats["in_flight_by_class"] == {}
+            assert asyncio.run(executor.run("maximum", lambda: 1)) == 1
+        finally:
+            executor.shutdown()
+    
+    def test_invalid_configuration(self):
+        """Test invalid limits are rejected."""
+        with pytest.raises(ValueError):
+            BoundedWorkExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            BoundedWorkExecutor(max_queue_depth=-1)
+        with pytest.raises(ValueError):
+            BoundedWorkExecutor(executor_type="fiber")
+
+
+class TestEnrollmentBackpressure:
+    """Test the enrollment endpoint runs on the bounded executor."""
+    
+    def test_enroll_succeeds(self):
+        """Test enrollment completes through the executor."""
+        pytest.importorskip("httpx")
+        from server.api.main import app
+        from fastapi.testclient import TestClient
+        
+        client = TestClient(app)
+        response = client.post("/api/v1/enroll", json={"subject_id": "executor@example.com"})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["serialized_key"]
+    
+    def test_enroll_quota_returns_429(self, monkeypatch):
+        """Test a saturated security level returns 429 with Retry-After."""
+        pytest.importorskip("httpx")
+        from server.api import main
+        from fastapi.testclient import TestClient
+        
+        executor = BoundedWorkExecutor(max_workers=1, max_queue_depth=1, class_quotas={"maximum": 1})
+        gate = threading.Event()
+        monkeypatch.setattr(main, "enrollment_executor", executor)
+        try:
+            executor.submit("maximum", gate.wait)
+            client = TestClient(main.app)
+            response = client.post(
+                "/api/v1/enroll",
+                json={"subject_id": "heavy@example.com", "security_level": "maximum"},
+            )
+            
+            assert response.status_code == 429
+            assert response.headers["Retry-After"]
+            assert response.json()["error_code"] == "QUOTA_EXCEEDED"
+        finally:
+            gate.set()
+            executor.shutdown()
+    
+    def test_enroll_queue_full_returns_503(self, monkeypatch):
+        """Test a full enrollment queue returns 503."""
+        pytest.importorskip("httpx")
+        from server.api import main
+        from fastapi.testclient import TestClient
+        
+        executor = BoundedWorkExecutor(max_workers=1, max_queue_depth=0)
+        gate = threading.Event()
+        monkeypatch.setattr(main, "enrollment_executor", executor)
+        try:
+            executor.submit("enhanced", gate.wait)
+            client = TestClient(main.app)
+            response = client.post("/api/v1/enroll", json={"subject_id": "queued@example.com"})
+            
+            assert response.status_code == 503
+            assert response.json()["error_code"] == "QUEUE_FULL"
+        finally:
+            gate.set()
+            executor.shutdown()